@@ -229,12 +229,46 @@ class DataMerger:
         if not dataframes:
             raise ValueError("No valid CSV files to merge")
         
+        dataframes = self.drop_superseded_rows(dataframes)
+        
         # 모든 데이터프레임 병합
         merged_df = pd.concat(dataframes, ignore_index=True)
         print(f"\nTotal merged rows: {len(merged_df)}")
         
         return merged_df
     
+    def drop_superseded_rows(self, dataframes):
+        """
+        여러 파일에 같은 행(통신사/가입유형/네트워크/요금제/기기)이 있으면 뒤(최신) 파일의 행만 유지
+        KT는 같은 날짜 파일을 모두 읽으므로 야간 전체 파일과 hot 프로필 병합 스냅샷(crawl_profiles.py)이 겹칠 수 있음
+        
+        Args:
+            dataframes (list): 파일 순서(오래된 파일 먼저)의 데이터프레임 목록
+            
+        Returns:
+            list: 앞 파일에서 겹치는 행을 뺀 데이터프레임 목록
+        """
+        key_columns = ['carrier', 'scrb_type_name', 'network_type', 'plan_name', 'device_nm']
+        seen = set()
+        result = []
+        dropped = 0
+        
+        for df in reversed(dataframes):
+            if not all(col in df.columns for col in key_columns):
+                result.append(df)
+                continue
+            keys = list(df[key_columns].astype(str).itertuples(index=False, name=None))
+            mask = [key not in seen for key in keys]
+            seen.update(keys)
+            dropped += len(keys) - sum(mask)
+            result.append(df[mask])
+        
+        if dropped:
+            print(f"Dropped {dropped} rows superseded by newer files")
+        
+        result.reverse()
+        return result
+    
     def add_additional_columns(self, df):
         """
         추가 컬럼들을 생성하여 데이터프레임에 추가
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+적응형 동시성 제어 (AIMD)
+수동으로 정한 max_workers / delay_between_requests 대신, 실행 중 관측한 페이지 로드 지연,
+오류/타임아웃, 알림창을 보고 동시 작업 수와 요청 간 지연을 조절합니다.
+
+- 가산 증가: 현재 동시 작업 수만큼 연속 성공하면 동시 작업 +1, 지연 -delay_step
+- 곱셈 감소: 타임아웃/재시도/알림창/지연 급증 시 동시 작업 ×decrease_factor, 지연 ×2
+  (감소 직후 cooldown 동안은 이미 진행 중이던 요청의 신호를 무시)
+- 지연 급증: 최근 페이지 로드 중앙값이 초기 중앙값의 latency_factor배 초과
+- 모든 값은 [min, max] 범위 안에서만 조절
+- 신호는 CrawlTelemetry 구독(page_load 단계, 재시도)과 handle_alert에서 전달
+- enabled=False면 고정값 (기존 max_workers / delay_between_requests와 동일하게 동작)
+
+작성일: 2025-10-27
+파일명: adaptive_concurrency.py
+"""
+
+import time
+import logging
+import statistics
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 지연 시간 표본으로 사용하는 텔레메트리 단계
+LATENCY_STEPS = ('page_load',)
+
+
+class AdaptiveConcurrency:
+    """AIMD 기반 동시 작업 수 / 요청 간 지연 제어"""
+
+    def __init__(self, initial_workers: int, min_workers: int = 1, max_workers: int = 8,
+                 initial_delay: float = 1.0, min_delay: float = 0.0, max_delay: float = 30.0,
+                 delay_step: float = 0.25, decrease_factor: float = 0.5, latency_factor: float = 2.0,
+                 window: int = 5, cooldown: float = 30.0, enabled: bool = True,
+                 latency_steps: Iterable[str] = LATENCY_STEPS):
+        """
+        Args:
+            initial_workers: 시작 동시 작업 수 (기존 max_workers)
+            min_workers / max_workers: 동시 작업 수 범위
+            initial_delay: 시작 요청 간 지연(초, 기존 delay_between_requests)
+            min_delay / max_delay: 요청 간 지연 범위(초)
+            delay_step: 가산 증가 시 줄이는 지연(초)
+            decrease_factor: 곱셈 감소 비율
+            latency_factor: 최근 지연 중앙값이 초기 중앙값의 몇 배를 넘으면 혼잡으로 판단
+            window: 지연 중앙값 계산 표본 수
+            cooldown: 감소 후 다음 감소까지 최소 간격(초)
+            enabled: False면 조절하지 않음
+            latency_steps: 지연 표본으로 사용할 텔레메트리 단계
+        """
+        self.enabled = enabled
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers if enabled else initial_workers)
+        self.min_delay = min_delay
+        self.max_delay = max(min_delay, max_delay)
+        self.delay_step = delay_step
+        self.decrease_factor = decrease_factor
+        self.latency_factor = latency_factor
+        self.window = max(1, window)
+        self.cooldown = cooldown
+        self.latency_steps = set(latency_steps)
+
+        self._limit = min(max(initial_workers, self.min_workers), self.max_workers)
+        self._delay = initial_delay if not enabled else min(max(initial_delay, min_delay), self.max_delay)
+        self._active = 0
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._baseline: List[float] = []
+        self._recent: Deque[float] = deque(maxlen=self.window)
+        self._cond = threading.Condition()
+
+        # 통계
+        self.stats = {'increases': 0, 'decreases': 0, 'ignored': 0, 'signals': {},
+                      'lowest': self._limit, 'highest': self._limit, 'max_delay': self._delay}
+
+    @property
+    def limit(self) -> int:
+        """현재 동시 작업 수 한도"""
+        return self._limit
+
+    @property
+    def delay(self) -> float:
+        """현재 요청 간 지연(초)"""
+        return self._delay
+
+    @contextmanager
+    def slot(self):
+        """작업 슬롯 (현재 한도만큼만 동시에 진입, 한도가 줄면 진행 중인 작업이 끝날 때까지 대기)"""
+        with self._cond:
+            while self._active >= self._limit:
+                self._cond.wait()
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify_all()
+
+    def resize(self, initial_workers: int, max_workers: int):
+        """동시 작업 수 범위 재설정 (실행 방식이 정해진 뒤 - 예: 공유 브라우저 엔진은 컨텍스트 수 기준)"""
+        with self._cond:
+            self.max_workers = max(self.min_workers, max_workers)
+            self._limit = min(max(initial_workers, self.min_workers), self.max_workers)
+            self._successes = 0
+            self.stats['lowest'] = self.stats['highest'] = self._limit
+            self._cond.notify_all()
+
+    def pause(self):
+        """요청 간 지연"""
+        if self._delay > 0:
+            time.sleep(self._delay)
+
+    # ------------------------------------------------------------------
+    # 신호
+
+    def success(self, latency: Optional[float] = None):
+        """요청 성공 (latency: 페이지 로드 소요 시간)"""
+        if not self.enabled:
+            return
+        with self._cond:
+            if latency is not None:
+                if len(self._baseline) < self.window:
+                    self._baseline.append(latency)
+                else:
+                    self._recent.append(latency)
+                    if len(self._recent) >= self.window:
+                        baseline = statistics.median(self._baseline)
+                        recent = statistics.median(self._recent)
+                        if recent > baseline * self.latency_factor:
+                            self._recent.clear()
+                            self._decrease_locked(f"latency {recent:.1f}s/{baseline:.1f}s", 'latency')
+                            return
+
+            self._successes += 1
+            if self._successes < self._limit:
+                return
+            # 현재 한도만큼 연속 성공 - 가산 증가
+            self._successes = 0
+            changed = False
+            if self._limit < self.max_workers:
+                self._limit += 1
+                self.stats['highest'] = max(self.stats['highest'], self._limit)
+                changed = True
+                self._cond.notify_all()
+            if self._delay > self.min_delay:
+                self._delay = max(self.min_delay, round(self._delay - self.delay_step, 3))
+                changed = True
+            if changed:
+                self.stats['increases'] += 1
+                logger.debug(f"동시성 증가: 워커 {self._limit}개, 지연 {self._delay:.2f}초")
+
+    def congestion(self, reason: str):
+        """혼잡 신호 (timeout, error, alert, retry 등)"""
+        if not self.enabled:
+            return
+        with self._cond:
+            self._decrease_locked(reason, reason.split(':', 1)[0])
+
+    def _decrease_locked(self, detail: str, kind: str):
+        signals = self.stats['signals']
+        signals[kind] = signals.get(kind, 0) + 1
+        self._successes = 0
+
+        now = time.monotonic()
+        if now - self._last_decrease < self.cooldown:
+            self.stats['ignored'] += 1
+            return
+        self._last_decrease = now
+
+        self._limit = max(self.min_workers, int(self._limit * self.decrease_factor))
+        self._delay = min(self.max_delay, max(self._delay * 2, self.delay_step))
+        self.stats['decreases'] += 1
+        self.stats['lowest'] = min(self.stats['lowest'], self._limit)
+        self.stats['max_delay'] = max(self.stats['max_delay'], self._delay)
+        logger.warning(f"동시성 감소 ({detail}): 워커 {self._limit}개, 지연 {self._delay:.2f}초")
+
+    def observe(self, kind: str, step: str, seconds: float, ok: bool):
+        """CrawlTelemetry 구독 콜백 - page_load 단계는 지연/타임아웃, 재시도는 혼잡 신호"""
+        if kind == 'retry':
+            self.congestion(f"retry:{step}")
+        elif kind == 'step' and step in self.latency_steps:
+            if ok:
+                self.success(seconds)
+            else:
+                self.congestion(f"timeout:{step}")
+
+    def summary(self) -> str:
+        """통계 문자열"""
+        if not self.enabled:
+            return f"고정 (워커 {self._limit}개, 지연 {self._delay:.2f}초)"
+        stats = self.stats
+        signals = ', '.join(f"{name} {count}" for name, count in sorted(stats['signals'].items())) or '없음'
+        return (f"현재 워커 {self._limit}개 (범위 {stats['lowest']}~{stats['highest']}), 지연 {self._delay:.2f}초 "
+                f"(최대 {stats['max_delay']:.2f}초), 증가 {stats['increases']}회, 감소 {stats['decreases']}회 "
+                f"(무시 {stats['ignored']}회), 혼잡 신호: {signals}")
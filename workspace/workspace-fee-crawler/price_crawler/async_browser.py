@@ -0,0 +1,737 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+비동기 공유 브라우저 엔진
+작업(스레드)마다 Chrome 프로세스를 띄우는 대신, Chrome 하나에 격리된 브라우저 컨텍스트(탭)를
+여러 개 만들어 CDP(Chrome DevTools Protocol)로 직접 제어합니다.
+
+- AsyncBrowser: Chrome 실행 + CDP 웹소켓 연결 하나 (flat 세션으로 모든 탭 공유)
+- BrowserContext: 쿠키/스토리지가 분리된 컨텍스트 (시크릿 창과 같은 격리, 프로세스보다 훨씬 가벼움)
+- Page: 크롤러가 쓰는 고수준 동작 - goto(이동), evaluate(스크립트 실행), wait_for_selector/wait_for_function
+- ContextPool: 동시 작업 수만큼 컨텍스트를 만들어 재사용 (max_uses마다 새 컨텍스트로 교체)
+- BrowserEngine: 별도 스레드의 이벤트 루프에서 엔진을 실행하는 동기 어댑터 (스레드 기반 크롤러용)
+- 리소스 차단(BrowserProfile 패턴), 자동화 탐지 방지/네트워크 카운터 스크립트, alert 자동 수락
+
+websockets 패키지가 필요합니다 (pip install websockets). 없으면 WEBSOCKETS_AVAILABLE = False.
+
+작성일: 2025-10-27
+파일명: async_browser.py
+"""
+
+import os
+import json
+import time
+import shutil
+import asyncio
+import logging
+import platform
+import tempfile
+import threading
+import itertools
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import websockets
+    WEBSOCKETS_AVAILABLE = True
+except ImportError:
+    WEBSOCKETS_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+CHROME_PATH_ENV = 'CHROME_PATH'
+
+# Chrome 실행 파일 후보 (플랫폼별)
+CHROME_CANDIDATES = {
+    'Darwin': ['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome',
+               '/Applications/Chromium.app/Contents/MacOS/Chromium'],
+    'Linux': ['google-chrome', 'google-chrome-stable', 'chromium', 'chromium-browser'],
+    'Windows': [r'C:\Program Files\Google\Chrome\Application\chrome.exe',
+                r'C:\Program Files (x86)\Google\Chrome\Application\chrome.exe'],
+}
+
+DEFAULT_ARGS = [
+    '--no-first-run',
+    '--no-default-browser-check',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-background-networking',
+    '--disable-background-timer-throttling',
+    '--disable-renderer-backgrounding',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-breakpad',
+    '--disable-crash-reporter',
+    '--disable-notifications',
+    '--disable-features=TranslateUI',
+    '--window-size=1920,1080',
+]
+
+# 자동화 탐지 방지 (문서 로드 전 주입)
+STEALTH_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'languages', {get: () => ['ko-KR', 'ko', 'en-US', 'en']});
+"""
+
+# DevToolsActivePort 파일 대기 시간(초)
+LAUNCH_TIMEOUT = 30
+
+
+class BrowserError(Exception):
+    """CDP 명령 실패 / 연결 종료"""
+
+
+class BrowserTimeout(BrowserError):
+    """페이지 이동 또는 대기 타임아웃"""
+
+
+class ScriptError(BrowserError):
+    """페이지 스크립트 실행 오류"""
+
+
+def find_chrome() -> Optional[str]:
+    """Chrome 실행 파일 경로 (CHROME_PATH 환경변수 우선)"""
+    env_path = os.environ.get(CHROME_PATH_ENV)
+    if env_path:
+        return env_path
+    for candidate in CHROME_CANDIDATES.get(platform.system(), []):
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+class CDPSession:
+    """CDP 세션 (브라우저 또는 탭 하나, 연결은 flat 모드로 공유)"""
+
+    def __init__(self, connection: 'CDPConnection', session_id: Optional[str] = None):
+        self.connection = connection
+        self.session_id = session_id
+        self._handlers: Dict[str, List[Callable[[Dict[str, Any]], None]]] = {}
+        self._waiters: List[Tuple[str, Optional[Callable[[Dict[str, Any]], bool]], asyncio.Future]] = []
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None, timeout: float = 30) -> Dict[str, Any]:
+        """명령 전송 후 결과 대기"""
+        return await self.connection.send(method, params, self.session_id, timeout)
+
+    def on(self, method: str, handler: Callable[[Dict[str, Any]], None]):
+        """이벤트 핸들러 등록 (이벤트 루프에서 동기 호출)"""
+        self._handlers.setdefault(method, []).append(handler)
+
+    def wait_for(self, method: str, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> asyncio.Future:
+        """다음 이벤트를 받을 Future (명령 전송 전에 등록해 이벤트 누락 방지)"""
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append((method, predicate, future))
+        return future
+
+    def dispatch(self, method: str, params: Dict[str, Any]):
+        for handler in self._handlers.get(method, []):
+            try:
+                handler(params)
+            except Exception as e:
+                logger.debug(f"CDP 이벤트 처리 오류 ({method}): {e}")
+
+        remaining = []
+        for waiter in self._waiters:
+            name, predicate, future = waiter
+            if future.done():
+                continue
+            if name == method and (predicate is None or predicate(params)):
+                future.set_result(params)
+                continue
+            remaining.append(waiter)
+        self._waiters = remaining
+
+    def fail(self, error: Exception):
+        """연결 종료 시 대기 중인 이벤트 실패 처리"""
+        for _, _, future in self._waiters:
+            if not future.done():
+                future.set_exception(error)
+        self._waiters = []
+
+
+class CDPConnection:
+    """브라우저 CDP 웹소켓 연결 (요청 ID ↔ 응답, 세션별 이벤트 분배)"""
+
+    def __init__(self, ws):
+        self.ws = ws
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self.sessions: Dict[Optional[str], CDPSession] = {None: CDPSession(self)}
+        self._closed: Optional[Exception] = None
+        self._reader = asyncio.ensure_future(self._read())
+
+    @classmethod
+    async def connect(cls, url: str) -> 'CDPConnection':
+        ws = await websockets.connect(url, max_size=None, ping_interval=None)
+        return cls(ws)
+
+    @property
+    def browser(self) -> CDPSession:
+        return self.sessions[None]
+
+    def session(self, session_id: str) -> CDPSession:
+        session = self.sessions.get(session_id)
+        if session is None:
+            session = self.sessions[session_id] = CDPSession(self, session_id)
+        return session
+
+    async def send(self, method: str, params: Optional[Dict[str, Any]] = None,
+                   session_id: Optional[str] = None, timeout: float = 30) -> Dict[str, Any]:
+        if self._closed:
+            raise BrowserError(f"CDP 연결 종료됨: {self._closed}")
+        message_id = next(self._ids)
+        message = {'id': message_id, 'method': method, 'params': params or {}}
+        if session_id:
+            message['sessionId'] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self.ws.send(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise BrowserTimeout(f"CDP 응답 타임아웃: {method} ({timeout}초)")
+        finally:
+            self._pending.pop(message_id, None)
+
+    async def _read(self):
+        error: Exception = BrowserError("CDP 연결 종료")
+        try:
+            async for raw in self.ws:
+                message = json.loads(raw)
+                if 'id' in message:
+                    future = self._pending.get(message['id'])
+                    if future is None or future.done():
+                        continue
+                    if 'error' in message:
+                        future.set_exception(BrowserError(f"{message['error'].get('message')} ({message['error'].get('code')})"))
+                    else:
+                        future.set_result(message.get('result', {}))
+                    continue
+
+                method = message.get('method')
+                params = message.get('params', {})
+                if method == 'Target.detachedFromTarget':
+                    detached = self.sessions.pop(params.get('sessionId'), None)
+                    if detached:
+                        detached.fail(BrowserError("탭 연결 해제"))
+                session = self.sessions.get(message.get('sessionId'))
+                if session is not None:
+                    session.dispatch(method, params)
+        except Exception as e:
+            error = BrowserError(f"CDP 연결 오류: {e}")
+        finally:
+            self._closed = error
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(error)
+            for session in self.sessions.values():
+                session.fail(error)
+
+    async def close(self):
+        try:
+            await self.ws.close()
+        except Exception:
+            pass
+        self._reader.cancel()
+
+
+class Page:
+    """컨텍스트 안의 탭 하나 (크롤러용 고수준 동작)"""
+
+    def __init__(self, browser: 'AsyncBrowser', context: 'BrowserContext', target_id: str, session: CDPSession):
+        self.browser = browser
+        self.context = context
+        self.target_id = target_id
+        self.session = session
+        self.dialogs: List[str] = []
+        self.loaded_bytes = 0
+        self.closed = False
+
+    async def _setup(self):
+        browser = self.browser
+        self.session.on('Page.javascriptDialogOpening', self._on_dialog)
+        self.session.on('Network.loadingFinished', self._on_loading_finished)
+        await self.session.send('Page.enable')
+        for script in browser.init_scripts:
+            await self.session.send('Page.addScriptToEvaluateOnNewDocument', {'source': script})
+        await self.session.send('Network.enable')
+        if browser.blocked_patterns:
+            await self.session.send('Network.setBlockedURLs', {'urls': list(browser.blocked_patterns)})
+        if browser.user_agent:
+            await self.session.send('Network.setUserAgentOverride',
+                                    {'userAgent': browser.user_agent, 'acceptLanguage': 'ko-KR,ko;q=0.9'})
+
+    def _on_dialog(self, params: Dict[str, Any]):
+        """alert/confirm 자동 수락 (메시지는 dialogs에 보관)"""
+        message = params.get('message', '')
+        self.dialogs.append(message)
+        self.browser.stats['dialogs'] += 1
+        logger.debug(f"대화상자 자동 수락: {message}")
+        asyncio.ensure_future(self._accept_dialog())
+
+    async def _accept_dialog(self):
+        try:
+            await self.session.send('Page.handleJavaScriptDialog', {'accept': True})
+        except BrowserError as e:
+            logger.debug(f"대화상자 처리 실패: {e}")
+
+    def _on_loading_finished(self, params: Dict[str, Any]):
+        size = int(params.get('encodedDataLength', 0))
+        self.loaded_bytes += size
+        self.browser.stats['loaded_bytes'] += size
+
+    def take_dialogs(self) -> List[str]:
+        """처리한 대화상자 메시지 (읽으면 비움)"""
+        dialogs, self.dialogs = self.dialogs, []
+        return dialogs
+
+    async def goto(self, url: str, timeout: Optional[float] = None) -> bool:
+        """페이지 이동 후 load 이벤트 대기
+
+        Raises:
+            BrowserTimeout: 타임아웃 (로딩은 중단되며 부분 로드된 페이지는 계속 사용 가능)
+            BrowserError: 이동 실패 (DNS/연결 오류 등)
+        """
+        timeout = timeout or self.browser.default_timeout
+        loaded = self.session.wait_for('Page.loadEventFired')
+        started = time.monotonic()
+        try:
+            result = await self.session.send('Page.navigate', {'url': url}, timeout=timeout)
+            if result.get('errorText'):
+                raise BrowserError(f"페이지 이동 실패: {result['errorText']} ({url[:100]})")
+            if result.get('loaderId'):
+                await asyncio.wait_for(loaded, max(0.1, timeout - (time.monotonic() - started)))
+        except (asyncio.TimeoutError, BrowserTimeout):
+            try:
+                await self.session.send('Page.stopLoading', timeout=5)
+            except BrowserError:
+                pass
+            raise BrowserTimeout(f"페이지 로드 타임아웃 ({timeout}초): {url[:100]}")
+        finally:
+            if not loaded.done():
+                loaded.cancel()
+        self.browser.stats['navigations'] += 1
+        return True
+
+    async def evaluate(self, script: str, *args: Any, timeout: Optional[float] = None) -> Any:
+        """스크립트 실행 (Selenium execute_script와 같이 함수 본문 + arguments, JSON 값 반환)"""
+        expression = f"(function() {{\n{script}\n}}).apply(window, {json.dumps(list(args), ensure_ascii=False)})"
+        result = await self.session.send('Runtime.evaluate', {
+            'expression': expression,
+            'returnByValue': True,
+            'awaitPromise': True,
+            'userGesture': True
+        }, timeout=timeout or self.browser.default_timeout)
+        if 'exceptionDetails' in result:
+            details = result['exceptionDetails']
+            description = details.get('exception', {}).get('description') or details.get('text')
+            raise ScriptError(f"스크립트 오류: {description}")
+        return result.get('result', {}).get('value')
+
+    async def wait_for_function(self, script: str, *args: Any, timeout: Optional[float] = None,
+                                poll: float = 0.1) -> Any:
+        """스크립트 결과가 참이 될 때까지 대기 (결과 반환)
+
+        Raises:
+            BrowserTimeout: 타임아웃
+        """
+        timeout = timeout or self.browser.default_timeout
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                value = await self.evaluate(script, *args, timeout=max(1.0, deadline - time.monotonic()))
+                if value:
+                    return value
+            except BrowserTimeout:
+                raise BrowserTimeout(f"조건 대기 타임아웃 ({timeout}초)")
+            except BrowserError:
+                # 페이지 이동 중에는 실행 컨텍스트가 사라질 수 있음 (탭이 닫혔으면 중단)
+                if self.closed or self.session.session_id not in self.browser.connection.sessions:
+                    raise
+            if time.monotonic() >= deadline:
+                raise BrowserTimeout(f"조건 대기 타임아웃 ({timeout}초)")
+            await asyncio.sleep(poll)
+
+    async def wait_for_selector(self, selector: str, timeout: Optional[float] = None, visible: bool = False) -> bool:
+        """선택자 요소가 나타날 때까지 대기 (타임아웃이면 False)"""
+        script = """
+            var el = document.querySelector(arguments[0]);
+            if (!el) return false;
+            return !arguments[1] || el.offsetParent !== null;
+        """
+        try:
+            await self.wait_for_function(script, selector, visible, timeout=timeout)
+            return True
+        except BrowserTimeout:
+            return False
+
+    async def wait_for_ready(self, timeout: Optional[float] = None, states: Iterable[str] = ('complete', 'interactive')) -> bool:
+        """document.readyState 대기 (타임아웃이면 False)"""
+        try:
+            await self.wait_for_function("return arguments[0].indexOf(document.readyState) >= 0;",
+                                         list(states), timeout=timeout)
+            return True
+        except BrowserTimeout:
+            return False
+
+    async def url(self) -> str:
+        """현재 URL"""
+        return await self.evaluate("return window.location.href;")
+
+    async def content(self) -> str:
+        """현재 문서 HTML"""
+        return await self.evaluate("return document.documentElement.outerHTML;")
+
+    async def close(self):
+        """탭 닫기"""
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self.browser.connection.browser.send('Target.closeTarget', {'targetId': self.target_id}, timeout=10)
+        except BrowserError as e:
+            logger.debug(f"탭 닫기 실패: {e}")
+        self.browser.connection.sessions.pop(self.session.session_id, None)
+
+
+class BrowserContext:
+    """격리된 브라우저 컨텍스트 (쿠키/스토리지/캐시 분리)"""
+
+    def __init__(self, browser: 'AsyncBrowser', context_id: str):
+        self.browser = browser
+        self.context_id = context_id
+        self.pages: List[Page] = []
+        self.closed = False
+
+    async def new_page(self) -> Page:
+        """새 탭"""
+        browser_session = self.browser.connection.browser
+        target = await browser_session.send('Target.createTarget', {
+            'url': 'about:blank',
+            'browserContextId': self.context_id
+        })
+        attached = await browser_session.send('Target.attachToTarget', {
+            'targetId': target['targetId'],
+            'flatten': True
+        })
+        page = Page(self.browser, self, target['targetId'], self.browser.connection.session(attached['sessionId']))
+        await page._setup()
+        self.pages.append(page)
+        self.browser.stats['pages'] += 1
+        return page
+
+    async def close(self):
+        """컨텍스트와 소속 탭 모두 닫기"""
+        if self.closed:
+            return
+        self.closed = True
+        for page in self.pages:
+            page.closed = True
+            self.browser.connection.sessions.pop(page.session.session_id, None)
+        try:
+            await self.browser.connection.browser.send('Target.disposeBrowserContext',
+                                                       {'browserContextId': self.context_id}, timeout=10)
+        except BrowserError as e:
+            logger.debug(f"컨텍스트 종료 실패: {e}")
+        if self in self.browser.contexts:
+            self.browser.contexts.remove(self)
+
+
+class AsyncBrowser:
+    """Chrome 프로세스 하나 + CDP 연결"""
+
+    def __init__(self, chrome_path: Optional[str] = None, headless: bool = True,
+                 args: Iterable[str] = (), blocked_patterns: Iterable[str] = (),
+                 init_scripts: Iterable[str] = (STEALTH_SCRIPT,), user_agent: Optional[str] = None,
+                 default_timeout: float = 30):
+        """
+        Args:
+            chrome_path: Chrome 실행 파일 (None이면 CHROME_PATH 환경변수 또는 설치 경로 탐색)
+            headless: 헤드리스 실행
+            args: 추가 Chrome 인자
+            blocked_patterns: 차단 URL 패턴 (Network.setBlockedURLs, 예: BrowserProfile.blocked_patterns)
+            init_scripts: 모든 문서 로드 전에 주입할 스크립트
+            user_agent: User-Agent 덮어쓰기
+            default_timeout: 이동/스크립트/대기 기본 타임아웃(초)
+        """
+        if not WEBSOCKETS_AVAILABLE:
+            raise ImportError("websockets 패키지가 필요합니다: pip install websockets")
+        self.chrome_path = chrome_path or find_chrome()
+        self.headless = headless
+        self.args = list(args)
+        self.blocked_patterns = list(blocked_patterns)
+        self.init_scripts = list(init_scripts)
+        self.user_agent = user_agent
+        self.default_timeout = default_timeout
+
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self.connection: Optional[CDPConnection] = None
+        self.contexts: List[BrowserContext] = []
+        self._user_data_dir: Optional[str] = None
+
+        # 통계
+        self.stats = {'contexts': 0, 'pages': 0, 'navigations': 0, 'dialogs': 0, 'loaded_bytes': 0}
+
+    async def start(self) -> 'AsyncBrowser':
+        """Chrome 실행 후 CDP 연결"""
+        if not self.chrome_path:
+            raise BrowserError(f"Chrome 실행 파일을 찾을 수 없습니다 ({CHROME_PATH_ENV} 환경변수로 지정)")
+
+        self._user_data_dir = tempfile.mkdtemp(prefix='price_crawler_chrome_')
+        command = [self.chrome_path, '--remote-debugging-port=0', f'--user-data-dir={self._user_data_dir}']
+        command += DEFAULT_ARGS + self.args
+        if self.headless:
+            command.append('--headless=new')
+        command.append('about:blank')
+
+        self.process = await asyncio.create_subprocess_exec(
+            *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL)
+
+        # 포트 0으로 실행하면 Chrome이 사용한 포트와 브라우저 경로를 DevToolsActivePort 파일에 기록
+        port_file = Path(self._user_data_dir) / 'DevToolsActivePort'
+        deadline = time.monotonic() + LAUNCH_TIMEOUT
+        while True:
+            if port_file.exists():
+                lines = port_file.read_text().split()
+                if len(lines) >= 2:
+                    break
+            if self.process.returncode is not None:
+                await self.close()
+                raise BrowserError(f"Chrome이 종료되었습니다 (코드 {self.process.returncode})")
+            if time.monotonic() >= deadline:
+                await self.close()
+                raise BrowserTimeout(f"Chrome 시작 타임아웃 ({LAUNCH_TIMEOUT}초)")
+            await asyncio.sleep(0.1)
+
+        self.connection = await CDPConnection.connect(f"ws://127.0.0.1:{lines[0]}{lines[1]}")
+        version = await self.connection.browser.send('Browser.getVersion')
+        logger.info(f"공유 브라우저 시작: {version.get('product')} (PID {self.process.pid})")
+        return self
+
+    async def new_context(self) -> BrowserContext:
+        """격리된 컨텍스트 생성"""
+        result = await self.connection.browser.send('Target.createBrowserContext', {'disposeOnDetach': True})
+        context = BrowserContext(self, result['browserContextId'])
+        self.contexts.append(context)
+        self.stats['contexts'] += 1
+        return context
+
+    async def close(self):
+        """모든 컨텍스트와 Chrome 종료"""
+        if self.connection:
+            try:
+                await self.connection.browser.send('Browser.close', timeout=5)
+            except BrowserError:
+                pass
+            await self.connection.close()
+            self.connection = None
+        if self.process and self.process.returncode is None:
+            try:
+                await asyncio.wait_for(self.process.wait(), 10)
+            except asyncio.TimeoutError:
+                self.process.kill()
+                await self.process.wait()
+        if self._user_data_dir:
+            shutil.rmtree(self._user_data_dir, ignore_errors=True)
+            self._user_data_dir = None
+        self.contexts = []
+
+    async def __aenter__(self) -> 'AsyncBrowser':
+        return await self.start()
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def summary(self) -> str:
+        """통계 문자열"""
+        stats = self.stats
+        return (f"컨텍스트 {stats['contexts']}개, 탭 {stats['pages']}개, 페이지 이동 {stats['navigations']}회, "
+                f"대화상자 {stats['dialogs']}회, 로드 {stats['loaded_bytes'] / 1024 / 1024:.1f}MB")
+
+
+class ContextPool:
+    """동시 작업 수만큼 컨텍스트(+탭)를 만들어 재사용"""
+
+    def __init__(self, browser: AsyncBrowser, size: int = 10, max_uses: int = 50):
+        """
+        Args:
+            browser: 시작된 AsyncBrowser
+            size: 동시 컨텍스트 수
+            max_uses: 이 횟수만큼 사용한 컨텍스트는 닫고 새로 생성 (쿠키/메모리 누적 방지)
+        """
+        self.browser = browser
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self._idle: List[Page] = []
+        self._uses: Dict[int, int] = {}
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def acquire(self) -> Page:
+        """탭 대여 (모두 사용 중이면 반납될 때까지 대기)"""
+        await self._slots.acquire()
+        try:
+            while self._idle:
+                page = self._idle.pop()
+                if not page.closed:
+                    return page
+            context = await self.browser.new_context()
+            page = await context.new_page()
+            self._uses[id(page)] = 0
+            return page
+        except BaseException:
+            self._slots.release()
+            raise
+
+    async def release(self, page: Page, discard: bool = False):
+        """탭 반납 (discard=True 또는 max_uses 도달 시 컨텍스트 종료)"""
+        try:
+            uses = self._uses.get(id(page), 0) + 1
+            if discard or page.closed or (self.max_uses and uses >= self.max_uses):
+                self._uses.pop(id(page), None)
+                await page.context.close()
+            else:
+                self._uses[id(page)] = uses
+                page.take_dialogs()
+                self._idle.append(page)
+        finally:
+            self._slots.release()
+
+    async def run(self, items: Iterable[Any], handler: Callable[[Page, Any], Awaitable[Any]]) -> List[Any]:
+        """항목별로 handler(page, item)을 최대 size개 동시 실행 (결과 또는 예외 객체 목록, 입력 순서)"""
+        async def _one(item):
+            page = await self.acquire()
+            failed = False
+            try:
+                return await handler(page, item)
+            except BrowserError:
+                failed = True
+                raise
+            finally:
+                await self.release(page, discard=failed)
+
+        return await asyncio.gather(*(_one(item) for item in items), return_exceptions=True)
+
+    async def close(self):
+        """대기 중인 컨텍스트 종료"""
+        idle, self._idle = self._idle, []
+        for page in idle:
+            await page.context.close()
+
+
+class SyncPage:
+    """BrowserEngine 스레드 어댑터 - 다른 스레드에서 Page 동작을 동기 호출"""
+
+    def __init__(self, engine: 'BrowserEngine', page: Page):
+        self.engine = engine
+        self.page = page
+
+    def get(self, url: str, timeout: Optional[float] = None) -> bool:
+        return self.engine.call(self.page.goto(url, timeout))
+
+    def execute_script(self, script: str, *args: Any) -> Any:
+        return self.engine.call(self.page.evaluate(script, *args))
+
+    def wait_for_function(self, script: str, *args: Any, timeout: Optional[float] = None) -> Any:
+        return self.engine.call(self.page.wait_for_function(script, *args, timeout=timeout))
+
+    def wait_for_selector(self, selector: str, timeout: Optional[float] = None, visible: bool = False) -> bool:
+        return self.engine.call(self.page.wait_for_selector(selector, timeout, visible))
+
+    def wait_for_ready(self, timeout: Optional[float] = None) -> bool:
+        return self.engine.call(self.page.wait_for_ready(timeout))
+
+    @property
+    def current_url(self) -> str:
+        return self.engine.call(self.page.url())
+
+    @property
+    def page_source(self) -> str:
+        return self.engine.call(self.page.content())
+
+    def take_dialogs(self) -> List[str]:
+        return self.page.take_dialogs()
+
+
+class BrowserEngine:
+    """공유 브라우저를 별도 스레드의 이벤트 루프에서 실행하는 동기 어댑터
+
+    스레드 기반 크롤러에서 워커 스레드마다 acquire()로 탭을 빌려 사용합니다.
+    모든 워커가 Chrome 프로세스 하나를 공유하며, 워커는 각자 격리된 컨텍스트를 사용합니다.
+    """
+
+    def __init__(self, size: int = 10, max_uses: int = 50, **browser_options: Any):
+        """
+        Args:
+            size: 동시 컨텍스트 수
+            max_uses: 컨텍스트 재생성 주기 (사용 횟수)
+            browser_options: AsyncBrowser 인자
+        """
+        self.size = size
+        self.max_uses = max_uses
+        self.browser_options = browser_options
+        self.browser: Optional[AsyncBrowser] = None
+        self.pool: Optional[ContextPool] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> 'BrowserEngine':
+        """이벤트 루프 스레드 시작 후 브라우저 실행"""
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='browser-engine', daemon=True)
+        self._thread.start()
+        try:
+            self.call(self._start())
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    async def _start(self):
+        self.browser = await AsyncBrowser(**self.browser_options).start()
+        self.pool = ContextPool(self.browser, self.size, self.max_uses)
+
+    def call(self, coroutine: Awaitable[Any], timeout: Optional[float] = None) -> Any:
+        """엔진 루프에서 코루틴 실행 후 결과 대기 (호출 스레드 차단)"""
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result(timeout)
+
+    def acquire(self) -> SyncPage:
+        """탭 대여"""
+        return SyncPage(self, self.call(self.pool.acquire()))
+
+    def release(self, page: Optional[SyncPage], discard: bool = False):
+        """탭 반납 (discard=True면 컨텍스트를 닫고 다음 대여 시 새로 생성)"""
+        if page is None:
+            return
+        try:
+            self.call(self.pool.release(page.page, discard=discard), timeout=30)
+        except Exception as e:
+            logger.debug(f"탭 반납 오류: {e}")
+
+    def close(self):
+        """브라우저와 이벤트 루프 종료"""
+        if self._loop is None:
+            return
+        try:
+            if self.browser is not None:
+                self.call(self._close(), timeout=30)
+        except Exception as e:
+            logger.debug(f"공유 브라우저 종료 오류: {e}")
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join(5)
+        if self._thread is not None and self._thread.is_alive():
+            # 실행 중인 루프는 닫을 수 없음 (RuntimeError) - 데몬 스레드이므로 프로세스 종료 시 정리됨
+            logger.warning("이벤트 루프 스레드가 5초 내에 끝나지 않음 - 루프를 닫지 않고 둡니다")
+        else:
+            self._loop.close()
+        self._loop = None
+
+    async def _close(self):
+        if self.pool is not None:
+            await self.pool.close()
+        await self.browser.close()
+
+    def summary(self) -> str:
+        """통계 문자열"""
+        return self.browser.summary() if self.browser else "시작 안 됨"
@@ -0,0 +1,192 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+리소스 차단 브라우저 프로필
+공시지원금 표에 필요 없는 이미지/폰트/미디어/광고·분석 스크립트 요청을 차단합니다.
+
+- Chrome 설정으로 이미지 로딩 비활성화
+- CDP Network.setBlockedURLs로 URL 패턴 차단 (폰트, 미디어, 추적/광고 스크립트 등)
+- 통신사별 허용 목록: 표 동작에 필요한 스크립트는 차단 패턴에서 제외
+- performance 로그의 차단/완료 이벤트로 실행별 절감 요청 수와 바이트(추정) 집계
+
+작성일: 2025-10-27
+파일명: browser_profile.py
+"""
+
+import fnmatch
+import logging
+import threading
+from typing import Any, Dict, Iterable, List, Optional
+
+from price_crawler.cdp_network import enable_performance_log, drain_performance_log
+
+logger = logging.getLogger(__name__)
+
+# 차단 패턴 (Network.setBlockedURLs 와일드카드 형식)
+BLOCKED_URL_PATTERNS = {
+    'images': ['*.png', '*.png?*', '*.jpg', '*.jpg?*', '*.jpeg', '*.jpeg?*', '*.gif', '*.gif?*',
+               '*.webp', '*.webp?*', '*.svg', '*.svg?*', '*.ico', '*.ico?*'],
+    'fonts': ['*.woff', '*.woff?*', '*.woff2', '*.woff2?*', '*.ttf', '*.ttf?*', '*.otf', '*.otf?*',
+              '*.eot', '*.eot?*', '*fonts.googleapis.com*', '*fonts.gstatic.com*'],
+    'media': ['*.mp4', '*.mp4?*', '*.webm', '*.webm?*', '*.mp3', '*.mp3?*', '*.m3u8*'],
+    'trackers': [
+        '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*',
+        '*googleadservices.com*', '*googlesyndication.com*', '*connect.facebook.net*',
+        '*facebook.com/tr*', '*analytics.tiktok.com*', '*wcs.naver.net*', '*wcs.naver.com*',
+        '*t1.daumcdn.net/kas*', '*t1.kakaocdn.net/kakao_js_sdk*', '*criteo.com*', '*criteo.net*',
+        '*adobedtm.com*', '*omtrdc.net*', '*demdex.net*', '*hotjar.com*', '*clarity.ms*',
+        '*mixpanel.com*', '*amplitude.com*', '*appier.net*', '*mobon.net*', '*acecounter.com*',
+        '*logger.kakao.com*', '*channel.io*', '*happytalk*'
+    ],
+}
+
+# 통신사별 허용 URL (이 URL을 막는 차단 패턴은 적용하지 않음)
+# 태그 관리 스크립트가 버튼 onclick 안에서 호출되어, 막으면 클릭 처리 자체가 중단되는 경우
+CARRIER_ALLOWLISTS = {
+    'KT': ['https://assets.adobedtm.com/launch.min.js'],
+    'SK': [],
+    'LG': ['https://www.googletagmanager.com/gtm.js'],
+}
+
+# 차단된 요청의 리소스 유형별 평균 크기 추정치(바이트) - 절감량 추정용
+ESTIMATED_RESOURCE_BYTES = {
+    'Image': 40 * 1024,
+    'Font': 50 * 1024,
+    'Media': 300 * 1024,
+    'Script': 60 * 1024,
+    'Stylesheet': 20 * 1024,
+    'XHR': 2 * 1024,
+    'Fetch': 2 * 1024,
+}
+DEFAULT_ESTIMATED_BYTES = 5 * 1024
+
+
+class BrowserProfile:
+    """통신사별 리소스 차단 설정과 절감량 집계"""
+
+    def __init__(self, carrier: str, enabled: bool = True,
+                 extra_blocked: Optional[Iterable[str]] = None,
+                 extra_allowed: Optional[Iterable[str]] = None,
+                 categories: Iterable[str] = ('images', 'fonts', 'media', 'trackers'),
+                 report: bool = True):
+        """
+        Args:
+            carrier: 통신사 (SK, KT, LG)
+            enabled: False면 아무것도 차단하지 않음
+            extra_blocked: 추가 차단 패턴
+            extra_allowed: 추가 허용 URL (통신사 기본 허용 목록에 더함)
+            categories: 적용할 차단 분류 (BLOCKED_URL_PATTERNS 키)
+            report: performance 로그로 절감량 집계 여부
+        """
+        self.carrier = carrier
+        self.enabled = enabled
+        self.report = report and enabled
+        self.categories = tuple(categories)
+        self.allowed = list(CARRIER_ALLOWLISTS.get(carrier, [])) + list(extra_allowed or [])
+
+        patterns = []
+        for category in self.categories:
+            patterns.extend(BLOCKED_URL_PATTERNS.get(category, []))
+        patterns.extend(extra_blocked or [])
+        self.blocked_patterns = self._apply_allowlist(patterns)
+
+        self._lock = threading.Lock()
+        self.stats = {
+            'blocked_requests': 0,
+            'blocked_bytes_estimate': 0,
+            'loaded_requests': 0,
+            'loaded_bytes': 0,
+            'blocked_by_type': {},
+        }
+
+    def _apply_allowlist(self, patterns: List[str]) -> List[str]:
+        """허용 URL을 막는 패턴 제거 (중복 제거, 순서 유지)"""
+        result = []
+        for pattern in patterns:
+            if pattern in result:
+                continue
+            if any(fnmatch.fnmatch(url, pattern) for url in self.allowed):
+                logger.debug(f"[{self.carrier}] 허용 목록으로 차단 제외: {pattern}")
+                continue
+            result.append(pattern)
+        return result
+
+    def apply_options(self, options):
+        """ChromeOptions에 이미지 비활성화 설정 병합 (create_driver에서 드라이버 생성 전 호출)"""
+        if not self.enabled:
+            return options
+
+        if 'images' in self.categories:
+            prefs = dict(options.experimental_options.get('prefs', {}))
+            prefs['profile.managed_default_content_settings.images'] = 2
+            options.add_experimental_option('prefs', prefs)
+
+        if self.report:
+            enable_performance_log(options)
+        return options
+
+    def apply(self, driver):
+        """드라이버에 URL 차단 적용 (드라이버 생성 직후 호출)"""
+        if not self.enabled or not self.blocked_patterns:
+            return
+        try:
+            driver.execute_cdp_cmd('Network.enable', {})
+            driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_patterns})
+        except Exception as e:
+            logger.warning(f"[{self.carrier}] 리소스 차단 설정 실패: {e}")
+            return
+
+        if self.report:
+            # drain_performance_log()가 호출될 때마다 이벤트를 집계
+            driver.crawler_event_tap = self.observe
+
+    def observe(self, events: Iterable[Dict[str, Any]]):
+        """Network 이벤트에서 차단/로드 요청 집계"""
+        blocked = 0
+        blocked_bytes = 0
+        loaded = 0
+        loaded_bytes = 0
+        by_type: Dict[str, int] = {}
+
+        for event in events:
+            method = event.get('method')
+            params = event.get('params', {})
+            if method == 'Network.loadingFailed' and params.get('blockedReason') == 'inspector':
+                resource_type = params.get('type', 'Other')
+                blocked += 1
+                blocked_bytes += ESTIMATED_RESOURCE_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+                by_type[resource_type] = by_type.get(resource_type, 0) + 1
+            elif method == 'Network.loadingFinished':
+                loaded += 1
+                loaded_bytes += int(params.get('encodedDataLength', 0))
+
+        if not (blocked or loaded):
+            return
+
+        with self._lock:
+            self.stats['blocked_requests'] += blocked
+            self.stats['blocked_bytes_estimate'] += blocked_bytes
+            self.stats['loaded_requests'] += loaded
+            self.stats['loaded_bytes'] += loaded_bytes
+            for resource_type, count in by_type.items():
+                self.stats['blocked_by_type'][resource_type] = self.stats['blocked_by_type'].get(resource_type, 0) + count
+
+    def collect(self, driver):
+        """누적된 performance 로그를 비워 집계 (드라이버 반납/종료 전 호출)"""
+        if self.report and driver is not None:
+            drain_performance_log(driver)
+
+    def summary(self) -> str:
+        """절감량 통계 문자열"""
+        if not self.enabled:
+            return "리소스 차단 비활성화"
+        with self._lock:
+            stats = dict(self.stats)
+            by_type = ', '.join(f"{k} {v}" for k, v in sorted(stats['blocked_by_type'].items(), key=lambda kv: -kv[1]))
+        text = (f"차단 요청 {stats['blocked_requests']:,}개 (추정 절감 {stats['blocked_bytes_estimate'] / 1024 / 1024:.1f}MB), "
+                f"로드 요청 {stats['loaded_requests']:,}개 ({stats['loaded_bytes'] / 1024 / 1024:.1f}MB)")
+        if by_type:
+            text += f" - {by_type}"
+        if 'images' in self.categories:
+            text += " (이미지 설정으로 요청 전 차단된 이미지는 제외)"
+        return text
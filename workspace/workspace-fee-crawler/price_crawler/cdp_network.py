@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Chrome DevTools 네트워크 로그 도우미
+페이지가 내부적으로 호출하는 AJAX 요청/응답을 performance 로그로 수집합니다.
+
+- 드라이버 생성 시 enable_performance_log(options) 호출 필요
+- drain_performance_log()로 누적된 Network.* 이벤트 수집
+- poll_performance_log()는 이벤트를 미리 읽어 탭에 전달하고, 다음 drain 결과로 보관
+- collect_exchanges()로 요청/응답 쌍 구성, get_response_body()로 본문 조회
+
+작성일: 2025-10-27
+파일명: cdp_network.py
+"""
+
+import json
+import base64
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 데이터 요청으로 간주하는 리소스 유형
+DATA_RESOURCE_TYPES = ('XHR', 'Fetch', 'Document')
+
+# poll_performance_log()로 읽고 아직 drain되지 않은 이벤트 최대 보관 수
+BACKLOG_LIMIT = 20000
+
+
+def enable_performance_log(options):
+    """ChromeOptions에 performance 로그 수집 설정"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+
+def drain_performance_log(driver) -> List[Dict[str, Any]]:
+    """누적된 Network 이벤트 수집 (호출 시 로그 버퍼는 비워짐)
+
+    드라이버에 crawler_event_tap이 설정되어 있으면 수집한 이벤트를 함께 전달합니다
+    (BrowserProfile 절감량 집계, 픽스처 기록).
+
+    Returns:
+        [{'method': 'Network.requestWillBeSent', 'params': {...}}, ...]
+    """
+    backlog = getattr(driver, 'crawler_event_backlog', None)
+    if backlog:
+        driver.crawler_event_backlog = []
+    return (backlog or []) + _read_performance_log(driver)
+
+
+def poll_performance_log(driver) -> int:
+    """performance 로그를 미리 읽어 이벤트 탭에 전달 (이벤트는 다음 drain_performance_log() 결과로 보관)
+
+    응답 본문은 페이지를 벗어나면 조회할 수 없으므로, 호출 측 drain 시점과 무관하게
+    이벤트를 처리해야 하는 경우(픽스처 기록) 사용합니다.
+
+    Returns:
+        새로 읽은 이벤트 수
+    """
+    events = _read_performance_log(driver)
+    if events:
+        backlog = getattr(driver, 'crawler_event_backlog', None) or []
+        backlog.extend(events)
+        driver.crawler_event_backlog = backlog[-BACKLOG_LIMIT:]
+    return len(events)
+
+
+def _read_performance_log(driver) -> List[Dict[str, Any]]:
+    """드라이버 로그 버퍼에서 Network 이벤트를 읽어 탭에 전달"""
+    events = []
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logger.debug(f"performance 로그 조회 실패: {e}")
+        return events
+
+    for entry in entries:
+        try:
+            message = json.loads(entry['message'])['message']
+        except (KeyError, ValueError, TypeError):
+            continue
+        if message.get('method', '').startswith('Network.'):
+            events.append(message)
+
+    tap = getattr(driver, 'crawler_event_tap', None)
+    if tap is not None and events:
+        try:
+            tap(events)
+        except Exception as e:
+            logger.debug(f"이벤트 집계 실패: {e}")
+
+    return events
+
+
+def collect_exchanges(events: Iterable[Dict[str, Any]], url_contains: Optional[str] = None,
+                      resource_types: Iterable[str] = DATA_RESOURCE_TYPES) -> List[Dict[str, Any]]:
+    """이벤트 목록에서 완료된 요청/응답 쌍 구성 (요청 순서 유지)
+
+    Returns:
+        [{'request_id', 'url', 'method', 'headers', 'post_data', 'has_post_data',
+          'resource_type', 'status', 'mime_type'}, ...]
+    """
+    resource_types = set(resource_types)
+    exchanges: Dict[str, Dict[str, Any]] = {}
+    finished = set()
+
+    for event in events:
+        method = event.get('method')
+        params = event.get('params', {})
+        request_id = params.get('requestId')
+        if not request_id:
+            continue
+
+        if method == 'Network.requestWillBeSent':
+            request = params.get('request', {})
+            url = request.get('url', '')
+            if url_contains and url_contains not in url:
+                continue
+            if params.get('type') and params['type'] not in resource_types:
+                continue
+            # 리다이렉트 시 같은 requestId로 다시 들어오므로 마지막 요청으로 덮어씀
+            exchanges[request_id] = {
+                'request_id': request_id,
+                'url': url,
+                'method': request.get('method', 'GET'),
+                'headers': request.get('headers', {}),
+                'post_data': request.get('postData'),
+                'has_post_data': request.get('hasPostData', False),
+                'resource_type': params.get('type'),
+                'status': None,
+                'mime_type': None,
+            }
+        elif method == 'Network.responseReceived' and request_id in exchanges:
+            response = params.get('response', {})
+            exchanges[request_id]['status'] = response.get('status')
+            exchanges[request_id]['mime_type'] = response.get('mimeType')
+            if params.get('type'):
+                exchanges[request_id]['resource_type'] = params['type']
+        elif method == 'Network.loadingFinished':
+            finished.add(request_id)
+
+    return [
+        exchange for request_id, exchange in exchanges.items()
+        if request_id in finished and exchange['status'] is not None
+        and exchange['resource_type'] in resource_types
+    ]
+
+
+def get_response_body(driver, request_id: str) -> Optional[str]:
+    """Network.getResponseBody로 응답 본문 조회 (버퍼에서 사라졌으면 None)"""
+    try:
+        result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+    except Exception as e:
+        logger.debug(f"응답 본문 조회 실패 ({request_id}): {e}")
+        return None
+
+    body = result.get('body', '')
+    if result.get('base64Encoded'):
+        try:
+            body = base64.b64decode(body).decode('utf-8', errors='replace')
+        except Exception:
+            return None
+    return body
+
+
+def get_request_post_data(driver, exchange: Dict[str, Any]) -> Optional[str]:
+    """요청 본문 (로그에 생략된 경우 Network.getRequestPostData로 조회)"""
+    if exchange.get('post_data') is not None:
+        return exchange['post_data']
+    if not exchange.get('has_post_data'):
+        return None
+
+    try:
+        result = driver.execute_cdp_cmd('Network.getRequestPostData', {'requestId': exchange['request_id']})
+        return result.get('postData')
+    except Exception as e:
+        logger.debug(f"요청 본문 조회 실패 ({exchange['request_id']}): {e}")
+        return None
+
+
+def cookies_to_session(driver, session):
+    """브라우저 쿠키를 requests 세션으로 복사"""
+    for cookie in driver.get_cookies():
+        session.cookies.set(
+            cookie['name'], cookie['value'],
+            domain=cookie.get('domain'), path=cookie.get('path', '/')
+        )
@@ -0,0 +1,291 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+추가 전용 체크포인트 저널
+체크포인트마다 전체 상태를 pickle로 다시 쓰는 대신, 지난 체크포인트 이후 새로 수집한 행과
+진행 마커만 JSONL 세그먼트 파일에 덧붙입니다.
+
+- 체크포인트 비용이 누적 행 수가 아닌 새 행 수에 비례
+- 세그먼트 크기 초과 시 새 세그먼트로 전환, 추가한 바이트만 fsync
+- 진행 마커(mark)가 뒤따르지 않은 행은 재개 시 버림 (쓰다 중단된 꼬리 무시)
+- 요금제/조합 목록 등 거의 바뀌지 않는 상태는 별도 파일(state.pkl)에 한 번만 저장
+- 완료/재개 시 하나의 세그먼트로 압축
+- RowStore 행은 필드별 값 목록(cols 레코드)으로 기록 (행마다 dict 변환/키 반복 없음)
+
+디렉토리 구조:
+    <체크포인트 파일명>.journal/
+        seg-000001.jsonl   {"t": "rows", "rows": [...]} / {"t": "cols", "cols": {필드: [...]}}
+                           / {"t": "mark", "mark": {...}} / {"t": "reset"}
+        state.pkl
+
+작성일: 2025-10-27
+파일명: checkpoint_journal.py
+"""
+
+import os
+import json
+import pickle
+import shutil
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = 'seg-'
+SEGMENT_SUFFIX = '.jsonl'
+STATE_FILE = 'state.pkl'
+
+
+def _encode_row(row: Any) -> Dict[str, Any]:
+    """dict 또는 dataclass 행을 dict로 변환"""
+    return row if isinstance(row, dict) else vars(row)
+
+
+def _row_records(rows: Sequence[Any], start: int, end: int, chunk: int = 5000) -> List[Dict[str, Any]]:
+    """[start, end) 구간 행 레코드 (RowStore는 cols, 그 외는 rows 레코드, chunk행 단위로 나눔)"""
+    records = []
+    for chunk_start in range(start, end, chunk):
+        chunk_end = min(chunk_start + chunk, end)
+        if hasattr(rows, 'columns'):
+            records.append({'t': 'cols', 'cols': rows.columns(chunk_start, chunk_end)})
+        else:
+            records.append({'t': 'rows', 'rows': [_encode_row(row) for row in rows[chunk_start:chunk_end]]})
+    return records
+
+
+def _decode_columns(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    """cols 레코드 → 행 dict 목록"""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*(columns[name] for name in names))]
+
+
+class CheckpointJournal:
+    """세그먼트 기반 추가 전용 체크포인트"""
+
+    def __init__(self, path: Path, segment_bytes: int = 16 * 1024 * 1024, fsync: bool = True):
+        """
+        Args:
+            path: 저널 디렉토리 (보통 체크포인트 파일 경로의 .journal)
+            segment_bytes: 세그먼트 전환 크기
+            fsync: 체크포인트마다 fsync 여부
+        """
+        self.path = Path(path)
+        self.segment_bytes = segment_bytes
+        self.fsync = fsync
+
+        # 이미 저널에 기록한 행 수 (all_data 앞부분)
+        self.journaled = 0
+        # 이번 실행에서 상태 파일을 썼거나 읽었는지
+        self.state_written = False
+
+        self._file = None
+        self._segment_no = 0
+        self._lock = threading.Lock()
+        self.stats = {'checkpoints': 0, 'rows': 0, 'bytes': 0}
+
+    # ------------------------------------------------------------------
+    # 파일 관리
+
+    def exists(self) -> bool:
+        """재개 가능한 저널 존재 여부"""
+        return bool(self._segments())
+
+    def _segments(self) -> List[Path]:
+        """세그먼트 파일 (번호 순)"""
+        if not self.path.exists():
+            return []
+        return sorted(self.path.glob(f'{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}'))
+
+    def _segment_path(self, number: int) -> Path:
+        return self.path / f'{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}'
+
+    def _open_segment(self, number: Optional[int] = None):
+        """쓰기용 세그먼트 열기 (기본: 마지막 세그먼트에 이어 쓰기)"""
+        self._close_file()
+        self.path.mkdir(parents=True, exist_ok=True)
+        if number is None:
+            segments = self._segments()
+            number = int(segments[-1].name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) if segments else 1
+        self._segment_no = number
+        self._file = open(self._segment_path(number), 'ab')
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except Exception:
+                pass
+            self._file = None
+
+    def _write(self, records: List[Dict[str, Any]]) -> int:
+        """레코드를 현재 세그먼트에 추가하고 fsync (기록 바이트 수 반환)"""
+        if self._file is None:
+            self._open_segment()
+        elif self._file.tell() >= self.segment_bytes:
+            self._open_segment(self._segment_no + 1)
+
+        payload = ''.join(json.dumps(r, ensure_ascii=False, default=str) + '\n' for r in records).encode('utf-8')
+        self._file.write(payload)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        return len(payload)
+
+    def _write_state(self, state: Any):
+        """상태 파일 저장 (원자적 교체)"""
+        self.path.mkdir(parents=True, exist_ok=True)
+        state_file = self.path / STATE_FILE
+        temp_file = state_file.with_suffix('.tmp')
+        with open(temp_file, 'wb') as f:
+            pickle.dump(state, f)
+        temp_file.replace(state_file)
+        self.state_written = True
+
+    # ------------------------------------------------------------------
+    # 체크포인트
+
+    def checkpoint(self, rows: Sequence[Any], marker: Dict[str, Any], state: Any = None) -> int:
+        """지난 체크포인트 이후 추가된 행과 진행 마커 기록
+
+        Args:
+            rows: 전체 수집 행 (all_data) - 앞쪽 journaled개는 이미 기록된 것으로 간주
+            marker: 재개 지점 정보 (작은 dict)
+            state: 거의 바뀌지 않는 상태 (주어지면 state.pkl로 저장)
+
+        Returns:
+            이번에 기록한 행 수
+        """
+        with self._lock:
+            records = []
+            if len(rows) < self.journaled:
+                # 행 목록이 교체/축소됨 - 처음부터 다시 기록
+                records.append({'t': 'reset'})
+                self.journaled = 0
+
+            # 이번 체크포인트 범위 고정 (기록 중 추가되는 행은 다음 체크포인트에서)
+            end = len(rows)
+            records.extend(_row_records(rows, self.journaled, end))
+            records.append({'t': 'mark', 'mark': marker})
+
+            try:
+                if state is not None:
+                    self._write_state(state)
+                written = self._write(records)
+            except Exception as e:
+                logger.error(f"체크포인트 저널 기록 실패: {e}")
+                return 0
+
+            appended = end - self.journaled
+            self.journaled = end
+            self.stats['checkpoints'] += 1
+            self.stats['rows'] += appended
+            self.stats['bytes'] += written
+            return appended
+
+    def load(self, compact: bool = True) -> Optional[Tuple[List[Dict[str, Any]], Dict[str, Any], Any]]:
+        """저널 재생
+
+        Args:
+            compact: 세그먼트/마커가 여러 개면 재생 후 하나로 압축 (재개를 반복해도 저널이 계속 커지지 않도록)
+                     손상된 줄이나 마커 없는 행이 있으면 이 값과 관계없이 압축
+
+        Returns:
+            (행 dict 리스트, 마지막 진행 마커, 상태), 저널이 없으면 None
+        """
+        segments = self._segments()
+        if not segments:
+            return None
+
+        rows: List[Dict[str, Any]] = []
+        pending: List[Dict[str, Any]] = []
+        marker: Dict[str, Any] = {}
+        marks = 0
+        damaged = False
+
+        for segment in segments:
+            with open(segment, 'rb') as f:
+                for line_no, line in enumerate(f, 1):
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 쓰다 중단된 마지막 줄 - 이후 내용은 신뢰할 수 없음
+                        logger.warning(f"저널 손상 감지 ({segment.name}:{line_no}) - 이전 마커까지만 복원")
+                        damaged = True
+                        break
+                    kind = record.get('t')
+                    if kind == 'reset':
+                        rows = []
+                        pending = []
+                    elif kind == 'rows':
+                        pending.extend(record.get('rows', []))
+                    elif kind == 'cols':
+                        pending.extend(_decode_columns(record.get('cols', {})))
+                    elif kind == 'mark':
+                        rows.extend(pending)
+                        pending = []
+                        marker = record.get('mark', {})
+                        marks += 1
+
+        if pending:
+            # 파일에 남겨두면 다음 체크포인트의 마커 뒤에 포함되어 복원되므로 손상과 같이 다시 씀
+            logger.warning(f"마커 없는 {len(pending)}개 행은 버립니다 (체크포인트 도중 중단)")
+            damaged = True
+
+        state = None
+        state_file = self.path / STATE_FILE
+        if state_file.exists():
+            with open(state_file, 'rb') as f:
+                state = pickle.load(f)
+            self.state_written = True
+
+        self.journaled = len(rows)
+        logger.info(f"체크포인트 저널 재생: 세그먼트 {len(segments)}개, 마커 {marks}개, {len(rows)}개 행")
+
+        # 손상되었거나 마커 없는 꼬리 뒤에 이어 쓰지 않도록 이 경우 항상 다시 씀
+        if damaged or (compact and (len(segments) > 1 or marks > 1)):
+            self.compact(rows, marker)
+        return rows, marker, state
+
+    def compact(self, rows: Sequence[Any], marker: Dict[str, Any]):
+        """전체 행을 새 세그먼트 하나로 다시 쓰고 이전 세그먼트 삭제
+
+        새 세그먼트는 reset 레코드로 시작하므로 삭제 도중 중단되어도 재생 결과는 같습니다.
+        """
+        with self._lock:
+            old_segments = self._segments()
+            next_no = (int(old_segments[-1].name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) + 1) if old_segments else 1
+            try:
+                self._open_segment(next_no)
+                self.journaled = 0
+                end = len(rows)
+                # 한 줄이 지나치게 커지지 않도록 나눠 기록
+                records = [{'t': 'reset'}] + _row_records(rows, 0, end) + [{'t': 'mark', 'mark': marker}]
+                self._write(records)
+                self.journaled = end
+            except Exception as e:
+                logger.error(f"체크포인트 저널 압축 실패: {e}")
+                return
+
+            for segment in old_segments:
+                try:
+                    segment.unlink()
+                except Exception as e:
+                    logger.debug(f"세그먼트 삭제 실패 ({segment.name}): {e}")
+
+        logger.info(f"체크포인트 저널 압축: {len(rows)}개 행 (세그먼트 {len(old_segments)}개 → 1개)")
+
+    def clear(self):
+        """저널 삭제"""
+        with self._lock:
+            self._close_file()
+            self.journaled = 0
+            self.state_written = False
+            if self.path.exists():
+                shutil.rmtree(self.path, ignore_errors=True)
+
+    def close(self):
+        """파일 닫기"""
+        with self._lock:
+            self._close_file()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+원시 크롤링 데이터 Parquet 저장소
+통신사 / 수집일 단위로 나눈 Parquet 파일로 원시 데이터를 저장하고 읽습니다.
+
+- 경로: <root>/carrier=<통신사>/crawl_date=<YYYY-MM-DD>/<통신사>_<YYYYMMDD_HHMMSS>.parquet (Hive 형식 분할)
+- 반복이 많은 문자열 컬럼(device_nm, plan_name, scrb_type_name 등)은 사전(dictionary) 인코딩
+- 가격 컬럼은 int32 정수형으로 저장 (CSV 재파싱/형 추론 불필요)
+- read_raw_data(): 통신사/수집일/컬럼을 골라 DataFrame으로 로드 (문자열 컬럼은 category)
+- 기존 CSV 변환: python price_crawler/columnar_store.py convert --csv-dir price_crawler/data
+
+pyarrow가 없으면 PYARROW_AVAILABLE=False이며 크롤러는 CSV만 저장합니다.
+
+작성일: 2025-10-27
+파일명: columnar_store.py
+"""
+
+import os
+import re
+import sys
+import logging
+import argparse
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# 사전 인코딩할 문자열 컬럼
+STRING_COLUMNS = ('date', 'crawled_at', 'carrier', 'manufacturer', 'scrb_type_name',
+                  'network_type', 'device_nm', 'plan_name')
+
+# 정수형 가격 컬럼 (원 단위, int32 범위)
+PRICE_COLUMNS = ('monthly_fee', 'release_price', 'public_support_fee',
+                 'additional_support_fee', 'total_support_fee', 'total_price')
+
+CARRIERS = ('kt', 'sk', 'lg')
+
+# CSV 파일명 (kt_20250722_131828.csv)
+CSV_NAME_PATTERN = re.compile(r'^(kt|sk|lg)_(\d{8})_(\d{6})\.csv$')
+
+DEFAULT_ROOT = Path(__file__).parent / 'data' / 'parquet'
+
+
+def _require_pyarrow():
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Parquet 저장에는 pyarrow가 필요합니다 (pip install pyarrow)")
+
+
+def to_arrow_table(df: pd.DataFrame) -> 'pa.Table':
+    """DataFrame → Arrow 테이블 (문자열 컬럼 사전 인코딩, 가격 컬럼 int32)"""
+    _require_pyarrow()
+    arrays = []
+    names = []
+    for column in df.columns:
+        series = df[column]
+        if column in PRICE_COLUMNS:
+            array = pa.array(pd.to_numeric(series, errors='coerce'), type=pa.int32(), from_pandas=True)
+        elif column in STRING_COLUMNS or series.dtype == object:
+            array = pa.array(series.astype('string'), type=pa.string(), from_pandas=True).dictionary_encode()
+        else:
+            array = pa.array(series, from_pandas=True)
+        arrays.append(array)
+        names.append(column)
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+def partition_dir(root: Union[str, Path], carrier: str, crawl_date: str) -> Path:
+    """통신사 / 수집일 분할 디렉토리"""
+    return Path(root) / f"carrier={carrier.lower()}" / f"crawl_date={crawl_date}"
+
+
+def write_raw_data(df: pd.DataFrame, carrier: str, root: Union[str, Path, None] = None,
+                   run_time: Optional[datetime] = None, compression: str = 'zstd') -> Path:
+    """원시 데이터를 통신사/수집일 분할 Parquet 파일로 저장
+
+    Args:
+        df: 크롤링 결과 (CSV와 같은 컬럼)
+        carrier: 통신사 (kt, sk, lg)
+        root: 저장소 루트 (기본: price_crawler/data/parquet)
+        run_time: 수집 시각 (파일명/분할 기준, 기본: 현재)
+        compression: Parquet 압축 방식
+
+    Returns:
+        저장한 파일 경로
+    """
+    _require_pyarrow()
+    run_time = run_time or datetime.now()
+    carrier = carrier.lower()
+
+    directory = partition_dir(root or DEFAULT_ROOT, carrier, run_time.strftime('%Y-%m-%d'))
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{carrier}_{run_time.strftime('%Y%m%d_%H%M%S')}.parquet"
+
+    table = to_arrow_table(df)
+    temp_path = path.with_suffix('.parquet.tmp')
+    pq.write_table(table, temp_path, compression=compression, use_dictionary=True)
+    os.replace(temp_path, path)
+
+    logger.info(f"Parquet 저장: {path} ({len(df):,}행, {path.stat().st_size / 1024 / 1024:.1f}MB)")
+    return path
+
+
+def list_partitions(root: Union[str, Path, None] = None) -> Dict[str, Dict[str, List[Path]]]:
+    """저장소의 분할 목록 {통신사: {수집일: [파일...]}} (수집일/파일 오름차순)"""
+    root = Path(root or DEFAULT_ROOT)
+    partitions: Dict[str, Dict[str, List[Path]]] = {}
+    for path in sorted(root.glob('carrier=*/crawl_date=*/*.parquet')):
+        carrier = path.parent.parent.name.split('=', 1)[1]
+        crawl_date = path.parent.name.split('=', 1)[1]
+        partitions.setdefault(carrier, {}).setdefault(crawl_date, []).append(path)
+    return {carrier: dict(sorted(dates.items())) for carrier, dates in partitions.items()}
+
+
+def select_files(root: Union[str, Path, None] = None, carriers: Optional[Iterable[str]] = None,
+                 crawl_dates: Optional[Iterable[str]] = None, latest: Optional[str] = None) -> List[Path]:
+    """조건에 맞는 Parquet 파일 목록
+
+    Args:
+        carriers: 통신사 목록 (기본: 전체)
+        crawl_dates: 수집일 목록 (YYYY-MM-DD)
+        latest: 'date' = 통신사별 최신 수집일의 모든 파일, 'run' = 통신사별 최신 파일 하나
+    """
+    partitions = list_partitions(root)
+    carriers = [c.lower() for c in carriers] if carriers else sorted(partitions)
+    crawl_dates = set(crawl_dates) if crawl_dates else None
+
+    files = []
+    for carrier in carriers:
+        dates = partitions.get(carrier, {})
+        if crawl_dates is not None:
+            dates = {d: f for d, f in dates.items() if d in crawl_dates}
+        if not dates:
+            continue
+        if latest == 'date':
+            files.extend(dates[max(dates)])
+        elif latest == 'run':
+            files.append(dates[max(dates)][-1])
+        else:
+            for date_files in dates.values():
+                files.extend(date_files)
+    return files
+
+
+def read_raw_data(root: Union[str, Path, None] = None, carriers: Optional[Iterable[str]] = None,
+                  crawl_dates: Optional[Iterable[str]] = None, latest: Optional[str] = None,
+                  columns: Optional[List[str]] = None, categorical: bool = True) -> pd.DataFrame:
+    """저장소에서 원시 데이터 로드
+
+    Args:
+        root: 저장소 루트 (기본: price_crawler/data/parquet)
+        carriers: 통신사 목록 (기본: 전체)
+        crawl_dates: 수집일 목록 (YYYY-MM-DD)
+        latest: 'date' = 통신사별 최신 수집일 전체, 'run' = 통신사별 최신 실행 하나, None = 조건에 맞는 전체
+        columns: 읽을 컬럼 (기본: 전체)
+        categorical: False면 문자열 컬럼을 category 대신 object로 반환 (CSV 로드 결과와 같은 형태)
+
+    Returns:
+        DataFrame (파일이 없으면 빈 DataFrame)
+    """
+    _require_pyarrow()
+    files = select_files(root, carriers, crawl_dates, latest)
+    if not files:
+        return pd.DataFrame(columns=columns) if columns else pd.DataFrame()
+
+    tables = [pq.read_table(path, columns=columns) for path in files]
+    table = pa.concat_tables(tables, promote_options='default') if len(tables) > 1 else tables[0]
+    # 파일마다 다른 사전을 하나로 합쳐 category 변환 비용을 줄임
+    table = table.unify_dictionaries()
+    df = table.to_pandas()
+
+    if not categorical:
+        for column in df.columns:
+            if isinstance(df[column].dtype, pd.CategoricalDtype):
+                df[column] = df[column].astype(object)
+    return df
+
+
+def convert_csv_dir(csv_dir: Union[str, Path], root: Union[str, Path, None] = None,
+                    overwrite: bool = False) -> List[Path]:
+    """기존 원시 CSV(kt_YYYYMMDD_HHMMSS.csv 등)를 저장소로 변환 (CSV는 그대로 둠)"""
+    _require_pyarrow()
+    root = Path(root or DEFAULT_ROOT)
+    written = []
+    for csv_file in sorted(Path(csv_dir).glob('*.csv')):
+        match = CSV_NAME_PATTERN.match(csv_file.name)
+        if not match:
+            continue
+        carrier = match.group(1)
+        run_time = datetime.strptime(match.group(2) + match.group(3), '%Y%m%d%H%M%S')
+        target = partition_dir(root, carrier, run_time.strftime('%Y-%m-%d')) / f"{csv_file.stem}.parquet"
+        if target.exists() and not overwrite:
+            continue
+
+        df = pd.read_csv(csv_file, encoding='utf-8-sig', dtype={c: str for c in STRING_COLUMNS})
+        written.append(write_raw_data(df, carrier, root, run_time))
+    return written
+
+
+def print_info(root: Union[str, Path, None] = None, csv_dir: Union[str, Path, None] = None):
+    """통신사/수집일별 파일 수, 행 수, 크기 출력 (CSV 디렉토리를 주면 크기 비교)"""
+    _require_pyarrow()
+    partitions = list_partitions(root)
+    if not partitions:
+        print(f"Parquet 파일이 없습니다: {root or DEFAULT_ROOT}")
+        return
+
+    total_rows = 0
+    total_bytes = 0
+    for carrier, dates in sorted(partitions.items()):
+        for crawl_date, files in dates.items():
+            rows = sum(pq.ParquetFile(f).metadata.num_rows for f in files)
+            size = sum(f.stat().st_size for f in files)
+            total_rows += rows
+            total_bytes += size
+            print(f"{carrier.upper()} {crawl_date}: 파일 {len(files)}개, {rows:,}행, {size / 1024 / 1024:.1f}MB")
+
+    print(f"\n합계: {total_rows:,}행, {total_bytes / 1024 / 1024:.1f}MB")
+    if csv_dir:
+        csv_bytes = sum(f.stat().st_size for f in Path(csv_dir).glob('*.csv') if CSV_NAME_PATTERN.match(f.name))
+        if csv_bytes:
+            print(f"CSV: {csv_bytes / 1024 / 1024:.1f}MB ({csv_bytes / max(total_bytes, 1):.1f}배)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='원시 크롤링 데이터 Parquet 저장소')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    convert = subparsers.add_parser('convert', help='기존 CSV를 Parquet 저장소로 변환')
+    convert.add_argument('--csv-dir', default=str(Path(__file__).parent / 'data'), help='원시 CSV 디렉토리')
+    convert.add_argument('--root', default=None, help=f'저장소 루트 (기본: {DEFAULT_ROOT})')
+    convert.add_argument('--overwrite', action='store_true', help='이미 변환된 파일도 다시 변환')
+
+    info = subparsers.add_parser('info', help='저장소 통계')
+    info.add_argument('--root', default=None, help=f'저장소 루트 (기본: {DEFAULT_ROOT})')
+    info.add_argument('--csv-dir', default=None, help='크기를 비교할 CSV 디렉토리')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if not PYARROW_AVAILABLE:
+        print("pyarrow가 설치되어 있지 않습니다 (pip install pyarrow)")
+        return 1
+
+    if args.command == 'convert':
+        written = convert_csv_dir(args.csv_dir, args.root, args.overwrite)
+        print(f"변환 완료: {len(written)}개 파일")
+        print_info(args.root, args.csv_dir)
+    else:
+        print_info(args.root, args.csv_dir)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
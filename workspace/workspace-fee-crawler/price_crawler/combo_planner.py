@@ -0,0 +1,191 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+조합 계획기 (중복 조합 건너뛰기)
+같은 요금제(family)에서 가입유형/네트워크(variant)만 다른 조합은 결과 테이블이
+동일한 경우가 많습니다. 수집한 테이블의 지문(fingerprint)을 앞선 variant들과 비교해
+학습하고, 중복으로 예측되는 조합은 수집을 미루고 원본 결과를 복사합니다.
+
+- 연속 min_streak회 동일했던 variant만 중복으로 예측
+- 매 실행마다 sample_rate 비율은 예측과 무관하게 다시 수집해 검증
+- 학습 상태는 JSON 파일로 실행 간 유지
+
+작성일: 2025-10-27
+파일명: combo_planner.py
+"""
+
+import json
+import random
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 지문 계산에 사용하는 필드 (가입유형/네트워크/수집시각 등 variant별 필드 제외)
+DEFAULT_FINGERPRINT_FIELDS = (
+    'device_nm', 'date', 'release_price',
+    'public_support_fee', 'additional_support_fee', 'total_price'
+)
+
+
+def _field(row: Any, name: str) -> Any:
+    """dict 또는 dataclass 행에서 필드 값 조회"""
+    if isinstance(row, dict):
+        return row.get(name)
+    return getattr(row, name, None)
+
+
+def fingerprint_rows(rows: Iterable[Any], fields: Iterable[str] = DEFAULT_FINGERPRINT_FIELDS) -> str:
+    """행 목록의 순서 무관 지문 (SHA1)"""
+    fields = tuple(fields)
+    keys = sorted(json.dumps([_field(row, f) for f in fields], ensure_ascii=False, default=str) for row in rows)
+    digest = hashlib.sha1()
+    for key in keys:
+        digest.update(key.encode('utf-8'))
+        digest.update(b'\n')
+    return digest.hexdigest()
+
+
+class CombinationPlanner:
+    """결과 지문 기반 중복 조합 예측기"""
+
+    def __init__(self, carrier: str, state_file: Optional[Path] = None, sample_rate: float = 0.1,
+                 min_streak: int = 2, enabled: bool = True,
+                 fields: Iterable[str] = DEFAULT_FINGERPRINT_FIELDS):
+        """
+        Args:
+            carrier: 통신사 (SK, KT, LG)
+            state_file: 학습 상태 저장 파일 (None이면 저장하지 않음)
+            sample_rate: 중복 예측 조합 중 검증을 위해 다시 수집할 비율
+            min_streak: 중복으로 예측하기 위한 연속 동일 횟수
+            enabled: False면 아무것도 미루지 않음 (지문 학습은 계속)
+            fields: 지문 계산 필드
+        """
+        self.carrier = carrier
+        self.state_file = Path(state_file) if state_file else None
+        self.sample_rate = sample_rate
+        self.min_streak = max(1, min_streak)
+        self.enabled = enabled
+        self.fields = tuple(fields)
+
+        # {family: {variant: {source: 연속 동일 횟수}}}
+        self.streaks: Dict[str, Dict[str, Dict[str, int]]] = {}
+        # 이번 실행의 지문 {family: {variant: fingerprint}}
+        self.fingerprints: Dict[str, Dict[str, str]] = {}
+        # 이번 실행에서 미룬 조합 [(family, variant, source)]
+        self.deferred: List[Tuple[str, str, str]] = []
+        self._deferred_keys = set()
+
+        self._lock = threading.Lock()
+        self.stats = {'deferred': 0, 'sampled': 0, 'confirmed': 0, 'diverged': 0}
+
+        self.load()
+
+    def load(self):
+        """학습 상태 로드"""
+        if not self.state_file or not self.state_file.exists():
+            return
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.streaks = data.get('streaks', {})
+            logger.info(f"조합 계획 상태 로드: {len(self.streaks)}개 요금제 ({self.state_file})")
+        except Exception as e:
+            logger.warning(f"조합 계획 상태 로드 실패: {e}")
+
+    def save(self):
+        """학습 상태 저장 (원자적 교체)"""
+        if not self.state_file:
+            return
+        try:
+            self.state_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.state_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'carrier': self.carrier, 'streaks': self.streaks}, f, ensure_ascii=False, indent=1)
+            temp_file.replace(self.state_file)
+        except Exception as e:
+            logger.warning(f"조합 계획 상태 저장 실패: {e}")
+
+    def should_defer(self, family: str, variant: str, sources: Iterable[str]) -> Optional[str]:
+        """조합 수집을 미룰지 결정
+
+        Args:
+            family: 조합 묶음 키 (예: 요금제 ID)
+            variant: 묶음 안의 조합 키 (예: 네트워크/가입유형)
+            sources: 복사 원본 후보 variant (조합 순서상 앞선 것들)
+
+        Returns:
+            복사 원본 variant (None이면 정상 수집)
+        """
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            learned = self.streaks.get(family, {}).get(variant, {})
+            candidates = [
+                (learned.get(source, 0), source) for source in sources
+                if source != variant and (family, source) not in self._deferred_keys
+            ]
+            if not candidates:
+                return None
+            streak, source = max(candidates, key=lambda c: c[0])
+            if streak < self.min_streak:
+                return None
+
+            # 예측된 중복이라도 일부는 다시 수집해 검증
+            if random.random() < self.sample_rate:
+                self.stats['sampled'] += 1
+                return None
+
+            self.deferred.append((family, variant, source))
+            self._deferred_keys.add((family, variant))
+            self.stats['deferred'] += 1
+            return source
+
+    def record(self, family: str, variant: str, rows: Iterable[Any]):
+        """수집 결과 지문 기록 (수집에 실패한 조합은 기록하지 않음)"""
+        fingerprint = fingerprint_rows(rows, self.fields)
+        with self._lock:
+            self.fingerprints.setdefault(family, {})[variant] = fingerprint
+
+    def unresolved(self) -> List[Tuple[str, str, str]]:
+        """원본 조합 결과가 없어 복사할 수 없는 미룬 조합 (호출 측에서 직접 수집 필요)"""
+        with self._lock:
+            return [
+                (family, variant, source) for family, variant, source in self.deferred
+                if source not in self.fingerprints.get(family, {})
+            ]
+
+    def resolved(self) -> List[Tuple[str, str, str]]:
+        """원본 결과를 복사하면 되는 미룬 조합"""
+        with self._lock:
+            return [
+                (family, variant, source) for family, variant, source in self.deferred
+                if source in self.fingerprints.get(family, {})
+            ]
+
+    def finish(self):
+        """이번 실행에서 수집한 조합끼리 지문을 비교해 학습 후 상태 저장"""
+        with self._lock:
+            for family, variants in self.fingerprints.items():
+                family_streaks = self.streaks.setdefault(family, {})
+                for variant, fingerprint in variants.items():
+                    variant_streaks = family_streaks.setdefault(variant, {})
+                    for source, source_fingerprint in variants.items():
+                        if source == variant:
+                            continue
+                        if fingerprint == source_fingerprint:
+                            variant_streaks[source] = variant_streaks.get(source, 0) + 1
+                            self.stats['confirmed'] += 1
+                        else:
+                            if variant_streaks.get(source, 0) >= self.min_streak:
+                                logger.info(f"중복 예측 해제: {family} / {variant} ≠ {source}")
+                            variant_streaks[source] = 0
+                            self.stats['diverged'] += 1
+
+        self.save()
+        logger.info(f"[{self.carrier}] 조합 계획 - 미룸 {self.stats['deferred']}개, 검증 수집 {self.stats['sampled']}개, "
+                    f"동일 {self.stats['confirmed']}쌍, 상이 {self.stats['diverged']}쌍")
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+증분 크롤링 인덱스
+(요금제, 가입유형, 네트워크, 기기) 별로 마지막으로 본 공시일자와 지원금을 실행 간 유지합니다.
+
+- 세 통신사 모두 최근 공시/변경 순으로 정렬해 조회하므로,
+  한 페이지의 모든 행이 이전과 같으면 이후 페이지도 변경이 없다고 보고 페이지 이동을 멈춤
+- 멈춘 조합의 나머지 행은 이전 스냅샷에서 가져와 결과를 채움
+- 인덱스는 매 실행 종료 시 이번 결과로 갱신 (증분 모드가 아니어도 갱신)
+- 첫 페이지/상위 기기만 수집한 실행(partial)은 조합 전체가 아니라 수집된 기기만 교체
+
+작성일: 2025-10-27
+파일명: crawl_index.py
+"""
+
+import json
+import logging
+import threading
+from dataclasses import asdict, is_dataclass
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 변경 여부 판단 필드
+COMPARE_FIELDS = ('date', 'release_price', 'public_support_fee', 'additional_support_fee')
+
+
+def row_to_dict(row: Any) -> Dict[str, Any]:
+    """dict 또는 dataclass 행을 dict로 변환"""
+    if isinstance(row, dict):
+        return dict(row)
+    if is_dataclass(row):
+        return asdict(row)
+    return dict(vars(row))
+
+
+def combo_key(plan_name: str, scrb_type_name: str, network_type: str) -> str:
+    """조합 키 (요금제|가입유형|네트워크)"""
+    return f"{plan_name}|{scrb_type_name}|{network_type}"
+
+
+class CrawlIndex:
+    """실행 간 유지되는 공시 행 인덱스"""
+
+    def __init__(self, carrier: str, index_file: Optional[Path] = None):
+        """
+        Args:
+            carrier: 통신사 (SK, KT, LG)
+            index_file: 인덱스 저장 파일 (JSON)
+        """
+        self.carrier = carrier
+        self.index_file = Path(index_file) if index_file else None
+
+        # {조합 키: {기기명: [행 dict, ...]}}
+        self.entries: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self.updated_at = None
+
+        self._lock = threading.Lock()
+        self.stats = {'pages_skipped': 0, 'rows_reused': 0}
+
+        self.load()
+
+    def load(self):
+        """인덱스 로드"""
+        if not self.index_file or not self.index_file.exists():
+            return
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = data.get('entries', {})
+            self.updated_at = data.get('updated_at')
+            logger.info(f"[{self.carrier}] 크롤링 인덱스 로드: {len(self.entries)}개 조합 (갱신: {self.updated_at})")
+        except Exception as e:
+            logger.warning(f"크롤링 인덱스 로드 실패: {e}")
+
+    def save(self):
+        """인덱스 저장 (원자적 교체)"""
+        if not self.index_file:
+            return
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.index_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'carrier': self.carrier,
+                    'updated_at': self.updated_at,
+                    'entries': self.entries
+                }, f, ensure_ascii=False)
+            temp_file.replace(self.index_file)
+            logger.info(f"[{self.carrier}] 크롤링 인덱스 저장: {len(self.entries)}개 조합")
+        except Exception as e:
+            logger.warning(f"크롤링 인덱스 저장 실패: {e}")
+
+    def has(self, key: str) -> bool:
+        """이전 스냅샷 존재 여부"""
+        return key in self.entries
+
+    def row_unchanged(self, key: str, row: Any) -> bool:
+        """이전 실행과 공시일자/금액이 같은 행인지"""
+        row = row_to_dict(row)
+        previous = self.entries.get(key, {}).get(row.get('device_nm', ''), [])
+        return any(all(prev.get(f) == row.get(f) for f in COMPARE_FIELDS) for prev in previous)
+
+    def page_unchanged(self, key: str, rows: Iterable[Any]) -> bool:
+        """페이지의 모든 행이 이전과 같은지 (빈 페이지는 False)"""
+        rows = list(rows)
+        if not rows or key not in self.entries:
+            return False
+        unchanged = all(self.row_unchanged(key, row) for row in rows)
+        if unchanged:
+            with self._lock:
+                self.stats['pages_skipped'] += 1
+        return unchanged
+
+    def snapshot_rows(self, key: str, exclude_devices: Iterable[str] = ()) -> List[Dict[str, Any]]:
+        """이전 스냅샷의 행 (이번에 이미 수집한 기기 제외)"""
+        exclude = set(exclude_devices)
+        rows = [
+            dict(row)
+            for device_nm, device_rows in self.entries.get(key, {}).items()
+            if device_nm not in exclude
+            for row in device_rows
+        ]
+        with self._lock:
+            self.stats['rows_reused'] += len(rows)
+        return rows
+
+    def update(self, rows: Iterable[Any], partial: bool = False):
+        """이번 결과로 인덱스 갱신 (이번에 수집된 조합만 교체, 나머지는 유지)
+
+        Args:
+            partial: 조합의 일부 기기만 수집한 실행 - 수집된 기기만 교체하고 나머지 기기는 유지
+        """
+        fresh: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        if hasattr(rows, 'dicts'):
+            # RowStore: 행 객체를 거치지 않고 dict로 바로 읽기
+            rows = rows.dicts()
+        for row in rows:
+            row = row_to_dict(row)
+            key = combo_key(row.get('plan_name', ''), row.get('scrb_type_name', ''), row.get('network_type', ''))
+            fresh.setdefault(key, {}).setdefault(row.get('device_nm', ''), []).append(row)
+
+        with self._lock:
+            if partial:
+                for key, devices in fresh.items():
+                    self.entries.setdefault(key, {}).update(devices)
+            else:
+                self.entries.update(fresh)
+            self.updated_at = datetime.now(ZoneInfo('Asia/Seoul')).isoformat()
+
+    def summary(self) -> str:
+        """증분 모드 통계 문자열"""
+        return f"변경 없는 페이지에서 중단 {self.stats['pages_skipped']}회, 스냅샷 재사용 {self.stats['rows_reused']}개 행"
@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+계층형 크롤링 프로필 (hot / full)
+자주 실행하는 가벼운 hot 크롤링과 야간 full 크롤링을 같은 실행기로 돌리고,
+hot 결과는 통신사별 최신 스냅샷에 병합해 주력 기기 가격 변경이 한 시간 안에 시트에 반영되도록 합니다.
+
+- full: 기존 전체 크롤링 (crawl_scheduler로 KT/SK/LG 동시 실행)
+- hot: 요금제/조합별 첫 페이지에서 최신 공시 상위 N개 기기만 수집 (세 통신사 모두)
+  조합 계획기/증분 스냅샷/Parquet 비활성화, 체크포인트는 '_hot' 파일로 분리해 야간 크롤링 재개에 영향 없음
+- 병합: 통신사별 최신 raw CSV(merge_and_upload가 읽는 스냅샷)에서
+  (통신사, 가입유형, 네트워크, 요금제, 기기) 키가 hot 결과에 있는 행은 hot 행으로 교체, 새 키는 추가
+- 병합 결과는 hot 실행이 저장한 raw CSV 자리에 기록 (raw 폴더에는 항상 전체 스냅샷만 존재),
+  hot 원본은 raw/hot/ 에 보관
+- 기준 스냅샷이 없으면 (full 실행 전) hot 결과는 raw/hot/ 에만 보관
+- --delta: 저장된(hot은 병합된) 스냅샷의 직전 스냅샷 대비 변경분을 raw/delta/ 에 저장 (snapshot_diff.py)
+
+사용법:
+    python3 price_crawler/crawl_profiles.py --profile hot --delta             # 매시간 (변경분 포함)
+    python3 price_crawler/crawl_profiles.py --profile full                    # 야간
+    python3 price_crawler/crawl_profiles.py --profile hot --carriers sk lg --max-devices 20
+    python3 price_crawler/crawl_profiles.py --merge-only data/raw/hot/sk_20251027_100512.csv
+
+    # crontab 예시
+    0 7-23 * * *  cd /path/to/workspace-fee-crawler && python3 price_crawler/crawl_profiles.py --profile hot
+    30 2 * * *    cd /path/to/workspace-fee-crawler && python3 price_crawler/crawl_profiles.py --profile full
+
+작성일: 2025-10-27
+파일명: crawl_profiles.py
+"""
+
+import sys
+import logging
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from price_crawler.crawl_scheduler import BrowserBudget, CrawlScheduler, CARRIER_CRAWLERS
+from price_crawler.snapshot_diff import (KEY_COLUMNS, snapshot_file_key, list_snapshot_files, snapshot_files_at,
+                                         row_keys, load_snapshot, write_delta)
+
+logger = logging.getLogger(__name__)
+
+# hot 원본 보관 폴더 (raw 폴더 아래, merge_and_upload는 raw/*.csv만 읽음)
+HOT_DIR_NAME = 'hot'
+
+# hot 프로필 기본 기기 수 (조합별, 최신 공시 순)
+DEFAULT_HOT_DEVICES = 10
+
+PROFILES = {
+    'hot': {
+        'description': '조합별 첫 페이지, 최신 공시 상위 기기만 수집 후 최신 스냅샷에 병합',
+        'merge': True,
+        'config': {
+            'first_page_only': True,
+            'max_devices': DEFAULT_HOT_DEVICES,
+            'combo_planner': False,  # 일부 결과로 중복 예측 상태를 갱신하지 않음
+            'incremental': False,  # 첫 페이지만 보므로 스냅샷 재사용 불필요
+            'resume': False,
+            'checkpoint_tag': 'hot',  # 야간 크롤링 체크포인트와 분리
+            'save_parquet': False,  # 분할 저장소에는 전체 수집 결과만
+            'save_delta': False,  # 변경분은 병합 스냅샷 기준으로 실행기에서 생성
+            'save_formats': ['csv']
+        }
+    },
+    'full': {
+        'description': '전체 요금제/기기 수집',
+        'merge': False,
+        'config': {}
+    }
+}
+
+
+def profile_config(profile: str, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """프로필 크롤러 설정 (프로필 기본값 + 덮어쓰기)"""
+    if profile not in PROFILES:
+        raise ValueError(f"알 수 없는 프로필: {profile} (가능: {', '.join(PROFILES)})")
+    config = dict(PROFILES[profile]['config'])
+    config.update(overrides or {})
+    return config
+
+
+def latest_snapshot_files(raw_dir: Path, carrier: str, exclude: Optional[Path] = None) -> List[Path]:
+    """통신사 최신 스냅샷 파일 (merge_and_upload와 같은 선택 규칙)
+
+    KT는 최신 날짜의 모든 파일, SK/LG는 최신 파일 하나
+    """
+    files = [f for f in list_snapshot_files(raw_dir, carrier)
+             if exclude is None or f.resolve() != Path(exclude).resolve()]
+    if not files:
+        return []
+    return [f for f in snapshot_files_at(raw_dir, carrier, files[-1]) if f in files]
+
+
+def merge_hot_rows(snapshot: pd.DataFrame, hot: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """hot 결과를 스냅샷에 병합
+
+    hot 결과에 있는 키는 스냅샷 행을 모두 hot 행으로 교체 (기기가 여러 행이어도 함께 교체),
+    hot 결과에 없는 스냅샷 행은 그대로 유지
+
+    Returns:
+        (병합 결과, {'replaced': 교체된 스냅샷 행, 'added': 새 키 행, 'kept': 유지된 행})
+    """
+    missing = [col for col in KEY_COLUMNS if col not in snapshot.columns or col not in hot.columns]
+    if missing:
+        raise ValueError(f"스냅샷/hot 결과에 키 컬럼 없음: {', '.join(missing)}")
+
+    hot_keys = set(row_keys(hot))
+    snapshot_keys = row_keys(snapshot)
+    replaced = [key in hot_keys for key in snapshot_keys]
+    kept = snapshot[[not flag for flag in replaced]]
+
+    known = set(snapshot_keys)
+    stats = {
+        'replaced': sum(replaced),
+        'added': sum(1 for key in row_keys(hot) if key not in known),
+        'kept': len(kept)
+    }
+
+    # 스냅샷 컬럼 순서 유지 (hot에만 있는 컬럼은 뒤에)
+    columns = list(snapshot.columns) + [col for col in hot.columns if col not in snapshot.columns]
+    merged = pd.concat([kept, hot], ignore_index=True).reindex(columns=columns)
+    return merged, stats
+
+
+def merge_hot_file(hot_file: Path) -> Optional[Dict[str, Any]]:
+    """hot 실행이 저장한 raw CSV를 최신 스냅샷과 병합
+
+    hot 원본은 raw/hot/ 으로 옮기고, 같은 파일명으로 병합 스냅샷을 raw 폴더에 기록
+
+    Returns:
+        병합 정보 dict, 병합하지 않았으면 None
+    """
+    hot_file = Path(hot_file)
+    file_key = snapshot_file_key(hot_file)
+    if not file_key or not hot_file.exists():
+        logger.warning(f"hot 결과 파일이 아님: {hot_file}")
+        return None
+
+    carrier = file_key[0]
+    # raw/hot/ 안의 파일을 다시 병합하는 경우 raw 폴더 기준
+    raw_dir = hot_file.parent.parent if hot_file.parent.name == HOT_DIR_NAME else hot_file.parent
+    hot_dir = raw_dir / HOT_DIR_NAME
+    target = raw_dir / hot_file.name
+
+    base_files = latest_snapshot_files(raw_dir, carrier, exclude=target)
+    hot = pd.read_csv(hot_file, encoding='utf-8-sig')
+
+    # hot 원본 보관
+    hot_dir.mkdir(parents=True, exist_ok=True)
+    archived = hot_dir / hot_file.name
+    if hot_file.resolve() != archived.resolve():
+        hot_file.replace(archived)
+
+    if not base_files:
+        logger.warning(f"[{carrier.upper()}] 기준 스냅샷 없음 - hot 결과는 {archived}에만 보관 (full 실행 필요)")
+        return None
+
+    merged, stats = merge_hot_rows(load_snapshot(base_files), hot)
+
+    temp_file = target.with_suffix('.tmp')
+    merged.to_csv(temp_file, index=False, encoding='utf-8-sig')
+    temp_file.replace(target)
+
+    info = {
+        'carrier': carrier,
+        'file': str(target),
+        'hot_file': str(archived),
+        'base_files': [str(f) for f in base_files],
+        'rows': len(merged),
+        **stats
+    }
+    logger.info(f"[{carrier.upper()}] hot 병합: 기준 {', '.join(f.name for f in base_files)} → {target.name} "
+                f"({len(merged):,}행, 교체 {stats['replaced']:,} / 추가 {stats['added']:,} / 유지 {stats['kept']:,})")
+    return info
+
+
+def run_profile(profile: str, carriers: List[str], overrides: Optional[Dict[str, Any]] = None,
+                max_browsers: int = 6, max_memory_mb: int = 0, delta: bool = False) -> Dict[str, Dict[str, Any]]:
+    """프로필로 통신사 크롤러 동시 실행 (hot이면 결과를 최신 스냅샷에 병합)
+
+    Args:
+        delta: 저장된(hot은 병합된) 스냅샷의 직전 스냅샷 대비 변경분 저장
+
+    Returns:
+        {통신사: {'files', 'elapsed', 'error', 'merged', 'deltas'}}
+    """
+    budget = BrowserBudget(max_browsers=max_browsers, max_memory_mb=max_memory_mb)
+    scheduler = CrawlScheduler(budget)
+    config = profile_config(profile, overrides)
+    for carrier in carriers:
+        scheduler.add(carrier, config)
+
+    print(f"[{profile}] {PROFILES[profile]['description']}: {', '.join(c.upper() for c in carriers)}")
+    results = scheduler.run()
+
+    for carrier, result in results.items():
+        result['merged'] = []
+        result['deltas'] = []
+        snapshots = [file for file in result['files'] if snapshot_file_key(file)]
+        if PROFILES[profile]['merge']:
+            for file in snapshots:
+                try:
+                    info = merge_hot_file(Path(file))
+                except Exception as e:
+                    logger.error(f"[{carrier.upper()}] hot 병합 실패: {e}")
+                    continue
+                if info:
+                    result['merged'].append(info)
+            snapshots = [info['file'] for info in result['merged']]
+
+        if not delta:
+            continue
+        for file in snapshots:
+            try:
+                output = write_delta(file)
+            except Exception as e:
+                logger.error(f"[{carrier.upper()}] 변경분 저장 실패: {e}")
+                continue
+            if output:
+                result['deltas'].append(str(output))
+    return results
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(
+        description='계층형 크롤링 프로필 (hot: 최신 기기 빠른 갱신, full: 전체 수집)',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--profile', choices=list(PROFILES), default='hot',
+                        help='실행 프로필 (기본: hot)')
+    parser.add_argument('--carriers', nargs='+', choices=list(CARRIER_CRAWLERS), default=['kt', 'sk', 'lg'],
+                        help='실행할 통신사 (기본: kt sk lg)')
+    parser.add_argument('--max-devices', type=int, default=None,
+                        help=f'hot 프로필 조합별 최대 기기 수 (기본: {DEFAULT_HOT_DEVICES})')
+    parser.add_argument('--max-browsers', type=int, default=6,
+                        help='전체 동시 Chrome 수 (기본: 6)')
+    parser.add_argument('--max-memory-mb', type=int, default=0,
+                        help='전체 Chrome 메모리 한도 MB (0=확인 안함)')
+    parser.add_argument('--show-browser', action='store_true',
+                        help='브라우저 표시')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='동시 작업 수/요청 간 지연 자동 조절')
+    parser.add_argument('--parquet', action='store_true',
+                        help='CSV와 함께 Parquet 저장 (full 프로필만, pyarrow 필요)')
+    parser.add_argument('--delta', action='store_true',
+                        help='직전 스냅샷 대비 변경분(추가/변경/삭제)을 raw/delta/에 저장')
+    parser.add_argument('--merge-only', type=str, default=None, metavar='CSV',
+                        help='크롤링 없이 저장된 hot CSV를 최신 스냅샷에 병합')
+
+    args = parser.parse_args()
+
+    if args.merge_only:
+        info = merge_hot_file(Path(args.merge_only))
+        if info:
+            print(f"병합 스냅샷: {info['file']} ({info['rows']:,}행, 교체 {info['replaced']:,} / 추가 {info['added']:,})")
+            if args.delta:
+                write_delta(info['file'])
+        sys.exit(0 if info else 1)
+
+    overrides = {
+        'headless': not args.show_browser,
+        'show_browser': args.show_browser,
+        'adaptive_concurrency': args.adaptive
+    }
+    if args.profile == 'hot' and args.max_devices is not None:
+        overrides['max_devices'] = args.max_devices
+    if args.profile == 'full':
+        overrides['save_parquet'] = args.parquet
+
+    results = run_profile(args.profile, args.carriers, overrides,
+                          max_browsers=args.max_browsers, max_memory_mb=args.max_memory_mb, delta=args.delta)
+
+    for carrier, result in results.items():
+        files = [info['file'] for info in result['merged']] or result['files']
+        for file in files + result['deltas']:
+            print(f"  - [{carrier.upper()}] {file}")
+
+    sys.exit(0 if any(r['files'] for r in results.values()) else 1)
+
+
+if __name__ == '__main__':
+    main()
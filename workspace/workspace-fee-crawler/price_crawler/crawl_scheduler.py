@@ -0,0 +1,447 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+통신사 크롤러 동시 실행 스케줄러
+KT/SK/LG 크롤러를 한 프로세스에서 동시에 실행하고, 전체 Chrome 수와 메모리를 하나의 예산으로 관리합니다.
+
+- 세 통신사 사이트는 서로 요청 제한에 영향을 주지 않으므로 전체 소요 시간은 가장 느린 통신사 수준
+- BrowserBudget: 전체 동시 Chrome 수 / 메모리 한도, 통신사별 우선순위와 가중치 기반 공정 분배
+- 크롤러 코드는 그대로 두고 드라이버 생성 함수만 예산 대여/반납으로 감쌈 (driver.quit 시 반납)
+- SK async 엔진의 공유 Chrome도 엔진 시작/종료에 맞춰 1개로 계산 (메모리 한도 측정에는 미포함)
+- 로그는 통신사별 로그 파일로 분리 (크롤러 모듈의 import 시 basicConfig는 처음 import한 통신사 파일만 적용됨)
+
+사용법:
+    python3 price_crawler/crawl_scheduler.py                       # KT/SK/LG 동시 실행
+    python3 price_crawler/crawl_scheduler.py --max-browsers 4 --max-memory-mb 6000
+    python3 price_crawler/crawl_scheduler.py --carriers kt lg --priority lg=0 kt=1 --weight lg=2
+
+작성일: 2025-10-27
+파일명: crawl_scheduler.py
+"""
+
+import os
+import sys
+import time
+import logging
+import argparse
+import functools
+import importlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from price_crawler.driver_pool import driver_memory_mb, PSUTIL_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+# 통신사별 크롤러 (모듈, 클래스, 드라이버 생성 메서드)
+# SK는 create_driver 외에 setup_driver를 직접 호출하는 경로가 있어 setup_driver를 감쌈
+CARRIER_CRAWLERS = {
+    'kt': ('price_crawler.kt_crawler', 'KTCrawler', 'create_driver'),
+    'sk': ('price_crawler.sk_crawler', 'TworldCrawler', 'setup_driver'),
+    'lg': ('price_crawler.lg_crawler', 'LGUPlusCrawler', 'create_driver'),
+}
+
+# 드라이버 생성 함수 밖에서 Chrome을 직접 띄우는 경로 (시작 메서드, 종료 메서드, 사용 조건 설정)
+# SK async 엔진은 Chrome 하나에 컨텍스트 여러 개 - 예산에는 Chrome 1개로 계산
+CARRIER_ENGINES = {
+    'sk': ('_open_browser_engine', '_close_browser_engine', ('browser_engine', 'async')),
+}
+
+# 통신사별 로그 파일 형식 (크롤러 모듈과 동일)
+LOG_FORMAT = '%(asctime)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s'
+
+# 기본 우선순위 (작을수록 먼저) - 가장 오래 걸리는 KT부터
+DEFAULT_PRIORITY = {'kt': 0, 'sk': 1, 'lg': 2}
+
+
+class BrowserBudget:
+    """여러 크롤러가 공유하는 Chrome 동시 실행 예산"""
+
+    def __init__(self, max_browsers: int = 6, max_memory_mb: int = 0,
+                 acquire_timeout: float = 600, memory_check_interval: float = 2.0):
+        """
+        Args:
+            max_browsers: 전체 동시 Chrome 수
+            max_memory_mb: 실행 중인 Chrome 프로세스 RSS 합계 한도 (0 = 확인 안함, psutil 필요)
+            acquire_timeout: 대여 대기 최대 시간(초) - 초과 시 경고 후 예산을 넘겨 실행 (교착 방지)
+            memory_check_interval: 메모리 재측정 간격(초)
+        """
+        self.max_browsers = max(1, max_browsers)
+        self.max_memory_mb = max_memory_mb
+        self.acquire_timeout = acquire_timeout
+        self.memory_check_interval = memory_check_interval
+
+        self._cond = threading.Condition()
+        self._carriers: Dict[str, Dict[str, Any]] = {}
+        self._drivers: Dict[int, Any] = {}  # id(driver) -> (carrier, driver)
+        self._memory_mb = 0.0
+        self._memory_checked = 0.0
+        self.peak_browsers = 0
+
+        if max_memory_mb and not PSUTIL_AVAILABLE:
+            logger.warning("psutil 미설치 - 브라우저 메모리 한도 비활성화 (pip install psutil)")
+
+    def register(self, carrier: str, priority: int = 0, weight: float = 1.0):
+        """통신사 등록 (우선순위: 작을수록 먼저, 가중치: 경합 시 점유 비율)"""
+        with self._cond:
+            self._carriers[carrier] = {
+                'priority': priority,
+                'weight': max(weight, 0.01),
+                'in_use': 0,
+                'waiting': 0,
+                'granted': 0,
+                'overflow': 0,
+                'wait_time': 0.0,
+            }
+
+    # ------------------------------------------------------------------
+    # 대여/반납
+
+    def acquire(self, carrier: str):
+        """Chrome 1개 슬롯 대여 (예산이 빌 때까지 대기)"""
+        start = time.time()
+        deadline = start + self.acquire_timeout
+
+        with self._cond:
+            state = self._carriers[carrier]
+            state['waiting'] += 1
+            try:
+                while not self._grantable(carrier):
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        logger.warning(f"[{carrier.upper()}] 브라우저 예산 대기 {self.acquire_timeout:.0f}초 초과 - 예산을 넘겨 실행")
+                        state['overflow'] += 1
+                        break
+                    # 메모리는 반납 없이도 줄어들 수 있으므로 주기적으로 재확인
+                    self._cond.wait(min(remaining, self.memory_check_interval))
+
+                state['in_use'] += 1
+                state['granted'] += 1
+                state['wait_time'] += time.time() - start
+                self.peak_browsers = max(self.peak_browsers, self._total_in_use())
+            finally:
+                state['waiting'] -= 1
+                self._cond.notify_all()
+
+    def release(self, carrier: str):
+        """슬롯 반납"""
+        with self._cond:
+            state = self._carriers.get(carrier)
+            if state and state['in_use'] > 0:
+                state['in_use'] -= 1
+            self._cond.notify_all()
+
+    def _total_in_use(self) -> int:
+        return sum(s['in_use'] for s in self._carriers.values())
+
+    def _grantable(self, carrier: str) -> bool:
+        """carrier에 지금 슬롯을 줄 수 있는지 (호출 시 락 보유)"""
+        total = self._total_in_use()
+        if total >= self.max_browsers:
+            return False
+
+        # 한 개도 실행 중이 아니면 메모리와 관계없이 허용
+        if total > 0 and self._memory_exceeded():
+            return False
+
+        # 공정 분배: 대기 중인 통신사 중 (점유 수 / 가중치)가 가장 작은 곳, 같으면 우선순위 순
+        waiting = [name for name, s in self._carriers.items() if s['waiting'] > 0]
+        best = min(waiting, key=lambda name: (
+            self._carriers[name]['in_use'] / self._carriers[name]['weight'],
+            self._carriers[name]['priority']
+        ))
+        return best == carrier
+
+    def _memory_exceeded(self) -> bool:
+        """실행 중인 Chrome RSS 합계가 한도를 넘었는지 (측정값은 memory_check_interval 동안 재사용)"""
+        if not self.max_memory_mb or not PSUTIL_AVAILABLE:
+            return False
+
+        now = time.time()
+        if now - self._memory_checked >= self.memory_check_interval:
+            self._memory_mb = sum(driver_memory_mb(driver) for _, driver in self._drivers.values())
+            self._memory_checked = now
+        return self._memory_mb >= self.max_memory_mb
+
+    # ------------------------------------------------------------------
+    # 드라이버 생성 함수 감싸기
+
+    def wrap_factory(self, carrier: str, factory: Callable) -> Callable:
+        """드라이버 생성 전 슬롯을 대여하고, driver.quit() 시 반납하도록 감싼 생성 함수"""
+
+        @functools.wraps(factory)
+        def create(*args, **kwargs):
+            self.acquire(carrier)
+            try:
+                driver = factory(*args, **kwargs)
+            except Exception:
+                self.release(carrier)
+                raise
+
+            if driver is None:
+                self.release(carrier)
+                return None
+
+            self._track(carrier, driver)
+            return driver
+
+        return create
+
+    def wrap_engine(self, carrier: str, open_engine: Callable, close_engine: Callable) -> tuple:
+        """공유 브라우저 엔진 시작/종료 함수 감싸기 - 시작 전 슬롯 대여, 종료(또는 시작 실패) 시 반납
+
+        시작 함수는 엔진 사용 여부(bool)를 반환해야 함
+        """
+        held = threading.Event()
+
+        @functools.wraps(open_engine)
+        def open_(*args, **kwargs):
+            self.acquire(carrier)
+            try:
+                opened = open_engine(*args, **kwargs)
+            except Exception:
+                self.release(carrier)
+                raise
+            if opened:
+                held.set()
+            else:
+                self.release(carrier)
+            return opened
+
+        @functools.wraps(close_engine)
+        def close(*args, **kwargs):
+            try:
+                return close_engine(*args, **kwargs)
+            finally:
+                if held.is_set():
+                    held.clear()
+                    self.release(carrier)
+
+        return open_, close
+
+    def _track(self, carrier: str, driver):
+        """driver.quit()이 슬롯을 반납하도록 연결"""
+        key = id(driver)
+        with self._cond:
+            self._drivers[key] = (carrier, driver)
+
+        original_quit = driver.quit
+
+        def quit(*args, **kwargs):
+            try:
+                return original_quit(*args, **kwargs)
+            finally:
+                self._untrack(key)
+
+        driver.quit = quit
+
+    def _untrack(self, key: int):
+        with self._cond:
+            entry = self._drivers.pop(key, None)
+        if entry is not None:
+            self.release(entry[0])
+
+    def release_all(self, carrier: str):
+        """크롤러 종료 후 남은 슬롯 정리 (quit하지 않은 드라이버 포함)"""
+        with self._cond:
+            keys = [key for key, (name, _) in self._drivers.items() if name == carrier]
+            for key in keys:
+                self._drivers.pop(key, None)
+            state = self._carriers.get(carrier)
+            if state:
+                state['in_use'] = 0
+            self._cond.notify_all()
+        if keys:
+            logger.debug(f"[{carrier.upper()}] 종료되지 않은 드라이버 {len(keys)}개 슬롯 회수")
+
+    def summary(self) -> str:
+        """예산 사용 통계 문자열"""
+        with self._cond:
+            parts = [
+                f"{name.upper()} {s['granted']}회 (대기 {s['wait_time']:.0f}초"
+                + (f", 초과 {s['overflow']}회" if s['overflow'] else "") + ")"
+                for name, s in self._carriers.items()
+            ]
+        return f"최대 동시 브라우저 {self.peak_browsers}/{self.max_browsers}개 - " + ', '.join(parts)
+
+
+class CrawlScheduler:
+    """여러 통신사 크롤러를 BrowserBudget 아래에서 동시에 실행"""
+
+    def __init__(self, budget: BrowserBudget):
+        self.budget = budget
+        self.jobs: List[Dict[str, Any]] = []
+
+    def add(self, carrier: str, config: Optional[Dict[str, Any]] = None,
+            priority: Optional[int] = None, weight: float = 1.0):
+        """크롤러 작업 추가"""
+        if carrier not in CARRIER_CRAWLERS:
+            raise ValueError(f"지원하지 않는 통신사: {carrier}")
+        priority = DEFAULT_PRIORITY.get(carrier, 9) if priority is None else priority
+        self.budget.register(carrier, priority=priority, weight=weight)
+        self.jobs.append({'carrier': carrier, 'config': dict(config or {}), 'priority': priority})
+
+    def _run_job(self, job: Dict[str, Any]) -> Dict[str, Any]:
+        """크롤러 하나 실행"""
+        carrier = job['carrier']
+        module_name, class_name, factory_name = CARRIER_CRAWLERS[carrier]
+        start = time.time()
+        result = {'carrier': carrier, 'files': [], 'elapsed': 0.0, 'error': None}
+
+        try:
+            crawler_class = getattr(importlib.import_module(module_name), class_name)
+            crawler = crawler_class(job['config'])
+            setattr(crawler, factory_name, self.budget.wrap_factory(carrier, getattr(crawler, factory_name)))
+            if carrier in CARRIER_ENGINES:
+                open_name, close_name, (key, value) = CARRIER_ENGINES[carrier]
+                if crawler.config.get(key) == value:
+                    open_engine, close_engine = self.budget.wrap_engine(
+                        carrier, getattr(crawler, open_name), getattr(crawler, close_name))
+                    setattr(crawler, open_name, open_engine)
+                    setattr(crawler, close_name, close_engine)
+            result['files'] = crawler.run() or []
+        except Exception as e:
+            logger.error(f"[{carrier.upper()}] 크롤링 실패: {e}")
+            result['error'] = str(e)
+        finally:
+            self.budget.release_all(carrier)
+            result['elapsed'] = time.time() - start
+
+        print(f"{'✓' if not result['error'] else '✗'} {carrier.upper()} 크롤링 종료: "
+              f"{len(result['files'])}개 파일, {result['elapsed'] / 60:.1f}분")
+        return result
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """모든 크롤러 동시 실행 (우선순위 순으로 시작)
+
+        Returns:
+            {통신사: {'files', 'elapsed', 'error'}}
+        """
+        jobs = sorted(self.jobs, key=lambda job: job['priority'])
+        # 크롤러 모듈을 먼저 import해 로그 설정 후 실행
+        split_carrier_logs([CARRIER_CRAWLERS[job['carrier']][0] for job in jobs])
+        start = time.time()
+
+        with ThreadPoolExecutor(max_workers=max(1, len(jobs)), thread_name_prefix='crawl') as executor:
+            futures = [executor.submit(self._run_job, job) for job in jobs]
+            results = {future.result()['carrier']: future.result() for future in futures}
+
+        wall = time.time() - start
+        sequential = sum(r['elapsed'] for r in results.values())
+        print(f"\n전체 소요 시간: {wall / 60:.1f}분 (순차 실행 시 약 {sequential / 60:.1f}분)")
+        print(f"브라우저 예산: {self.budget.summary()}")
+        return results
+
+
+def split_carrier_logs(module_names: List[str]):
+    """크롤러 모듈 로거마다 자기 통신사 로그 파일 핸들러 연결
+
+    크롤러 모듈은 import 시 basicConfig로 루트 로거에 자기 로그 파일을 연결하는데,
+    basicConfig는 처음 한 번만 적용되므로 나머지 통신사 로그가 첫 통신사 파일에 섞임.
+    루트 로거의 통신사 로그 파일 핸들러는 제거하고 (콘솔 출력은 유지) 모듈 로거에 각각 연결.
+    공통 모듈(crawl_index 등)의 로그는 루트 로거(콘솔)로만 출력됨.
+    """
+    modules = [importlib.import_module(name) for name in module_names]
+    log_files = {os.path.abspath(module.log_file): module for module in modules}
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, logging.FileHandler) and handler.baseFilename in log_files:
+            root.removeHandler(handler)
+            handler.close()
+    if not root.handlers:
+        root.addHandler(logging.StreamHandler())
+
+    for path, module in log_files.items():
+        module_logger = logging.getLogger(module.__name__)
+        if any(isinstance(h, logging.FileHandler) and h.baseFilename == path for h in module_logger.handlers):
+            continue
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        module_logger.addHandler(handler)
+        module_logger.setLevel(logging.INFO)
+
+
+def _parse_mapping(items: Optional[List[str]], cast: Callable) -> Dict[str, Any]:
+    """['kt=0', 'sk=1'] 형식 인자를 dict로 변환"""
+    mapping = {}
+    for item in items or []:
+        key, _, value = item.partition('=')
+        if not value:
+            raise argparse.ArgumentTypeError(f"'통신사=값' 형식이 아닙니다: {item}")
+        mapping[key.strip().lower()] = cast(value)
+    return mapping
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(
+        description='KT/SK/LG 크롤러 동시 실행',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--carriers', nargs='+', choices=list(CARRIER_CRAWLERS), default=['kt', 'sk', 'lg'],
+                        help='실행할 통신사 (기본: kt sk lg)')
+    parser.add_argument('--max-browsers', type=int, default=6,
+                        help='전체 동시 Chrome 수 (기본: 6)')
+    parser.add_argument('--max-memory-mb', type=int, default=0,
+                        help='전체 Chrome 메모리 한도 MB (0=확인 안함)')
+    parser.add_argument('--priority', nargs='+', metavar='CARRIER=N',
+                        help='통신사별 우선순위 (작을수록 먼저, 기본: kt=0 sk=1 lg=2)')
+    parser.add_argument('--weight', nargs='+', metavar='CARRIER=W',
+                        help='통신사별 브라우저 분배 가중치 (기본: 1)')
+    parser.add_argument('--workers', nargs='+', metavar='CARRIER=N',
+                        help='통신사별 워커 수 (예: sk=3 lg=3)')
+    parser.add_argument('--show-browser', action='store_true',
+                        help='브라우저 표시')
+    parser.add_argument('--resume', action='store_true',
+                        help='체크포인트에서 재개')
+    parser.add_argument('--incremental', action='store_true',
+                        help='증분 모드 (변경 없는 페이지 이후는 이전 결과 재사용)')
+    parser.add_argument('--refresh-plans', action='store_true',
+                        help='요금제 카탈로그를 무시하고 요금제 목록 전체 다시 열거')
+    parser.add_argument('--shared-service', action='store_true',
+                        help='chromedriver Service 하나를 모든 통신사/드라이버가 공유')
+    parser.add_argument('--record-fixtures', type=str, default=None, metavar='DIR',
+                        help='페이지/XHR 응답을 픽스처 코퍼스로 기록')
+    parser.add_argument('--replay-fixtures', type=str, default=None, metavar='DIR_OR_URL',
+                        help='라이브 사이트 대신 픽스처 코퍼스(또는 재생 서버)로 실행')
+    parser.add_argument('--parquet', action='store_true',
+                        help='CSV와 함께 Parquet 저장 (통신사/수집일 분할, pyarrow 필요)')
+
+    args = parser.parse_args()
+    priorities = _parse_mapping(args.priority, int)
+    weights = _parse_mapping(args.weight, float)
+    workers = _parse_mapping(args.workers, int)
+
+    budget = BrowserBudget(max_browsers=args.max_browsers, max_memory_mb=args.max_memory_mb)
+    scheduler = CrawlScheduler(budget)
+
+    for carrier in args.carriers:
+        config = {
+            'headless': not args.show_browser,
+            'show_browser': args.show_browser,
+            'resume': args.resume,
+            'incremental': args.incremental,
+            'plan_catalog': not args.refresh_plans,
+            'shared_service': args.shared_service,
+            'fixture_record': args.record_fixtures,
+            'fixture_replay': args.replay_fixtures,
+            'save_parquet': args.parquet
+        }
+        if carrier in workers:
+            config['max_workers'] = workers[carrier]
+        scheduler.add(carrier, config, priority=priorities.get(carrier), weight=weights.get(carrier, 1.0))
+
+    print(f"동시 크롤링 시작: {', '.join(c.upper() for c in args.carriers)} (최대 브라우저 {args.max_browsers}개)")
+    results = scheduler.run()
+
+    for carrier, result in results.items():
+        for file in result['files']:
+            print(f"  - [{carrier.upper()}] {file}")
+
+    sys.exit(0 if any(r['files'] for r in results.values()) else 1)
+
+
+if __name__ == '__main__':
+    main()
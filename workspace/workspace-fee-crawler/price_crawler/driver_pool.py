@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+Chrome WebDriver 풀
+작업마다 드라이버를 새로 띄우지 않고, 미리 띄워 둔 드라이버를 빌려주고 돌려받습니다.
+
+- 풀 크기는 크롤러의 max_workers 와 동일하게 사용
+- 대여 전 상태 확인(health check), 반납 시 상태 초기화(쿠키, Alert, 프레임, 추가 창)
+- 사용 횟수 / 메모리 사용량 기준으로 드라이버 재생성
+
+작성일: 2025-10-27
+파일명: driver_pool.py
+"""
+
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class DriverPool:
+    """재사용 가능한 Chrome 드라이버 풀"""
+
+    def __init__(self, factory: Callable, size: int = 3, max_uses: int = 50,
+                 max_memory_mb: int = 0, acquire_timeout: float = 300,
+                 on_discard: Optional[Callable] = None):
+        """
+        Args:
+            factory: 새 드라이버를 생성하는 함수 (예: crawler.create_driver)
+            size: 동시에 유지할 최대 드라이버 수
+            max_uses: 드라이버 재생성 전 최대 대여 횟수 (0 = 무제한)
+            max_memory_mb: Chrome 프로세스 트리 RSS 한도 (0 = 확인 안함, psutil 필요)
+            acquire_timeout: 대여 대기 최대 시간(초)
+            on_discard: 드라이버 종료 후 호출되는 콜백 (활성 드라이버 목록 정리용)
+        """
+        self.factory = factory
+        self.size = max(1, size)
+        self.max_uses = max_uses
+        self.max_memory_mb = max_memory_mb
+        self.acquire_timeout = acquire_timeout
+        self.on_discard = on_discard
+
+        self._idle: List = []
+        self._uses: Dict[int, int] = {}
+        self._created = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+        # 통계
+        self.stats = {'created': 0, 'reused': 0, 'recycled': 0, 'unhealthy': 0}
+
+        if max_memory_mb and not PSUTIL_AVAILABLE:
+            logger.warning("psutil 미설치 - 드라이버 메모리 기준 재생성 비활성화 (pip install psutil)")
+
+    def acquire(self):
+        """드라이버 대여 (유휴 드라이버가 없으면 생성하거나 반납을 기다림)"""
+        deadline = time.time() + self.acquire_timeout
+
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise RuntimeError("DriverPool이 이미 종료되었습니다.")
+
+                driver = self._idle.pop() if self._idle else None
+
+                if driver is None:
+                    if self._created < self.size:
+                        # 슬롯 예약 후 락 밖에서 생성
+                        self._created += 1
+                    else:
+                        remaining = deadline - time.time()
+                        if remaining <= 0:
+                            raise TimeoutError("드라이버 대여 대기 시간 초과")
+                        self._cond.wait(timeout=remaining)
+                        continue
+
+            if driver is None:
+                try:
+                    driver = self.factory()
+                except Exception:
+                    with self._cond:
+                        self._created -= 1
+                        self._cond.notify()
+                    raise
+                self._uses[id(driver)] = 0
+                self.stats['created'] += 1
+            else:
+                if not self._is_healthy(driver):
+                    self.stats['unhealthy'] += 1
+                    logger.warning("유휴 드라이버 상태 불량 - 폐기 후 재시도")
+                    self._discard(driver)
+                    continue
+                self.stats['reused'] += 1
+
+            self._uses[id(driver)] = self._uses.get(id(driver), 0) + 1
+            return driver
+
+    def release(self, driver, discard: bool = False):
+        """드라이버 반납 (discard=True면 재사용하지 않고 종료)"""
+        if driver is None:
+            return
+
+        if not discard and self._needs_recycle(driver):
+            self.stats['recycled'] += 1
+            discard = True
+
+        if not discard:
+            try:
+                self._reset(driver)
+            except Exception as e:
+                logger.debug(f"드라이버 초기화 실패, 폐기: {e}")
+                discard = True
+
+        if discard or self._closed:
+            self._discard(driver)
+            return
+
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    @contextmanager
+    def lease(self):
+        """with 문으로 드라이버 대여 - 예외 발생 시 드라이버 폐기"""
+        driver = self.acquire()
+        try:
+            yield driver
+        except Exception:
+            self.release(driver, discard=True)
+            raise
+        else:
+            self.release(driver)
+
+    def close(self):
+        """풀의 모든 유휴 드라이버 종료"""
+        with self._cond:
+            self._closed = True
+            idle = self._idle[:]
+            self._idle.clear()
+            self._cond.notify_all()
+
+        for driver in idle:
+            self._discard(driver)
+
+        logger.info(f"DriverPool 종료 - 생성 {self.stats['created']}회, 재사용 {self.stats['reused']}회, "
+                    f"재생성 {self.stats['recycled']}회, 상태불량 {self.stats['unhealthy']}회")
+
+    def _discard(self, driver):
+        """드라이버 종료 및 슬롯 반환"""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류: {e}")
+
+        if self.on_discard:
+            try:
+                self.on_discard(driver)
+            except Exception as e:
+                logger.debug(f"on_discard 콜백 오류: {e}")
+
+        self._uses.pop(id(driver), None)
+        with self._cond:
+            self._created = max(0, self._created - 1)
+            self._cond.notify()
+
+    def _is_healthy(self, driver) -> bool:
+        """세션 및 JavaScript 실행 가능 여부 확인"""
+        try:
+            driver.current_window_handle
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def _needs_recycle(self, driver) -> bool:
+        """사용 횟수 또는 메모리 한도 초과 여부"""
+        if self.max_uses and self._uses.get(id(driver), 0) >= self.max_uses:
+            logger.info(f"드라이버 사용 횟수 한도 도달 ({self.max_uses}회) - 재생성")
+            return True
+
+        if self.max_memory_mb and PSUTIL_AVAILABLE:
+            rss_mb = driver_memory_mb(driver)
+            if rss_mb > self.max_memory_mb:
+                logger.info(f"드라이버 메모리 한도 초과 ({rss_mb:.0f}MB > {self.max_memory_mb}MB) - 재생성")
+                return True
+
+        return False
+
+    def _reset(self, driver):
+        """다음 작업을 위한 드라이버 상태 초기화"""
+        # 남아있는 Alert 닫기
+        try:
+            driver.switch_to.alert.dismiss()
+        except Exception:
+            pass
+
+        # 추가로 열린 창/탭 닫기
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # 프레임에서 빠져나오기
+        driver.switch_to.default_content()
+
+        # 스토리지와 쿠키 정리 후 빈 페이지로 이동
+        try:
+            driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+        except Exception:
+            pass
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+
+def driver_memory_mb(driver) -> float:
+    """chromedriver 및 하위 Chrome 프로세스의 RSS 합계 (MB)"""
+    if not PSUTIL_AVAILABLE:
+        return 0.0
+
+    try:
+        service = driver.service
+        root = psutil.Process(service.process.pid)
+        if getattr(service, 'shared', False):
+            # 공유 chromedriver (driver_resolver.py): 이 세션의 Chrome만 (user-data-dir 기준)
+            data_dir = driver.capabilities.get('chrome', {}).get('userDataDir')
+            if not data_dir:
+                return 0.0
+            roots = [p for p in root.children() if any(data_dir in arg for arg in p.cmdline())]
+        else:
+            roots = [root]
+        total = 0
+        for process in roots:
+            for member in [process] + process.children(recursive=True):
+                try:
+                    total += member.memory_info().rss
+                except psutil.Error:
+                    continue
+        return total / (1024 * 1024)
+    except Exception:
+        return 0.0
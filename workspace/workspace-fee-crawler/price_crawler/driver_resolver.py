@@ -0,0 +1,298 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+chromedriver 경로 확인 (프로세스당 한 번)
+드라이버를 만들 때마다 ChromeDriverManager().install()로 버전을 조회하고 Service를 새로 띄우지 않도록,
+chromedriver 경로를 프로세스 전체에서 한 번만 확인해 재사용합니다.
+
+- 확인 순서: CHROMEDRIVER_PATH 환경변수 → 오프라인 캐시 파일 → webdriver_manager 다운로드 → PATH의 chromedriver
+- 확인한 바이너리는 실행/버전 검증 (설치된 Chrome 및 고정 버전과 메이저 버전 비교)
+- 버전 고정: chromedriver_version 설정 또는 CHROMEDRIVER_VERSION 환경변수 (예: '131' 또는 '131.0.6778.85')
+- 오프라인 캐시: ~/.cache/price_crawler/chromedriver.json (네트워크 없이도 재사용)
+- shared=True: chromedriver Service 프로세스 하나를 띄워 두고 모든 드라이버가 공유 (종료 시 함께 정리)
+
+작성일: 2025-10-27
+파일명: driver_resolver.py
+"""
+
+import os
+import re
+import json
+import atexit
+import shutil
+import logging
+import platform
+import threading
+import subprocess
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from selenium.webdriver.chrome.service import Service
+
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+    WEBDRIVER_MANAGER_AVAILABLE = True
+except ImportError:
+    WEBDRIVER_MANAGER_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+DRIVER_PATH_ENV = 'CHROMEDRIVER_PATH'
+VERSION_ENV = 'CHROMEDRIVER_VERSION'
+DEFAULT_CACHE_FILE = Path.home() / '.cache' / 'price_crawler' / 'chromedriver.json'
+
+# 설치된 Chrome 버전 확인 명령 (플랫폼별 후보)
+CHROME_VERSION_COMMANDS = {
+    'Darwin': [['/Applications/Google Chrome.app/Contents/MacOS/Google Chrome', '--version']],
+    'Linux': [['google-chrome', '--version'], ['google-chrome-stable', '--version'],
+              ['chromium', '--version'], ['chromium-browser', '--version']],
+    'Windows': [['reg', 'query', r'HKEY_CURRENT_USER\Software\Google\Chrome\BLBeacon', '/v', 'version']],
+}
+
+VERSION_PATTERN = re.compile(r'(\d+)\.(\d+)\.(\d+)\.(\d+)')
+
+
+def _run_version(command: List[str]) -> Optional[str]:
+    """명령 출력에서 버전 문자열 추출"""
+    try:
+        result = subprocess.run(command, capture_output=True, text=True, timeout=10, check=False)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = VERSION_PATTERN.search(result.stdout or '')
+    return match.group(0) if match else None
+
+
+def _major(version: Optional[str]) -> Optional[str]:
+    return version.split('.', 1)[0] if version else None
+
+
+def chrome_version() -> Optional[str]:
+    """설치된 Chrome 버전 (확인 불가 시 None)"""
+    for command in CHROME_VERSION_COMMANDS.get(platform.system(), []):
+        version = _run_version(command)
+        if version:
+            return version
+    return None
+
+
+def driver_version(path: str) -> Optional[str]:
+    """chromedriver 바이너리 버전 (실행 불가 시 None)"""
+    return _run_version([path, '--version'])
+
+
+def _prepare_binary(path: str):
+    """macOS에서 quarantine 속성 제거 및 실행 권한 부여"""
+    if platform.system() != 'Darwin':
+        return
+    subprocess.run(['xattr', '-cr', os.path.dirname(path)], capture_output=True, check=False)
+    subprocess.run(['chmod', '+x', path], capture_output=True, check=False)
+
+
+class DriverResolver:
+    """chromedriver 경로를 한 번 확인해 재사용하는 프로세스 전역 해석기"""
+
+    def __init__(self, cache_file: Optional[Path] = DEFAULT_CACHE_FILE):
+        """
+        Args:
+            cache_file: 오프라인 캐시 파일 (None이면 사용하지 않음)
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self._resolved: Dict[Optional[str], Optional[str]] = {}
+        self._chrome_version: Optional[str] = None
+        self._chrome_checked = False
+        self._lock = threading.Lock()
+
+        # 통계 (source: env / cache / download / path / selenium-manager)
+        self.stats = {'resolves': 0, 'reused': 0, 'source': None, 'version': None}
+
+    def resolve(self, version: Optional[str] = None, refresh: bool = False) -> Optional[str]:
+        """chromedriver 경로 (None이면 Selenium Manager에 맡김)
+
+        Args:
+            version: 고정 버전 (메이저 또는 전체, None이면 CHROMEDRIVER_VERSION 환경변수)
+            refresh: 이 프로세스/오프라인 캐시를 무시하고 다시 확인 (드라이버 생성 실패 후 재시도용)
+        """
+        version = version or os.environ.get(VERSION_ENV) or None
+        with self._lock:
+            if not refresh and version in self._resolved:
+                self.stats['reused'] += 1
+                return self._resolved[version]
+
+            path = self._resolve(version, refresh)
+            self._resolved[version] = path
+            self.stats['resolves'] += 1
+            return path
+
+    def _chrome(self) -> Optional[str]:
+        if not self._chrome_checked:
+            self._chrome_version = chrome_version()
+            self._chrome_checked = True
+        return self._chrome_version
+
+    def _validate(self, path: Optional[str], pin: Optional[str]) -> Optional[str]:
+        """실행 가능하고 버전이 맞으면 드라이버 버전, 아니면 None"""
+        if not path or not os.path.isfile(path) or not os.access(path, os.X_OK):
+            return None
+        found = driver_version(path)
+        if not found:
+            return None
+        if pin and (found != pin if '.' in pin else _major(found) != pin):
+            logger.info(f"chromedriver 버전 불일치: {path} ({found}, 고정 {pin})")
+            return None
+        chrome = self._chrome()
+        if not pin and chrome and _major(chrome) != _major(found):
+            logger.info(f"chromedriver 버전 불일치: {path} ({found}, Chrome {chrome})")
+            return None
+        return found
+
+    def _resolve(self, pin: Optional[str], refresh: bool) -> Optional[str]:
+        # 1. 환경변수로 지정한 경로 (검증 실패해도 사용자가 지정한 값이므로 그대로 사용)
+        env_path = os.environ.get(DRIVER_PATH_ENV)
+        if env_path:
+            return self._found(env_path, 'env', driver_version(env_path))
+
+        # 2. 오프라인 캐시
+        cache = self._load_cache()
+        key = pin or 'auto'
+        if not refresh:
+            cached = cache.get(key, {}).get('path')
+            found = self._validate(cached, pin)
+            if found:
+                return self._found(cached, 'cache', found)
+
+        # 3. webdriver_manager (네트워크)
+        if WEBDRIVER_MANAGER_AVAILABLE:
+            try:
+                manager = ChromeDriverManager(driver_version=pin) if pin else ChromeDriverManager()
+                path = manager.install()
+                _prepare_binary(path)
+                found = self._validate(path, pin)
+                if found:
+                    cache[key] = {
+                        'path': path,
+                        'version': found,
+                        'chrome_version': self._chrome(),
+                        'resolved_at': datetime.now(ZoneInfo('Asia/Seoul')).isoformat()
+                    }
+                    self._save_cache(cache)
+                    return self._found(path, 'download', found)
+            except Exception as e:
+                logger.warning(f"webdriver_manager로 chromedriver 확인 실패: {e}")
+
+        # 4. 오프라인: 캐시 항목을 검증 없이라도 재사용 → PATH의 chromedriver
+        cached = cache.get(key, {}).get('path')
+        if cached and os.path.isfile(cached):
+            return self._found(cached, 'cache', cache[key].get('version'))
+        path = shutil.which('chromedriver')
+        if path and self._validate(path, pin):
+            return self._found(path, 'path', driver_version(path))
+
+        # 5. Selenium Manager (Service 경로 미지정)
+        logger.warning("chromedriver 경로를 확인하지 못함 - Selenium Manager 사용")
+        return self._found(None, 'selenium-manager', None)
+
+    def _found(self, path: Optional[str], source: str, version: Optional[str]) -> Optional[str]:
+        self.stats['source'] = source
+        self.stats['version'] = version
+        logger.info(f"chromedriver: {path or '(Selenium Manager)'} ({source}, {version or '버전 미확인'})")
+        return path
+
+    def _load_cache(self) -> Dict[str, Any]:
+        if not self.cache_file or not self.cache_file.exists():
+            return {}
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.debug(f"chromedriver 캐시 로드 실패: {e}")
+            return {}
+
+    def _save_cache(self, cache: Dict[str, Any]):
+        if not self.cache_file:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.cache_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(cache, f, ensure_ascii=False, indent=1)
+            temp_file.replace(self.cache_file)
+        except Exception as e:
+            logger.debug(f"chromedriver 캐시 저장 실패: {e}")
+
+
+class SharedService(Service):
+    """여러 드라이버가 공유하는 chromedriver Service (driver.quit()으로 종료되지 않음)"""
+
+    shared = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._start_lock = threading.Lock()
+
+    def start(self):
+        """처음 한 번만 프로세스 시작 (종료됐으면 다시 시작)"""
+        with self._start_lock:
+            process = getattr(self, 'process', None)
+            if process is not None and process.poll() is None:
+                return
+            super().start()
+
+    def stop(self):
+        """드라이버 종료 시 호출 - 공유 중이므로 무시 (shutdown()으로 종료)"""
+
+    def shutdown(self):
+        """chromedriver 프로세스 종료"""
+        super().stop()
+
+
+_resolver = DriverResolver()
+_shared_services: Dict[Optional[str], SharedService] = {}
+_shared_lock = threading.Lock()
+
+
+def resolve_chromedriver(version: Optional[str] = None, refresh: bool = False) -> Optional[str]:
+    """프로세스 전역 해석기로 chromedriver 경로 확인"""
+    return _resolver.resolve(version, refresh)
+
+
+def make_service(shared: bool = False, version: Optional[str] = None, refresh: bool = False) -> Service:
+    """드라이버 생성용 Service
+
+    Args:
+        shared: True면 프로세스에서 하나의 chromedriver를 공유 (드라이버마다 Service를 띄우지 않음)
+        version: chromedriver 고정 버전
+        refresh: 경로를 다시 확인 (생성 실패 후 재시도용)
+            공유 Service는 다른 드라이버가 아직 사용 중일 수 있으므로 종료하지 않음 -
+            프로세스가 죽었으면 start()에서 다시 시작하고, 경로가 바뀌었으면 새 경로의 Service를 사용
+    """
+    path = resolve_chromedriver(version, refresh)
+    if not shared:
+        return Service(executable_path=path, log_output=os.devnull)
+
+    with _shared_lock:
+        service = _shared_services.get(path)
+        if service is None:
+            service = SharedService(executable_path=path, log_output=os.devnull)
+            _shared_services[path] = service
+        return service
+
+
+@atexit.register
+def shutdown_shared_services():
+    """공유 chromedriver Service 모두 종료"""
+    with _shared_lock:
+        services = list(_shared_services.values())
+        _shared_services.clear()
+    for service in services:
+        try:
+            service.shutdown()
+        except Exception as e:
+            logger.debug(f"공유 Service 종료 오류: {e}")
+
+
+def resolver_summary() -> str:
+    """통계 문자열"""
+    stats = _resolver.stats
+    return f"chromedriver 확인 {stats['resolves']}회, 재사용 {stats['reused']}회 ({stats['source']}, {stats['version']})"
@@ -0,0 +1,722 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+크롤링 픽스처 기록 / 재생 서버
+라이브 통신사 사이트 없이 크롤러를 실행할 수 있도록 페이지·XHR 응답을 압축 코퍼스로 기록하고,
+기록한 코퍼스를 로컬 HTTP 프록시로 재생합니다.
+
+- 기록: 드라이버 performance 로그에서 완료된 요청마다 응답 본문을 조회해 요청 키와 함께 저장
+  (HttpFetcher 요청도 함께 기록), 코퍼스는 <코퍼스>/<통신사>/<시각>-<pid>.jsonl.gz
+- 요청 키: 메서드 + 호스트/경로 + 정렬된 쿼리(캐시 무력화 파라미터 제외) + 요청 본문 해시
+- 재생: 브라우저/HttpFetcher를 로컬 프록시로 연결, HTTPS는 자체 서명 인증서로 중계해 응답
+  (같은 키는 기록 순서대로 응답하고 마지막 응답을 반복, 본문만 다른 요청은 본문 무시 키로 대체)
+- 크롤러 설정: fixture_record=<코퍼스 경로>, fixture_replay=<코퍼스 경로 또는 재생 서버 URL>
+
+사용법:
+    # 기록
+    python price_crawler/kt_crawler.py --test --record-fixtures fixtures
+
+    # 재생 (크롤러가 재생 서버를 직접 띄움)
+    python price_crawler/kt_crawler.py --test --replay-fixtures fixtures
+
+    # 재생 서버를 따로 실행 (여러 크롤러/벤치마크에서 공유)
+    python price_crawler/fixtures.py serve --corpus fixtures --port 8765
+    python price_crawler/kt_crawler.py --test --replay-fixtures http://127.0.0.1:8765
+
+    # 코퍼스 통계
+    python price_crawler/fixtures.py stats --corpus fixtures
+
+작성일: 2025-10-27
+파일명: fixtures.py
+"""
+
+import os
+import ssl
+import sys
+import gzip
+import json
+import time
+import base64
+import hashlib
+import logging
+import argparse
+import threading
+import subprocess
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from price_crawler.cdp_network import enable_performance_log, poll_performance_log, get_request_post_data
+
+logger = logging.getLogger(__name__)
+
+# 기록할 리소스 유형 (이미지/폰트/미디어는 재생에 필요 없음)
+RECORD_RESOURCE_TYPES = ('Document', 'XHR', 'Fetch', 'Script', 'Stylesheet', 'Other')
+
+# 요청 키에서 제외할 쿼리 파라미터 (캐시 무력화용 타임스탬프 등)
+IGNORED_QUERY_PARAMS = ('_', '_dc', 'timestamp', 'ts', 'nocache')
+
+# 재생 시 돌려줄 응답 헤더 (본문은 디코딩된 상태로 저장되므로 Content-Encoding 등은 제외)
+REPLAY_HEADERS = ('content-type', 'location', 'set-cookie',
+                  'access-control-allow-origin', 'access-control-allow-credentials')
+
+# 텍스트로 저장하는 Content-Type
+TEXT_CONTENT_TYPES = ('text/', 'json', 'javascript', 'xml', 'html', 'x-www-form-urlencoded')
+
+DEFAULT_CORPUS_DIR = 'fixtures'
+
+
+def _normalize_netloc(scheme: str, netloc: str) -> str:
+    """호스트 소문자화 + 기본 포트 제거 (http/https 구분 없이 같은 키)"""
+    netloc = netloc.lower()
+    if (scheme == 'https' and netloc.endswith(':443')) or (scheme == 'http' and netloc.endswith(':80')):
+        netloc = netloc.rsplit(':', 1)[0]
+    return netloc
+
+
+def _body_digest(body: Optional[str]) -> str:
+    """요청 본문 해시 (폼/JSON 본문은 필드 순서 무관)"""
+    if not body:
+        return '-'
+    text = body.strip()
+    if text.startswith(('{', '[')):
+        try:
+            text = json.dumps(json.loads(text), sort_keys=True, ensure_ascii=False)
+        except ValueError:
+            pass
+    elif '=' in text and ' ' not in text:
+        text = urlencode(sorted(parse_qsl(text, keep_blank_values=True)))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()[:16]
+
+
+def url_key(method: str, url: str) -> str:
+    """본문을 제외한 요청 키 (메서드 + 호스트/경로 + 정렬된 쿼리)"""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k not in IGNORED_QUERY_PARAMS)
+    key = f"{method.upper()} {_normalize_netloc(parts.scheme, parts.netloc)}{parts.path or '/'}"
+    if query:
+        key += '?' + urlencode(query)
+    return key
+
+
+def request_key(method: str, url: str, body: Optional[str] = None) -> str:
+    """요청 키 (본문 해시 포함)"""
+    return f"{url_key(method, url)} #{_body_digest(body)}"
+
+
+def _is_text(content_type: str) -> bool:
+    return any(marker in content_type.lower() for marker in TEXT_CONTENT_TYPES)
+
+
+def _replay_headers(headers: Dict[str, Any]) -> Dict[str, str]:
+    """응답 헤더 중 재생에 필요한 것만 (키 소문자화)"""
+    result = {}
+    for name, value in (headers or {}).items():
+        name = name.lower()
+        if name in REPLAY_HEADERS and value is not None:
+            result[name] = str(value)
+    return result
+
+
+class FixtureRecorder:
+    """드라이버/HttpFetcher 응답을 압축 코퍼스로 기록"""
+
+    def __init__(self, corpus_dir, carrier: str, poll_interval: float = 1.0,
+                 max_body_bytes: int = 20 * 1024 * 1024,
+                 resource_types: Iterable[str] = RECORD_RESOURCE_TYPES):
+        """
+        Args:
+            corpus_dir: 코퍼스 디렉토리 (통신사별 하위 디렉토리에 기록)
+            carrier: 통신사 (SK, KT, LG)
+            poll_interval: execute_script 호출 시 performance 로그를 읽는 최소 간격(초)
+            max_body_bytes: 이보다 큰 응답 본문은 기록하지 않음
+            resource_types: 기록할 리소스 유형
+        """
+        self.carrier = carrier
+        self.poll_interval = poll_interval
+        self.max_body_bytes = max_body_bytes
+        self.resource_types = set(resource_types)
+
+        directory = Path(corpus_dir) / carrier.lower()
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / f"{time.strftime('%Y%m%d_%H%M%S')}-{os.getpid()}.jsonl.gz"
+        self._file = gzip.open(self.path, 'at', encoding='utf-8')
+        self._lock = threading.Lock()
+        self._closed = False
+
+        self.stats = {'records': 0, 'bytes': 0, 'skipped': 0, 'missing_bodies': 0}
+
+    def attach(self, driver):
+        """드라이버 이벤트 탭 연결 + 페이지 이동/스크립트 실행/종료 전에 로그 읽기"""
+        try:
+            # 응답 본문이 버퍼에서 밀려나지 않도록 버퍼 확대
+            driver.execute_cdp_cmd('Network.enable', {
+                'maxTotalBufferSize': 200 * 1024 * 1024,
+                'maxResourceBufferSize': self.max_body_bytes
+            })
+        except Exception as e:
+            logger.warning(f"[{self.carrier}] 픽스처 기록용 네트워크 설정 실패: {e}")
+
+        pending: Dict[str, Dict[str, Any]] = {}
+        previous_tap = getattr(driver, 'crawler_event_tap', None)
+
+        def tap(events):
+            if previous_tap is not None:
+                previous_tap(events)
+            self._observe(driver, pending, events)
+        driver.crawler_event_tap = tap
+
+        last_poll = [0.0]
+
+        def poll(force=False):
+            now = time.time()
+            if force or now - last_poll[0] >= self.poll_interval:
+                last_poll[0] = now
+                poll_performance_log(driver)
+
+        original_get = driver.get
+        original_execute_script = driver.execute_script
+        original_quit = driver.quit
+
+        def get(url):
+            # 이전 페이지 응답 본문은 이동 후 조회할 수 없으므로 먼저 기록
+            poll(force=True)
+            result = original_get(url)
+            poll(force=True)
+            return result
+
+        def execute_script(script, *args):
+            result = original_execute_script(script, *args)
+            poll()
+            return result
+
+        def quit():
+            try:
+                poll(force=True)
+            except Exception as e:
+                logger.debug(f"종료 전 픽스처 기록 실패: {e}")
+            return original_quit()
+
+        driver.get = get
+        driver.execute_script = execute_script
+        driver.quit = quit
+
+    def _observe(self, driver, pending: Dict[str, Dict[str, Any]], events: Iterable[Dict[str, Any]]):
+        """Network 이벤트로 요청/응답을 맞춰 완료된 응답 기록"""
+        for event in events:
+            method = event.get('method')
+            params = event.get('params', {})
+            request_id = params.get('requestId')
+            if not request_id:
+                continue
+
+            if method == 'Network.requestWillBeSent':
+                redirect = params.get('redirectResponse')
+                if redirect and request_id in pending:
+                    # 같은 requestId로 리다이렉트되므로 이전 요청은 리다이렉트 응답으로 기록
+                    exchange = pending.pop(request_id)
+                    self.record(exchange['method'], exchange['url'], exchange['post_data'],
+                                redirect.get('status', 302), redirect.get('headers', {}), '')
+
+                request = params.get('request', {})
+                url = request.get('url', '')
+                if params.get('type', 'Other') not in self.resource_types or not url.startswith(('http://', 'https://')):
+                    continue
+                pending[request_id] = {
+                    'request_id': request_id,
+                    'url': url,
+                    'method': request.get('method', 'GET'),
+                    'post_data': request.get('postData'),
+                    'has_post_data': request.get('hasPostData', False),
+                    'status': None,
+                    'headers': {},
+                }
+            elif method == 'Network.responseReceived' and request_id in pending:
+                response = params.get('response', {})
+                pending[request_id]['status'] = response.get('status')
+                pending[request_id]['headers'] = response.get('headers', {})
+            elif method == 'Network.loadingFinished' and request_id in pending:
+                exchange = pending.pop(request_id)
+                if exchange['status'] is None:
+                    continue
+                body, encoded = self._response_body(driver, request_id)
+                if body is None:
+                    self.stats['missing_bodies'] += 1
+                    continue
+                post_data = get_request_post_data(driver, exchange)
+                # 캐시 재검증 응답(304)은 본문을 가진 200으로 기록
+                status = 200 if exchange['status'] == 304 else exchange['status']
+                self.record(exchange['method'], exchange['url'], post_data, status,
+                            exchange['headers'], body, base64_encoded=encoded)
+            elif method == 'Network.loadingFailed':
+                pending.pop(request_id, None)
+
+    def _response_body(self, driver, request_id: str) -> Tuple[Optional[str], bool]:
+        """응답 본문 (base64 여부 포함, 조회 실패 시 None)"""
+        try:
+            result = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        except Exception as e:
+            logger.debug(f"픽스처 응답 본문 조회 실패 ({request_id}): {e}")
+            return None, False
+        return result.get('body', ''), bool(result.get('base64Encoded'))
+
+    def record(self, method: str, url: str, post_data: Optional[str], status: int,
+               headers: Dict[str, Any], body: str, base64_encoded: bool = False, source: str = 'browser'):
+        """응답 한 건 기록"""
+        if len(body) > self.max_body_bytes:
+            self.stats['skipped'] += 1
+            return
+
+        entry = {
+            'key': request_key(method, url, post_data),
+            'method': method.upper(),
+            'url': url,
+            'post_data': post_data,
+            'status': status,
+            'headers': _replay_headers(headers),
+            'body': body,
+            'base64': base64_encoded,
+            'source': source,
+            'recorded_at': time.time(),
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+
+        with self._lock:
+            if self._closed:
+                return
+            self._file.write(line)
+            self.stats['records'] += 1
+            self.stats['bytes'] += len(body)
+            if self.stats['records'] % 50 == 0:
+                # 비정상 종료 시에도 그때까지의 기록은 읽을 수 있도록
+                self._file.flush()
+
+    def record_response(self, response):
+        """requests 응답 기록 (리다이렉트 이력 포함) - HttpFetcher에서 호출"""
+        for item in list(response.history) + [response]:
+            request = item.request
+            body = request.body
+            if isinstance(body, bytes):
+                body = body.decode('utf-8', errors='replace')
+
+            if item is not response:
+                content, encoded = '', False
+            elif _is_text(item.headers.get('Content-Type', '')):
+                content, encoded = item.text, False
+            else:
+                content, encoded = base64.b64encode(item.content).decode('ascii'), True
+
+            self.record(request.method, request.url, body, item.status_code,
+                        dict(item.headers), content, base64_encoded=encoded, source='http')
+
+    def close(self):
+        """코퍼스 파일 닫기"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._file.close()
+        logger.info(f"[{self.carrier}] 픽스처 기록 완료: {self.path} - {self.summary()}")
+
+    def summary(self) -> str:
+        """기록 통계 문자열"""
+        return (f"응답 {self.stats['records']:,}개 ({self.stats['bytes'] / 1024 / 1024:.1f}MB), "
+                f"본문 조회 실패 {self.stats['missing_bodies']}개, 크기 초과 {self.stats['skipped']}개")
+
+
+class FixtureCorpus:
+    """기록된 코퍼스 (요청 키 → 기록 순서대로의 응답 목록)"""
+
+    def __init__(self, corpus_dir, carrier: Optional[str] = None):
+        """
+        Args:
+            corpus_dir: 코퍼스 디렉토리
+            carrier: 통신사 하위 디렉토리만 읽을 때 지정 (없으면 전체)
+        """
+        self.corpus_dir = Path(corpus_dir)
+        self.carrier = carrier
+        self.entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.loose_entries: Dict[str, List[Dict[str, Any]]] = {}
+        self.files: List[Path] = []
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        """코퍼스 파일 읽기 (같은 키는 가장 최근 기록 파일의 응답 사용)"""
+        root = self.corpus_dir / self.carrier.lower() if self.carrier else self.corpus_dir
+        if not root.exists():
+            raise FileNotFoundError(f"픽스처 코퍼스가 없습니다: {root}")
+
+        self.files = sorted(root.rglob('*.jsonl.gz'), key=lambda p: p.name)
+        self.entries.clear()
+        self.loose_entries.clear()
+
+        for path in self.files:
+            recorded: Dict[str, List[Dict[str, Any]]] = {}
+            for entry in self._read(path):
+                recorded.setdefault(entry['key'], []).append(entry)
+            self.entries.update(recorded)
+
+        for key, responses in self.entries.items():
+            loose = url_key(responses[0]['method'], responses[0]['url'])
+            self.loose_entries.setdefault(loose, []).extend(responses)
+
+        self.rewind()
+        logger.info(f"픽스처 코퍼스 로드: {root} - 파일 {len(self.files)}개, 요청 키 {len(self.entries):,}개")
+
+    @staticmethod
+    def _read(path: Path):
+        """기록 파일 한 개 읽기 (비정상 종료로 잘린 끝부분은 무시)"""
+        try:
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        logger.debug(f"손상된 픽스처 레코드 무시: {path.name}")
+        except (EOFError, OSError) as e:
+            logger.warning(f"픽스처 파일 끝부분 손상 ({path.name}): {e}")
+
+    def lookup(self, method: str, url: str, body: Optional[str] = None) -> Tuple[Optional[Dict[str, Any]], str]:
+        """요청에 대한 기록 응답
+
+        Returns:
+            (기록 항목 또는 None, 'exact' | 'loose' | 'miss')
+        """
+        key = request_key(method, url, body)
+        responses = self.entries.get(key)
+        match = 'exact'
+        if not responses:
+            key = url_key(method, url)
+            responses = self.loose_entries.get(key)
+            match = 'loose'
+        if not responses:
+            return None, 'miss'
+
+        with self._lock:
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+        return responses[min(index, len(responses) - 1)], match
+
+    def rewind(self):
+        """응답 순서를 처음으로 되돌림 (같은 코퍼스로 반복 실행할 때)"""
+        with self._lock:
+            self._cursors.clear()
+
+    def __len__(self) -> int:
+        return sum(len(responses) for responses in self.entries.values())
+
+
+def ensure_certificate(cert_dir) -> Optional[Tuple[Path, Path]]:
+    """HTTPS 중계용 자체 서명 인증서 (없으면 openssl로 생성, 실패 시 None)"""
+    cert_dir = Path(cert_dir)
+    cert_file = cert_dir / 'replay-cert.pem'
+    key_file = cert_dir / 'replay-key.pem'
+    if cert_file.exists() and key_file.exists():
+        return cert_file, key_file
+
+    cert_dir.mkdir(parents=True, exist_ok=True)
+    try:
+        subprocess.run(
+            ['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '3650',
+             '-subj', '/CN=fixture-replay', '-keyout', str(key_file), '-out', str(cert_file)],
+            capture_output=True, check=True, timeout=60
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.warning(f"재생 서버 인증서 생성 실패 - HTTPS 요청은 재생되지 않습니다: {e}")
+        return None
+    return cert_file, key_file
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    """프록시 요청(절대 URL) / HTTPS 터널 내부 요청을 코퍼스에서 응답"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'FixtureReplay/1.0'
+    tunnel_host = None
+
+    def log_message(self, format, *args):
+        logger.debug(f"재생 서버: {format % args}")
+
+    def do_CONNECT(self):
+        replay = self.server.replay
+        if replay.ssl_context is None:
+            self.send_error(502, 'HTTPS replay unavailable')
+            return
+
+        self.send_response(200, 'Connection Established')
+        self.end_headers()
+        try:
+            connection = replay.ssl_context.wrap_socket(self.connection, server_side=True)
+        except (ssl.SSLError, OSError) as e:
+            logger.debug(f"HTTPS 터널 연결 실패 ({self.path}): {e}")
+            self.close_connection = True
+            return
+
+        with replay.stats_lock:
+            replay.stats['tunnels'] += 1
+        # 이후 요청은 터널 안에서 평문으로 처리
+        self.tunnel_host = self.path
+        self.connection = connection
+        self.rfile = connection.makefile('rb', self.rbufsize)
+        self.wfile = connection.makefile('wb', 0)
+        self.close_connection = False
+
+    def _replay(self):
+        if self.path.startswith(('http://', 'https://')):
+            url = self.path
+        elif self.tunnel_host:
+            url = f"https://{self.tunnel_host}{self.path}"
+        else:
+            url = f"http://{self.headers.get('Host', '')}{self.path}"
+
+        length = int(self.headers.get('Content-Length') or 0)
+        body = self.rfile.read(length).decode('utf-8', errors='replace') if length else None
+
+        replay = self.server.replay
+        entry, match = replay.corpus.lookup(self.command, url, body)
+        with replay.stats_lock:
+            replay.stats[match] += 1
+
+        if entry is None:
+            logger.debug(f"재생 기록 없음: {self.command} {url[:150]}")
+            if self.command == 'OPTIONS':
+                # 기록되지 않은 CORS 사전 요청은 허용
+                self._send(204, {'access-control-allow-origin': self.headers.get('Origin', '*'),
+                                 'access-control-allow-credentials': 'true',
+                                 'access-control-allow-headers': self.headers.get('Access-Control-Request-Headers', '*'),
+                                 'access-control-allow-methods': 'GET, POST, PUT, DELETE, OPTIONS'}, b'')
+            else:
+                self._send(404, {'content-type': 'text/plain; charset=utf-8'}, b'fixture not recorded')
+            return
+
+        headers = dict(entry['headers'])
+        if entry.get('base64'):
+            payload = base64.b64decode(entry['body'])
+        else:
+            payload = entry['body'].encode('utf-8')
+            # 본문은 디코딩된 문자열로 저장되므로 원래 charset(euc-kr 등) 대신 utf-8로 응답
+            content_type = headers.get('content-type')
+            if content_type and 'charset=' in content_type.lower():
+                base_type = content_type.split(';', 1)[0]
+                headers['content-type'] = f"{base_type}; charset=utf-8"
+
+        with replay.stats_lock:
+            replay.stats['bytes'] += len(payload)
+        self._send(entry['status'], headers, payload)
+
+    def _send(self, status: int, headers: Dict[str, str], payload: bytes):
+        self.send_response(status)
+        for name, value in headers.items():
+            # 여러 값(Set-Cookie 등)은 줄바꿈으로 이어져 기록됨
+            for line in str(value).split('\n'):
+                if line:
+                    self.send_header(name, line)
+        self.send_header('Cache-Control', 'no-store')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_DELETE = do_PATCH = do_HEAD = do_OPTIONS = _replay
+
+
+class ReplayServer:
+    """코퍼스를 응답하는 로컬 HTTP 프록시 (HTTPS는 CONNECT 터널을 자체 서명 인증서로 중계)"""
+
+    def __init__(self, corpus: FixtureCorpus, host: str = '127.0.0.1', port: int = 0,
+                 https: bool = True, cert_dir=None):
+        """
+        Args:
+            corpus: 재생할 코퍼스
+            host: 바인드 주소
+            port: 포트 (0이면 임의 포트)
+            https: HTTPS 터널 중계 여부
+            cert_dir: 인증서 위치 (기본: 코퍼스 디렉토리)
+        """
+        self.corpus = corpus
+        self.ssl_context = None
+        if https:
+            cert = ensure_certificate(cert_dir or corpus.corpus_dir)
+            if cert:
+                self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+                self.ssl_context.load_cert_chain(str(cert[0]), str(cert[1]))
+
+        self.httpd = ThreadingHTTPServer((host, port), _ReplayHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.replay = self
+        self._thread = None
+
+        self.stats_lock = threading.Lock()
+        self.stats = {'exact': 0, 'loose': 0, 'miss': 0, 'bytes': 0, 'tunnels': 0}
+
+    @property
+    def url(self) -> str:
+        """프록시 주소 (브라우저 --proxy-server / requests proxies에 사용)"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> str:
+        """백그라운드 스레드로 시작"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='fixture-replay', daemon=True)
+        self._thread.start()
+        logger.info(f"픽스처 재생 서버 시작: {self.url} (응답 {len(self.corpus):,}개)")
+        return self.url
+
+    def serve_forever(self):
+        """현재 스레드에서 실행 (Ctrl+C로 종료)"""
+        self.httpd.serve_forever()
+
+    def stop(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        logger.info(f"픽스처 재생 서버 종료 - {self.summary()}")
+
+    def summary(self) -> str:
+        """재생 통계 문자열"""
+        with self.stats_lock:
+            stats = dict(self.stats)
+        return (f"일치 {stats['exact']:,}개, 본문 무시 일치 {stats['loose']:,}개, 기록 없음 {stats['miss']:,}개, "
+                f"응답 {stats['bytes'] / 1024 / 1024:.1f}MB")
+
+
+class FixtureMode:
+    """크롤러 설정(fixture_record / fixture_replay)에 따라 드라이버와 HttpFetcher를 기록/재생에 연결"""
+
+    def __init__(self, carrier: str, record_dir=None, replay: Optional[str] = None):
+        """
+        Args:
+            carrier: 통신사 (SK, KT, LG)
+            record_dir: 기록할 코퍼스 디렉토리
+            replay: 재생할 코퍼스 디렉토리 (재생 서버를 직접 실행) 또는 실행 중인 재생 서버 URL
+        """
+        if record_dir and replay:
+            raise ValueError("fixture_record와 fixture_replay는 함께 사용할 수 없습니다")
+
+        self.carrier = carrier
+        self.recorder = FixtureRecorder(record_dir, carrier) if record_dir else None
+        self.server = None
+        self.proxy_url = None
+
+        if replay:
+            replay = str(replay)
+            if replay.startswith(('http://', 'https://')):
+                self.proxy_url = replay.rstrip('/')
+            else:
+                self.server = ReplayServer(FixtureCorpus(replay, carrier))
+                self.proxy_url = self.server.start()
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], carrier: str) -> 'FixtureMode':
+        return cls(carrier, record_dir=config.get('fixture_record'), replay=config.get('fixture_replay'))
+
+    @property
+    def active(self) -> bool:
+        return self.recorder is not None or self.proxy_url is not None
+
+    def apply_options(self, options):
+        """ChromeOptions 설정 (create_driver에서 드라이버 생성 전 호출)"""
+        if self.recorder:
+            enable_performance_log(options)
+        if self.proxy_url:
+            options.add_argument(f'--proxy-server={self.proxy_url}')
+            options.add_argument('--proxy-bypass-list=<-loopback>')
+            options.add_argument('--ignore-certificate-errors')
+            options.set_capability('acceptInsecureCerts', True)
+        return options
+
+    def attach(self, driver):
+        """드라이버에 기록 연결 (드라이버 생성 직후, BrowserProfile.apply 이후 호출)"""
+        if self.recorder:
+            self.recorder.attach(driver)
+
+    def configure_fetcher(self, fetcher):
+        """HttpFetcher 요청을 기록하거나 재생 서버로 보냄"""
+        if self.recorder:
+            fetcher.recorder = self.recorder
+        if self.proxy_url:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+            fetcher.session.proxies.update({'http': self.proxy_url, 'https': self.proxy_url})
+            fetcher.session.verify = False
+        return fetcher
+
+    def summary(self) -> str:
+        """기록/재생 통계 문자열"""
+        if self.recorder:
+            return f"기록 {self.recorder.path} - {self.recorder.summary()}"
+        if self.server:
+            return f"재생 {self.server.url} - {self.server.summary()}"
+        if self.proxy_url:
+            return f"재생 서버 {self.proxy_url} 사용"
+        return "비활성화"
+
+    def close(self):
+        """기록 파일 닫기 / 재생 서버 종료 (여러 번 호출해도 안전)"""
+        if self.recorder:
+            self.recorder.close()
+        if self.server:
+            self.server.stop()
+            self.server = None
+
+
+def print_stats(corpus_dir):
+    """통신사별 코퍼스 통계 출력"""
+    corpus_dir = Path(corpus_dir)
+    carriers = sorted(p.name for p in corpus_dir.iterdir() if p.is_dir()) if corpus_dir.exists() else []
+    if not carriers:
+        print(f"코퍼스가 없습니다: {corpus_dir}")
+        return
+
+    for carrier in carriers:
+        corpus = FixtureCorpus(corpus_dir, carrier)
+        size = sum(p.stat().st_size for p in corpus.files)
+        hosts: Dict[str, int] = {}
+        for responses in corpus.entries.values():
+            host = urlsplit(responses[0]['url']).netloc
+            hosts[host] = hosts.get(host, 0) + len(responses)
+        print(f"{carrier.upper()}: 파일 {len(corpus.files)}개 ({size / 1024 / 1024:.1f}MB 압축), "
+              f"요청 키 {len(corpus.entries):,}개, 응답 {len(corpus):,}개")
+        for host, count in sorted(hosts.items(), key=lambda kv: -kv[1])[:10]:
+            print(f"  {host}: {count:,}개")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='크롤링 픽스처 재생 서버 / 코퍼스 통계')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    serve = subparsers.add_parser('serve', help='코퍼스 재생 서버 실행')
+    serve.add_argument('--corpus', default=DEFAULT_CORPUS_DIR, help=f'코퍼스 디렉토리 (기본: {DEFAULT_CORPUS_DIR})')
+    serve.add_argument('--carrier', default=None, help='특정 통신사 코퍼스만 재생 (kt, sk, lg)')
+    serve.add_argument('--host', default='127.0.0.1', help='바인드 주소 (기본: 127.0.0.1)')
+    serve.add_argument('--port', type=int, default=8765, help='포트 (기본: 8765)')
+    serve.add_argument('--no-https', action='store_true', help='HTTPS 터널 중계 비활성화')
+
+    stats = subparsers.add_parser('stats', help='코퍼스 통계')
+    stats.add_argument('--corpus', default=DEFAULT_CORPUS_DIR, help=f'코퍼스 디렉토리 (기본: {DEFAULT_CORPUS_DIR})')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.command == 'stats':
+        print_stats(args.corpus)
+        return 0
+
+    server = ReplayServer(FixtureCorpus(args.corpus, args.carrier), host=args.host, port=args.port,
+                          https=not args.no_https)
+    print(f"재생 서버: {server.url} (크롤러 옵션 --replay-fixtures {server.url})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+HTTP 페이지 수집기
+서버에서 렌더링되는 페이지를 브라우저 없이 가져오기 위한 공용 세션입니다.
+
+- keep-alive 연결 풀을 공유하는 requests.Session
+- 호스트별 동시 요청 수 제한
+- 일시적 오류(502/503/504) 자동 재시도
+- 차단/JS 전용 응답 판별 (이 경우 호출 측에서 Selenium으로 대체)
+
+작성일: 2025-10-27
+파일명: http_fetch.py
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    'User-Agent': ('Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+                   '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'),
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+# 차단/봇 확인 페이지로 판단하는 문구
+BLOCK_MARKERS = (
+    'captcha',
+    'access denied',
+    '접근이 차단',
+    '비정상적인 접근',
+    '잠시 후 다시 시도',
+)
+
+BLOCK_STATUS_CODES = (401, 403, 429, 503)
+
+
+class HttpFetcher:
+    """연결 풀과 호스트별 동시성 제한을 가진 HTTP 수집기"""
+
+    def __init__(self, max_connections: int = 32, max_per_host: int = 8,
+                 timeout: float = 20, retries: int = 2,
+                 headers: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            max_connections: 호스트당 유지할 keep-alive 연결 수
+            max_per_host: 호스트별 동시 요청 수
+            timeout: 요청 타임아웃(초)
+            retries: 연결 오류 및 502/503/504 재시도 횟수
+            headers: 기본 헤더에 덮어쓸 헤더
+        """
+        self.max_per_host = max(1, max_per_host)
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        if headers:
+            self.session.headers.update(headers)
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_connections,
+                              max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._host_limits: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+        # 통계
+        self.stats = {'requests': 0, 'errors': 0, 'blocked': 0, 'bytes': 0}
+
+        # 픽스처 기록기 (FixtureMode.configure_fetcher에서 설정)
+        self.recorder = None
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 세마포어"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    def get(self, url: str, **kwargs) -> Optional[requests.Response]:
+        """GET 요청 (네트워크 오류 시 None)"""
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Optional[requests.Response]:
+        """POST 요청 (네트워크 오류 시 None)"""
+        return self.request('POST', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> Optional[requests.Response]:
+        """요청 실행 (네트워크 오류 시 None)"""
+        kwargs.setdefault('timeout', self.timeout)
+
+        with self._host_limit(url):
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except requests.RequestException as e:
+                with self._lock:
+                    self.stats['errors'] += 1
+                logger.debug(f"HTTP 요청 실패: {url[:100]}... - {e}")
+                return None
+
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['bytes'] += len(response.content)
+            if looks_blocked(response):
+                self.stats['blocked'] += 1
+
+        if self.recorder is not None:
+            self.recorder.record_response(response)
+
+        return response
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
+        logger.info(f"HttpFetcher 종료 - 요청 {self.stats['requests']}회, 오류 {self.stats['errors']}회, "
+                    f"차단 {self.stats['blocked']}회, 수신 {self.stats['bytes'] / 1024 / 1024:.1f}MB")
+
+
+def looks_blocked(response: requests.Response) -> bool:
+    """차단 또는 봇 확인 페이지 여부"""
+    if response.status_code in BLOCK_STATUS_CODES:
+        return True
+
+    content_type = response.headers.get('Content-Type', '')
+    if 'html' not in content_type:
+        return False
+
+    head = response.text[:4000].lower()
+    return any(marker in head for marker in BLOCK_MARKERS)
@@ -27,6 +27,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from queue import Queue
 import pickle
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 import pandas as pd
 from selenium import webdriver
@@ -35,8 +36,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, NoAlertPresentException, UnexpectedAlertPresentException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 
 # Rich UI 지원 (선택사항)
 # Rich 라이브러리 사용 안함 (UnicodeEncodeError 방지)
@@ -45,6 +44,27 @@ console = None
 
 # Path imports
 from shared_config.config.paths import PathManager, get_raw_data_path, get_checkpoint_path, get_log_path
+from price_crawler.http_fetch import HttpFetcher, looks_blocked
+from price_crawler.combo_planner import CombinationPlanner
+from price_crawler.crawl_index import CrawlIndex, combo_key
+from price_crawler.cdp_network import (
+    enable_performance_log, drain_performance_log, collect_exchanges,
+    get_response_body, get_request_post_data, cookies_to_session
+)
+from price_crawler.waits import StepWaiter, install_network_tracker
+from price_crawler.browser_profile import BrowserProfile
+from price_crawler.checkpoint_journal import CheckpointJournal
+from price_crawler.fixtures import FixtureMode
+from price_crawler.columnar_store import write_raw_data, PYARROW_AVAILABLE
+from price_crawler.snapshot_diff import write_delta
+from price_crawler.work_partitions import StealingQueue
+from price_crawler.kt_parser import parse_product_list
+from price_crawler.row_store import RowStore, crawl_timestamp
+from price_crawler.plan_catalog import PlanCatalog, plan_fingerprint, DEFAULT_TTL_HOURS
+from price_crawler.driver_resolver import make_service, resolver_summary
+from price_crawler.standby_driver import StandbyDriver, RefreshPolicy
+from price_crawler.telemetry import CrawlTelemetry
+from price_crawler.adaptive_concurrency import AdaptiveConcurrency
 
 # 경로 매니저 초기화
 path_manager = PathManager()
@@ -68,7 +88,7 @@ logger = logging.getLogger(__name__)
 class DeviceData:
     """기기 데이터 - 통합 형식"""
     date: str = ""
-    crawled_at: str = field(default_factory=lambda: datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S'))
+    crawled_at: str = field(default_factory=crawl_timestamp)
     carrier: str = "KT"
     manufacturer: str = "전체"
     scrb_type_name: str = ""
@@ -88,22 +108,122 @@ class KTCrawler:
     
     BASE_URL = "https://shop.kt.com/smart/supportAmtList.do"
     
+    # 가입유형 정보
+    SUBSCRIPTION_TYPES = [
+        # {'value': '01', 'name': '신규가입'},  # 이미 수집 완료
+        {'value': '02', 'name': '번호이동'},
+        {'value': '04', 'name': '기기변경'}
+    ]
+    
+    # 재생 요청에서 페이지 번호로 간주하는 파라미터명
+    PAGE_PARAM_PATTERN = re.compile(r'^(page(no|num|index)?|curr?page(no)?|pageno)$', re.IGNORECASE)
+    
+    # 대기 조건 스크립트
+    RATE_MODAL_READY_JS = "return document.querySelectorAll('.chargeItemCase').length > 0;"
+    LAYER_CLOSED_JS = """
+        var layer = document.querySelector('.layerBody');
+        return layer === null || layer.offsetParent === null;
+    """
+    PROD_LIST_READY_JS = "return document.querySelectorAll('#prodList li[cd]').length > 0;"
+    
+    # 요금제 모달의 현재 목록 추출 (arguments[0] = 네트워크 타입)
+    RATE_PLAN_LIST_JS = """
+        var networkType = arguments[0];
+        var plans = [];
+        var items = document.querySelectorAll('.chargeItemCase');
+        
+        items.forEach(function(item) {
+            var nameElem = item.querySelector('.prodName');
+            var priceElem = item.querySelector('.price');
+            
+            if (nameElem && priceElem) {
+                var planId = item.getAttribute('id');
+                // prodCopy 제거하고 요금제명만 추출
+                var planNameFull = nameElem.textContent.trim();
+                var copyElem = nameElem.querySelector('.prodCopy');
+                var planName = copyElem ? planNameFull.replace(copyElem.textContent, '').trim() : planNameFull;
+                var priceText = priceElem.textContent.trim();
+                
+                // 월 요금 추출 (예: "월 130,000원" -> 130000)
+                var price = priceText.replace(/[^0-9]/g, '');
+                
+                plans.push({
+                    id: planId,
+                    name: planName,
+                    monthly_fee: parseInt(price) || 0,
+                    network_type: networkType
+                });
+            }
+        });
+        
+        return plans;
+    """
+    
+    # 단계별 대기 타임아웃 기본값(초) - 기록된 대기 시간(kt_step_waits.json)으로 조정
+    STEP_TIMEOUTS = {
+        'page_ready': 5,
+        'rate_modal_open': 5,
+        'rate_tab_switch': 3,
+        'rate_all_plans': 3,
+        'plan_item_ready': 3,
+        'plan_selected': 3,
+        'rate_modal_close': 5,
+        'plan_apply': 20,
+        'plan_apply_settle': 5,
+        'page_switch': 8,
+        'prod_list_ready': 10,
+        'sort_apply': 5,
+        'subscription_type': 8,
+    }
+    
     def __init__(self, config: Dict[str, Any] = None):
         """초기화"""
         # 기본 설정
         self.config = {
             'headless': True,
-            'max_workers': 1,  # KT는 단일 스레드로 시작
+            'max_workers': 1,  # KT는 단일 스레드로 시작 (2 이상이면 가입유형×요금제 구간을 드라이버별로 분할)
             'page_timeout': 10,  # 20 -> 10 속도 개선
             'element_timeout': 5,  # 10 -> 5 속도 개선
             'retry_count': 1,  # 2 -> 1 속도 개선
             'fast_mode': True,
             'output_dir': 'data',
             'checkpoint_interval': 20,
+            'checkpoint_fsync': True,  # 체크포인트마다 저널 fsync
+            'checkpoint_tag': None,  # 체크포인트 파일 구분자 (예: 'hot' - 프로필 실행이 전체 크롤링 체크포인트를 건드리지 않음)
             'use_rich': False,
             'debug': False,
             'delay_between_requests': 0.5,  # 2 -> 0.5 속도 개선
-            'first_page_only': False  # 첫 페이지만 수집 (최신 공시 기기)
+            'first_page_only': False,  # 첫 페이지만 수집 (최신 공시 기기)
+            'fetch_mode': 'browser',  # 'replay' = 기록한 prodList 요청을 HTTP로 재생
+            'replay_workers': 8,  # 재생 모드 동시 요청 수
+            'replay_timeout': 20,  # 재생 요청 타임아웃(초)
+            'combo_planner': True,  # 결과가 동일할 것으로 예측되는 가입유형은 수집을 미루고 복사
+            'planner_sample_rate': 0.1,  # 중복 예측 조합 중 검증 수집 비율
+            'planner_min_streak': 2,  # 중복 예측에 필요한 연속 동일 횟수
+            'incremental': False,  # 변경 없는 페이지에서 페이지 이동 중단, 나머지는 이전 스냅샷 사용
+            'event_waits': True,  # 고정 sleep 대신 DOM 변경/네트워크 유휴 신호 대기
+            'block_resources': True,  # 이미지/폰트/미디어/광고·분석 스크립트 요청 차단
+            'blocked_url_patterns': [],  # 추가 차단 URL 패턴 (예: ['*.mp4'])
+            'allowed_url_patterns': [],  # 차단에서 제외할 URL (통신사 기본 허용 목록에 추가)
+            'step_timeouts': {},  # 단계별 대기 타임아웃 덮어쓰기 (예: {'plan_apply': 30})
+            'fixture_record': None,  # 코퍼스 경로 지정 시 페이지/XHR 응답을 픽스처로 기록
+            'fixture_replay': None,  # 코퍼스 경로 또는 재생 서버 URL (라이브 사이트 대신 기록된 응답 사용)
+            'save_parquet': False,  # CSV와 함께 통신사/수집일 분할 Parquet 저장 (pyarrow 필요)
+            'parquet_dir': None,  # Parquet 저장소 루트 (기본: price_crawler/data/parquet)
+            'save_delta': False,  # 직전 스냅샷 대비 추가/변경/삭제 행을 raw/delta/에 저장 (snapshot_diff.py)
+            'shared_service': False,  # chromedriver Service 하나를 모든 드라이버가 공유 (드라이버마다 프로세스 생성 안 함)
+            'chromedriver_version': None,  # chromedriver 버전 고정 (예: '131', 기본: 설치된 Chrome에 맞춤)
+            'plan_catalog': True,  # 요금제 모달 첫 목록의 지문이 같으면 저장된 요금제 목록 사용
+            'plan_catalog_ttl_hours': DEFAULT_TTL_HOURS,  # 저장된 요금제 목록 유효 시간
+            'standby_driver': True,  # 교체용 드라이버를 백그라운드에서 미리 띄워 세션 갱신 시 즉시 교체
+            'driver_max_memory_mb': 1500,  # Chrome 프로세스 RSS 한도 - 초과 시 세션 갱신 (psutil 필요)
+            'driver_latency_factor': 3.0,  # 응답 지연이 초기의 N배를 넘으면 세션 갱신
+            'driver_max_plans': 0,  # 드라이버당 최대 요금제 수 (0 = 제한 없음, psutil 미설치 시 20)
+            'telemetry': True,  # 작업/단계별 소요 시간을 JSON Lines + Prometheus textfile로 기록
+            'telemetry_dir': None,  # 텔레메트리 저장 디렉토리 (기본: 체크포인트 디렉토리/telemetry)
+            'adaptive_concurrency': False,  # 페이지 로드 지연/재시도에 따라 요청 간 지연(병렬 모드는 동시 워커 수도) 자동 조절 (AIMD)
+            'adaptive_max_workers': 4,  # 병렬 모드 자동 조절 시 최대 동시 워커 수 (시작값은 max_workers)
+            'adaptive_max_delay': 10  # 자동 조절 시 최대 요청 간 지연(초)
         }
         
         if config:
@@ -113,7 +233,7 @@ class KTCrawler:
         os.makedirs(self.config['output_dir'], exist_ok=True)
         
         # 데이터 저장소
-        self.all_data: List[DeviceData] = []
+        self.all_data = RowStore(DeviceData)  # 필드별 배열로 보관 (row_store.py)
         self.data_lock = threading.Lock()
         self.active_drivers = []
         self.active_services = []
@@ -128,6 +248,12 @@ class KTCrawler:
         
         # 체크포인트
         self.checkpoint_file = get_checkpoint_path('kt')
+        if self.config['checkpoint_tag']:
+            self.checkpoint_file = self.checkpoint_file.with_stem(f"{self.checkpoint_file.stem}_{self.config['checkpoint_tag']}")
+        self.journal = CheckpointJournal(
+            self.checkpoint_file.with_suffix('.journal'),
+            fsync=self.config['checkpoint_fsync']
+        )
         
         # 진행상황 추적
         self.progress_details = {
@@ -135,6 +261,71 @@ class KTCrawler:
             'rate_plans': {},
             'current_status': ''
         }
+        
+        # 조합 계획기 (요금제별로 가입유형 간 중복 예측)
+        self.planner = CombinationPlanner(
+            'KT',
+            state_file=self.checkpoint_file.parent / 'kt_combo_planner.json',
+            sample_rate=self.config['planner_sample_rate'],
+            min_streak=self.config['planner_min_streak'],
+            enabled=self.config['combo_planner']
+        )
+        self.deferred_plans: Dict[Tuple[str, str], Tuple[Dict[str, str], Dict[str, Any]]] = {}
+        
+        # 증분 크롤링 인덱스 (실행 간 유지)
+        self.crawl_index = CrawlIndex('KT', self.checkpoint_file.parent / 'kt_crawl_index.json')
+        
+        # 요금제 카탈로그 (실행 간 유지, 변경 없으면 전체 열거 생략)
+        self.plan_catalog = PlanCatalog(
+            'KT',
+            self.checkpoint_file.parent / 'kt_plan_catalog.json',
+            ttl_hours=self.config['plan_catalog_ttl_hours'],
+            enabled=self.config['plan_catalog']
+        )
+        
+        # 리소스 차단 프로필 (드라이버 생성 시 적용)
+        self.browser_profile = BrowserProfile(
+            'KT',
+            enabled=self.config['block_resources'],
+            extra_blocked=self.config['blocked_url_patterns'],
+            extra_allowed=self.config['allowed_url_patterns']
+        )
+        
+        # 단계별 대기 (대기 시간 기록은 실행 간 누적)
+        self.waiter = StepWaiter(
+            timeouts={**self.STEP_TIMEOUTS, **self.config['step_timeouts']},
+            enabled=self.config['event_waits'],
+            stats_file=self.checkpoint_file.parent / 'kt_step_waits.json'
+        )
+        
+        # 픽스처 기록/재생 (드라이버 생성 시 연결)
+        self.fixtures = FixtureMode.from_config(self.config, 'KT')
+        
+        # 작업/단계별 소요 시간 기록 (실행 종료 시 Prometheus textfile)
+        self.telemetry = CrawlTelemetry(
+            'KT',
+            Path(self.config['telemetry_dir'] or self.checkpoint_file.parent / 'telemetry'),
+            enabled=self.config['telemetry']
+        )
+        
+        # 요청 간 지연 / 병렬 워커 수 (adaptive_concurrency면 page_load·재시도 기록으로 조절)
+        self.concurrency = AdaptiveConcurrency(
+            initial_workers=self.config['max_workers'],
+            max_workers=max(self.config['adaptive_max_workers'], self.config['max_workers']),
+            initial_delay=self.config['delay_between_requests'],
+            max_delay=self.config['adaptive_max_delay'],
+            enabled=self.config['adaptive_concurrency']
+        )
+        self.telemetry.subscribe(self.concurrency.observe)
+        
+        # 세션 갱신용 대기 드라이버 (지원금 페이지까지 미리 열어 둠)
+        # (create_driver는 호출 시점에 조회 - 스케줄러가 브라우저 예산으로 감싼 메서드 사용)
+        self.standby = StandbyDriver(
+            lambda: self.create_driver(),
+            prepare=self._prepare_fresh_driver,
+            enabled=self.config['standby_driver'],
+            on_retire=self.browser_profile.collect
+        )
     
     def create_driver(self) -> webdriver.Chrome:
         """Chrome 드라이버 생성"""
@@ -192,6 +383,10 @@ class KTCrawler:
         if self.config['headless']:
             options.add_argument('--headless=new')
         
+        # 재생 모드: 요청 기록을 위한 네트워크 로그 수집
+        if self.config.get('fetch_mode') == 'replay':
+            enable_performance_log(options)
+        
         # 성능 최적화 (fast_mode)
         if self.config['fast_mode']:
             prefs = {
@@ -206,28 +401,22 @@ class KTCrawler:
             }
             options.add_experimental_option('prefs', prefs)
         
+        # 리소스 차단 프로필 (이미지 비활성화 설정 병합)
+        self.browser_profile.apply_options(options)
+        
+        # 픽스처 기록(performance 로그) / 재생(로컬 프록시) 설정
+        self.fixtures.apply_options(options)
+        
         # ChromeDriver 설정
         max_retries = 3
+        started = time.perf_counter()
         for attempt in range(max_retries):
             try:
-                # ChromeDriver 다운로드 및 설치
-                chromedriver_path = ChromeDriverManager().install()
-                
-                # macOS에서 quarantine 속성 제거
-                if platform.system() == 'Darwin':
-                    try:
-                        import subprocess
-                        subprocess.run(['xattr', '-cr', os.path.dirname(chromedriver_path)], 
-                                     capture_output=True, check=False)
-                        subprocess.run(['chmod', '+x', chromedriver_path], 
-                                     capture_output=True, check=False)
-                    except:
-                        pass
-                
-                # Service 객체 생성
-                service = Service(
-                    executable_path=chromedriver_path,
-                    log_output=os.devnull
+                # chromedriver 경로 / Service (경로는 프로세스당 한 번만 확인, 재시도 시 다시 확인 - driver_resolver.py)
+                service = make_service(
+                    shared=self.config['shared_service'],
+                    version=self.config['chromedriver_version'],
+                    refresh=attempt > 0
                 )
                 
                 # Driver 생성
@@ -244,10 +433,13 @@ class KTCrawler:
             except Exception as e:
                 logger.error(f"ChromeDriver 생성 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
+                    self.telemetry.retry('driver_create')
                     time.sleep(5)
                 else:
+                    self.telemetry.record('driver_create', time.perf_counter() - started, ok=False)
                     raise Exception(f"ChromeDriver를 시작할 수 없습니다: {str(e)}")
         
+        self.telemetry.record('driver_create', time.perf_counter() - started)
         driver.set_page_load_timeout(self.config['page_timeout'])
         driver.implicitly_wait(5)
         
@@ -281,6 +473,15 @@ class KTCrawler:
             '''
         })
         
+        # 네트워크 유휴 대기용 XHR/fetch 카운터
+        install_network_tracker(driver)
+        
+        # 불필요한 리소스 요청 차단
+        self.browser_profile.apply(driver)
+        
+        # 픽스처 기록 연결
+        self.fixtures.attach(driver)
+        
         return driver
     
     def check_driver_health(self, driver: webdriver.Chrome) -> bool:
@@ -304,6 +505,51 @@ class KTCrawler:
             logger.warning(f"WebDriver 상태 확인 실패: {e}")
             return False
     
+    def _refresh_policy(self) -> RefreshPolicy:
+        """드라이버 갱신 기준 (RSS / 응답 지연)"""
+        return RefreshPolicy(
+            max_memory_mb=self.config['driver_max_memory_mb'],
+            latency_factor=self.config['driver_latency_factor'],
+            max_plans=self.config['driver_max_plans']
+        )
+    
+    def _refresh_reason(self, driver: webdriver.Chrome, policy: RefreshPolicy) -> Optional[str]:
+        """상태 확인(응답 지연 기록) 후 갱신이 필요하면 이유 반환"""
+        started = time.time()
+        if not self.check_driver_health(driver):
+            return "상태 불량"
+        policy.record(time.time() - started)
+        return policy.check(driver)
+    
+    def _prepare_fresh_driver(self, driver: webdriver.Chrome):
+        """새 드라이버를 지원금 페이지(최근 공시 순)까지 준비"""
+        with self.telemetry.step('page_load'):
+            driver.get(self.BASE_URL)
+            self.wait_for_page_ready(driver)
+            self.waiter.until(driver, 'prod_list_ready', self.PROD_LIST_READY_JS, fallback=3)
+        self._apply_recent_sort(driver)
+    
+    def _swap_driver(self, driver: Optional[webdriver.Chrome]) -> webdriver.Chrome:
+        """드라이버 교체 - 대기 드라이버가 있으면 즉시 교체, 없으면 종료 후 새로 생성"""
+        new_driver = self.standby.take()
+        if new_driver is not None:
+            self.standby.retire(driver)
+            logger.info("대기 드라이버로 교체")
+            return new_driver
+        
+        if driver is not None:
+            try:
+                self.browser_profile.collect(driver)
+                driver.quit()
+            except:
+                pass
+            # 잠시 대기 (프로세스 정리 시간)
+            time.sleep(3)
+        
+        new_driver = self.create_driver()
+        self._prepare_fresh_driver(new_driver)
+        return new_driver
+    
     def wait_for_page_ready(self, driver: webdriver.Chrome, timeout: int = None):
         """페이지 로딩 대기 - 속도 최적화"""
         if timeout is None:
@@ -315,139 +561,40 @@ class KTCrawler:
             WebDriverWait(driver, wait_time).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
-            # fast_mode에서는 jQuery 체크 생략
-            if not self.config['fast_mode']:
-                WebDriverWait(driver, wait_time).until(
-                    lambda d: d.execute_script(
-                        "return typeof jQuery === 'undefined' || jQuery.active == 0"
-                    )
-                )
-            time.sleep(0.3 if self.config['fast_mode'] else 1)
+            # 진행 중인 AJAX(jQuery 포함)가 끝날 때까지 대기
+            self.waiter.network_idle(driver, 'page_ready', fallback=0.3 if self.config['fast_mode'] else 1,
+                                     idle=0.3 if self.config['fast_mode'] else 0.5)
         except TimeoutException:
             logger.debug("페이지 로딩 타임아웃")
         except:
             pass
     
     def parse_html_data(self, html_content: str) -> List[DeviceData]:
-        """HTML 데이터 파싱"""
+        """HTML 데이터 파싱 (단일 패스 토큰 파서 - kt_parser.py)"""
         data_list = []
+        crawled_at = crawl_timestamp()
         
-        # BeautifulSoup 대신 정규식과 문자열 파싱 사용
-        # 각 제품을 prodItemCase 단위로 추출 (li 태그가 아닌 cd 속성을 기준으로)
-        # HTML에서 각 제품은 li cd="..." 로 시작하고 다음 li cd="..." 전까지가 하나의 제품
-        product_items = []
-        
-        # li cd="..." 패턴 찾기
-        li_starts = []
-        for match in re.finditer(r'<li cd="([^"]+)">', html_content):
-            li_starts.append((match.start(), match.group(1)))
-        
-        # 각 제품별로 HTML 추출
-        for i in range(len(li_starts)):
-            start_pos = li_starts[i][0]
-            cd = li_starts[i][1]
-            
-            # 다음 li까지 또는 끝까지
-            if i < len(li_starts) - 1:
-                end_pos = li_starts[i + 1][0]
-            else:
-                # 마지막 요소는 </ul>까지
-                end_match = html_content.find('</ul>', start_pos)
-                end_pos = end_match if end_match > -1 else len(html_content)
-            
-            li_content = html_content[start_pos:end_pos]
-            product_items.append((cd, li_content))
-        
-        for cd, li_content in product_items:
+        for product in parse_product_list(html_content):
             try:
-                # 기기명 추출
-                device_name_match = re.search(r'<strong class="prodName">([^<]+)</strong>', li_content)
-                device_name = device_name_match.group(1).strip() if device_name_match else ""
-                
-                # 공시일 추출
-                date_match = re.search(r'<span>(\d{4}\.\d{2}\.\d{2})</span>', li_content)
-                date_str = date_match.group(1).replace('.', '-') if date_match else ""
-                
-                # 출고가 추출
-                release_price_match = re.search(r'<div class="tit">출고가</div>[\s\S]*?<div class="conts">([^<]+)</div>', li_content)
-                release_price = 0
-                if release_price_match:
-                    price_text = release_price_match.group(1).replace('원', '').replace(',', '').strip()
-                    release_price = int(price_text) if price_text.isdigit() else 0
-                
-                # 공통지원금 (공시지원금) 추출
-                common_support_match = re.search(r'<div class="tit">공통지원금</div>[\s\S]*?<div class="conts">([^<]+)</div>', li_content)
-                public_support = 0
-                if common_support_match:
-                    support_text = common_support_match.group(1).replace('원', '').replace(',', '').strip()
-                    public_support = int(support_text) if support_text.isdigit() else 0
-                
-                # 단말가격 (구매가) 추출
-                final_price_match = re.search(r'<div class="tit">단말가격</div>[\s\S]*?<div class="conts">([^<]+)</div>', li_content)
-                final_price = 0
-                if final_price_match:
-                    price_text = final_price_match.group(1).replace('원', '').replace(',', '').strip()
-                    final_price = int(price_text) if price_text.isdigit() else 0
-                
-                # 요금할인 추출 (24개월)
-                rate_discount_match = re.search(r'<strong class="tit"[^>]*>요금할인\(24개월\)</strong>[\s\S]*?<div class="conts">\s*([^<]+)', li_content)
-                rate_discount_total = 0
-                monthly_discount = 0
-                if rate_discount_match:
-                    discount_text = rate_discount_match.group(1).replace('원', '').replace(',', '').strip()
-                    rate_discount_total = int(discount_text) if discount_text.isdigit() else 0
-                    # 24개월 총 할인액을 월 할인액으로 변환
-                    monthly_discount = rate_discount_total // 24 if rate_discount_total > 0 else 0
-                else:
-                    # 요금할인이 없는 경우 디버그 로그
-                    if self.config.get('debug', False):
-                        logger.debug(f"요금할인을 찾을 수 없음: {device_name}")
-                        # 다른 패턴으로 재시도
-                        alt_match = re.search(r'요금할인[\s\S]*?([0-9,]+)원', li_content)
-                        if alt_match:
-                            logger.debug(f"대체 패턴으로 발견: {alt_match.group(1)}")
-                
-                # 전환지원금 (추가지원금) 추출 - KT는 별도로 표시하지 않는 경우가 많음
-                conversion_support_match = re.search(r'<div class="tit">전환지원금</div>[\s\S]*?<div class="conts">([^<]+)</div>', li_content)
-                additional_support = 0
-                if conversion_support_match:
-                    support_text = conversion_support_match.group(1).replace('원', '').replace(',', '').strip()
-                    additional_support = int(support_text) if support_text.isdigit() else 0
-                
-                # 제조사 판별
-                manufacturer = '기타'
-                if '갤럭시' in device_name or 'Galaxy' in device_name.lower():
-                    manufacturer = '삼성'
-                elif '아이폰' in device_name or 'iPhone' in device_name:
-                    manufacturer = '애플'
-                elif 'LG' in device_name:
-                    manufacturer = 'LG'
-                elif '샤오미' in device_name or 'Xiaomi' in device_name or '레드미' in device_name:
-                    manufacturer = '샤오미'
-                
-                # 네트워크 타입 판별
-                network_type = '5G'  # 기본값
-                if 'LTE' in device_name or '4G' in device_name:
-                    network_type = 'LTE'
-                elif any(keyword in device_name for keyword in ['워치', 'Watch', '태블릿', 'Tab', 'iPad']):
-                    network_type = '기타'
+                if not product['has_rate_discount'] and self.config.get('debug', False):
+                    logger.debug(f"요금할인을 찾을 수 없음: {product['device_nm']}")
                 
                 # DeviceData 생성
                 device_data = DeviceData(
-                    date=date_str,
-                    crawled_at=datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S'),
+                    date=product['date'],
+                    crawled_at=crawled_at,
                     carrier='KT',
-                    manufacturer=manufacturer,
+                    manufacturer=product['manufacturer'],
                     scrb_type_name='전체',  # 나중에 crawl_data에서 업데이트
-                    network_type=network_type,
-                    device_nm=device_name,
+                    network_type=product['network_type'],
+                    device_nm=product['device_nm'],
                     plan_name='요금할인',  # 요금제별 수집 시 업데이트
-                    monthly_fee=monthly_discount,  # 월 요금할인액 또는 요금제 월요금
-                    release_price=release_price,
-                    public_support_fee=public_support,  # 공통지원금 = 공시지원금
-                    additional_support_fee=additional_support,  # 전환지원금 = 추가지원금
-                    total_support_fee=public_support + additional_support,  # 총 지원금 = 공시지원금 + 추가지원금
-                    total_price=final_price
+                    monthly_fee=product['monthly_discount'],  # 월 요금할인액 또는 요금제 월요금
+                    release_price=product['release_price'],
+                    public_support_fee=product['public_support_fee'],  # 공통지원금 = 공시지원금
+                    additional_support_fee=product['additional_support_fee'],  # 전환지원금 = 추가지원금
+                    total_support_fee=product['public_support_fee'] + product['additional_support_fee'],  # 총 지원금 = 공시지원금 + 추가지원금
+                    total_price=product['total_price']
                 )
                 
                 data_list.append(device_data)
@@ -479,81 +626,66 @@ class KTCrawler:
                 logger.error("요금제 변경 버튼을 찾을 수 없습니다.")
                 return rate_plans
             
-            time.sleep(2)  # 모달 로딩 대기
+            # 모달 로딩 대기
+            self.waiter.until(driver, 'rate_modal_open', self.RATE_MODAL_READY_JS, fallback=2)
+            
+            # 모달 첫 목록으로 카탈로그 확인 (변경 없으면 탭 전환/전체 목록 열거 생략)
+            fingerprint = plan_fingerprint(driver.execute_script(self.RATE_PLAN_LIST_JS, ''))
+            cached = self.plan_catalog.lookup(fingerprint)
+            if cached:
+                self._close_rate_modal(driver)
+                logger.info(f"요금제 {len(cached)}개 (카탈로그)")
+                return [dict(plan) for plan in cached]
             
             # 5G와 LTE 탭별로 요금제 수집
+            complete = True
             for network_type in ['5G', 'LTE']:
-                # 네트워크 탭 선택
-                tab_clicked = driver.execute_script(f"""
-                    var tabs = document.querySelectorAll('button');
-                    for (var tab of tabs) {{
-                        if (tab.textContent.trim() === '{network_type}' && 
-                            tab.getAttribute('onclick') && 
-                            tab.getAttribute('onclick').includes('fnChangePplTabPopup')) {{
-                            tab.click();
-                            return true;
+                # 네트워크 탭 선택 (요금제 목록 갱신 대기)
+                with self.waiter.mutation(driver, 'rate_tab_switch', '.chargeListWrap', fallback=1) as watch:
+                    tab_clicked = driver.execute_script(f"""
+                        var tabs = document.querySelectorAll('button');
+                        for (var tab of tabs) {{
+                            if (tab.textContent.trim() === '{network_type}' && 
+                                tab.getAttribute('onclick') && 
+                                tab.getAttribute('onclick').includes('fnChangePplTabPopup')) {{
+                                tab.click();
+                                return true;
+                            }}
                         }}
-                    }}
-                    return false;
-                """)
+                        return false;
+                    """)
+                    if not tab_clicked:
+                        watch.skip()
                 
                 if not tab_clicked:
                     logger.warning(f"{network_type} 탭을 찾을 수 없습니다.")
+                    complete = False
                     continue
                 
-                time.sleep(1)
-                
                 # 전체 요금제 선택
-                all_plans_clicked = driver.execute_script("""
-                    var btn = document.getElementById('pplGroupObj_ALL');
-                    if (btn && !btn.classList.contains('active')) {
-                        btn.click();
-                    }
-                    return true;
-                """)
-                
-                time.sleep(1)
+                with self.waiter.mutation(driver, 'rate_all_plans', '.chargeListWrap', fallback=1) as watch:
+                    all_plans_clicked = driver.execute_script("""
+                        var btn = document.getElementById('pplGroupObj_ALL');
+                        if (btn && !btn.classList.contains('active')) {
+                            btn.click();
+                            return true;
+                        }
+                        return false;
+                    """)
+                    if not all_plans_clicked:
+                        watch.skip()
                 
                 # 요금제 목록 추출
-                plans = driver.execute_script(f"""
-                    var plans = [];
-                    var items = document.querySelectorAll('.chargeItemCase');
-                    
-                    items.forEach(function(item) {{
-                        var nameElem = item.querySelector('.prodName');
-                        var priceElem = item.querySelector('.price');
-                        
-                        if (nameElem && priceElem) {{
-                            var planId = item.getAttribute('id');
-                            // prodCopy 제거하고 요금제명만 추출
-                            var planNameFull = nameElem.textContent.trim();
-                            var copyElem = nameElem.querySelector('.prodCopy');
-                            var planName = copyElem ? planNameFull.replace(copyElem.textContent, '').trim() : planNameFull;
-                            var priceText = priceElem.textContent.trim();
-                            
-                            // 월 요금 추출 (예: "월 130,000원" -> 130000)
-                            var price = priceText.replace(/[^0-9]/g, '');
-                            
-                            plans.push({{
-                                id: planId,
-                                name: planName,
-                                monthly_fee: parseInt(price) || 0,
-                                network_type: '{network_type}'
-                            }});
-                        }}
-                    }});
-                    
-                    return plans;
-                """)
+                plans = driver.execute_script(self.RATE_PLAN_LIST_JS, network_type)
                 
                 rate_plans.extend(plans)
                 logger.info(f"{network_type} 요금제 {len(plans)}개 수집")
             
-            # 모달 닫기
-            driver.execute_script("""
-                var closeBtn = document.querySelector('.modal-close, .btn-close, [class*="close"]');
-                if (closeBtn) closeBtn.click();
-            """)
+            self._close_rate_modal(driver)
+            
+            # 일부 탭이 빠진 목록은 카탈로그에 저장하지 않음
+            if rate_plans and complete:
+                self.plan_catalog.store(fingerprint, rate_plans)
             
         except Exception as e:
             logger.error(f"요금제 수집 오류: {e}")
@@ -562,9 +694,26 @@ class KTCrawler:
         
         return rate_plans
     
+    def _close_rate_modal(self, driver: webdriver.Chrome):
+        """요금제 모달 닫기"""
+        driver.execute_script("""
+            var closeBtn = document.querySelector('.modal-close, .btn-close, [class*="close"]');
+            if (closeBtn) closeBtn.click();
+        """)
+    
     def crawl_data_for_plan(self, driver: webdriver.Chrome, plan: Dict[str, Any], sub_type: Dict[str, str] = None, is_first: bool = True) -> List[DeviceData]:
-        """특정 요금제에 대한 기기 데이터 수집"""
+        """특정 요금제에 대한 기기 데이터 수집 (요금제 × 가입유형 작업 단위로 텔레메트리 기록)"""
+        with self.telemetry.task('plan', plan=plan.get('name'), sub_type=(sub_type or {}).get('name')) as task:
+            devices = self._crawl_data_for_plan(driver, plan, sub_type, is_first)
+            task.rows = len(devices)
+            task.ok = bool(devices)
+        return devices
+    
+    def _crawl_data_for_plan(self, driver: webdriver.Chrome, plan: Dict[str, Any], sub_type: Optional[Dict[str, str]],
+                             is_first: bool) -> List[DeviceData]:
+        """요금제 적용 → 첫 페이지 추출 → 페이지 이동 (단계별 소요 시간 기록)"""
         devices = []
+        timer = self.telemetry.timer()
         
         try:
             # 모달이 닫혀있을 때만 요금제 변경 버튼 클릭
@@ -627,7 +776,8 @@ class KTCrawler:
                     logger.error("요금제 변경 버튼을 찾을 수 없습니다.")
                     return devices
                 
-                time.sleep(2)  # 모달 로딩 대기
+                # 모달 로딩 대기
+                self.waiter.until(driver, 'rate_modal_open', self.RATE_MODAL_READY_JS, fallback=2)
             
             # 모달이 열렸는지 확인
             modal_opened = driver.execute_script("""
@@ -645,39 +795,41 @@ class KTCrawler:
                 logger.warning("요금제 선택 모달이 열리지 않았습니다. 계속 진행합니다.")
                 # 에러 대신 경고로 변경하고 계속 진행
             
-            # 네트워크 타입 선택 (5G/LTE)
-            network_tab_clicked = driver.execute_script(f"""
-                var networkType = '{plan['network_type']}';
-                var tabId = 'TAB_' + networkType;
-                var tab = document.getElementById(tabId);
-                
-                if (tab) {{
-                    var button = tab.querySelector('button');
-                    if (button && button.getAttribute('aria-selected') !== 'true') {{
-                        button.click();
-                        return true;
+            # 네트워크 타입 선택 (5G/LTE) - 탭이 바뀌면 요금제 목록 갱신 대기
+            with self.waiter.mutation(driver, 'rate_tab_switch', '.chargeListWrap', fallback=1) as watch:
+                network_tab_clicked = driver.execute_script(f"""
+                    var networkType = '{plan['network_type']}';
+                    var tabId = 'TAB_' + networkType;
+                    var tab = document.getElementById(tabId);
+                    
+                    if (tab) {{
+                        var button = tab.querySelector('button');
+                        if (button && button.getAttribute('aria-selected') !== 'true') {{
+                            button.click();
+                            return true;
+                        }}
                     }}
-                }}
-                return false;
-            """)
-            
-            if network_tab_clicked:
-                time.sleep(1)  # 네트워크 탭 변경 대기
-            
-            # 전체요금제 버튼 클릭
-            all_plans_clicked = driver.execute_script("""
-                var allBtn = document.getElementById('pplGroupObj_ALL');
-                if (allBtn && allBtn.getAttribute('aria-selected') !== 'true') {
-                    allBtn.click();
-                    return true;
-                }
-                return false;
-            """)
+                    return false;
+                """)
+                if not network_tab_clicked:
+                    watch.skip()
             
-            if all_plans_clicked:
-                time.sleep(1)  # 전체요금제 로딩 대기
+            # 전체요금제 버튼 클릭 - 전체요금제 로딩 대기
+            with self.waiter.mutation(driver, 'rate_all_plans', '.chargeListWrap', fallback=1) as watch:
+                all_plans_clicked = driver.execute_script("""
+                    var allBtn = document.getElementById('pplGroupObj_ALL');
+                    if (allBtn && allBtn.getAttribute('aria-selected') !== 'true') {
+                        allBtn.click();
+                        return true;
+                    }
+                    return false;
+                """)
+                if not all_plans_clicked:
+                    watch.skip()
             
-            time.sleep(1)
+            # 선택할 요금제 항목이 목록에 나타날 때까지 대기
+            self.waiter.until(driver, 'plan_item_ready',
+                              f"return document.getElementById('{plan['id']}') !== null;", fallback=1)
             
             # 요금제 선택 - 재시도 로직 포함
             plan_selected = False
@@ -714,16 +866,15 @@ class KTCrawler:
                     break
                 else:
                     logger.warning(f"요금제 선택 실패, 재시도 {retry + 1}/3")
+                    self.telemetry.retry('plan_select')
                     time.sleep(1)
             
             if not plan_selected:
                 logger.warning(f"요금제 {plan['name']}를 선택할 수 없습니다.")
                 return devices
             
-            time.sleep(2)  # 선택 후 대기 시간 증가
-            
-            # 요금제가 실제로 선택되었는지 확인
-            is_selected = driver.execute_script(f"""
+            # 요금제가 실제로 선택되었는지 확인 (선택 표시가 나타날 때까지 대기)
+            is_selected = self.waiter.until(driver, 'plan_selected', f"""
                 var planElem = document.getElementById('{plan['id']}');
                 if (planElem) {{
                     // aria-selected 또는 active 클래스 확인
@@ -733,7 +884,7 @@ class KTCrawler:
                     return isActive || ariaSelected !== null;
                 }}
                 return false;
-            """)
+            """, fallback=None)
             
             if not is_selected:
                 logger.warning(f"요금제 '{plan['name']}'가 선택되지 않았습니다.")
@@ -752,11 +903,13 @@ class KTCrawler:
             if not complete_clicked:
                 logger.warning(f"선택완료 버튼을 찾을 수 없음 - 요금제: {plan['name']}")
                 return devices
+            timer.lap('plan_select')
             
             # 페이지 리로드 감지를 위한 마커 설정
             driver.execute_script("window.ktCrawlerMarker = Date.now();")
             
-            time.sleep(3)  # 모달 닫힘 대기
+            # 모달 닫힘 대기
+            self.waiter.until(driver, 'rate_modal_close', self.LAYER_CLOSED_JS, fallback=3)
             
             # 페이지가 업데이트되었는지 확인
             self.wait_for_page_ready(driver)
@@ -765,12 +918,10 @@ class KTCrawler:
             logger.info("요금제 선택 완료, 페이지 업데이트 대기 중...")
             
             # 페이지가 새로고침되거나 AJAX로 업데이트될 때까지 대기
-            update_detected = False
-            for i in range(20):  # 최대 20초 대기
-                time.sleep(1)
-                
-                # 페이지 상태 확인
-                page_status = driver.execute_script("""
+            page_status = {}
+            
+            def page_updated(d):
+                page_status.update(d.execute_script("""
                     return {
                         url: window.location.href,
                         readyState: document.readyState,
@@ -781,29 +932,25 @@ class KTCrawler:
                         modalClosed: document.querySelector('.layerBody') === null || 
                                     document.querySelector('.layerBody').offsetParent === null
                     };
-                """)
-                
-                logger.debug(f"대기 {i+1}초: items={page_status['itemCount']}, ajax={page_status['ajaxActive']}, modal={not page_status['modalClosed']}")
-                
-                # 페이지 리로드 감지 (마커가 사라짐)
-                if not page_status['markerExists']:
-                    logger.info("페이지 리로드 감지")
-                    self.wait_for_page_ready(driver)
-                    update_detected = True
-                    break
-                
-                # AJAX 완료 및 모달 닫힘 확인
-                if page_status['modalClosed'] and page_status['ajaxActive'] == 0 and page_status['readyState'] == 'complete':
-                    if page_status['itemCount'] > 0:
-                        update_detected = True
-                        logger.info(f"페이지 업데이트 완료: {page_status['itemCount']}개 기기 발견")
-                        break
-            
-            if not update_detected:
+                """))
+                # 페이지 리로드 감지 (마커가 사라짐) 또는 AJAX 완료 및 모달 닫힘 확인
+                return (not page_status['markerExists'] or
+                        (page_status['modalClosed'] and page_status['ajaxActive'] == 0 and
+                         page_status['readyState'] == 'complete' and page_status['itemCount'] > 0))
+            
+            update_detected = self.waiter.until(driver, 'plan_apply', page_updated, fallback=None)
+            
+            if update_detected and not page_status.get('markerExists', True):
+                logger.info("페이지 리로드 감지")
+                self.wait_for_page_ready(driver)
+            elif update_detected:
+                logger.info(f"페이지 업데이트 완료: {page_status['itemCount']}개 기기 발견")
+            else:
                 logger.warning("페이지 업데이트를 감지하지 못했습니다. 계속 진행합니다.")
             
-            # 추가 안정화 대기
-            time.sleep(2)
+            # 추가 안정화 대기 (후속 AJAX 완료)
+            self.waiter.network_idle(driver, 'plan_apply_settle', fallback=2)
+            timer.lap('page_load')
             
             # 기기 목록 가져오기
             prod_list_info = driver.execute_script("""
@@ -839,6 +986,14 @@ class KTCrawler:
                 # 첫 페이지 파싱
                 devices = self.parse_html_data_with_plan(prod_list_html, plan)
                 logger.info(f"요금제 '{plan['name']}' 페이지 1에서 {len(devices)}개 기기 수집")
+                self.telemetry.add_bytes(len(prod_list_html))
+                timer.lap('extract')
+                
+                # 증분 모드: 첫 페이지가 이전과 같으면 나머지는 스냅샷 사용
+                reused = self._incremental_snapshot(plan, sub_type, devices, devices)
+                if reused is not None:
+                    devices.extend(reused)
+                    return devices
                 
                 # 테스트 모드에서는 기기 수 제한
                 if self.config.get('max_devices') and len(devices) > self.config['max_devices']:
@@ -866,18 +1021,20 @@ class KTCrawler:
                 
                 # 2페이지부터 순회
                 for page_num in range(2, page_count + 1):
-                    # 페이지 이동
-                    page_clicked = driver.execute_script(f"""
-                        var pageLink = document.querySelector('.pageWrap a[pageno="{page_num}"]');
-                        if (pageLink) {{
-                            pageLink.click();
-                            return true;
-                        }}
-                        return false;
-                    """)
+                    # 페이지 이동 (기기 목록 갱신 대기)
+                    with self.waiter.mutation(driver, 'page_switch', '#prodList', fallback=3) as watch:
+                        page_clicked = driver.execute_script(f"""
+                            var pageLink = document.querySelector('.pageWrap a[pageno="{page_num}"]');
+                            if (pageLink) {{
+                                pageLink.click();
+                                return true;
+                            }}
+                            return false;
+                        """)
+                        if not page_clicked:
+                            watch.skip()
                     
                     if page_clicked:
-                        time.sleep(3)  # 페이지 로딩 대기
                         
                         # 해당 페이지의 기기 목록 가져오기
                         page_html = driver.execute_script("""
@@ -889,7 +1046,15 @@ class KTCrawler:
                             page_devices = self.parse_html_data_with_plan(page_html, plan)
                             devices.extend(page_devices)
                             logger.info(f"페이지 {page_num}에서 {len(page_devices)}개 기기 추가 수집")
+                            self.telemetry.add_bytes(len(page_html))
+                            
+                            reused = self._incremental_snapshot(plan, sub_type, page_devices, devices)
+                            if reused is not None:
+                                devices.extend(reused)
+                                break
                 
+                if page_count > 1:
+                    timer.lap('paginate', pages=page_count)
                 logger.info(f"요금제 '{plan['name']}'에서 총 {len(devices)}개 기기 수집 완료")
             
         except TimeoutException as e:
@@ -911,6 +1076,24 @@ class KTCrawler:
         
         return devices
     
+    def _incremental_snapshot(self, plan: Dict[str, Any], sub_type: Optional[Dict[str, str]],
+                              page_devices: List[DeviceData], collected: List[DeviceData]) -> Optional[List[DeviceData]]:
+        """증분 모드: 페이지가 이전과 같으면 나머지 기기를 이전 스냅샷에서 가져옴
+        
+        Returns:
+            스냅샷 기기 리스트 (페이지 이동을 멈춰야 함), 계속 수집해야 하면 None
+        """
+        if not self.config.get('incremental') or not sub_type:
+            return None
+        key = combo_key(plan['name'], sub_type['name'], plan['network_type'])
+        if not self.crawl_index.page_unchanged(key, page_devices):
+            return None
+        
+        seen = {d.device_nm for d in collected}
+        reused = [DeviceData(**row) for row in self.crawl_index.snapshot_rows(key, exclude_devices=seen)]
+        logger.info(f"변경 없는 페이지 - 이전 결과 {len(reused)}개 재사용: {plan['name']}")
+        return reused
+    
     def parse_html_data_with_plan(self, html_content: str, plan: Dict[str, Any]) -> List[DeviceData]:
         """요금제 정보를 포함한 HTML 데이터 파싱"""
         devices = self.parse_html_data(html_content)
@@ -929,13 +1112,11 @@ class KTCrawler:
         self.current_driver = driver  # 현재 드라이버 참조 저장
         
         # 가입유형 정보
-        subscription_types = [
-            # {'value': '01', 'name': '신규가입'},  # 이미 수집 완료
-            {'value': '02', 'name': '번호이동'},
-            {'value': '04', 'name': '기기변경'}
-        ]
+        subscription_types = self.SUBSCRIPTION_TYPES
         
         try:
+            timer = self.telemetry.timer()
+            
             # 먼저 메인 페이지로 이동
             try:
                 driver.get("https://shop.kt.com/")
@@ -943,28 +1124,23 @@ class KTCrawler:
                 logger.warning(f"메인 페이지 로드 실패: {e}")
                 # 바로 지원금 페이지로 이동 시도
             
-            time.sleep(2)
+            self.waiter.network_idle(driver, 'page_ready', fallback=2)
             
             # 그 다음 지원금 페이지로 이동
             driver.get(self.BASE_URL)
             self.wait_for_page_ready(driver)
             
-            # 페이지가 로드될 때까지 대기
-            time.sleep(5)
+            # 기기 목록이 로드될 때까지 대기
+            self.waiter.until(driver, 'prod_list_ready', self.PROD_LIST_READY_JS, fallback=5)
+            timer.lap('page_load')
             
             # 초기 정렬 설정 - 최근 공시 순
-            initial_sort = driver.execute_script("""
-                var sortBtn = document.getElementById('sortProd1');
-                if (sortBtn && !sortBtn.classList.contains('active')) {
-                    sortBtn.click();
-                    return true;
-                }
-                return false;
-            """)
-            
-            if initial_sort:
+            if self._apply_recent_sort(driver):
                 logger.info("초기 정렬: 최근 공시 순")
-                time.sleep(2)
+            
+            # 세션 갱신 기준 / 교체용 드라이버 준비 시작
+            policy = self._refresh_policy()
+            self.standby.warm()
             
             # 각 가입유형별로 처리
             logger.info(f"처리할 가입유형 목록: {[s['name'] for s in subscription_types]}")
@@ -990,66 +1166,28 @@ class KTCrawler:
                     if sub_idx > 0:
                         logger.info(f"가입유형 간 WebDriver 세션 갱신 중...")
                         
-                        # 기존 드라이버 종료
-                        try:
-                            driver.quit()
-                        except:
-                            pass
-                        
-                        # 새 드라이버 생성
-                        time.sleep(3)
-                        self.current_driver = self.create_driver()
+                        self.current_driver = self._swap_driver(driver)
                         driver = self.current_driver
-                        
-                        # 페이지 재로드
-                        driver.get(self.BASE_URL)
-                        self.wait_for_page_ready(driver)
-                        time.sleep(5)
+                        policy.reset()
                         
                         logger.info("WebDriver 세션 갱신 완료")
                     
                     print(f"\n가입유형: {sub_type['name']} 처리 시작")
                     
-                    # 가입유형 선택
-                    type_selected = driver.execute_script(f"""
-                        var select = document.getElementById('sbscTypeCd');
-                        if (select) {{
-                            select.value = '{sub_type['value']}';
-                            // change 이벤트 발생
-                            var event = new Event('change', {{ bubbles: true }});
-                            select.dispatchEvent(event);
-                            return true;
-                        }}
-                        return false;
-                    """)
-                    
-                    if not type_selected:
+                    # 가입유형 선택 (페이지 업데이트 대기 포함)
+                    if not self._select_subscription_type(driver, sub_type):
                         logger.error(f"가입유형 선택 실패: {sub_type['name']}")
                         continue
                     
-                    time.sleep(3)  # 페이지 업데이트 대기
-                    
-                    # 정렬 옵션 설정 - 최근 공시 순
-                    sort_applied = driver.execute_script("""
-                    // 최근 공시 순 정렬 버튼 클릭
-                    var sortBtn = document.getElementById('sortProd1');
-                    if (sortBtn && !sortBtn.classList.contains('active')) {
-                        sortBtn.click();
-                        return true;
-                    }
-                    
-                    // 이미 선택되어 있거나 버튼이 없는 경우에도 진행
-                    return false;
-                    """)
-                    
-                    if sort_applied:
+                    # 정렬 옵션 설정 - 최근 공시 순 (이미 선택되어 있거나 버튼이 없는 경우에도 진행)
+                    if self._apply_recent_sort(driver):
                         logger.info("최근 공시 순으로 정렬 적용")
-                        time.sleep(2)  # 정렬 후 페이지 갱신 대기
                     
                     # 1. 요금제 목록 수집
                     print("요금제 목록 수집 중...")
                     
-                    rate_plans = self.collect_rate_plans(driver)
+                    with self.telemetry.step('plan_list', sub_type=sub_type['name']):
+                        rate_plans = self.collect_rate_plans(driver)
                     
                     if not rate_plans:
                         logger.warning(f"{sub_type['name']}에서 요금제를 찾을 수 없습니다. 기본 모드로 수집합니다.")
@@ -1091,67 +1229,25 @@ class KTCrawler:
                             if i < start_index:
                                 continue
                             
+                            # 앞선 가입유형과 결과가 같을 것으로 예측되면 나중에 복사
+                            if self._defer_plan(sub_type, plan):
+                                continue
+                            
                             self.current_plan_index = i
-                            # WebDriver 상태 확인 및 재생성 (개선된 로직)
-                            should_refresh = False
-
-                            # 20개 요금제마다 정기 갱신 (30개 -> 20개로 줄임)
-                            if i > 0 and i % 20 == 0:
-                                should_refresh = True
-                                logger.info(f"정기 WebDriver 세션 갱신 (요금제 {i}/{len(rate_plans)})")
-                            # 매 요금제마다 상태 체크
-                            elif i > 0 and not self.check_driver_health(driver):
-                                should_refresh = True
-                                logger.warning(f"WebDriver 상태 불량 감지, 재생성 필요 (요금제 {i}/{len(rate_plans)})")
-
-                            if should_refresh:
-                                logger.info("WebDriver 세션을 갱신합니다...")
-
-                                # 현재 URL 저장
-                                current_url = None
-                                try:
-                                    current_url = driver.current_url
-                                except:
-                                    current_url = self.BASE_URL
+                            # WebDriver 상태 확인 및 갱신 (Chrome RSS / 응답 지연 기준)
+                            refresh_reason = self._refresh_reason(driver, policy) if i > 0 else None
 
-                                # 기존 드라이버 종료 (강제 종료)
-                                try:
-                                    driver.quit()
-                                except:
-                                    pass
-
-                                # 잠시 대기 (프로세스 정리 시간)
-                                time.sleep(3)
-
-                                # 새 드라이버 생성 (최대 3회 시도)
-                                for retry in range(3):
-                                    try:
-                                        self.current_driver = self.create_driver()
-                                        driver = self.current_driver
-                                        break
-                                    except Exception as e:
-                                        logger.error(f"드라이버 재생성 실패 ({retry+1}/3): {e}")
-                                        if retry < 2:
-                                            time.sleep(5)
-                                        else:
-                                            raise Exception("드라이버 재생성 실패")
+                            if refresh_reason:
+                                logger.info(f"WebDriver 세션을 갱신합니다 ({refresh_reason}, 요금제 {i}/{len(rate_plans)})")
 
-                                # 페이지 재로드
-                                driver.get(current_url)
-                                self.wait_for_page_ready(driver)
-                                time.sleep(3)
+                                # 대기 드라이버로 교체 (없으면 새로 생성, 생성 실패는 예외)
+                                self.current_driver = self._swap_driver(driver)
+                                driver = self.current_driver
+                                policy.reset()
 
                                 # 가입유형 재선택
                                 try:
-                                    driver.execute_script(f"""
-                                        var select = document.getElementById('sbscTypeCd');
-                                        if (select) {{
-                                            select.value = '{sub_type['value']}';
-                                            var event = new Event('change', {{ bubbles: true }});
-                                            select.dispatchEvent(event);
-                                        }}
-                                    """)
-                                    time.sleep(2)
+                                    self._select_subscription_type(driver, sub_type)
                                 except Exception as e:
                                     logger.error(f"가입유형 재선택 실패: {e}")
 
@@ -1178,33 +1274,16 @@ class KTCrawler:
                                                                      'no such window', 'session not created']):
                                     logger.warning("WebDriver 세션 오류 감지, 재생성 시도...")
 
-                                    # 기존 드라이버 강제 종료
-                                    try:
-                                        driver.quit()
-                                    except:
-                                        pass
-
-                                    time.sleep(5)  # 프로세스 정리 시간 충분히 부여
-
-                                    # 새 드라이버 생성 (최대 3회 시도)
+                                    # 대기 드라이버로 교체 (없으면 새로 생성, 최대 3회 시도)
                                     for retry in range(3):
+                                        self.telemetry.retry('plan')
                                         try:
-                                            self.current_driver = self.create_driver()
+                                            self.current_driver = self._swap_driver(driver)
                                             driver = self.current_driver
-                                            driver.get(self.BASE_URL)
-                                            self.wait_for_page_ready(driver)
-                                            time.sleep(3)
+                                            policy.reset()
 
                                             # 가입유형 재선택
-                                            driver.execute_script(f"""
-                                                var select = document.getElementById('sbscTypeCd');
-                                                if (select) {{
-                                                    select.value = '{sub_type['value']}';
-                                                    var event = new Event('change', {{ bubbles: true }});
-                                                    select.dispatchEvent(event);
-                                                }}
-                                            """)
-                                            time.sleep(2)
+                                            self._select_subscription_type(driver, sub_type)
 
                                             # 재시도
                                             devices = self.crawl_data_for_plan(driver, plan, sub_type, is_first=True)
@@ -1226,6 +1305,11 @@ class KTCrawler:
                                 self.all_data.extend(devices)
                             
                             extracted_count += len(devices)
+                            if devices:
+                                self.planner.record(plan['id'], sub_type['value'], devices)
+                            
+                            # 리소스 차단 집계 (performance 로그 버퍼 비우기)
+                            self.browser_profile.collect(driver)
                             
                             # 요금제별 결과 표시
                             plan_elapsed = time.time() - plan_start_time
@@ -1246,7 +1330,7 @@ class KTCrawler:
                             
                             # 다음 요금제 처리 전 잠시 대기
                             if i < len(rate_plans) - 1:
-                                time.sleep(self.config.get('delay_between_requests', 0.5))
+                                self.concurrency.pause()
                     
                     
                     # 모든 요금제 처리 완료 후 모달 닫기
@@ -1257,7 +1341,7 @@ class KTCrawler:
                                 closeBtn.click();
                             }
                         """)
-                        time.sleep(1)
+                        self.waiter.until(driver, 'rate_modal_close', self.LAYER_CLOSED_JS, fallback=1)
                     except:
                         pass
 
@@ -1286,6 +1370,9 @@ class KTCrawler:
                     # 오류가 발생해도 다음 가입유형 처리를 계속함
                     continue
             
+            # 미룬 요금제 처리
+            extracted_count += self._materialize_deferred_plans(self.current_driver)
+            
             logger.info(f"총 추출된 기기 수: {extracted_count}")
             
             # 최종 진행상황 요약 표시
@@ -1298,6 +1385,666 @@ class KTCrawler:
         
         return extracted_count
     
+    def _defer_plan(self, sub_type: Dict[str, str], plan: Dict[str, Any]) -> bool:
+        """앞선 가입유형과 결과가 같을 것으로 예측되는 요금제면 수집을 미룸"""
+        sources = []
+        for s in self.SUBSCRIPTION_TYPES:
+            if s['value'] == sub_type['value']:
+                break
+            sources.append(s['value'])
+        
+        if self.planner.should_defer(plan['id'], sub_type['value'], sources):
+            self.deferred_plans[(plan['id'], sub_type['value'])] = (sub_type, plan)
+            logger.info(f"중복 예측 - 수집 미룸: {sub_type['name']} / {plan['name']}")
+            return True
+        return False
+    
+    def _materialize_deferred_plans(self, driver: Optional[webdriver.Chrome]) -> int:
+        """미룬 요금제 처리 - 원본 가입유형 결과 복사, 원본이 없으면 직접 수집
+        
+        Returns:
+            추가된 기기 수
+        """
+        added = 0
+        if not self.deferred_plans:
+            self.planner.finish()
+            return added
+        
+        names = {s['value']: s['name'] for s in self.SUBSCRIPTION_TYPES}
+        
+        # 원본 결과가 없는 요금제는 직접 수집 (재개 실행 등)
+        unresolved = self.planner.unresolved()
+        if unresolved and driver is not None:
+            selected = None
+            for plan_id, variant, _ in unresolved:
+                sub_type, plan = self.deferred_plans.pop((plan_id, variant))
+                if selected != sub_type['value']:
+                    self._select_subscription_type(driver, sub_type)
+                    selected = sub_type['value']
+                devices = self.crawl_data_for_plan(driver, plan, sub_type, is_first=True)
+                for device in devices:
+                    device.scrb_type_name = sub_type['name']
+                with self.data_lock:
+                    self.all_data.extend(devices)
+                added += len(devices)
+        
+        # 원본 가입유형 결과 복사
+        copied_plans = 0
+        for plan_id, variant, source in self.planner.resolved():
+            if (plan_id, variant) not in self.deferred_plans:
+                continue
+            sub_type, plan = self.deferred_plans[(plan_id, variant)]
+            with self.data_lock:
+                source_rows = self.all_data.where(plan_name=plan['name'], scrb_type_name=names[source])
+                copied = self.all_data.copy_rows(source_rows, scrb_type_name=sub_type['name'])
+            added += copied
+            copied_plans += 1
+        
+        print(f"\n미룬 요금제 {copied_plans}개 - 원본 결과 {added}개 반영")
+        self.deferred_plans = {}
+        self.planner.finish()
+        return added
+    
+    def _select_subscription_type(self, driver: webdriver.Chrome, sub_type: Dict[str, str]) -> bool:
+        """가입유형 선택 (change 이벤트 발생 후 기기 목록 갱신 대기)"""
+        with self.waiter.mutation(driver, 'subscription_type', '#prodList', fallback=3) as watch:
+            selected = driver.execute_script(f"""
+                var select = document.getElementById('sbscTypeCd');
+                if (select) {{
+                    select.value = '{sub_type['value']}';
+                    var event = new Event('change', {{ bubbles: true }});
+                    select.dispatchEvent(event);
+                    return true;
+                }}
+                return false;
+            """)
+            if not selected:
+                watch.skip()
+        return selected
+    
+    def _apply_recent_sort(self, driver: webdriver.Chrome) -> bool:
+        """최근 공시 순 정렬 (정렬 버튼을 눌렀으면 True, 기기 목록 갱신 대기)"""
+        with self.waiter.mutation(driver, 'sort_apply', '#prodList', fallback=2) as watch:
+            sort_applied = driver.execute_script("""
+                var sortBtn = document.getElementById('sortProd1');
+                if (sortBtn && !sortBtn.classList.contains('active')) {
+                    sortBtn.click();
+                    return true;
+                }
+                return false;
+            """)
+            if not sort_applied:
+                watch.skip()
+        return sort_applied
+    
+    def _record_replay_template(self, driver: webdriver.Chrome, plan: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """요금제 적용 시 발생한 prodList 요청을 재생 템플릿으로 기록
+        
+        crawl_data_for_plan() 실행 직후 호출하며, performance 로그에서
+        응답에 기기 목록(li cd=...)이 포함되고 파라미터에 요금제 ID가 들어간 요청을 찾습니다.
+        """
+        events = drain_performance_log(driver)
+        exchanges = collect_exchanges(events, url_contains='shop.kt.com')
+        logger.debug(f"기록된 요청 {len(exchanges)}개 검사")
+        
+        for exchange in reversed(exchanges):
+            if exchange['status'] != 200:
+                continue
+            
+            post_data = get_request_post_data(driver, exchange)
+            split = urlsplit(exchange['url'])
+            in_body = bool(post_data)
+            params = parse_qsl(post_data if in_body else split.query, keep_blank_values=True)
+            
+            # 요금제 ID가 들어간 파라미터 찾기 (접두/접미어가 붙은 경우 포함)
+            plan_key, prefix, suffix = None, '', ''
+            for key, value in params:
+                if value == plan['id']:
+                    plan_key = key
+                    break
+                if len(value) >= 4 and value in plan['id']:
+                    plan_key = key
+                    prefix, suffix = plan['id'].split(value, 1)
+                    break
+            if plan_key is None:
+                continue
+            
+            body = get_response_body(driver, exchange['request_id'])
+            if not body or '<li cd="' not in body:
+                continue
+            
+            page_key = next((key for key, _ in params if self.PAGE_PARAM_PATTERN.match(key)), None)
+            headers = {
+                k: v for k, v in exchange['headers'].items()
+                if not k.startswith(':') and k.lower() not in ('content-length', 'host', 'cookie', 'accept-encoding')
+            }
+            
+            template = {
+                'method': exchange['method'],
+                'url': urlunsplit((split.scheme, split.netloc, split.path, '', '')) if not in_body else exchange['url'],
+                'params': params,
+                'in_body': in_body,
+                'headers': headers,
+                'plan_key': plan_key,
+                'plan_prefix': prefix,
+                'plan_suffix': suffix,
+                'page_key': page_key
+            }
+            logger.info(f"재생 템플릿 기록: {template['method']} {split.path} (요금제 파라미터: {plan_key}, 페이지 파라미터: {page_key})")
+            return template
+        
+        logger.warning("prodList 요청을 찾지 못했습니다.")
+        return None
+    
+    def _build_replay_request(self, template: Dict[str, Any], plan: Dict[str, Any], page: int = 1) -> Optional[Dict[str, Any]]:
+        """템플릿에 요금제/페이지를 대입한 요청 인자 생성"""
+        plan_id = plan['id']
+        prefix, suffix = template['plan_prefix'], template['plan_suffix']
+        if not plan_id.startswith(prefix) or not plan_id.endswith(suffix):
+            return None
+        plan_value = plan_id[len(prefix):len(plan_id) - len(suffix)]
+        
+        params = []
+        for key, value in template['params']:
+            if key == template['plan_key']:
+                value = plan_value
+            elif key == template['page_key']:
+                value = str(page)
+            params.append((key, value))
+        
+        request = {'headers': template['headers']}
+        if template['in_body']:
+            request['data'] = urlencode(params)
+            request['url'] = template['url']
+        else:
+            request['url'] = f"{template['url']}?{urlencode(params)}"
+        return request
+    
+    def _extract_prod_list_html(self, response) -> Optional[str]:
+        """재생 응답에서 기기 목록 HTML 추출 (JSON 응답이면 HTML 문자열 필드 탐색)"""
+        text = response.text
+        if 'json' not in response.headers.get('Content-Type', ''):
+            return text if ('<li cd="' in text or 'prodList' in text) else None
+        
+        try:
+            stack = [response.json()]
+        except ValueError:
+            return None
+        while stack:
+            value = stack.pop()
+            if isinstance(value, str) and '<li cd="' in value:
+                return value
+            if isinstance(value, dict):
+                stack.extend(value.values())
+            elif isinstance(value, list):
+                stack.extend(value)
+        return None
+    
+    def _replay_plan(self, fetcher: HttpFetcher, template: Dict[str, Any], plan: Dict[str, Any],
+                     sub_type: Dict[str, str]) -> Optional[List[DeviceData]]:
+        """기록한 요청으로 요금제 1개 수집 (실패 시 None)"""
+        with self.telemetry.task('replay_plan', plan=plan['name'], sub_type=sub_type['name']) as task:
+            devices = self._replay_plan_pages(fetcher, template, plan, sub_type)
+            task.rows = len(devices or [])
+            task.ok = devices is not None
+        return devices
+    
+    def _replay_plan_pages(self, fetcher: HttpFetcher, template: Dict[str, Any], plan: Dict[str, Any],
+                           sub_type: Dict[str, str]) -> Optional[List[DeviceData]]:
+        """페이지별 요청 재생 → 추출 (단계별 소요 시간 기록)"""
+        devices = []
+        timer = self.telemetry.timer()
+        page = 1
+        page_count = 1
+        
+        while page <= page_count:
+            request = self._build_replay_request(template, plan, page)
+            if request is None:
+                return None
+            
+            url = request.pop('url')
+            response = fetcher.request(template['method'], url, **request)
+            timer.lap('page_load', ok=response is not None, page=page)
+            if response is None or response.status_code != 200 or looks_blocked(response):
+                return None
+            self.telemetry.add_bytes(len(response.content), 'xhr')
+            
+            html = self._extract_prod_list_html(response)
+            if html is None:
+                return None
+            
+            page_devices = self.parse_html_data_with_plan(html, plan)
+            devices.extend(page_devices)
+            timer.lap('extract', page=page)
+            
+            # 증분 모드: 변경 없는 페이지면 나머지는 스냅샷 사용
+            reused = self._incremental_snapshot(plan, sub_type, page_devices, devices)
+            if reused is not None:
+                devices.extend(reused)
+                break
+            
+            if page == 1:
+                if self.config.get('max_devices') and len(devices) > self.config['max_devices']:
+                    devices = devices[:self.config['max_devices']]
+                    break
+                if self.config.get('first_page_only') or not template['page_key']:
+                    break
+                page_numbers = [int(n) for n in re.findall(r'pageno="(\d+)"', html)]
+                page_count = max(page_numbers) if page_numbers else 1
+            
+            page += 1
+        
+        for device in devices:
+            device.scrb_type_name = sub_type['name']
+        return devices
+    
+    def crawl_data_replay(self, driver: webdriver.Chrome) -> Optional[int]:
+        """재생 모드 크롤링
+        
+        가입유형마다 첫 요금제만 브라우저로 적용해 prodList 요청을 기록하고,
+        나머지 요금제는 기록한 요청을 HTTP로 동시에 재생합니다.
+        
+        Returns:
+            추출한 기기 수, 요청 기록에 실패하면 None (브라우저 모드로 대체)
+        """
+        extracted_count = 0
+        self.current_driver = driver
+        
+        if not hasattr(self, 'completed_scrb_types'):
+            self.completed_scrb_types = []
+        sub_types = [s for s in self.SUBSCRIPTION_TYPES if s['name'] not in self.completed_scrb_types]
+        if not sub_types:
+            return 0
+        
+        driver.get(self.BASE_URL)
+        self.wait_for_page_ready(driver)
+        self.waiter.until(driver, 'prod_list_ready', self.PROD_LIST_READY_JS, fallback=3)
+        
+        self._apply_recent_sort(driver)
+        
+        # 1. 가입유형별 요청 기록 (첫 요금제는 브라우저 결과를 그대로 사용)
+        templates = {}
+        recorded_devices = {}
+        rate_plans = None
+        for sub_type in sub_types:
+            if not self._select_subscription_type(driver, sub_type):
+                logger.error(f"가입유형 선택 실패: {sub_type['name']}")
+                return None
+            
+            if rate_plans is None:
+                with self.telemetry.step('plan_list'):
+                    rate_plans = self.collect_rate_plans(driver)
+                if not rate_plans:
+                    logger.warning("요금제를 찾을 수 없습니다.")
+                    return None
+                if self.config.get('max_plans'):
+                    rate_plans = rate_plans[:self.config['max_plans']]
+                print(f"{len(rate_plans)}개 요금제 발견")
+            
+            drain_performance_log(driver)  # 이전 이벤트 버리기
+            devices = self.crawl_data_for_plan(driver, rate_plans[0], sub_type, is_first=True)
+            template = self._record_replay_template(driver, rate_plans[0])
+            if template is None:
+                return None
+            
+            for device in devices:
+                device.scrb_type_name = sub_type['name']
+            templates[sub_type['name']] = template
+            recorded_devices[sub_type['name']] = devices
+        
+        # 2. 나머지 요금제 동시 재생
+        fetcher = HttpFetcher(
+            max_connections=self.config['replay_workers'],
+            max_per_host=self.config['replay_workers'],
+            timeout=self.config['replay_timeout']
+        )
+        self.fixtures.configure_fetcher(fetcher)
+        cookies_to_session(driver, fetcher.session)
+        
+        tasks = [(sub_type, plan) for sub_type in sub_types for plan in rate_plans[1:]
+                 if not self._defer_plan(sub_type, plan)]
+        results = {(s['name'], rate_plans[0]['id']): recorded_devices[s['name']] for s in sub_types}
+        for sub_type in sub_types:
+            if recorded_devices[sub_type['name']]:
+                self.planner.record(rate_plans[0]['id'], sub_type['value'], recorded_devices[sub_type['name']])
+        failed = []
+        
+        print(f"\n재생 모드: {len(tasks)}개 요청 (동시 {self.config['replay_workers']}개)")
+        try:
+            with ThreadPoolExecutor(max_workers=self.config['replay_workers']) as executor:
+                futures = {
+                    executor.submit(self._replay_plan, fetcher, templates[sub_type['name']], plan, sub_type): (sub_type, plan)
+                    for sub_type, plan in tasks
+                }
+                for done, future in enumerate(as_completed(futures), 1):
+                    sub_type, plan = futures[future]
+                    try:
+                        devices = future.result()
+                    except Exception as e:
+                        logger.error(f"재생 오류 - {sub_type['name']} / {plan['name']}: {e}")
+                        devices = None
+                    
+                    if devices is None:
+                        failed.append((sub_type, plan))
+                    else:
+                        results[(sub_type['name'], plan['id'])] = devices
+                        if devices:
+                            self.planner.record(plan['id'], sub_type['value'], devices)
+                    
+                    if done % 20 == 0 or done == len(tasks):
+                        print(f"진행: {done}/{len(tasks)} (실패 {len(failed)}개)")
+        finally:
+            fetcher.close()
+        
+        # 3. 재생에 실패한 요금제는 브라우저로 수집
+        if failed:
+            logger.warning(f"재생 실패 {len(failed)}개 요금제 - 브라우저로 수집합니다.")
+            for sub_type in sub_types:
+                sub_failed = [plan for s, plan in failed if s['name'] == sub_type['name']]
+                if not sub_failed:
+                    continue
+                self._select_subscription_type(driver, sub_type)
+                for plan in sub_failed:
+                    devices = self.crawl_data_for_plan(driver, plan, sub_type, is_first=True)
+                    for device in devices:
+                        device.scrb_type_name = sub_type['name']
+                    results[(sub_type['name'], plan['id'])] = devices
+                    if devices:
+                        self.planner.record(plan['id'], sub_type['value'], devices)
+        
+        # 4. 요금제 순서대로 결과 반영
+        for sub_type in sub_types:
+            sub_type_progress = []
+            for plan in rate_plans:
+                devices = results.get((sub_type['name'], plan['id']), [])
+                with self.data_lock:
+                    self.all_data.extend(devices)
+                extracted_count += len(devices)
+                sub_type_progress.append({
+                    'plan_name': plan['name'],
+                    'network_type': plan['network_type'],
+                    'monthly_fee': plan['monthly_fee'],
+                    'device_count': len(devices),
+                    'elapsed_time': 0.0
+                })
+            
+            self._print_subscription_type_summary(sub_type['name'], sub_type_progress)
+            self.progress_details['subscription_types'][sub_type['name']] = {
+                'total_devices': sum(p['device_count'] for p in sub_type_progress),
+                'rate_plans': sub_type_progress
+            }
+            self.completed_scrb_types.append(sub_type['name'])
+            self.save_checkpoint()
+        
+        # 미룬 요금제 처리
+        extracted_count += self._materialize_deferred_plans(driver)
+        
+        logger.info(f"재생 모드 총 추출된 기기 수: {extracted_count}")
+        self._print_final_progress_summary()
+        
+        return extracted_count
+    
+    def crawl_data_parallel(self, driver: webdriver.Chrome) -> Optional[int]:
+        """병렬 크롤링
+        
+        (가입유형, 요금제 인덱스 구간)을 max_workers개 드라이버에 나누어 수집합니다.
+        자기 구간을 먼저 끝낸 워커는 남은 작업이 가장 많은 워커의 구간을 가져갑니다.
+        결과는 가입유형/요금제 순서대로 all_data에 반영하므로 체크포인트의
+        current_scrb_type / current_plan_index 재개 지점은 순차 모드와 같은 의미를 가집니다.
+        
+        Returns:
+            추출한 기기 수, 요금제 목록을 가져오지 못하면 None (순차 모드로 대체)
+        """
+        self.current_driver = driver
+        workers = self.concurrency.max_workers  # 자동 조절 시 상한만큼 워커를 두고 동시 실행은 슬롯으로 제한
+        
+        if not hasattr(self, 'completed_scrb_types'):
+            self.completed_scrb_types = []
+        if not hasattr(self, 'current_scrb_type'):
+            self.current_scrb_type = None
+        if not hasattr(self, 'current_plan_index'):
+            self.current_plan_index = None
+        
+        sub_types = [s for s in self.SUBSCRIPTION_TYPES if s['name'] not in self.completed_scrb_types]
+        if not sub_types:
+            return 0
+        
+        # 1. 요금제 목록 (가입유형과 무관하게 동일 - 재생 모드와 같은 가정)
+        driver.get(self.BASE_URL)
+        self.wait_for_page_ready(driver)
+        self.waiter.until(driver, 'prod_list_ready', self.PROD_LIST_READY_JS, fallback=3)
+        self._apply_recent_sort(driver)
+        
+        if not self._select_subscription_type(driver, sub_types[0]):
+            logger.error(f"가입유형 선택 실패: {sub_types[0]['name']}")
+            return None
+        
+        rate_plans = self.collect_rate_plans(driver)
+        if not rate_plans:
+            logger.warning("요금제를 찾을 수 없습니다.")
+            return None
+        if self.config.get('max_plans'):
+            rate_plans = rate_plans[:self.config['max_plans']]
+        print(f"{len(rate_plans)}개 요금제 발견")
+        
+        # 2. 작업 공간 분할 (재개 지점 이후, 미룬 요금제는 수집하지 않고 반영 시 건너뜀)
+        state = {
+            'sub_types': sub_types,
+            'rate_plans': rate_plans,
+            'results': {},  # {(가입유형, 인덱스): 기기 리스트} - 순서대로 반영되기 전까지 보관
+            'deferred': set(),  # 미룬 (가입유형, 인덱스) - 워커는 건너뛰고 반영 시 통과
+            'entries': {},  # {(가입유형, 인덱스): 진행 항목}
+            'next': {},  # 가입유형별 다음 반영 인덱스
+            'progress': {s['name']: [] for s in sub_types},
+            'extracted': 0,
+            'since_checkpoint': 0
+        }
+        ranges = []
+        for sub_type in sub_types:
+            start = 0
+            if self.current_scrb_type == sub_type['name'] and self.current_plan_index is not None:
+                start = self.current_plan_index + 1
+                logger.info(f"{sub_type['name']}: 요금제 인덱스 {start}부터 재개")
+            state['next'][sub_type['name']] = start
+            for i in range(start, len(rate_plans)):
+                if self._defer_plan(sub_type, rate_plans[i]):
+                    state['deferred'].add((sub_type['name'], i))
+            ranges.append((sub_type['name'], start, len(rate_plans)))
+        
+        queue = StealingQueue(ranges, workers)
+        print(f"\n병렬 모드: 워커 {workers}개, {queue.remaining()}개 요금제")
+        for worker, assigned in queue.assignments().items():
+            logger.info(f"워커 {worker} 초기 구간: {assigned}")
+        
+        # 3. 워커 실행 (워커 0은 현재 드라이버 사용, 세션 갱신용 대기 드라이버 준비 시작)
+        self.standby.warm()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._parallel_worker, worker, queue, state,
+                                driver if worker == 0 else None, sub_types[0]['name'] if worker == 0 else None)
+                for worker in range(workers)
+            ]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"병렬 워커 오류: {e}")
+                    if self.config['debug']:
+                        traceback.print_exc()
+        
+        logger.info(f"병렬 모드 작업 훔치기: {queue.stats['steals']}회 ({queue.stats['stolen_items']}개 요금제)")
+        
+        # 마지막 구간이 미룬 요금제뿐이면 반영되지 않았으므로 한 번 더 반영
+        with self.data_lock:
+            self._flush_parallel_results(state)
+        self.save_checkpoint()
+        
+        # 4. 미룬 요금제 처리
+        extracted_count = state['extracted'] + self._materialize_deferred_plans(self.current_driver)
+        
+        logger.info(f"병렬 모드 총 추출된 기기 수: {extracted_count}")
+        self._print_final_progress_summary()
+        
+        return extracted_count
+    
+    def _parallel_worker(self, worker: int, queue: StealingQueue, state: Dict[str, Any],
+                         driver: Optional[webdriver.Chrome] = None, selected: Optional[str] = None):
+        """병렬 모드 워커 - 큐에서 (가입유형, 요금제 인덱스)를 받아 수집"""
+        sub_types = {s['name']: s for s in state['sub_types']}
+        rate_plans = state['rate_plans']
+        policy = self._refresh_policy()
+        
+        try:
+            while True:
+                item = queue.next(worker)
+                if item is None:
+                    break
+                
+                name, i = item
+                if item in state['deferred']:  # 미룬 요금제 (시작 전에 정해지고 이후 변경 없음)
+                    continue
+                sub_type, plan = sub_types[name], rate_plans[i]
+                plan_start_time = time.time()
+                devices = []
+                
+                # 동시 실행 수는 적응형 동시성 한도를 따름 (한도가 줄면 다음 요금제 전에 대기)
+                # 수집 오류 시 순차 모드와 같이 드라이버 교체 + 가입유형 재선택 후 최대 3회 재시도
+                # (실패한 채 완료 처리하면 체크포인트 재개 지점이 이 요금제를 지나쳐 다시 수집되지 않음)
+                with self.concurrency.slot():
+                    for attempt in range(4):
+                        try:
+                            # 드라이버 생성/갱신 (재시도 시 교체, 그 외 Chrome RSS / 응답 지연 기준)
+                            refresh_reason = self._refresh_reason(driver, policy) if driver is not None and not attempt else None
+                            if driver is None or refresh_reason or attempt:
+                                if refresh_reason:
+                                    logger.info(f"[워커 {worker}] WebDriver 세션 갱신 ({refresh_reason})")
+                                driver = self._open_parallel_driver(driver)
+                                policy.reset()
+                                selected = None
+                        
+                            if selected != name:
+                                if not self._select_subscription_type(driver, sub_type):
+                                    raise Exception(f"가입유형 선택 실패: {name}")
+                                selected = name
+                        
+                            devices = self.crawl_data_for_plan(driver, plan, sub_type, is_first=True)
+                            self.browser_profile.collect(driver)
+                            break
+                        except Exception as e:
+                            selected = None
+                            if attempt == 0:
+                                logger.error(f"[워커 {worker}] {name} / {plan['name']} 수집 오류: {e}")
+                                if self.config['debug']:
+                                    traceback.print_exc()
+                            else:
+                                logger.error(f"[워커 {worker}] 재시도 실패 ({attempt}/3): {e}")
+                            if attempt == 3:  # 마지막 시도 실패
+                                devices = []
+                                break
+                            self.telemetry.retry('plan')
+                            if attempt > 0:
+                                time.sleep(5)
+                
+                for device in devices:
+                    device.scrb_type_name = name
+                if devices:
+                    self.planner.record(plan['id'], sub_type['value'], devices)
+                
+                elapsed = time.time() - plan_start_time
+                print(f"[워커 {worker}] {name} [{i+1}/{len(rate_plans)}] {plan['name']}: {len(devices)}개 기기 ({elapsed:.1f}초)")
+                self._complete_parallel_plan(state, name, i, plan, devices, elapsed)
+        finally:
+            if worker == 0:
+                # 미룬 요금제 처리에 사용
+                self.current_driver = driver
+            elif driver is not None:
+                try:
+                    self.browser_profile.collect(driver)
+                    driver.quit()
+                except:
+                    pass
+    
+    def _open_parallel_driver(self, old_driver: Optional[webdriver.Chrome]) -> webdriver.Chrome:
+        """병렬 워커용 드라이버 (재)생성 후 지원금 페이지 준비 (갱신은 대기 드라이버 우선)"""
+        if old_driver is not None:
+            return self._swap_driver(old_driver)
+        
+        driver = self.create_driver()
+        self._prepare_fresh_driver(driver)
+        return driver
+    
+    def _complete_parallel_plan(self, state: Dict[str, Any], name: str, index: int,
+                                plan: Dict[str, Any], devices: List[DeviceData], elapsed: float):
+        """요금제 결과 보관 후 순서대로 반영 가능한 결과를 all_data에 반영하고 체크포인트 저장"""
+        with self.data_lock:
+            state['results'][(name, index)] = devices
+            state['entries'][(name, index)] = {
+                'plan_name': plan['name'],
+                'network_type': plan['network_type'],
+                'monthly_fee': plan['monthly_fee'],
+                'device_count': len(devices),
+                'elapsed_time': elapsed
+            }
+            
+            flushed, finished = self._flush_parallel_results(state)
+            state['since_checkpoint'] += flushed
+            if finished or state['since_checkpoint'] >= 10:
+                self.save_checkpoint()
+                state['since_checkpoint'] = 0
+                logger.info(f"체크포인트 저장: {len(self.all_data)}개 기기 (재개 지점: {self.current_scrb_type} / {self.current_plan_index})")
+    
+    def _flush_parallel_results(self, state: Dict[str, Any]) -> Tuple[int, bool]:
+        """가입유형/요금제 순서대로 이어지는 결과만 all_data에 반영 (data_lock 보유 상태에서 호출)
+        
+        Returns:
+            (반영한 요금제 수, 완료된 가입유형이 있는지)
+        """
+        flushed = 0
+        finished = False
+        total_plans = len(state['rate_plans'])
+        
+        for sub_type in state['sub_types']:
+            name = sub_type['name']
+            if name in self.completed_scrb_types:
+                continue
+            
+            index = state['next'][name]
+            while (name, index) in state['results'] or (name, index) in state['deferred']:
+                if (name, index) in state['deferred']:
+                    index += 1
+                    continue
+                devices = state['results'].pop((name, index))
+                self.all_data.extend(devices)
+                state['extracted'] += len(devices)
+                entry = state['entries'].pop((name, index), None)
+                if entry is not None:
+                    state['progress'][name].append(entry)
+                index += 1
+                flushed += 1
+            state['next'][name] = index
+            
+            if index < total_plans:
+                # 앞선 요금제가 끝나지 않은 가입유형에서 멈춤 (이후 결과는 보관)
+                self.current_scrb_type = name
+                self.current_plan_index = index - 1 if index > 0 else None
+                break
+            
+            # 가입유형 완료
+            progress = state['progress'][name]
+            self._print_subscription_type_summary(name, progress)
+            self.progress_details['subscription_types'][name] = {
+                'total_devices': sum(p['device_count'] for p in progress),
+                'rate_plans': progress
+            }
+            self.completed_scrb_types.append(name)
+            finished = True
+            logger.info(f"가입유형 '{name}' 완료")
+        else:
+            self.current_scrb_type = None
+            self.current_plan_index = None
+        
+        return flushed, finished
+    
     def _print_subscription_type_summary(self, sub_type_name: str, progress: List[Dict[str, Any]]):
         """가입유형별 요약 표시"""
         if not progress:
@@ -1352,12 +2099,15 @@ class KTCrawler:
                 print(f"  • {plan['plan_name']}: {plan['device_count']}개")
             print(f"  합계: {data['total_devices']}개")
     
-    def save_checkpoint(self):
-        """체크포인트 저장 - 개선된 버전"""
-        checkpoint_data = {
+    def save_checkpoint(self, compact: bool = False):
+        """체크포인트 저장 - 지난 체크포인트 이후 수집한 행과 재개 정보만 저널에 추가
+        
+        Args:
+            compact: 저장 후 저널을 하나의 세그먼트로 압축 (중단/오류로 실행을 끝낼 때)
+        """
+        marker = {
             'completed': self.completed_count,
             'failed': self.failed_count,
-            'data': [vars(d) for d in self.all_data],
             'timestamp': datetime.now(ZoneInfo('Asia/Seoul')).isoformat(),
             'current_scrb_type': getattr(self, 'current_scrb_type', None),
             'current_plan_index': getattr(self, 'current_plan_index', None),
@@ -1365,36 +2115,37 @@ class KTCrawler:
             'progress': self.progress_details
         }
         
-        # 원자적 쓰기를 위해 임시 파일 사용
-        temp_file = self.checkpoint_file.with_suffix('.tmp')
-        try:
-            with open(temp_file, 'wb') as f:
-                pickle.dump(checkpoint_data, f)
-            
-            # 원자적 파일 교체
-            temp_file.replace(self.checkpoint_file)
-            logger.debug(f"체크포인트 저장 완료 (데이터: {len(checkpoint_data.get('data', []))}개)")
-        except Exception as e:
-            logger.error(f"체크포인트 저장 실패: {e}")
-            # 임시 파일 정리
-            if temp_file.exists():
-                try:
-                    temp_file.unlink()
-                except:
-                    pass
+        appended = self.journal.checkpoint(self.all_data, marker)
+        logger.debug(f"체크포인트 저장 완료 (데이터: {len(self.all_data)}개, 추가: {appended}개)")
+        
+        if compact:
+            self.journal.compact(self.all_data, marker)
     
     def load_checkpoint(self) -> bool:
-        """체크포인트 로드 - 개선된 버전"""
-        if not os.path.exists(self.checkpoint_file):
+        """체크포인트 로드 - 저널 재생 (없으면 이전 pickle 체크포인트)"""
+        try:
+            loaded = self.journal.load()
+        except Exception as e:
+            logger.error(f"체크포인트 저널 로드 실패: {e}")
+            loaded = None
+        
+        if loaded is not None:
+            rows, data, _ = loaded
+        elif os.path.exists(self.checkpoint_file):
+            try:
+                with open(self.checkpoint_file, 'rb') as f:
+                    data = pickle.load(f)
+                rows = data.get('data', [])
+            except Exception as e:
+                logger.error(f"체크포인트 로드 실패: {e}")
+                return False
+        else:
             return False
         
         try:
-            with open(self.checkpoint_file, 'rb') as f:
-                data = pickle.load(f)
-            
             self.completed_count = data.get('completed', 0)
             self.failed_count = data.get('failed', 0)
-            self.all_data = [DeviceData(**d) for d in data.get('data', [])]
+            self.all_data = RowStore(DeviceData, rows)
             
             # 재개 정보 복원
             self.current_scrb_type = data.get('current_scrb_type')
@@ -1402,7 +2153,7 @@ class KTCrawler:
             self.completed_scrb_types = data.get('completed_scrb_types', [])
             self.progress_details = data.get('progress', self.progress_details)
             
-            logger.info(f"체크포인트 로드: {data['timestamp']}")
+            logger.info(f"체크포인트 로드: {data.get('timestamp')}")
             if self.current_scrb_type:
                 logger.info(f"재개 지점: {self.current_scrb_type} - 요금제 인덱스 {self.current_plan_index}")
             return True
@@ -1417,7 +2168,7 @@ class KTCrawler:
             return []
         
         # DataFrame 생성
-        df = pd.DataFrame([vars(d) for d in self.all_data])
+        df = self.all_data.to_dataframe()
         
         # 파일 저장
         timestamp = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y%m%d_%H%M%S')
@@ -1431,6 +2182,27 @@ class KTCrawler:
         # 파일 경로 출력
         logger.info(f"[OK] CSV 저장: {csv_file}")
         
+        # 직전 스냅샷 대비 변경분 (선택)
+        if self.config['save_delta']:
+            try:
+                delta_file = write_delta(csv_file)
+                if delta_file:
+                    saved_files.append(str(delta_file))
+            except Exception as e:
+                logger.error(f"변경분 저장 실패: {e}")
+        
+        # Parquet (통신사/수집일 분할, 선택)
+        if self.config['save_parquet']:
+            if PYARROW_AVAILABLE:
+                try:
+                    parquet_file = write_raw_data(df, 'kt', root=self.config['parquet_dir'],
+                                                  run_time=datetime.now(ZoneInfo('Asia/Seoul')))
+                    saved_files.append(str(parquet_file))
+                except Exception as e:
+                    logger.error(f"Parquet 저장 실패: {e}")
+            else:
+                logger.warning("pyarrow가 설치되어 있지 않아 Parquet 저장을 건너뜁니다.")
+        
         # 통계 출력
         self._print_statistics(df)
         
@@ -1462,6 +2234,7 @@ class KTCrawler:
         """메인 실행"""
         self.start_time = time.time()
         driver = None
+        status = 'failed'
         
         try:
             # 헤더 출력
@@ -1482,8 +2255,19 @@ class KTCrawler:
                 # 크롤링 시작
                 print("\n공시지원금 데이터 수집 시작")
                 
-                # 데이터 크롤링
-                extracted_count = self.crawl_data(driver)
+                # 데이터 크롤링 (재생 모드는 요청 기록 실패 시 브라우저 모드로 대체)
+                extracted_count = None
+                if self.config.get('fetch_mode') == 'replay':
+                    extracted_count = self.crawl_data_replay(driver)
+                    if extracted_count is None:
+                        logger.warning("재생 모드 사용 불가 - 브라우저 모드로 수집합니다.")
+                        driver = self.current_driver
+                if extracted_count is None and self.config.get('max_workers', 1) > 1:
+                    extracted_count = self.crawl_data_parallel(driver)
+                    if extracted_count is None:
+                        logger.warning("병렬 모드 사용 불가 - 순차 모드로 수집합니다.")
+                if extracted_count is None:
+                    extracted_count = self.crawl_data(driver)
             finally:
                 # 드라이버 정리
                 if driver:
@@ -1497,6 +2281,26 @@ class KTCrawler:
                 self.failed_count = 0 if extracted_count > 0 else 1
                 self.total_devices = extracted_count
             
+            # 증분 인덱스 갱신 (첫 페이지/상위 기기만 수집했으면 수집된 기기만 교체)
+            self.crawl_index.update(self.all_data,
+                                    partial=bool(self.config.get('first_page_only') or self.config.get('max_devices')))
+            self.crawl_index.save()
+            if self.config.get('incremental'):
+                logger.info(f"증분 모드 - {self.crawl_index.summary()}")
+            
+            # 단계별 대기 시간 기록
+            self.waiter.save()
+            self.waiter.log_summary()
+            logger.info(f"리소스 차단 - {self.browser_profile.summary()}")
+            logger.info(f"요금제 카탈로그 - {self.plan_catalog.summary()}")
+            logger.info(f"드라이버 - {resolver_summary()}")
+            logger.info(f"동시성 - {self.concurrency.summary()}")
+            self.standby.close()
+            logger.info(f"대기 드라이버 - {self.standby.summary()}")
+            if self.fixtures.active:
+                logger.info(f"픽스처 - {self.fixtures.summary()}")
+                self.fixtures.close()
+            
             # 결과 저장
             saved_files = self.save_results()
             
@@ -1508,14 +2312,17 @@ class KTCrawler:
             print(f"총 수집 데이터: {self.total_devices}개")
             
             # 체크포인트 삭제
+            self.journal.clear()
             if self.checkpoint_file.exists():
                 self.checkpoint_file.unlink()
             
+            status = 'ok'
             return saved_files
             
         except KeyboardInterrupt:
+            status = 'interrupted'
             print("\n사용자에 의해 중단되었습니다.")
-            self.save_checkpoint()
+            self.save_checkpoint(compact=True)
             if self.all_data:
                 saved_files = self.save_results()
                 return saved_files
@@ -1524,12 +2331,16 @@ class KTCrawler:
             logger.error(f"크롤링 오류: {e}")
             if self.config['debug']:
                 traceback.print_exc()
-            self.save_checkpoint()
+            self.save_checkpoint(compact=True)
             if self.all_data:
                 saved_files = self.save_results()
                 return saved_files
             return []
         finally:
+            # 작업/단계별 소요 시간 기록
+            self.telemetry.add_bytes(self.browser_profile.stats['loaded_bytes'], 'browser')
+            self.telemetry.finish(rows=len(self.all_data), status=status)
+            
             # 모든 리소스 정리
             self.cleanup_resources()
     
@@ -1563,6 +2374,14 @@ class KTCrawler:
                     except Exception as e:
                         logger.debug(f"서비스 종료 실패: {e}")
         
+        # 대기 드라이버 종료 (중단·오류 시)
+        if hasattr(self, 'standby'):
+            self.standby.close()
+        
+        # 픽스처 기록 파일 닫기 / 재생 서버 종료 (중단·오류 시)
+        if hasattr(self, 'fixtures'):
+            self.fixtures.close()
+        
         logger.info("리소스 정리 완료")
     
     def __del__(self):
@@ -1603,6 +2422,48 @@ def main():
                         help='요금제당 수집할 최대 기기 수')
     parser.add_argument('--first-page-only', action='store_true',
                         help='각 요금제의 첫 페이지만 수집 (최신 공시 기기)')
+    parser.add_argument('--no-block-resources', action='store_true',
+                        help='이미지/폰트/광고 스크립트 등 리소스 차단 비활성화')
+    parser.add_argument('--record-fixtures', type=str, default=None, metavar='DIR',
+                        help='페이지/XHR 응답을 픽스처 코퍼스로 기록')
+    parser.add_argument('--replay-fixtures', type=str, default=None, metavar='DIR_OR_URL',
+                        help='라이브 사이트 대신 픽스처 코퍼스(또는 재생 서버)로 실행')
+    parser.add_argument('--parquet', action='store_true',
+                        help='CSV와 함께 Parquet 저장 (통신사/수집일 분할, pyarrow 필요)')
+    parser.add_argument('--delta', action='store_true',
+                        help='직전 스냅샷 대비 변경분(추가/변경/삭제)을 raw/delta/에 저장')
+    parser.add_argument('--fixed-waits', action='store_true',
+                        help='이벤트 기반 대기 대신 기존 고정 대기 사용')
+    parser.add_argument('--incremental', action='store_true',
+                        help='증분 모드 (변경 없는 페이지 이후는 이전 결과 재사용)')
+    parser.add_argument('--shared-service', action='store_true',
+                        help='chromedriver Service 하나를 모든 드라이버가 공유')
+    parser.add_argument('--chromedriver-version', type=str, default=None, metavar='VERSION',
+                        help='chromedriver 버전 고정 (예: 131, 기본: 설치된 Chrome에 맞춤)')
+    parser.add_argument('--no-telemetry', action='store_true',
+                        help='작업/단계별 소요 시간 기록(JSON Lines, Prometheus textfile) 비활성화')
+    parser.add_argument('--telemetry-dir', type=str, default=None, metavar='DIR',
+                        help='텔레메트리 저장 디렉토리 (기본: 체크포인트 디렉토리/telemetry)')
+    parser.add_argument('--refresh-plans', action='store_true',
+                        help='요금제 카탈로그를 무시하고 요금제 목록 전체 다시 열거')
+    parser.add_argument('--plan-ttl', type=float, default=DEFAULT_TTL_HOURS, metavar='HOURS',
+                        help=f'저장된 요금제 목록 유효 시간 (기본: {DEFAULT_TTL_HOURS}시간)')
+    parser.add_argument('--no-planner', action='store_true',
+                        help='중복 조합 예측 비활성화 (모든 요금제 수집)')
+    parser.add_argument('--replay', action='store_true',
+                        help='재생 모드 (prodList 요청을 기록해 HTTP로 동시 재생)')
+    parser.add_argument('--replay-workers', type=int, default=8,
+                        help='재생 모드 동시 요청 수 (기본: 8)')
+    parser.add_argument('--no-standby', action='store_true',
+                        help='세션 갱신용 대기 드라이버를 미리 띄우지 않음 (종료 후 재생성)')
+    parser.add_argument('--driver-max-memory', type=int, default=1500, metavar='MB',
+                        help='Chrome 프로세스 RSS 한도 - 초과 시 세션 갱신 (기본: 1500, psutil 필요)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='브라우저 워커 수 (2 이상이면 가입유형×요금제 구간 병렬 수집, 기본: 1)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='요청 간 지연(병렬 모드는 동시 워커 수도) 자동 조절')
+    parser.add_argument('--adaptive-max-workers', type=int, default=4,
+                        help='병렬 모드 자동 조절 시 최대 동시 워커 수 (기본: 4)')
 
     args = parser.parse_args()
     
@@ -1616,7 +2477,28 @@ def main():
         'test': args.test,
         'max_plans': args.max_plans if args.max_plans else (3 if args.test else None),
         'max_devices': args.max_devices if args.max_devices else (5 if args.test else None),
-        'first_page_only': args.first_page_only
+        'first_page_only': args.first_page_only,
+        'combo_planner': not args.no_planner,
+        'incremental': args.incremental,
+        'plan_catalog': not args.refresh_plans,
+        'shared_service': args.shared_service,
+        'chromedriver_version': args.chromedriver_version,
+        'plan_catalog_ttl_hours': args.plan_ttl,
+        'telemetry': not args.no_telemetry,
+        'telemetry_dir': args.telemetry_dir,
+        'block_resources': not args.no_block_resources,
+        'fixture_record': args.record_fixtures,
+        'fixture_replay': args.replay_fixtures,
+        'standby_driver': not args.no_standby,
+        'driver_max_memory_mb': args.driver_max_memory,
+        'save_parquet': args.parquet,
+        'save_delta': args.delta,
+        'event_waits': not args.fixed_waits,
+        'fetch_mode': 'replay' if args.replay else 'browser',
+        'replay_workers': args.replay_workers,
+        'max_workers': args.workers,
+        'adaptive_concurrency': args.adaptive,
+        'adaptive_max_workers': args.adaptive_max_workers
     }
     
     # 크롤러 실행
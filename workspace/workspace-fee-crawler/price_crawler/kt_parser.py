@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+KT 상품 목록(prodList) HTML 파서
+prodList HTML을 미리 컴파일한 토큰 정규식 하나로 한 번만 훑으면서 모든 필드를 추출합니다.
+
+- 제품(li cd=...)마다 HTML을 잘라 필드별 정규식을 다시 실행하던 방식 대비 백트래킹 없음
+- 필드 값은 이전 방식과 동일 (각 항목의 첫 번째 일치, 항목 제목 뒤 첫 번째 값)
+- 결과는 DeviceData 생성용 dict 리스트 (scrb_type_name, plan_name 등은 호출 측에서 설정)
+
+작성일: 2025-10-27
+파일명: kt_parser.py
+"""
+
+import re
+from typing import Any, Dict, List, Optional
+
+# 한 번의 findall로 처리하는 토큰 (모두 '<'로 시작하므로 공통 접두어로 묶어 후보 위치만 검사)
+TOKEN_PATTERN = re.compile(
+    r'<(?:li cd="([^"]+)">'
+    r'|strong class="prodName">([^<]+)</strong>'
+    r'|span>(\d{4}\.\d{2}\.\d{2})</span>'
+    r'|div class="tit">(출고가|공통지원금|단말가격|전환지원금)</div>'
+    r'|strong class="tit"[^>]*>(요금할인\(24개월\))</strong>'
+    r'|div class="conts">([^<]*)(</div>)?'
+    r'|(/ul>))'
+)
+
+# 항목 제목 → 필드명
+LABEL_FIELDS = {
+    '출고가': 'release_price',
+    '공통지원금': 'public_support_fee',
+    '단말가격': 'total_price',
+    '전환지원금': 'additional_support_fee',
+    '요금할인(24개월)': 'rate_discount_total',
+}
+
+PRICE_FIELDS = ('release_price', 'public_support_fee', 'total_price', 'additional_support_fee', 'rate_discount_total')
+
+
+def parse_price(text: str) -> int:
+    """'1,234,000원' → 1234000 (숫자가 아니면 0)"""
+    text = text.replace('원', '').replace(',', '').strip()
+    return int(text) if text.isdigit() else 0
+
+
+def detect_manufacturer(device_name: str) -> str:
+    """기기명으로 제조사 판별"""
+    if '갤럭시' in device_name or 'Galaxy' in device_name.lower():
+        return '삼성'
+    if '아이폰' in device_name or 'iPhone' in device_name:
+        return '애플'
+    if 'LG' in device_name:
+        return 'LG'
+    if '샤오미' in device_name or 'Xiaomi' in device_name or '레드미' in device_name:
+        return '샤오미'
+    return '기타'
+
+
+def detect_network_type(device_name: str) -> str:
+    """기기명으로 네트워크 타입 판별"""
+    if 'LTE' in device_name or '4G' in device_name:
+        return 'LTE'
+    if any(keyword in device_name for keyword in ['워치', 'Watch', '태블릿', 'Tab', 'iPad']):
+        return '기타'
+    return '5G'
+
+
+def _new_item(cd: str) -> Dict[str, Any]:
+    return {'cd': cd, 'name': None, 'date': None, 'values': {}, 'pending': []}
+
+
+def _copy_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {**item, 'values': dict(item['values']), 'pending': list(item['pending'])}
+
+
+def _finish(item: Dict[str, Any]) -> Dict[str, Any]:
+    """토큰 상태 → 제품 필드 dict"""
+    device_name = (item['name'] or '').strip()
+    values = item['values']
+    prices = {field: parse_price(values[field]) if field in values else 0 for field in PRICE_FIELDS}
+    rate_discount_total = prices.pop('rate_discount_total')
+
+    return {
+        'cd': item['cd'],
+        'date': item['date'].replace('.', '-') if item['date'] else '',
+        'device_nm': device_name,
+        'manufacturer': detect_manufacturer(device_name),
+        'network_type': detect_network_type(device_name),
+        'monthly_discount': rate_discount_total // 24 if rate_discount_total > 0 else 0,
+        'has_rate_discount': 'rate_discount_total' in values,
+        **prices,
+    }
+
+
+def parse_product_list(html_content: str) -> List[Dict[str, Any]]:
+    """prodList HTML → 제품 필드 dict 리스트
+
+    각 제품은 li cd="..." 부터 다음 li cd="..." 직전까지(마지막 제품은 그 뒤 첫 </ul>까지)입니다.
+    """
+    products = []
+    item: Optional[Dict[str, Any]] = None
+    values: Dict[str, str] = {}
+    pending: List[str] = []
+    # 마지막 제품이면 </ul>에서 끝나므로, </ul> 시점의 상태를 보관했다가 다음 제품이 없으면 사용
+    frozen: Optional[Dict[str, Any]] = None
+
+    for cd, name, date, label, discount, conts, closed, list_end in TOKEN_PATTERN.findall(html_content):
+        if cd:
+            if item is not None:
+                products.append(_finish(item))
+            item = _new_item(cd)
+            values, pending = item['values'], item['pending']
+            frozen = None
+        elif item is None:
+            # 첫 제품 이전 토큰
+            continue
+        elif conts or closed:
+            if pending and conts:
+                # 요금할인은 닫는 태그 없이 첫 텍스트, 나머지는 <div class="conts">값</div> 형태만 인정
+                for field in list(pending):
+                    if closed or field == 'rate_discount_total':
+                        values[field] = conts
+                        pending.remove(field)
+        elif label or discount:
+            field = LABEL_FIELDS[label or discount]
+            if field not in values and field not in pending:
+                pending.append(field)
+        elif name:
+            if item['name'] is None:
+                item['name'] = name
+        elif date:
+            if item['date'] is None:
+                item['date'] = date
+        elif list_end and frozen is None:
+            frozen = _copy_item(item)
+
+    if item is not None:
+        products.append(_finish(frozen if frozen is not None else item))
+
+    return products
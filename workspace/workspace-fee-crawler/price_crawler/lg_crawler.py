@@ -21,8 +21,8 @@ import traceback
 import re
 from datetime import datetime
 from zoneinfo import ZoneInfo
-from typing import List, Dict, Optional, Tuple, Any
-from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field, asdict
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from queue import Queue
@@ -35,8 +35,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, NoAlertPresentException, UnexpectedAlertPresentException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 
 # Rich UI 지원 (선택사항)
 try:
@@ -55,6 +53,22 @@ except ImportError:
 
 # Path imports
 from shared_config.config.paths import PathManager, get_raw_data_path, get_checkpoint_path, get_log_path
+from price_crawler.driver_pool import DriverPool
+from price_crawler.cdp_network import enable_performance_log, drain_performance_log, collect_exchanges, get_response_body
+from price_crawler.combo_planner import CombinationPlanner
+from price_crawler.crawl_index import CrawlIndex, combo_key
+from price_crawler.waits import StepWaiter, install_network_tracker
+from price_crawler.browser_profile import BrowserProfile
+from price_crawler.checkpoint_journal import CheckpointJournal
+from price_crawler.fixtures import FixtureMode
+from price_crawler.columnar_store import write_raw_data, PYARROW_AVAILABLE
+from price_crawler.snapshot_diff import write_delta
+from price_crawler.row_store import RowStore, crawl_timestamp
+from price_crawler.plan_catalog import PlanCatalog, plan_fingerprint, DEFAULT_TTL_HOURS
+from price_crawler.driver_resolver import make_service, resolver_summary
+from price_crawler.telemetry import CrawlTelemetry
+from price_crawler.adaptive_concurrency import AdaptiveConcurrency
+from price_crawler.work_queue import WorkQueue, run_queue_worker, DEFAULT_LEASE_SECONDS, DEFAULT_MAX_ATTEMPTS
 
 # 경로 매니저 초기화
 path_manager = PathManager()
@@ -72,6 +86,10 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 분산 작업 큐: 작업 등록(요금제 수집) / 결과 병합 클레임 유지 시간(초) - 담당 워커가 죽으면 다른 워커가 이어받음
+QUEUE_SEED_TTL = 1800
+QUEUE_MERGE_TTL = 600
+
 
 # 데이터 클래스 정의
 @dataclass
@@ -87,7 +105,7 @@ class RatePlan:
 class DeviceData:
     """기기 데이터 - 통합 형식"""
     date: str = ""
-    crawled_at: str = field(default_factory=lambda: datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S'))
+    crawled_at: str = field(default_factory=crawl_timestamp)
     carrier: str = "LG"
     manufacturer: str = "전체"
     scrb_type_name: str = ""
@@ -128,6 +146,43 @@ class LGUPlusCrawler:
         'lte-premium', 'lte-special', 'lte-value'
     ]
     
+    # 요금제 목록(라디오 버튼) 표시 여부
+    PLANS_VISIBLE_JS = """
+        var planRadios = document.querySelectorAll('input[type="radio"]');
+        for (var i = 0; i < planRadios.length; i++) {
+            var radio = planRadios[i];
+            if (radio.name !== '가입유형' && radio.name !== '기기종류' && radio.offsetParent !== null) {
+                return true;
+            }
+        }
+        return false;
+    """
+    
+    # 단계별 대기 타임아웃 기본값(초) - 기록된 대기 시간(lg_step_waits.json)으로 조정
+    STEP_TIMEOUTS = {
+        'page_ready': 5,
+        'option_select': 5,
+        'rate_modal_open': 5,
+        'plan_item_ready': 3,
+        'plan_selected': 3,
+        'plan_apply': 8,
+        'manufacturer_all': 5,
+        'sort_apply': 5,
+        'page_switch': 8,
+    }
+    
+    # 네트워크 추출 시 JSON 필드명 후보 (앞쪽 우선)
+    NETWORK_FIELD_CANDIDATES = {
+        'device': ['urcTrmMdlNm', 'mblDvicNm', 'dvicNm', 'modelNm', 'deviceName', 'prodNm'],
+        'price': ['dlvrPrc', 'fctyPrc', 'releasePrice', 'outPrc', 'shipPrice'],
+        'date': ['pblsDt', 'ntcDt', 'disclosureDate', 'announceDate', 'pblsYmd'],
+        'subsidy': ['pblsSprtAmt', 'basicSprtAmt', 'supportAmt', 'subsidy', 'carrierSupportAmt'],
+        'additionalSubsidy': ['addSprtAmt', 'dstrSprtAmt', 'distributorSupportAmt', 'additionalSubsidy'],
+        'finalPrice': ['buyPrc', 'purchasePrice', 'finalPrice', 'salePrc'],
+        'duration': ['sprtTermNm', 'agmtPrdNm', 'planDuration', 'mntnPrdNm'],
+        'total': ['totalCnt', 'totalCount', 'totCnt', 'total']
+    }
+    
     def __init__(self, config: Dict[str, Any] = None):
         """초기화"""
         # 기본 설정
@@ -135,6 +190,8 @@ class LGUPlusCrawler:
             'headless': True,
             'max_workers': 3,
             'max_pages': 10,
+            'first_page_only': False,  # 조합별 첫 페이지만 수집 (최신 공시 기기)
+            'max_devices': 0,  # 조합별 최대 기기 수 (0 = 제한 없음, 최신 공시일자 순 상위, 지정 시 첫 페이지만 수집)
             'page_timeout': 20,  # 감소
             'element_timeout': 10,  # 감소
             'retry_count': 2,  # 감소
@@ -142,10 +199,46 @@ class LGUPlusCrawler:
             'skip_price_check': True,  # 가격 조회 스킵
             'output_dir': 'data',
             'checkpoint_interval': 20,  # 감소
+            'checkpoint_fsync': True,  # 체크포인트마다 저널 fsync
+            'checkpoint_tag': None,  # 체크포인트 파일 구분자 (예: 'hot' - 프로필 실행이 전체 크롤링 체크포인트를 건드리지 않음)
             'use_rich': RICH_AVAILABLE,
             'debug': False,
             'delay_between_requests': 1,  # 감소
-            'max_rate_plans': 0  # 추가
+            'max_rate_plans': 0,  # 추가
+            'use_driver_pool': True,  # 작업마다 Chrome을 새로 띄우지 않고 재사용
+            'driver_max_uses': 50,  # 드라이버 재생성 전 최대 사용 횟수
+            'driver_max_memory_mb': 0,  # 드라이버 메모리 한도 (0 = 확인 안함)
+            'extract_mode': 'dom',  # 'network' = 페이지의 JSON 응답에서 추출 (실패 시 DOM 추출)
+            'network_field_map': {},  # JSON 필드명 후보 추가 (예: {'device': ['newField']})
+            'combo_planner': True,  # 결과가 동일할 것으로 예측되는 가입유형은 수집을 미루고 복사
+            'planner_sample_rate': 0.1,  # 중복 예측 조합 중 검증 수집 비율
+            'planner_min_streak': 2,  # 중복 예측에 필요한 연속 동일 횟수
+            'incremental': False,  # 변경 없는 페이지에서 페이지 이동 중단, 나머지는 이전 스냅샷 사용
+            'event_waits': True,  # 고정 sleep 대신 DOM 변경/네트워크 유휴 신호 대기
+            'block_resources': True,  # 이미지/폰트/미디어/광고·분석 스크립트 요청 차단
+            'blocked_url_patterns': [],  # 추가 차단 URL 패턴 (예: ['*.mp4'])
+            'allowed_url_patterns': [],  # 차단에서 제외할 URL (통신사 기본 허용 목록에 추가)
+            'step_timeouts': {},  # 단계별 대기 타임아웃 덮어쓰기 (예: {'plan_apply': 15})
+            'fixture_record': None,  # 코퍼스 경로 지정 시 페이지/XHR 응답을 픽스처로 기록
+            'fixture_replay': None,  # 코퍼스 경로 또는 재생 서버 URL (라이브 사이트 대신 기록된 응답 사용)
+            'save_parquet': False,  # CSV와 함께 통신사/수집일 분할 Parquet 저장 (pyarrow 필요)
+            'parquet_dir': None,  # Parquet 저장소 루트 (기본: price_crawler/data/parquet)
+            'save_delta': False,  # 직전 스냅샷 대비 추가/변경/삭제 행을 raw/delta/에 저장 (snapshot_diff.py)
+            'shared_service': False,  # chromedriver Service 하나를 모든 드라이버가 공유 (드라이버마다 프로세스 생성 안 함)
+            'chromedriver_version': None,  # chromedriver 버전 고정 (예: '131', 기본: 설치된 Chrome에 맞춤)
+            'plan_catalog': True,  # 첫 조합(기기변경/5G) 요금제 목록의 지문이 같으면 저장된 요금제 목록/가격 사용
+            'plan_catalog_ttl_hours': DEFAULT_TTL_HOURS,  # 저장된 요금제 목록/가격 유효 시간
+            'telemetry': True,  # 작업/단계별 소요 시간을 JSON Lines + Prometheus textfile로 기록
+            'telemetry_dir': None,  # 텔레메트리 저장 디렉토리 (기본: 체크포인트 디렉토리/telemetry)
+            'adaptive_concurrency': False,  # 페이지 로드 지연/오류/알림창에 따라 동시 작업 수와 요청 간 지연 자동 조절 (AIMD)
+            'adaptive_max_workers': 8,  # 자동 조절 시 최대 동시 작업 수 (시작값은 max_workers)
+            'adaptive_max_delay': 30,  # 자동 조절 시 최대 요청 간 지연(초)
+            'queue_mode': False,  # 공유 작업 큐에서 작업을 가져와 처리 (여러 머신/컨테이너로 분산)
+            'work_queue': None,  # 작업 큐 파일 (기본: 체크포인트 디렉토리/lg_work_queue_YYYYMMDD.sqlite)
+            'queue_lease_seconds': DEFAULT_LEASE_SECONDS,  # 작업 임대 시간(초), 처리 중에는 하트비트로 연장
+            'queue_max_attempts': DEFAULT_MAX_ATTEMPTS,  # 작업당 최대 시도 횟수 (워커 간 합산)
+            'queue_merge': False,  # 작업 처리 없이 큐에 저장된 결과만 병합해 저장
+            'queue_retry_failed': False  # 실패한 작업을 다시 대기 상태로 돌린 뒤 처리
         }
         
         if config:
@@ -155,7 +248,7 @@ class LGUPlusCrawler:
         os.makedirs(self.config['output_dir'], exist_ok=True)
         
         # 데이터 저장소
-        self.all_data: List[DeviceData] = []
+        self.all_data = RowStore(DeviceData)  # 필드별 배열로 보관 (row_store.py)
         self.data_lock = threading.Lock()
         self.active_drivers = []  # 활성 드라이버 추적
         self.active_services = []  # 활성 서비스 추적
@@ -166,6 +259,7 @@ class LGUPlusCrawler:
         
         # 가격 캐시
         self.price_cache: Dict[str, str] = {}
+        self.price_verified: Set[str] = set()  # 이번 실행에서 사이트에서 조회한 요금제 값 (카탈로그 조회 시각 갱신용)
         self.cache_lock = threading.Lock()
         
         # 진행 상태
@@ -177,10 +271,87 @@ class LGUPlusCrawler:
         
         # 체크포인트
         self.checkpoint_file = get_checkpoint_path('lg')
+        if self.config['checkpoint_tag']:
+            self.checkpoint_file = self.checkpoint_file.with_stem(f"{self.checkpoint_file.stem}_{self.config['checkpoint_tag']}")
+        self.journal = CheckpointJournal(
+            self.checkpoint_file.with_suffix('.journal'),
+            fsync=self.config['checkpoint_fsync']
+        )
         
         # 크롤링 조합
         self.all_combinations = []
         
+        # 드라이버 풀 (작업 실행 동안만 사용)
+        self.driver_pool: Optional[DriverPool] = None
+        
+        # 네트워크 추출 필드명 후보 (설정값 우선)
+        self.network_field_candidates = {
+            key: list(self.config['network_field_map'].get(key, [])) + candidates
+            for key, candidates in LGUPlusCrawler.NETWORK_FIELD_CANDIDATES.items()
+        }
+        self.network_stats = {'network': 0, 'dom': 0}
+        
+        # 분산 작업 큐 (큐 모드 실행 동안만 사용)
+        self.work_queue: Optional[WorkQueue] = None
+        self.queue_processed = 0
+        
+        # 조합 계획기 (요금제별로 가입유형 간 중복 예측)
+        self.planner = CombinationPlanner(
+            'LG',
+            state_file=self.checkpoint_file.parent / 'lg_combo_planner.json',
+            sample_rate=self.config['planner_sample_rate'],
+            min_streak=self.config['planner_min_streak'],
+            enabled=self.config['combo_planner'] and not self.config['queue_mode']  # 큐 모드는 워커마다 일부 작업만 봄
+        )
+        self.deferred_tasks: Dict[Tuple[str, str], CrawlTask] = {}
+        
+        # 증분 크롤링 인덱스 (실행 간 유지)
+        self.crawl_index = CrawlIndex('LG', self.checkpoint_file.parent / 'lg_crawl_index.json')
+        
+        # 요금제 카탈로그 (실행 간 유지, 변경 없으면 나머지 조합 열거 생략, 가격 캐시 포함)
+        self.plan_catalog = PlanCatalog(
+            'LG',
+            self.checkpoint_file.parent / 'lg_plan_catalog.json',
+            ttl_hours=self.config['plan_catalog_ttl_hours'],
+            enabled=self.config['plan_catalog']
+        )
+        self.price_cache.update(self.plan_catalog.load_prices())
+        
+        # 리소스 차단 프로필 (드라이버 생성 시 적용)
+        self.browser_profile = BrowserProfile(
+            'LG',
+            enabled=self.config['block_resources'],
+            extra_blocked=self.config['blocked_url_patterns'],
+            extra_allowed=self.config['allowed_url_patterns']
+        )
+        
+        # 단계별 대기 (대기 시간 기록은 실행 간 누적)
+        self.waiter = StepWaiter(
+            timeouts={**self.STEP_TIMEOUTS, **self.config['step_timeouts']},
+            enabled=self.config['event_waits'],
+            stats_file=self.checkpoint_file.parent / 'lg_step_waits.json'
+        )
+        
+        # 픽스처 기록/재생 (드라이버 생성 시 연결)
+        self.fixtures = FixtureMode.from_config(self.config, 'LG')
+        
+        # 작업/단계별 소요 시간 기록 (실행 종료 시 Prometheus textfile)
+        self.telemetry = CrawlTelemetry(
+            'LG',
+            Path(self.config['telemetry_dir'] or self.checkpoint_file.parent / 'telemetry'),
+            enabled=self.config['telemetry']
+        )
+        
+        # 동시 작업 수 / 요청 간 지연 (adaptive_concurrency면 page_load·재시도 기록과 알림창으로 조절)
+        self.concurrency = AdaptiveConcurrency(
+            initial_workers=self.config['max_workers'],
+            max_workers=max(self.config['adaptive_max_workers'], self.config['max_workers']),
+            initial_delay=self.config['delay_between_requests'],
+            max_delay=self.config['adaptive_max_delay'],
+            enabled=self.config['adaptive_concurrency']
+        )
+        self.telemetry.subscribe(self.concurrency.observe)
+        
     def create_driver(self) -> webdriver.Chrome:
         """Chrome 드라이버 생성 - 개선된 버전"""
         options = Options()
@@ -230,6 +401,10 @@ class LGUPlusCrawler:
         if self.config['headless']:
             options.add_argument('--headless=new')
         
+        # 네트워크 추출 모드: 응답 수집을 위한 네트워크 로그
+        if self.config.get('extract_mode') == 'network':
+            enable_performance_log(options)
+        
         # 성능 최적화 (fast_mode)
         if self.config['fast_mode']:
             prefs = {
@@ -244,39 +419,22 @@ class LGUPlusCrawler:
             }
             options.add_experimental_option('prefs', prefs)
         
+        # 리소스 차단 프로필 (이미지 비활성화 설정 병합)
+        self.browser_profile.apply_options(options)
+        
+        # 픽스처 기록(performance 로그) / 재생(로컬 프록시) 설정
+        self.fixtures.apply_options(options)
+        
         # ChromeDriver 설정 개선
         max_retries = 3
+        started = time.perf_counter()
         for attempt in range(max_retries):
             try:
-                # 캐시 정리 (첫 시도에서만)
-                if attempt == 0:
-                    import shutil
-                    cache_dir = os.path.expanduser("~/.wdm")
-                    if os.path.exists(cache_dir):
-                        try:
-                            shutil.rmtree(cache_dir)
-                            logger.info(f"ChromeDriver 캐시 정리: {cache_dir}")
-                        except:
-                            pass
-                
-                # ChromeDriver 다운로듍 및 설치
-                chromedriver_path = ChromeDriverManager().install()
-                
-                # macOS에서 quarantine 속성 제거
-                if platform.system() == 'Darwin':
-                    try:
-                        import subprocess
-                        subprocess.run(['xattr', '-cr', os.path.dirname(chromedriver_path)], 
-                                     capture_output=True, check=False)
-                        subprocess.run(['chmod', '+x', chromedriver_path], 
-                                     capture_output=True, check=False)
-                    except:
-                        pass
-                
-                # Service 객체 생성 (로그 비활성화)
-                service = Service(
-                    executable_path=chromedriver_path,
-                    log_output=os.devnull  # 로그 출력 비활성화
+                # chromedriver 경로 / Service (경로는 프로세스당 한 번만 확인, 재시도 시 다시 확인 - driver_resolver.py)
+                service = make_service(
+                    shared=self.config['shared_service'],
+                    version=self.config['chromedriver_version'],
+                    refresh=attempt > 0
                 )
                 
                 # Driver 생성
@@ -293,9 +451,12 @@ class LGUPlusCrawler:
             except Exception as e:
                 logger.error(f"ChromeDriver 생성 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
+                    self.telemetry.retry('driver_create')
                     time.sleep(5)  # 재시도 전 대기
                 else:
+                    self.telemetry.record('driver_create', time.perf_counter() - started, ok=False)
                     raise Exception(f"ChromeDriver를 시작할 수 없습니다: {str(e)}")
+        self.telemetry.record('driver_create', time.perf_counter() - started)
         driver.set_page_load_timeout(self.config['page_timeout'])
         driver.implicitly_wait(5)
         
@@ -329,8 +490,61 @@ class LGUPlusCrawler:
             '''
         })
         
+        # 네트워크 유휴 대기용 XHR/fetch 카운터
+        install_network_tracker(driver)
+        
+        # 불필요한 리소스 요청 차단
+        self.browser_profile.apply(driver)
+        
+        # 픽스처 기록 연결
+        self.fixtures.attach(driver)
+        
         return driver
     
+    def _untrack_driver(self, driver: webdriver.Chrome):
+        """활성 드라이버 목록에서 제거"""
+        with self.drivers_lock:
+            if driver in self.active_drivers:
+                self.active_drivers.remove(driver)
+    
+    def _acquire_driver(self) -> webdriver.Chrome:
+        """작업용 드라이버 확보 (풀 사용 시 대여)"""
+        if self.driver_pool:
+            return self.driver_pool.acquire()
+        return self.create_driver()
+    
+    def _release_driver(self, driver: Optional[webdriver.Chrome], discard: bool = False):
+        """작업용 드라이버 반납 (풀 미사용 시 종료)"""
+        if driver is None:
+            return
+        self.browser_profile.collect(driver)
+        if self.driver_pool:
+            self.driver_pool.release(driver, discard=discard)
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류: {e}")
+        self._untrack_driver(driver)
+    
+    def _open_driver_pool(self):
+        """작업 실행용 드라이버 풀 생성"""
+        if not self.config.get('use_driver_pool', True):
+            return
+        self.driver_pool = DriverPool(
+            self.create_driver,
+            size=self.concurrency.max_workers,
+            max_uses=self.config.get('driver_max_uses', 50),
+            max_memory_mb=self.config.get('driver_max_memory_mb', 0),
+            on_discard=self._untrack_driver
+        )
+    
+    def _close_driver_pool(self):
+        """드라이버 풀 종료"""
+        if self.driver_pool:
+            self.driver_pool.close()
+            self.driver_pool = None
+    
     def wait_for_page_ready(self, driver: webdriver.Chrome, timeout: int = None):
         """페이지 로딩 대기"""
         if timeout is None:
@@ -342,13 +556,8 @@ class LGUPlusCrawler:
             WebDriverWait(driver, wait_time).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
             )
-            # jQuery가 있는 경우 대기
-            WebDriverWait(driver, wait_time).until(
-                lambda d: d.execute_script(
-                    "return typeof jQuery === 'undefined' || jQuery.active == 0"
-                )
-            )
-            time.sleep(1 if self.config['fast_mode'] else 2)  # 대기 시간 증가
+            # 진행 중인 AJAX(jQuery 포함)가 끝날 때까지 대기
+            self.waiter.network_idle(driver, 'page_ready', fallback=1 if self.config['fast_mode'] else 2)
         except TimeoutException:
             logger.debug("페이지 로딩 타임아웃")
         except:
@@ -368,6 +577,7 @@ class LGUPlusCrawler:
             # 네트워크 오류나 조회 실패 메시지 감지
             if any(keyword in alert_text for keyword in ['네트워크', '오류', '실패', '조회할 수 없습니다']):
                 logger.error(f"조회 실패 Alert: {alert_text}")
+                self.concurrency.congestion('alert')
                 return True  # Alert 발생했음을 알림
             
             return True
@@ -407,8 +617,22 @@ class LGUPlusCrawler:
             
             total_plans = 0
             
+            # 첫 조합 목록으로 카탈로그 확인 (변경 없으면 나머지 조합 열거 생략)
+            first_combo = (subscription_types[0], device_types[0])
+            first_plans = self._collect_plans_for_combination(driver, *first_combo)
+            fingerprint = plan_fingerprint(first_plans)
+            cached = self.plan_catalog.lookup(fingerprint) if first_plans else None
+            
+            if cached:
+                self.rate_plans = {
+                    dev: {sub: [RatePlan(**plan) for plan in plans] for sub, plans in subs.items()}
+                    for dev, subs in cached.items()
+                }
+                self.rate_plans.setdefault(device_types[0][0], {})[subscription_types[0][0]] = first_plans
+                total_plans = sum(len(plans) for subs in self.rate_plans.values() for plans in subs.values())
+                logger.info(f"요금제 {total_plans}개 (카탈로그)")
             # Progress 표시
-            if self.config['use_rich'] and console:
+            elif self.config['use_rich'] and console:
                 progress = Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
@@ -424,9 +648,12 @@ class LGUPlusCrawler:
                     
                     for sub_type in subscription_types:
                         for dev_type in device_types:
-                            plans = self._collect_plans_for_combination(
-                                driver, sub_type, dev_type
-                            )
+                            if (sub_type, dev_type) == first_combo:
+                                plans = first_plans
+                            else:
+                                plans = self._collect_plans_for_combination(
+                                    driver, sub_type, dev_type
+                                )
                             
                             # 저장
                             if dev_type[0] not in self.rate_plans:
@@ -445,9 +672,12 @@ class LGUPlusCrawler:
                 # 일반 출력
                 for sub_type in subscription_types:
                     for dev_type in device_types:
-                        plans = self._collect_plans_for_combination(
-                            driver, sub_type, dev_type
-                        )
+                        if (sub_type, dev_type) == first_combo:
+                            plans = first_plans
+                        else:
+                            plans = self._collect_plans_for_combination(
+                                driver, sub_type, dev_type
+                            )
                         
                         if dev_type[0] not in self.rate_plans:
                             self.rate_plans[dev_type[0]] = {}
@@ -456,6 +686,14 @@ class LGUPlusCrawler:
                         total_plans += len(plans)
                         time.sleep(self.config['delay_between_requests'])
             
+            # 모든 조합의 목록이 수집됐을 때만 카탈로그 갱신
+            if not cached and all(self.rate_plans.get(dev[0], {}).get(sub[0])
+                                  for sub in subscription_types for dev in device_types):
+                self.plan_catalog.store(fingerprint, {
+                    dev: {sub: [asdict(plan) for plan in plans] for sub, plans in subs.items()}
+                    for dev, subs in self.rate_plans.items()
+                })
+            
             # 결과 출력
             if RICH_AVAILABLE:
                 table = Table(title="수집된 요금제 현황", show_header=True)
@@ -516,12 +754,10 @@ class LGUPlusCrawler:
                 # 가입유형 선택
                 result = self._select_option(driver, '가입유형', sub_type[0])
                 logger.info(f"가입유형 선택 결과 ({sub_type[1]}): {result}")
-                time.sleep(1)
                 
                 # 기기종류 선택
                 result = self._select_option(driver, '기기종류', dev_type[0])
                 logger.info(f"기기종류 선택 결과 ({dev_type[1]}): {result}")
-                time.sleep(1)
                 
                 # 요금제 목록 열기 (_open_rate_plan_modal이 이미 "더 많은 요금제 보기"를 클릭함)
                 if self._open_rate_plan_modal(driver):
@@ -651,7 +887,7 @@ class LGUPlusCrawler:
         return plans
     
     def _select_option(self, driver: webdriver.Chrome, name: str, value: str) -> bool:
-        """옵션 선택"""
+        """옵션 선택 (선택이 바뀌었으면 후속 AJAX 완료까지 대기)"""
         try:
             script = """
                 var name = arguments[0];
@@ -689,7 +925,10 @@ class LGUPlusCrawler:
                 }
                 return false;
             """
-            return driver.execute_script(script, name, value)
+            changed = driver.execute_script(script, name, value)
+            if changed:
+                self.waiter.network_idle(driver, 'option_select', fallback=1)
+            return changed
         except Exception as e:
             logger.error(f"옵션 선택 오류: {e}")
             return False
@@ -724,24 +963,9 @@ class LGUPlusCrawler:
             """)
             
             if clicked:
-                time.sleep(2)  # 모달 로딩 대기 시간 증가
-                
-                # 요금제 목록 확인 (모달이 아닌 확장된 영역)
-                plans_visible = driver.execute_script("""
-                    // 요금제 라디오 버튼이 표시되는지 확인
-                    var planRadios = document.querySelectorAll('input[type="radio"]');
-                    var visiblePlans = 0;
-                    
-                    planRadios.forEach(function(radio) {
-                        if (radio.name !== '가입유형' && radio.name !== '기기종류' && 
-                            radio.offsetParent !== null) {
-                            visiblePlans++;
-                        }
-                    });
-                    
-                    console.log('표시된 요금제 수:', visiblePlans);
-                    return visiblePlans > 0;
-                """)
+                # 요금제 목록 확인 (모달이 아닌 확장된 영역) - 요금제 라디오 버튼이 표시될 때까지 대기
+                self.waiter.until(driver, 'rate_modal_open', self.PLANS_VISIBLE_JS, fallback=2)
+                plans_visible = driver.execute_script(self.PLANS_VISIBLE_JS)
                 
                 if plans_visible:
                     logger.info("요금제 목록이 표시되었습니다.")
@@ -792,15 +1016,89 @@ class LGUPlusCrawler:
         self.all_combinations = tasks
         return tasks
     
-    def process_task(self, task: CrawlTask, progress=None, main_task=None) -> int:
-        """단일 작업 처리"""
+    def _task_keys(self, task: CrawlTask) -> Tuple[str, str]:
+        """조합 계획기용 (family, variant) 키 - 기기종류+요금제 / 가입유형"""
+        return f"{task.device_type[0]}:{task.rate_plan.id}", task.subscription_type[0]
+    
+    def _plan_tasks(self, tasks: List[CrawlTask]) -> List[CrawlTask]:
+        """수집할 작업 결정 (앞선 가입유형과 결과가 같을 것으로 예측되는 작업은 미룸)"""
+        run_tasks = []
+        seen_variants: Dict[str, List[str]] = {}
+        for task in tasks:
+            family, variant = self._task_keys(task)
+            sources = seen_variants.setdefault(family, [])
+            if self.planner.should_defer(family, variant, sources):
+                self.deferred_tasks[(family, variant)] = task
+            else:
+                run_tasks.append(task)
+            sources.append(variant)
+        
+        if self.deferred_tasks:
+            if RICH_AVAILABLE:
+                console.print(f"[cyan]중복 예측으로 {len(self.deferred_tasks)}개 작업 수집을 미룹니다.[/cyan]")
+            else:
+                logger.info(f"중복 예측으로 {len(self.deferred_tasks)}개 작업 수집을 미룹니다.")
+        return run_tasks
+    
+    def _materialize_deferred_tasks(self):
+        """미룬 작업 처리 - 원본 가입유형 결과 복사, 원본이 없으면 직접 수집"""
+        if not self.deferred_tasks:
+            self.planner.finish()
+            return
+        
+        # 원본 수집에 실패한 작업은 직접 수집
+        for family, variant, _ in self.planner.unresolved():
+            task = self.deferred_tasks.pop((family, variant))
+            logger.info(f"원본 결과 없음 - 직접 수집: {task.rate_plan.name} ({task.subscription_type[1]})")
+            self.process_task(task)
+        
+        sub_type_names = {task.subscription_type[0]: task.subscription_type[1] for task in self.all_combinations}
+        
+        copied = 0
+        for family, variant, source in self.planner.resolved():
+            task = self.deferred_tasks.get((family, variant))
+            if task is None:
+                continue
+            source_name = sub_type_names.get(source)
+            with self.data_lock:
+                source_rows = self.all_data.where(plan_name=task.rate_plan.name,
+                                                  network_type=task.device_type[1],
+                                                  scrb_type_name=source_name)
+                copied += self.all_data.copy_rows(source_rows, scrb_type_name=task.subscription_type[1])
+        
+        if RICH_AVAILABLE:
+            console.print(f"[green]✓[/green] 미룬 작업 {len(self.deferred_tasks)}개 - 원본 결과 {copied:,}개 복사")
+        else:
+            logger.info(f"미룬 작업 {len(self.deferred_tasks)}개 - 원본 결과 {copied}개 복사")
+        
+        self.deferred_tasks = {}
+        self.planner.finish()
+    
+    def process_task(self, task: CrawlTask, progress=None, main_task=None) -> Optional[List[DeviceData]]:
+        """단일 작업 처리 (작업 단위로 텔레메트리 기록, 동시 실행 수는 적응형 동시성 한도를 따름)
+        
+        Returns:
+            성공한 시도에서 수집한 행 (기기가 없으면 빈 리스트), 모든 시도가 실패하면 None
+        """
+        with self.concurrency.slot(), self.telemetry.task('task', plan=task.rate_plan.name, device_type=task.device_type[1],
+                                 scrb_type=task.subscription_type[1]) as record:
+            collected = self._process_task(task, progress, main_task)
+            record.rows = len(collected) if collected is not None else 0
+            record.ok = collected is not None
+        return collected
+    
+    def _process_task(self, task: CrawlTask, progress=None, main_task=None) -> Optional[List[DeviceData]]:
+        """페이지 로드 → 옵션/요금제 선택 → 추출 (재시도 포함)
+        
+        Returns:
+            성공한 시도에서 수집한 행 (실패한 이전 시도의 행은 포함하지 않음), 실패면 None
+        """
         driver = None
-        extracted_count = 0
         retry_count = 0
         
         while retry_count < self.config['retry_count']:
             try:
-                driver = self.create_driver()
+                driver = self._acquire_driver()
                 
                 # 진행 상황 업데이트
                 if progress and main_task is not None:
@@ -809,20 +1107,28 @@ class LGUPlusCrawler:
                         desc += f" (재시도 {retry_count}/{self.config['retry_count']})"
                     progress.update(main_task, description=desc)
                 
+                # 이전 작업의 네트워크 이벤트 버리기
+                if self.config.get('extract_mode') == 'network':
+                    drain_performance_log(driver)
+                
                 # 페이지 로드
+                timer = self.telemetry.timer()
                 driver.get(self.BASE_URL)
                 self.wait_for_page_ready(driver)
+                timer.lap('page_load')
                 
                 # 옵션 선택
                 self._select_option(driver, '가입유형', task.subscription_type[0])
-                time.sleep(1)
-                
                 self._select_option(driver, '기기종류', task.device_type[0])
-                time.sleep(1)
                 
                 # 요금제 목록 열기 및 선택
                 if self._open_rate_plan_modal(driver):
-                    time.sleep(1)  # 요금제 목록 로딩 대기
+                    # 선택할 요금제가 목록에 나타날 때까지 대기
+                    self.waiter.until(
+                        driver, 'plan_item_ready',
+                        lambda d: d.execute_script("return document.getElementById(arguments[0]) !== null;", task.rate_plan.id),
+                        fallback=1
+                    )
                     
                     # 요금제 선택
                     selected = driver.execute_script("""
@@ -854,7 +1160,14 @@ class LGUPlusCrawler:
                     if not selected:
                         raise Exception("요금제 선택 실패")
                     
-                    time.sleep(1)  # 선택 후 대기 시간 증가
+                    # 라디오 버튼 체크 반영 대기
+                    self.waiter.until(
+                        driver, 'plan_selected',
+                        lambda d: d.execute_script(
+                            "var r = document.getElementById(arguments[0]); return r !== null && r.checked;",
+                            task.rate_plan.id),
+                        fallback=1
+                    )
                     
                     # 적용 버튼 클릭
                     applied = driver.execute_script("""
@@ -881,48 +1194,72 @@ class LGUPlusCrawler:
                     
                     if not applied:
                         raise Exception("적용 버튼 클릭 실패")
-                        
-                    time.sleep(2)  # 모달 닫히고 데이터 로딩 대기
-                
-                # 제조사 전체 선택
-                driver.execute_script("""
-                    var checkbox = document.getElementById('전체');
-                    if (checkbox && !checkbox.checked) {
-                        checkbox.checked = true;
-                        checkbox.dispatchEvent(new Event('change', { bubbles: true }));
-                        
-                        var label = document.querySelector('label[for="전체"]');
-                        if (label) label.click();
-                    }
-                """)
+                    
+                    # 모달 닫히고 데이터 로딩 대기
+                    self.waiter.network_idle(driver, 'plan_apply', fallback=2)
                 
-                time.sleep(2)  # 데이터 로딩 대기 시간 증가
+                # 제조사 전체 선택 (데이터 테이블 갱신 대기)
+                with self.waiter.mutation(driver, 'manufacturer_all', 'tbody', fallback=2) as watch:
+                    manufacturer_changed = driver.execute_script("""
+                        var checkbox = document.getElementById('전체');
+                        if (checkbox && !checkbox.checked) {
+                            checkbox.checked = true;
+                            checkbox.dispatchEvent(new Event('change', { bubbles: true }));
+                            
+                            var label = document.querySelector('label[for="전체"]');
+                            if (label) label.click();
+                            return true;
+                        }
+                        return false;
+                    """)
+                    if not manufacturer_changed:
+                        watch.skip()
                 
-                # 정렬순서를 "최신 공시일자 순"으로 변경
-                sort_changed = driver.execute_script("""
-                    var select = document.querySelector('select#cfrmSelect-1-1');
-                    if (select) {
-                        // 최신 공시일자 순 = value "01"
-                        select.value = '01';
-                        select.dispatchEvent(new Event('change', { bubbles: true }));
-                        console.log('정렬순서 변경: 최신 공시일자 순');
-                        return true;
-                    }
-                    return false;
-                """)
+                # 정렬순서를 "최신 공시일자 순"으로 변경 (데이터 재로딩 대기)
+                with self.waiter.mutation(driver, 'sort_apply', 'tbody', fallback=2) as watch:
+                    sort_changed = driver.execute_script("""
+                        var select = document.querySelector('select#cfrmSelect-1-1');
+                        if (select) {
+                            // 최신 공시일자 순 = value "01"
+                            select.value = '01';
+                            select.dispatchEvent(new Event('change', { bubbles: true }));
+                            console.log('정렬순서 변경: 최신 공시일자 순');
+                            return true;
+                        }
+                        return false;
+                    """)
+                    if not sort_changed:
+                        watch.skip()
                 
                 if sort_changed:
                     logger.info("정렬순서를 '최신 공시일자 순'으로 변경했습니다.")
-                    time.sleep(2)  # 정렬 변경 후 데이터 재로딩 대기
+                timer.lap('plan_select')
                 
                 # 요금제 가격 조회
                 monthly_price = task.rate_plan.monthly_fee  # 이미 수집한 가격 사용
                 if monthly_price == 0 and not self.config['skip_price_check'] and task.rate_plan.value:
                     # 가격이 없을 경우에만 추가 조회
                     monthly_price = self._get_rate_plan_price(driver, task.rate_plan)
+                    timer.lap('plan_price')
                 
-                # 데이터 추출
-                extracted_count = self._extract_data(driver, task, monthly_price)
+                # 데이터 추출 (네트워크 모드는 JSON 응답 우선, 실패 시 DOM)
+                collected = []
+                extracted_count = None
+                if self.config.get('extract_mode') == 'network':
+                    timer.reset()
+                    extracted_count = self._extract_data_from_network(driver, task, monthly_price, collected)
+                    timer.lap('extract', ok=extracted_count is not None, mode='network')
+                if extracted_count is None:
+                    extracted_count = self._extract_data(driver, task, monthly_price, collected)
+                    mode = 'dom'
+                else:
+                    mode = 'network'
+                
+                with self.status_lock:
+                    self.network_stats[mode] += 1
+                
+                if collected:
+                    self.planner.record(*self._task_keys(task), collected)
                 
                 with self.status_lock:
                     self.completed_count += 1
@@ -933,15 +1270,16 @@ class LGUPlusCrawler:
                 else:
                     logger.info(f"✓ {task.rate_plan.name}: {extracted_count}개")
                 
-                return extracted_count
+                return collected
                 
             except TimeoutException as e:
                 logger.error(f"작업 처리 타임아웃: {e}")
+                self.concurrency.congestion('timeout')
                 retry_count += 1
-                if driver:
-                    driver.quit()
-                    driver = None
+                self._release_driver(driver, discard=True)
+                driver = None
                 if retry_count < self.config['retry_count']:
+                    self.telemetry.retry('task')
                     time.sleep(self.config['delay_between_requests'] * 2)
                     continue
             except UnexpectedAlertPresentException as e:
@@ -951,37 +1289,32 @@ class LGUPlusCrawler:
                     self.handle_alert(driver)
                     time.sleep(3)
                 retry_count += 1
-                if driver:
-                    driver.quit()
-                    driver = None
+                self._release_driver(driver, discard=True)
+                driver = None
                 if retry_count < self.config['retry_count']:
+                    self.telemetry.retry('task')
                     time.sleep(self.config['delay_between_requests'] * 2)
                     continue
             except Exception as e:
                 logger.error(f"작업 처리 오류: {e}")
                 retry_count += 1
-                if driver:
-                    driver.quit()
-                    driver = None
+                self._release_driver(driver, discard=True)
+                driver = None
                 if retry_count < self.config['retry_count']:
+                    self.telemetry.retry('task')
                     time.sleep(self.config['delay_between_requests'] * 2)
                     continue
             finally:
-                if driver:
-                    try:
-                        driver.quit()
-                        with self.drivers_lock:
-                            if driver in self.active_drivers:
-                                self.active_drivers.remove(driver)
-                    except Exception as e:
-                        logger.debug(f"드라이버 종료 중 오류: {e}")
-                # 요청 간 지연
-                time.sleep(self.config['delay_between_requests'])
+                # 드라이버 반납 (풀 미사용 시 종료)
+                self._release_driver(driver)
+                driver = None
+                # 요청 간 지연 (적응형이면 현재 조절값)
+                self.concurrency.pause()
         
         with self.status_lock:
             self.failed_count += 1
         
-        return extracted_count
+        return None
     
     def _get_rate_plan_price(self, driver: webdriver.Chrome, rate_plan: RatePlan) -> int:
         """요금제 가격 조회"""
@@ -1041,6 +1374,7 @@ class LGUPlusCrawler:
             # 캐시 저장
             with self.cache_lock:
                 self.price_cache[rate_plan.value] = str(price)
+                self.price_verified.add(rate_plan.value)
             
         except Exception as e:
             logger.debug(f"가격 조회 오류: {e}")
@@ -1051,11 +1385,217 @@ class LGUPlusCrawler:
         
         return price
     
-    def _extract_data(self, driver: webdriver.Chrome, task: CrawlTask, monthly_price: int) -> int:
-        """데이터 추출"""
+    def _build_device_data(self, task: CrawlTask, monthly_price: int, item: Dict[str, Any]) -> DeviceData:
+        """추출 항목(device, price, date, subsidy, additionalSubsidy, finalPrice)을 통합 형식으로 변환"""
+        # 제조사 추출
+        device_nm = item.get('device', '')
+        manufacturer = '기타'
+        if '갤럭시' in device_nm or 'Galaxy' in device_nm.lower():
+            manufacturer = '삼성'
+        elif '아이폰' in device_nm or 'iPhone' in device_nm:
+            manufacturer = '애플'
+        elif 'LG' in device_nm:
+            manufacturer = 'LG'
+        elif '샤오미' in device_nm or 'Xiaomi' in device_nm:
+            manufacturer = '샤오미'
+        
+        # 월정액이 0원인 경우 로그만 남기고 계속 진행
+        if monthly_price <= 0:
+            logger.debug(f"월정액 0원 데이터: {task.rate_plan.name} - {device_nm}")
+        
+        # 공시일 파싱
+        date_str = item.get('date', '')
+        if date_str:
+            try:
+                # "2025.01.10" 형식을 "2025-01-10"으로 변환
+                date_str = date_str.replace('.', '-')
+                # 날짜가 올바른 형식인지 확인
+                datetime.strptime(date_str, '%Y-%m-%d')
+            except:
+                # 파싱 실패 시 현재 날짜 사용
+                date_str = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d')
+        else:
+            date_str = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d')
+        
+        # 지원금 계산
+        public_support = int(item.get('subsidy', '0'))  # 이통사지원금 (공시지원금)
+        additional_support = int(item.get('additionalSubsidy', '0'))  # 유통망지원금 (추가지원금)
+        
+        # 지원금 총액 = 이통사지원금 + 유통망지원금
+        total_support = public_support + additional_support
+        
+        # 통합 데이터 형식
+        device_data = DeviceData(
+            date=date_str,
+            crawled_at=crawl_timestamp(),
+            carrier='LG',
+            manufacturer=manufacturer,
+            scrb_type_name=task.subscription_type[1],
+            network_type=task.device_type[1],
+            device_nm=device_nm,
+            plan_name=task.rate_plan.name,
+            monthly_fee=monthly_price,
+            release_price=int(item.get('price', '0')),
+            public_support_fee=public_support,  # 이통사지원금
+            additional_support_fee=additional_support,  # 추가지원금 (추가이통사 + 유통망)
+            total_support_fee=total_support,  # 지원금 총액
+            total_price=int(item.get('finalPrice', '0'))
+        )
+        
+        return device_data
+    
+    def _find_network_rows(self, payload: Any) -> Optional[List[Dict[str, Any]]]:
+        """JSON 응답에서 지원금 행 목록 탐색 (기기명 + 지원금 필드를 가진 dict 리스트)"""
+        device_keys = self.network_field_candidates['device']
+        subsidy_keys = self.network_field_candidates['subsidy']
+        
+        stack = [payload]
+        while stack:
+            value = stack.pop()
+            if isinstance(value, list):
+                dict_rows = [row for row in value if isinstance(row, dict)]
+                if dict_rows and any(
+                    any(k in row for k in device_keys) and any(k in row for k in subsidy_keys)
+                    for row in dict_rows[:5]
+                ):
+                    return dict_rows
+                stack.extend(value)
+            elif isinstance(value, dict):
+                stack.extend(value.values())
+        return None
+    
+    def _map_network_row(self, row: Dict[str, Any]) -> Optional[Dict[str, str]]:
+        """JSON 행을 _build_device_data 입력 형식으로 변환 (24개월 유지 외 기간은 None)"""
+        def pick(field_name):
+            for key in self.network_field_candidates[field_name]:
+                if row.get(key) not in (None, ''):
+                    return row[key]
+            return None
+        
+        def amount(field_name):
+            value = pick(field_name)
+            digits = re.sub(r'[^0-9]', '', str(value)) if value is not None else ''
+            return digits or '0'
+        
+        # DOM 추출과 동일하게 24개월 유지 행만 사용
+        duration = pick('duration')
+        if duration is not None and '24' not in str(duration):
+            return None
+        
+        device = pick('device')
+        if not device:
+            return None
+        
+        date = pick('date')
+        return {
+            'device': str(device).strip(),
+            'price': amount('price'),
+            'date': str(date).strip() if date else '',
+            'subsidy': amount('subsidy'),
+            'additionalSubsidy': amount('additionalSubsidy'),
+            'finalPrice': amount('finalPrice')
+        }
+    
+    def _extract_data_from_network(self, driver: webdriver.Chrome, task: CrawlTask, monthly_price: int,
+                                   collected: Optional[List[DeviceData]] = None) -> Optional[int]:
+        """페이지가 호출한 JSON 응답에서 데이터 추출 (collected가 주어지면 추출 행을 함께 담음)
+        
+        Returns:
+            추출한 행 수, 지원금 JSON을 찾지 못했거나 결과가 일부뿐이면 None (DOM 추출로 대체)
+        """
+        events = drain_performance_log(driver)
+        exchanges = collect_exchanges(events, url_contains='lguplus.com', resource_types=('XHR', 'Fetch'))
+        
+        # 마지막 응답(정렬/필터가 모두 반영된 상태)부터 확인
+        for exchange in reversed(exchanges):
+            if exchange['status'] != 200 or 'json' not in (exchange['mime_type'] or ''):
+                continue
+            
+            body = get_response_body(driver, exchange['request_id'])
+            if not body:
+                continue
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                continue
+            
+            rows = self._find_network_rows(payload)
+            if rows is None:
+                continue
+            
+            # 전체 건수보다 적게 내려온 경우(서버 페이지네이션) DOM 페이지 순회로 대체
+            total = next((payload[k] for k in self.network_field_candidates['total']
+                          if isinstance(payload, dict) and isinstance(payload.get(k), int)), None)
+            if total is not None and total > len(rows):
+                logger.debug(f"JSON 응답이 일부 결과만 포함 ({len(rows)}/{total}) - DOM 추출 사용")
+                return None
+            
+            devices = []
+            for row in rows:
+                item = self._map_network_row(row)
+                if item:
+                    devices.append(self._build_device_data(task, monthly_price, item))
+            
+            if rows and not devices:
+                logger.debug(f"JSON 필드 매핑 실패 ({exchange['url'][:80]}) - DOM 추출 사용")
+                return None
+            
+            devices = self._top_devices(devices)
+            with self.data_lock:
+                self.all_data.extend(devices)
+            if collected is not None:
+                collected.extend(devices)
+            return len(devices)
+        
+        return None
+    
+    def _page_limit(self) -> int:
+        """조합별 최대 수집 페이지 수 (첫 페이지/상위 기기만 수집하면 1)"""
+        if self.config.get('first_page_only') or self.config.get('max_devices'):
+            return 1
+        return self.config['max_pages']
+    
+    def _top_devices(self, devices: List[DeviceData]) -> List[DeviceData]:
+        """상위 max_devices개 기기의 행만 유지 (최신 공시일자 순 정렬이므로 앞쪽이 최신)"""
+        limit = self.config.get('max_devices')
+        if not limit:
+            return devices
+        names = set()
+        kept = []
+        for device in devices:
+            if device.device_nm not in names:
+                if len(names) >= limit:
+                    continue
+                names.add(device.device_nm)
+            kept.append(device)
+        return kept
+    
+    def _incremental_snapshot(self, task: CrawlTask, page_devices: List[DeviceData],
+                              seen_devices: set) -> Optional[List[DeviceData]]:
+        """증분 모드: 페이지가 이전과 같으면 나머지 기기를 이전 스냅샷에서 가져옴
+        
+        Returns:
+            스냅샷 기기 리스트 (페이지 이동을 멈춰야 함), 계속 수집해야 하면 None
+        """
+        if not self.config.get('incremental'):
+            return None
+        key = combo_key(task.rate_plan.name, task.subscription_type[1], task.device_type[1])
+        if not self.crawl_index.page_unchanged(key, page_devices):
+            return None
+        
+        exclude = seen_devices | {d.device_nm for d in page_devices}
+        reused = [DeviceData(**row) for row in self.crawl_index.snapshot_rows(key, exclude_devices=exclude)]
+        logger.debug(f"변경 없는 페이지 - 이전 결과 {len(reused)}개 재사용: {task.task_id}")
+        return reused
+    
+    def _extract_data(self, driver: webdriver.Chrome, task: CrawlTask, monthly_price: int,
+                      collected: Optional[List[DeviceData]] = None) -> int:
+        """데이터 추출 (collected가 주어지면 추출 행을 함께 담음)"""
         extracted_count = 0
         page = 1
-        max_pages = self.config['max_pages']
+        max_pages = self._page_limit()
+        seen_devices = set()
+        timer = self.telemetry.timer(mode='dom')
         
         while page <= max_pages:
             try:
@@ -1230,102 +1770,64 @@ class LGUPlusCrawler:
                 """)
                 
                 # 데이터 저장 - 통합 형식으로 변환
-                for item in page_data:
-                    # 제조사 추출
-                    device_nm = item.get('device', '')
-                    manufacturer = '기타'
-                    if '갤럭시' in device_nm or 'Galaxy' in device_nm.lower():
-                        manufacturer = '삼성'
-                    elif '아이폰' in device_nm or 'iPhone' in device_nm:
-                        manufacturer = '애플'
-                    elif 'LG' in device_nm:
-                        manufacturer = 'LG'
-                    elif '샤오미' in device_nm or 'Xiaomi' in device_nm:
-                        manufacturer = '샤오미'
-                    
-                    # 월정액이 0원인 경우 로그만 남기고 계속 진행
-                    if monthly_price <= 0:
-                        logger.debug(f"월정액 0원 데이터: {task.rate_plan.name} - {device_nm}")
-                    
-                    # 공시일 파싱
-                    date_str = item.get('date', '')
-                    if date_str:
-                        try:
-                            # "2025.01.10" 형식을 "2025-01-10"으로 변환
-                            date_str = date_str.replace('.', '-')
-                            # 날짜가 올바른 형식인지 확인
-                            datetime.strptime(date_str, '%Y-%m-%d')
-                        except:
-                            # 파싱 실패 시 현재 날짜 사용
-                            date_str = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d')
-                    else:
-                        date_str = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d')
-                    
-                    # 지원금 계산
-                    public_support = int(item.get('subsidy', '0'))  # 이통사지원금 (공시지원금)
-                    additional_support = int(item.get('additionalSubsidy', '0'))  # 유통망지원금 (추가지원금)
-                    
-                    # 지원금 총액 = 이통사지원금 + 유통망지원금
-                    total_support = public_support + additional_support
-                    
-                    # 통합 데이터 형식
-                    device_data = DeviceData(
-                        date=date_str,
-                        crawled_at=datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S'),
-                        carrier='LG',
-                        manufacturer=manufacturer,
-                        scrb_type_name=task.subscription_type[1],
-                        network_type=task.device_type[1],
-                        device_nm=device_nm,
-                        plan_name=task.rate_plan.name,
-                        monthly_fee=monthly_price,
-                        release_price=int(item.get('price', '0')),
-                        public_support_fee=public_support,  # 이통사지원금
-                        additional_support_fee=additional_support,  # 추가지원금 (추가이통사 + 유통망)
-                        total_support_fee=total_support,  # 지원금 총액
-                        total_price=int(item.get('finalPrice', '0'))
-                    )
-                    
-                    with self.data_lock:
-                        self.all_data.append(device_data)
-                    
-                    extracted_count += 1
+                page_devices = self._top_devices([self._build_device_data(task, monthly_price, item) for item in page_data])
+                
+                # 증분 모드: 변경 없는 페이지면 나머지는 이전 스냅샷 사용
+                reused = self._incremental_snapshot(task, page_devices, seen_devices)
+                if reused is not None:
+                    page_devices.extend(reused)
+                
+                with self.data_lock:
+                    self.all_data.extend(page_devices)
+                if collected is not None:
+                    collected.extend(page_devices)
+                seen_devices.update(d.device_nm for d in page_devices)
+                extracted_count += len(page_devices)
+                if page == 1:
+                    timer.lap('extract', ok=bool(page_data))
+                
+                if reused is not None:
+                    break
                 
                 # 다음 페이지 확인
                 if page >= max_pages or len(page_data) == 0:
                     break
                 
-                # 다음 페이지로 이동
-                has_next = driver.execute_script("""
-                    var pagination = document.querySelector('.pagination');
-                    if (!pagination) return false;
-                    
-                    var buttons = pagination.querySelectorAll('li');
-                    for (var i = 0; i < buttons.length; i++) {
-                        if (buttons[i].classList.contains('active')) {
-                            if (i + 1 < buttons.length) {
-                                var nextBtn = buttons[i + 1].querySelector('button, a');
-                                if (nextBtn && !buttons[i + 1].classList.contains('disabled')) {
-                                    nextBtn.click();
-                                    return true;
+                # 다음 페이지로 이동 (데이터 테이블 갱신 대기)
+                with self.waiter.mutation(driver, 'page_switch', 'tbody', fallback=1) as watch:
+                    has_next = driver.execute_script("""
+                        var pagination = document.querySelector('.pagination');
+                        if (!pagination) return false;
+                        
+                        var buttons = pagination.querySelectorAll('li');
+                        for (var i = 0; i < buttons.length; i++) {
+                            if (buttons[i].classList.contains('active')) {
+                                if (i + 1 < buttons.length) {
+                                    var nextBtn = buttons[i + 1].querySelector('button, a');
+                                    if (nextBtn && !buttons[i + 1].classList.contains('disabled')) {
+                                        nextBtn.click();
+                                        return true;
+                                    }
                                 }
+                                break;
                             }
-                            break;
                         }
-                    }
-                    return false;
-                """)
+                        return false;
+                    """)
+                    if not has_next:
+                        watch.skip()
                 
                 if not has_next:
                     break
                 
                 page += 1
-                time.sleep(1)
                 
             except Exception as e:
                 logger.debug(f"페이지 {page} 데이터 추출 오류: {e}")
                 break
         
+        if page > 1:
+            timer.lap('paginate', pages=page)
         return extracted_count
     
     def run_single_thread(self, tasks: List[CrawlTask]):
@@ -1376,9 +1878,13 @@ class LGUPlusCrawler:
     
     def run_multi_thread(self, tasks: List[CrawlTask]):
         """멀티 스레드 실행"""
-        logger.info(f"멀티스레드 모드로 실행 중... (워커: {self.config['max_workers']}개)")
+        if self.concurrency.enabled:
+            logger.info(f"멀티스레드 모드로 실행 중... (워커 자동 조절: {self.concurrency.limit}개에서 시작, "
+                        f"최대 {self.concurrency.max_workers}개)")
+        else:
+            logger.info(f"멀티스레드 모드로 실행 중... (워커: {self.config['max_workers']}개)")
         
-        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
+        with ThreadPoolExecutor(max_workers=self.concurrency.max_workers) as executor:
             # 작업 제출
             futures = {executor.submit(self.process_task, task): task for task in tasks}
             
@@ -1437,42 +1943,194 @@ class LGUPlusCrawler:
                     if (self.completed_count + self.failed_count) % self.config['checkpoint_interval'] == 0:
                         self.save_checkpoint()
     
-    def save_checkpoint(self):
-        """체크포인트 저장"""
-        checkpoint_data = {
+    def _queue_path(self) -> Path:
+        """작업 큐 파일 (기본은 날짜별 - 같은 날 실행한 워커끼리 공유)"""
+        if self.config.get('work_queue'):
+            return Path(self.config['work_queue'])
+        day = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y%m%d')
+        return self.checkpoint_file.parent / f'lg_work_queue_{day}.sqlite'
+    
+    def _queue_key(self, task: CrawlTask) -> str:
+        """큐 작업 키 - 기기종류:가입유형:요금제"""
+        return f"{task.device_type[0]}:{task.subscription_type[0]}:{task.rate_plan.id}"
+    
+    def _task_from_payload(self, payload: Dict[str, Any]) -> CrawlTask:
+        """큐 페이로드(asdict) → CrawlTask"""
+        return CrawlTask(
+            subscription_type=tuple(payload['subscription_type']),
+            device_type=tuple(payload['device_type']),
+            rate_plan=RatePlan(**payload['rate_plan']),
+            task_id=payload.get('task_id', 0)
+        )
+    
+    def _seed_queue(self, queue: WorkQueue) -> bool:
+        """요금제 수집 후 작업 등록 (한 워커만 수행, 나머지는 등록이 끝날 때까지 대기)"""
+        while not queue.get_meta('seeded'):
+            if not queue.claim('seed', ttl=QUEUE_SEED_TTL):
+                logger.info("다른 워커가 작업을 등록하는 중 - 대기")
+                time.sleep(10)
+                continue
+            
+            try:
+                with self.telemetry.step('plan_list'):
+                    self.collect_rate_plans()
+                if not self.rate_plans:
+                    logger.error("수집된 요금제가 없어 작업을 등록하지 못했습니다.")
+                    return False
+                
+                tasks = self.prepare_tasks()
+                added = queue.enqueue((self._queue_key(task), asdict(task)) for task in tasks)
+                queue.set_meta('seeded', datetime.now(ZoneInfo('Asia/Seoul')).isoformat())
+                logger.info(f"작업 큐 등록: {added}개 ({queue.path})")
+            finally:
+                queue.release_claim('seed')
+        return True
+    
+    def _process_queue_task(self, lease) -> Optional[List[Dict[str, Any]]]:
+        """큐 작업 하나 처리 - 수집 행 반환 (실패면 None → 다른 워커/다음 시도로, 기기 없음은 빈 리스트로 완료)"""
+        task = self._task_from_payload(lease.payload)
+        collected = self.process_task(task)
+        if collected is None:
+            return None
+        return [asdict(device) for device in collected]
+    
+    def _queue_progress(self, lease, ok: bool):
+        """큐 진행 상황 (checkpoint_interval개마다 전체 상태 출력)"""
+        with self.status_lock:
+            self.queue_processed += 1
+            processed = self.queue_processed
+        if processed % self.config['checkpoint_interval'] == 0:
+            message = f"작업 큐 - {self.work_queue.summary()}"
+            if RICH_AVAILABLE:
+                console.print(f"[cyan]{message}[/cyan]")
+            else:
+                logger.info(message)
+    
+    def _merge_queue_results(self, queue: WorkQueue) -> List[str]:
+        """큐에 저장된 모든 워커의 수집 행을 병합해 저장"""
+        failures = queue.failures()
+        if failures:
+            logger.warning(f"실패한 작업 {len(failures)}개 - 결과에서 제외 "
+                           f"(예: {', '.join(key for key, _ in failures[:5])})")
+        
+        self.all_data = RowStore(DeviceData, queue.results())
+        self.total_devices = len(self.all_data)
+        logger.info(f"작업 큐 결과 병합: {self.total_devices:,}행 ({queue.path})")
+        
+        saved_files = self.save_results()
+        if saved_files:
+            self.crawl_index.update(self.all_data, partial=self._page_limit() == 1)
+            self.crawl_index.save()
+            queue.set_meta('merged', datetime.now(ZoneInfo('Asia/Seoul')).isoformat())
+        queue.release_claim('merge')
+        return saved_files
+    
+    def run_worker(self) -> List[str]:
+        """분산 워커 실행 - 공유 큐가 빌 때까지 작업을 가져와 처리
+        
+        첫 워커가 요금제를 수집해 작업을 등록하고, 큐가 비면 마지막까지 남은 워커 하나가 결과를 병합합니다.
+        """
+        queue = self.work_queue = WorkQueue(
+            self._queue_path(),
+            lease_seconds=self.config['queue_lease_seconds'],
+            max_attempts=self.config['queue_max_attempts']
+        )
+        
+        if RICH_AVAILABLE:
+            console.print(f"[cyan]분산 워커 {queue.worker_id} - 작업 큐: {queue.path}[/cyan]")
+        else:
+            logger.info(f"분산 워커 {queue.worker_id} - 작업 큐: {queue.path}")
+        
+        if self.config.get('queue_merge'):
+            return self._merge_queue_results(queue)
+        
+        if self.config.get('queue_retry_failed'):
+            reset = queue.reset_failed()
+            if reset:
+                queue.set_meta('merged', '')
+                logger.info(f"실패 작업 {reset}개 재등록")
+        
+        if not self._seed_queue(queue):
+            return []
+        
+        self._open_driver_pool()
+        try:
+            stats = run_queue_worker(queue, self._process_queue_task,
+                                     threads=self.concurrency.max_workers,
+                                     on_progress=self._queue_progress)
+        finally:
+            self._close_driver_pool()
+        
+        # 단계별 대기 시간 기록
+        self.waiter.save()
+        self.waiter.log_summary()
+        logger.info(f"리소스 차단 - {self.browser_profile.summary()}")
+        logger.info(f"동시성 - {self.concurrency.summary()}")
+        logger.info(f"작업 큐 - {queue.summary()}")
+        
+        # 큐가 비었으면 한 워커만 결과 병합
+        # (병합 완료 표시는 클레임과 같은 트랜잭션에서 확인 - 앞 워커가 병합 후 클레임을 해제해도 다시 병합하지 않음)
+        if queue.drained() and queue.claim('merge', ttl=QUEUE_MERGE_TTL, unless='merged'):
+            return self._merge_queue_results(queue)
+        
+        logger.info(f"이 워커 처리 완료: {stats['completed']}개 작업, {stats['rows']:,}행 (병합은 다른 워커 또는 --merge)")
+        return []
+    
+    def save_checkpoint(self, compact: bool = False):
+        """체크포인트 저장 (지난 체크포인트 이후 수집한 행만 저널에 추가)
+        
+        Args:
+            compact: 저장 후 저널을 하나의 세그먼트로 압축 (중단/오류로 실행을 끝낼 때)
+        """
+        marker = {
             'completed': self.completed_count,
             'failed': self.failed_count,
-            'data': [vars(d) for d in self.all_data],
             'price_cache': self.price_cache.copy(),
-            'rate_plans': self.rate_plans,
-            'all_combinations': self.all_combinations,
             'timestamp': datetime.now(ZoneInfo('Asia/Seoul')).isoformat()
         }
         
-        try:
-            with open(self.checkpoint_file, 'wb') as f:
-                pickle.dump(checkpoint_data, f)
-            logger.debug("체크포인트 저장 완료")
-        except Exception as e:
-            logger.error(f"체크포인트 저장 실패: {e}")
+        # 요금제/조합 목록은 실행 중 바뀌지 않으므로 한 번만 저장
+        state = None
+        if not self.journal.state_written:
+            state = {'rate_plans': self.rate_plans, 'all_combinations': self.all_combinations}
+        
+        appended = self.journal.checkpoint(self.all_data, marker, state)
+        logger.debug(f"체크포인트 저장 완료 (+{appended}행)")
+        
+        if compact:
+            self.journal.compact(self.all_data, marker)
     
     def load_checkpoint(self) -> bool:
-        """체크포인트 로드"""
-        if not os.path.exists(self.checkpoint_file):
+        """체크포인트 로드 (저널 재생, 없으면 이전 pickle 체크포인트)"""
+        try:
+            loaded = self.journal.load()
+        except Exception as e:
+            logger.error(f"체크포인트 저널 로드 실패: {e}")
+            loaded = None
+        
+        if loaded is not None:
+            rows, data, state = loaded
+            data = {**data, **(state or {})}
+        elif os.path.exists(self.checkpoint_file):
+            try:
+                with open(self.checkpoint_file, 'rb') as f:
+                    data = pickle.load(f)
+                rows = data.get('data', [])
+            except Exception as e:
+                logger.error(f"체크포인트 로드 실패: {e}")
+                return False
+        else:
             return False
         
         try:
-            with open(self.checkpoint_file, 'rb') as f:
-                data = pickle.load(f)
-            
             self.completed_count = data.get('completed', 0)
             self.failed_count = data.get('failed', 0)
-            self.all_data = [DeviceData(**d) for d in data.get('data', [])]
-            self.price_cache = data.get('price_cache', {})
+            self.all_data = RowStore(DeviceData, rows)
+            self.price_cache.update(data.get('price_cache', {}))
             self.rate_plans = data.get('rate_plans', {})
             self.all_combinations = data.get('all_combinations', [])
             
-            logger.info(f"체크포인트 로드: {data['timestamp']}")
+            logger.info(f"체크포인트 로드: {data.get('timestamp')}")
             return True
         except Exception as e:
             logger.error(f"체크포인트 로드 실패: {e}")
@@ -1488,7 +2146,7 @@ class LGUPlusCrawler:
             return []
         
         # DataFrame 생성
-        df = pd.DataFrame([vars(d) for d in self.all_data])
+        df = self.all_data.to_dataframe()
         
         # 파일 저장
         timestamp = datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y%m%d_%H%M%S')
@@ -1506,6 +2164,27 @@ class LGUPlusCrawler:
         else:
             logger.info(f"✅ CSV 저장: {csv_file}")
         
+        # 직전 스냅샷 대비 변경분 (선택)
+        if self.config['save_delta']:
+            try:
+                delta_file = write_delta(csv_file)
+                if delta_file:
+                    saved_files.append(str(delta_file))
+            except Exception as e:
+                logger.error(f"변경분 저장 실패: {e}")
+        
+        # Parquet (통신사/수집일 분할, 선택)
+        if self.config['save_parquet']:
+            if PYARROW_AVAILABLE:
+                try:
+                    parquet_file = write_raw_data(df, 'lg', root=self.config['parquet_dir'],
+                                                  run_time=datetime.now(ZoneInfo('Asia/Seoul')))
+                    saved_files.append(str(parquet_file))
+                except Exception as e:
+                    logger.error(f"Parquet 저장 실패: {e}")
+            else:
+                logger.warning("pyarrow가 설치되어 있지 않아 Parquet 저장을 건너뜁니다.")
+        
         # 통계 출력
         self._print_statistics(df)
         
@@ -1546,6 +2225,7 @@ class LGUPlusCrawler:
     def run(self):
         """메인 실행"""
         self.start_time = time.time()
+        status = 'failed'
         
         try:
             # 헤더 출력
@@ -1561,6 +2241,12 @@ class LGUPlusCrawler:
                 print("통합 버전 v6.1")
                 print("="*60)
             
+            # 분산 워커 모드: 공유 작업 큐에서 작업을 가져와 처리
+            if self.config.get('queue_mode'):
+                saved_files = self.run_worker()
+                status = 'ok'
+                return saved_files
+            
             # 체크포인트 확인
             if self.config.get('resume') and self.load_checkpoint():
                 if RICH_AVAILABLE:
@@ -1575,7 +2261,8 @@ class LGUPlusCrawler:
                     tasks = self.prepare_tasks()
             else:
                 # 요금제 수집
-                self.collect_rate_plans()
+                with self.telemetry.step('plan_list'):
+                    self.collect_rate_plans()
                 
                 if not self.rate_plans:
                     if RICH_AVAILABLE:
@@ -1610,10 +2297,44 @@ class LGUPlusCrawler:
                 print(f"\n공시지원금 데이터 수집 시작")
                 print(f"워커: {self.config['max_workers']}개")
             
-            if self.config['max_workers'] > 1:
-                self.run_multi_thread(tasks)
-            else:
-                self.run_single_thread(tasks)
+            # 중복 예측 작업 제외
+            run_tasks = self._plan_tasks(tasks)
+            
+            self._open_driver_pool()
+            try:
+                if self.concurrency.max_workers > 1:
+                    self.run_multi_thread(run_tasks)
+                else:
+                    self.run_single_thread(run_tasks)
+                
+                # 미룬 작업 처리
+                self._materialize_deferred_tasks()
+            finally:
+                self._close_driver_pool()
+            
+            if self.config.get('extract_mode') == 'network':
+                logger.info(f"추출 방식 - JSON 응답 {self.network_stats['network']}개, DOM {self.network_stats['dom']}개")
+            
+            # 증분 인덱스 갱신
+            self.crawl_index.update(self.all_data, partial=self._page_limit() == 1)
+            self.crawl_index.save()
+            if self.config.get('incremental'):
+                logger.info(f"증분 모드 - {self.crawl_index.summary()}")
+            
+            # 요금제 가격 조회 결과 유지 (다음 실행에서 재조회 생략)
+            if self.price_cache:
+                self.plan_catalog.store_prices(self.price_cache, verified=self.price_verified)
+            
+            # 단계별 대기 시간 기록
+            self.waiter.save()
+            self.waiter.log_summary()
+            logger.info(f"리소스 차단 - {self.browser_profile.summary()}")
+            logger.info(f"요금제 카탈로그 - {self.plan_catalog.summary()}")
+            logger.info(f"드라이버 - {resolver_summary()}")
+            logger.info(f"동시성 - {self.concurrency.summary()}")
+            if self.fixtures.active:
+                logger.info(f"픽스처 - {self.fixtures.summary()}")
+                self.fixtures.close()
             
             # 결과 저장
             saved_files = self.save_results()
@@ -1643,17 +2364,23 @@ class LGUPlusCrawler:
                 print(f"총 수집 데이터: {self.total_devices}개")
             
             # 체크포인트 삭제
+            self.journal.clear()
             if self.checkpoint_file.exists():
                 self.checkpoint_file.unlink()
             
+            status = 'ok'
             return saved_files
             
         except KeyboardInterrupt:
+            status = 'interrupted'
             if RICH_AVAILABLE:
                 console.print("\n[yellow]사용자에 의해 중단되었습니다.[/yellow]")
             else:
                 print("\n사용자에 의해 중단되었습니다.")
-            self.save_checkpoint()
+            if self.config.get('queue_mode'):
+                # 처리 중이던 작업은 임대 만료 후 다른 워커가 가져감
+                return []
+            self.save_checkpoint(compact=True)
             # 중단 시점 데이터 저장
             if self.all_data:
                 saved_files = self.save_results()
@@ -1663,12 +2390,18 @@ class LGUPlusCrawler:
             logger.error(f"크롤링 오류: {e}")
             if self.config['debug']:
                 traceback.print_exc()
-            self.save_checkpoint()
+            if self.config.get('queue_mode'):
+                return []
+            self.save_checkpoint(compact=True)
             # 오류 시 데이터 저장
             if self.all_data:
                 saved_files = self.save_results()
                 return saved_files
             return []
+        finally:
+            # 작업/단계별 소요 시간 기록
+            self.telemetry.add_bytes(self.browser_profile.stats['loaded_bytes'], 'browser')
+            self.telemetry.finish(rows=len(self.all_data), status=status)
     
     def __del__(self):
         """객체 소멸자 - 모든 드라이버 정리"""
@@ -1691,6 +2424,10 @@ class LGUPlusCrawler:
                             except:
                                 pass
                         self.active_services.clear()
+            
+            # 픽스처 기록 파일 닫기 / 재생 서버 종료 (중단·오류 시)
+            if hasattr(self, 'fixtures'):
+                self.fixtures.close()
         except:
             pass
 
@@ -1715,6 +2452,10 @@ def main():
     # 크롤링 옵션
     parser.add_argument('--max-pages', type=int, default=10,
                         help='최대 페이지 수 (기본값: 10)')
+    parser.add_argument('--first-page-only', action='store_true',
+                        help='각 조합의 첫 페이지만 수집 (최신 공시 기기)')
+    parser.add_argument('--max-devices', type=int, default=0,
+                        help='조합별 최대 기기 수 (0=전체, 지정 시 첫 페이지만 수집)')
     parser.add_argument('--max-rate-plans', type=int, default=0,
                         help='최대 요금제 수 (0=전체, 기본값: 0)')
     parser.add_argument('--skip-price-check', action='store_true',
@@ -1733,6 +2474,54 @@ def main():
                         help='테스트 모드 (처음 5개 요금제만)')
     parser.add_argument('--delay', type=int, default=2,
                         help='요청 간 지연 시간(초) (기본: 2)')
+    parser.add_argument('--no-driver-pool', action='store_true',
+                        help='드라이버 풀 비활성화 (작업마다 Chrome 새로 실행)')
+    parser.add_argument('--driver-max-uses', type=int, default=50,
+                        help='드라이버 재생성 전 최대 사용 횟수 (기본: 50)')
+    parser.add_argument('--no-block-resources', action='store_true',
+                        help='이미지/폰트/광고 스크립트 등 리소스 차단 비활성화')
+    parser.add_argument('--record-fixtures', type=str, default=None, metavar='DIR',
+                        help='페이지/XHR 응답을 픽스처 코퍼스로 기록')
+    parser.add_argument('--replay-fixtures', type=str, default=None, metavar='DIR_OR_URL',
+                        help='라이브 사이트 대신 픽스처 코퍼스(또는 재생 서버)로 실행')
+    parser.add_argument('--parquet', action='store_true',
+                        help='CSV와 함께 Parquet 저장 (통신사/수집일 분할, pyarrow 필요)')
+    parser.add_argument('--delta', action='store_true',
+                        help='직전 스냅샷 대비 변경분(추가/변경/삭제)을 raw/delta/에 저장')
+    parser.add_argument('--fixed-waits', action='store_true',
+                        help='이벤트 기반 대기 대신 기존 고정 대기 사용')
+    parser.add_argument('--incremental', action='store_true',
+                        help='증분 모드 (변경 없는 페이지 이후는 이전 결과 재사용)')
+    parser.add_argument('--shared-service', action='store_true',
+                        help='chromedriver Service 하나를 모든 드라이버가 공유')
+    parser.add_argument('--chromedriver-version', type=str, default=None, metavar='VERSION',
+                        help='chromedriver 버전 고정 (예: 131, 기본: 설치된 Chrome에 맞춤)')
+    parser.add_argument('--no-telemetry', action='store_true',
+                        help='작업/단계별 소요 시간 기록(JSON Lines, Prometheus textfile) 비활성화')
+    parser.add_argument('--telemetry-dir', type=str, default=None, metavar='DIR',
+                        help='텔레메트리 저장 디렉토리 (기본: 체크포인트 디렉토리/telemetry)')
+    parser.add_argument('--refresh-plans', action='store_true',
+                        help='요금제 카탈로그를 무시하고 요금제 목록 전체 다시 열거')
+    parser.add_argument('--plan-ttl', type=float, default=DEFAULT_TTL_HOURS, metavar='HOURS',
+                        help=f'저장된 요금제 목록 유효 시간 (기본: {DEFAULT_TTL_HOURS}시간)')
+    parser.add_argument('--no-planner', action='store_true',
+                        help='중복 조합 예측 비활성화 (모든 작업 수집)')
+    parser.add_argument('--network-extract', action='store_true',
+                        help='페이지의 JSON 응답에서 데이터 추출 (실패 시 DOM 추출)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='동시 작업 수/요청 간 지연 자동 조절 (--workers/--delay에서 시작)')
+    parser.add_argument('--adaptive-max-workers', type=int, default=8,
+                        help='자동 조절 시 최대 동시 작업 수 (기본: 8)')
+    parser.add_argument('--worker', action='store_true',
+                        help='분산 워커 모드 (공유 작업 큐가 빌 때까지 작업을 가져와 처리, 여러 머신에서 동시 실행)')
+    parser.add_argument('--queue', type=str, default=None, metavar='PATH',
+                        help='작업 큐 파일 (기본: 체크포인트 디렉토리/lg_work_queue_YYYYMMDD.sqlite, 공유 디렉토리 지정)')
+    parser.add_argument('--queue-lease', type=float, default=DEFAULT_LEASE_SECONDS, metavar='SECONDS',
+                        help=f'작업 임대 시간 (기본: {DEFAULT_LEASE_SECONDS}초)')
+    parser.add_argument('--merge', action='store_true',
+                        help='작업 큐의 결과만 병합해 저장 (--worker와 함께 사용)')
+    parser.add_argument('--retry-failed', action='store_true',
+                        help='작업 큐의 실패 작업을 다시 처리 (--worker와 함께 사용)')
     
     args = parser.parse_args()
     
@@ -1741,20 +2530,48 @@ def main():
         'max_workers': args.workers,
         'headless': True if not args.show_browser else False,  # 기본적으로 헤드리스 모드
         'max_pages': args.max_pages,
+        'first_page_only': args.first_page_only,
+        'max_devices': args.max_devices,
         'max_rate_plans': 5 if args.test else args.max_rate_plans,
         'skip_price_check': args.skip_price_check,
         'output_dir': args.output,
         'resume': args.resume,
         'debug': args.debug,
         'use_rich': RICH_AVAILABLE and not args.no_rich,
-        'delay_between_requests': args.delay
+        'delay_between_requests': args.delay,
+        'use_driver_pool': not args.no_driver_pool,
+        'driver_max_uses': args.driver_max_uses,
+        'extract_mode': 'network' if args.network_extract else 'dom',
+        'combo_planner': not args.no_planner,
+        'incremental': args.incremental,
+        'plan_catalog': not args.refresh_plans,
+        'shared_service': args.shared_service,
+        'chromedriver_version': args.chromedriver_version,
+        'plan_catalog_ttl_hours': args.plan_ttl,
+        'telemetry': not args.no_telemetry,
+        'telemetry_dir': args.telemetry_dir,
+        'block_resources': not args.no_block_resources,
+        'fixture_record': args.record_fixtures,
+        'fixture_replay': args.replay_fixtures,
+        'save_parquet': args.parquet,
+        'save_delta': args.delta,
+        'event_waits': not args.fixed_waits,
+        'adaptive_concurrency': args.adaptive,
+        'adaptive_max_workers': args.adaptive_max_workers,
+        'queue_mode': args.worker or args.merge,
+        'work_queue': args.queue,
+        'queue_lease_seconds': args.queue_lease,
+        'queue_merge': args.merge,
+        'queue_retry_failed': args.retry_failed
     }
     
     # 크롤러 실행
     crawler = LGUPlusCrawler(config)
     saved_files = crawler.run()
     
-    sys.exit(0 if saved_files else 1)
+    # 병합을 맡지 않은 워커는 저장 파일 없이 정상 종료
+    worker_done = args.worker and not args.merge and crawler.work_queue is not None
+    sys.exit(0 if saved_files or worker_done else 1)
 
 
 if __name__ == '__main__':
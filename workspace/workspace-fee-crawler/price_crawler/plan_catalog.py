@@ -0,0 +1,200 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+요금제 카탈로그 캐시
+통신사별 요금제 목록을 실행 간 유지해, 변경이 없으면 모달/카테고리 클릭으로
+전체 요금제를 다시 열거하는 과정을 건너뜁니다.
+
+- 크롤러는 한 화면만 읽어 지문(fingerprint)을 계산 (예: 요금제 모달 첫 목록의 개수 + 해시)
+- 저장된 지문과 같고 TTL 이내면 저장된 요금제 목록을 그대로 사용
+- 지문이 다르거나 TTL이 지났으면 전체 열거 후 카탈로그 갱신
+- 요금제별 월 요금 조회 결과(LG price_cache)도 같은 파일에 유지 (가격마다 마지막 조회 시각으로 TTL 판단)
+
+작성일: 2025-10-27
+파일명: plan_catalog.py
+"""
+
+import json
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 유효 시간 (시간)
+DEFAULT_TTL_HOURS = 24
+
+# 지문 계산에 사용하는 요금제 필드
+FINGERPRINT_FIELDS = ('id', 'name', 'monthly_fee')
+
+
+def _now() -> datetime:
+    return datetime.now(ZoneInfo('Asia/Seoul'))
+
+
+def _field(item: Any, name: str) -> Any:
+    """dict 또는 dataclass 항목에서 필드 값 조회"""
+    if isinstance(item, dict):
+        return item.get(name)
+    return getattr(item, name, None)
+
+
+def plan_fingerprint(items: Iterable[Any], fields: Iterable[str] = FINGERPRINT_FIELDS) -> str:
+    """요금제 목록 지문 ('개수:SHA1', 순서 포함)"""
+    fields = tuple(fields)
+    digest = hashlib.sha1()
+    count = 0
+    for item in items:
+        digest.update(json.dumps([_field(item, f) for f in fields], ensure_ascii=False, default=str).encode('utf-8'))
+        digest.update(b'\n')
+        count += 1
+    return f"{count}:{digest.hexdigest()}"
+
+
+class PlanCatalog:
+    """지문 검증 + TTL 기반 요금제 목록 캐시"""
+
+    def __init__(self, carrier: str, catalog_file: Optional[Path] = None,
+                 ttl_hours: float = DEFAULT_TTL_HOURS, enabled: bool = True):
+        """
+        Args:
+            carrier: 통신사 (SK, KT, LG)
+            catalog_file: 카탈로그 저장 파일 (JSON, None이면 저장하지 않음)
+            ttl_hours: 저장된 목록/가격의 유효 시간
+            enabled: False면 항상 전체 열거 (결과는 계속 저장)
+        """
+        self.carrier = carrier
+        self.catalog_file = Path(catalog_file) if catalog_file else None
+        self.ttl = timedelta(hours=ttl_hours)
+        self.enabled = enabled
+
+        self.fingerprint: Optional[str] = None
+        self.plans: Any = None
+        self.saved_at: Optional[str] = None
+        # {요금제 값: 월 요금}, {요금제 값: 사이트에서 마지막으로 조회한 시각}
+        self.prices: Dict[str, Any] = {}
+        self.prices_checked_at: Dict[str, str] = {}
+
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0}
+        self.last_result = None
+
+        self.load()
+
+    def load(self):
+        """카탈로그 로드"""
+        if not self.catalog_file or not self.catalog_file.exists():
+            return
+        try:
+            with open(self.catalog_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.fingerprint = data.get('fingerprint')
+            self.plans = data.get('plans')
+            self.saved_at = data.get('saved_at')
+            self.prices = data.get('prices', {})
+            # 이전 형식은 전체 가격에 저장 시각 하나
+            saved_at = data.get('prices_saved_at')
+            self.prices_checked_at = data.get('prices_checked_at') or (
+                {value: saved_at for value in self.prices} if saved_at else {})
+            logger.info(f"[{self.carrier}] 요금제 카탈로그 로드: 지문 {self.fingerprint} (저장: {self.saved_at})")
+        except Exception as e:
+            logger.warning(f"요금제 카탈로그 로드 실패: {e}")
+
+    def save(self):
+        """카탈로그 저장 (원자적 교체)"""
+        if not self.catalog_file:
+            return
+        try:
+            self.catalog_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.catalog_file.with_suffix('.tmp')
+            with self._lock:
+                data = {
+                    'carrier': self.carrier,
+                    'fingerprint': self.fingerprint,
+                    'saved_at': self.saved_at,
+                    'plans': self.plans,
+                    'prices_checked_at': self.prices_checked_at,
+                    'prices': self.prices,
+                }
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            temp_file.replace(self.catalog_file)
+        except Exception as e:
+            logger.warning(f"요금제 카탈로그 저장 실패: {e}")
+
+    def _fresh(self, saved_at: Optional[str]) -> bool:
+        """저장 시각이 TTL 이내인지"""
+        if not saved_at:
+            return False
+        try:
+            return _now() - datetime.fromisoformat(saved_at) < self.ttl
+        except (TypeError, ValueError):
+            return False
+
+    def lookup(self, fingerprint: str) -> Optional[Any]:
+        """지문이 같고 TTL 이내면 저장된 요금제 목록, 아니면 None (전체 열거 필요)"""
+        reason = None
+        if not self.enabled:
+            reason = '비활성화'
+        elif self.plans is None:
+            reason = '저장된 목록 없음'
+        elif not self._fresh(self.saved_at):
+            reason = f'TTL 만료 (저장: {self.saved_at})'
+        elif fingerprint != self.fingerprint:
+            reason = f'지문 변경 ({self.fingerprint} -> {fingerprint})'
+
+        with self._lock:
+            if reason:
+                self.stats['misses'] += 1
+                self.last_result = reason
+                logger.info(f"[{self.carrier}] 요금제 카탈로그 미사용: {reason} - 전체 열거")
+                return None
+            self.stats['hits'] += 1
+            self.last_result = 'hit'
+        logger.info(f"[{self.carrier}] 요금제 카탈로그 사용: 지문 {fingerprint} (저장: {self.saved_at})")
+        return self.plans
+
+    def store(self, fingerprint: str, plans: Any):
+        """전체 열거 결과 저장 (plans는 JSON 직렬화 가능한 값)"""
+        with self._lock:
+            self.fingerprint = fingerprint
+            self.plans = plans
+            self.saved_at = _now().isoformat()
+        self.save()
+        logger.info(f"[{self.carrier}] 요금제 카탈로그 갱신: 지문 {fingerprint}")
+
+    def load_prices(self) -> Dict[str, Any]:
+        """마지막 조회가 TTL 이내인 요금제 가격 (만료된 가격은 제외)"""
+        if not self.enabled:
+            return {}
+        with self._lock:
+            return {value: price for value, price in self.prices.items()
+                    if self._fresh(self.prices_checked_at.get(value))}
+
+    def store_prices(self, prices: Dict[str, Any], verified: Optional[Iterable[str]] = None):
+        """요금제 가격 저장 (변경이 있을 때만 기록)
+
+        Args:
+            prices: {요금제 값: 월 요금}
+            verified: 이번 실행에서 사이트에서 다시 조회한 요금제 값 (None이면 전체)
+                      - 이 값들만 조회 시각을 갱신하고, 캐시에서 가져온 가격은 이전 조회 시각 유지
+        """
+        verified = set(prices if verified is None else verified)
+        now = _now().isoformat()
+        with self._lock:
+            checked_at = {value: self.prices_checked_at[value]
+                          for value in prices if value in self.prices_checked_at}
+            checked_at.update({value: now for value in verified if value in prices})
+            if prices == self.prices and not verified:
+                return
+            self.prices = dict(prices)
+            self.prices_checked_at = checked_at
+        self.save()
+
+    def summary(self) -> str:
+        """통계 문자열"""
+        return f"요금제 카탈로그 사용 {self.stats['hits']}회, 전체 열거 {self.stats['misses']}회"
@@ -0,0 +1,248 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+열 단위 수집 결과 저장소
+크롤러의 all_data를 행 객체(DeviceData/dict) 리스트 대신 필드별 배열로 보관합니다.
+
+- 문자열 필드(device_nm, plan_name, scrb_type_name 등)는 필드별 사전에 한 번만 저장하고 코드(uint32)만 누적
+- 가격 필드는 int64 배열 (행당 객체/dict 없음)
+- 추가 전용: 체크포인트는 길이만 고정해 앞부분을 읽으므로 복사 없이 스냅샷
+- 리스트처럼 사용 가능 (len, 반복, 인덱스/슬라이스 → row_factory로 만든 DeviceData 또는 dict)
+- to_dataframe(): 가격 컬럼은 배열 버퍼를 한 번에 복사, 문자열 컬럼은 category로 변환
+
+작성일: 2025-10-27
+파일명: row_store.py
+"""
+
+import time
+import threading
+from array import array
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from price_crawler.columnar_store import STRING_COLUMNS, PRICE_COLUMNS
+
+# 원시 데이터 컬럼 (CSV 컬럼 순서)
+ROW_COLUMNS = STRING_COLUMNS + PRICE_COLUMNS
+
+_timestamp_cache = [0, '']
+
+
+def crawl_timestamp() -> str:
+    """수집 시각 문자열 (한국 시간, 같은 초에는 캐시 재사용)"""
+    now = int(time.time())
+    if _timestamp_cache[0] != now:
+        _timestamp_cache[1] = datetime.fromtimestamp(now, ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S')
+        _timestamp_cache[0] = now
+    return _timestamp_cache[1]
+
+
+def _row_values(row: Any) -> Dict[str, Any]:
+    """dict 또는 dataclass 행의 필드"""
+    return row if isinstance(row, dict) else vars(row)
+
+
+class RowStore:
+    """필드별 배열로 보관하는 추가 전용 행 저장소"""
+
+    def __init__(self, row_factory: Callable[..., Any] = dict, rows: Iterable[Any] = ()):
+        """
+        Args:
+            row_factory: 행을 꺼낼 때 사용할 생성자 (DeviceData 또는 dict), 필드는 키워드 인자로 전달
+            rows: 초기 행 (dict 또는 dataclass)
+        """
+        self.row_factory = row_factory
+        self._lock = threading.RLock()
+        self._reset()
+        self.extend(rows)
+
+    def _reset(self):
+        self._length = 0
+        self._codes: Dict[str, array] = {name: array('I') for name in STRING_COLUMNS}
+        self._values: Dict[str, List[str]] = {name: [] for name in STRING_COLUMNS}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in STRING_COLUMNS}
+        self._ints: Dict[str, array] = {name: array('q') for name in PRICE_COLUMNS}
+
+    # ------------------------------------------------------------------
+    # 추가
+
+    def _intern(self, name: str, value: Any) -> int:
+        """문자열 필드 값 → 코드 (락 보유 상태에서 호출)"""
+        value = '' if value is None else str(value)
+        lookup = self._lookup[name]
+        code = lookup.get(value)
+        if code is None:
+            code = len(self._values[name])
+            self._values[name].append(value)
+            lookup[value] = code
+        return code
+
+    def _append_locked(self, values: Dict[str, Any]):
+        for name in STRING_COLUMNS:
+            self._codes[name].append(self._intern(name, values.get(name, '')))
+        for name in PRICE_COLUMNS:
+            self._ints[name].append(int(values.get(name) or 0))
+        # 모든 필드를 채운 뒤 길이를 늘려 읽는 쪽이 반쯤 추가된 행을 보지 않도록
+        self._length += 1
+
+    def append(self, row: Any):
+        """행 추가 (dict 또는 dataclass, 스키마에 없는 필드는 무시)"""
+        with self._lock:
+            self._append_locked(_row_values(row))
+
+    def extend(self, rows: Iterable[Any]):
+        """여러 행 추가"""
+        if isinstance(rows, RowStore):
+            rows = rows.dicts()
+        with self._lock:
+            for row in rows:
+                self._append_locked(_row_values(row))
+
+    def extend_columns(self, columns: Dict[str, Sequence[Any]]):
+        """필드별 값 목록으로 행 추가 (체크포인트 복원)"""
+        count = len(next(iter(columns.values()), []))
+        with self._lock:
+            for name in STRING_COLUMNS:
+                values = columns.get(name, [''] * count)
+                self._codes[name].extend(self._intern(name, value) for value in values)
+            for name in PRICE_COLUMNS:
+                values = columns.get(name, [0] * count)
+                self._ints[name].extend(int(value or 0) for value in values)
+            self._length += count
+
+    def copy_rows(self, indices: Iterable[int], **overrides: Any) -> int:
+        """기존 행을 일부 필드만 바꿔 복사 추가 (예: 다른 가입유형으로 복사)
+
+        Returns:
+            추가한 행 수
+        """
+        indices = list(indices)
+        with self._lock:
+            override_codes = {name: self._intern(name, value) for name, value in overrides.items() if name in self._codes}
+            override_ints = {name: int(value or 0) for name, value in overrides.items() if name in self._ints}
+            for name, codes in self._codes.items():
+                if name in override_codes:
+                    codes.extend([override_codes[name]] * len(indices))
+                else:
+                    codes.extend(codes[i] for i in indices)
+            for name, ints in self._ints.items():
+                if name in override_ints:
+                    ints.extend([override_ints[name]] * len(indices))
+                else:
+                    ints.extend(ints[i] for i in indices)
+            self._length += len(indices)
+        return len(indices)
+
+    def clear(self):
+        """모든 행 삭제"""
+        with self._lock:
+            self._reset()
+
+    # ------------------------------------------------------------------
+    # 조회
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Any]:
+        length = self._length
+        for index in range(length):
+            yield self.row_factory(**self.row_dict(index))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row_factory(**values) for values in self.dicts(*index.indices(self._length)[:2])]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('RowStore index out of range')
+        return self.row_factory(**self.row_dict(index))
+
+    def row_dict(self, index: int) -> Dict[str, Any]:
+        """행 하나를 dict로"""
+        values = {name: self._values[name][self._codes[name][index]] for name in STRING_COLUMNS}
+        values.update((name, self._ints[name][index]) for name in PRICE_COLUMNS)
+        return values
+
+    def columns(self, start: int = 0, end: Optional[int] = None) -> Dict[str, list]:
+        """[start, end) 구간의 필드별 값 목록 (체크포인트 기록용)"""
+        end = self._length if end is None else min(end, self._length)
+        result: Dict[str, list] = {}
+        for name in STRING_COLUMNS:
+            values = self._values[name]
+            result[name] = [values[code] for code in self._codes[name][start:end]]
+        for name in PRICE_COLUMNS:
+            result[name] = self._ints[name][start:end].tolist()
+        return result
+
+    def dicts(self, start: int = 0, end: Optional[int] = None) -> List[Dict[str, Any]]:
+        """[start, end) 구간 행을 dict 목록으로"""
+        columns = self.columns(start, end)
+        return [dict(zip(ROW_COLUMNS, values)) for values in zip(*(columns[name] for name in ROW_COLUMNS))]
+
+    def where(self, **conditions: Any) -> List[int]:
+        """필드 값이 모두 일치하는 행 인덱스 (문자열 필드는 코드 비교)"""
+        length = self._length
+        checks: List[Tuple[array, Any]] = []
+        for name, value in conditions.items():
+            if name in self._lookup:
+                code = self._lookup[name].get('' if value is None else str(value))
+                if code is None:
+                    return []
+                checks.append((self._codes[name], code))
+            else:
+                checks.append((self._ints[name], int(value or 0)))
+
+        if not checks:
+            return list(range(length))
+        first, first_value = checks[0]
+        return [i for i in range(length) if first[i] == first_value
+                and all(column[i] == expected for column, expected in checks[1:])]
+
+    def group_indices(self, *fields: str) -> Dict[Tuple[Any, ...], List[int]]:
+        """필드 값 조합별 행 인덱스 {(값, ...): [인덱스, ...]}"""
+        length = self._length
+        keys = []
+        for name in fields:
+            if name in self._codes:
+                values = self._values[name]
+                keys.append([values[code] for code in self._codes[name][:length]])
+            else:
+                keys.append(self._ints[name][:length].tolist())
+
+        groups: Dict[Tuple[Any, ...], List[int]] = {}
+        for index, key in enumerate(zip(*keys)):
+            groups.setdefault(key, []).append(index)
+        return groups
+
+    def to_dataframe(self, categorical: bool = True) -> pd.DataFrame:
+        """DataFrame 변환
+
+        가격 컬럼은 배열 버퍼를 numpy 배열로 한 번에 복사합니다 (버퍼를 그대로 쓰면 DataFrame이
+        살아있는 동안 append가 BufferError를 내고, DataFrame 수정이 저장소에 반영됨).
+        문자열 컬럼은 category, categorical=False면 object.
+        """
+        with self._lock:
+            length = self._length
+            data = {}
+            for name in STRING_COLUMNS:
+                codes = np.frombuffer(self._codes[name], dtype=np.uint32, count=length).astype(np.int32)
+                categories = pd.Index(self._values[name], dtype=object)
+                if categorical:
+                    data[name] = pd.Categorical.from_codes(codes, categories=categories)
+                else:
+                    data[name] = categories.values[codes] if length else np.array([], dtype=object)
+            for name in PRICE_COLUMNS:
+                data[name] = np.frombuffer(self._ints[name], dtype=np.int64, count=length).copy()
+            return pd.DataFrame(data, columns=list(ROW_COLUMNS), copy=False)
+
+    def memory_bytes(self) -> int:
+        """필드 배열 + 사전 문자열이 차지하는 대략적인 바이트 수"""
+        total = sum(codes.buffer_info()[1] * codes.itemsize for codes in self._codes.values())
+        total += sum(ints.buffer_info()[1] * ints.itemsize for ints in self._ints.values())
+        total += sum(len(value.encode('utf-8')) + 49 for values in self._values.values() for value in values)
+        return total
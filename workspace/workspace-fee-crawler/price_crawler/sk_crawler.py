@@ -11,7 +11,6 @@ SKT T world 공시지원금 크롤러 - 통합 버전 (수정)
 import time
 import json
 import re
-import os
 import shutil
 from urllib.parse import urlencode, quote_plus
 from pathlib import Path
@@ -21,8 +20,6 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException, UnexpectedAlertPresentException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 import pandas as pd
 import logging
 from datetime import datetime
@@ -55,6 +52,24 @@ console = Console() if RICH_AVAILABLE else None
 
 # Path imports
 from shared_config.config.paths import PathManager, get_raw_data_path, get_checkpoint_path, get_log_path
+from price_crawler.driver_pool import DriverPool
+from price_crawler.http_fetch import HttpFetcher, looks_blocked
+from price_crawler.combo_planner import CombinationPlanner
+from price_crawler.crawl_index import CrawlIndex, combo_key
+from price_crawler.waits import StepWaiter, install_network_tracker, NETWORK_TRACKER_SCRIPT, NETWORK_IDLE_SCRIPT
+from price_crawler.browser_profile import BrowserProfile
+from price_crawler.checkpoint_journal import CheckpointJournal
+from price_crawler.fixtures import FixtureMode
+from price_crawler.columnar_store import write_raw_data, PYARROW_AVAILABLE
+from price_crawler.snapshot_diff import write_delta
+from price_crawler.row_store import RowStore, crawl_timestamp
+from price_crawler.plan_catalog import PlanCatalog, plan_fingerprint, DEFAULT_TTL_HOURS
+from price_crawler.driver_resolver import make_service, resolver_summary
+from price_crawler.telemetry import CrawlTelemetry
+from price_crawler.adaptive_concurrency import AdaptiveConcurrency
+from price_crawler.async_browser import (
+    BrowserEngine, BrowserError, BrowserTimeout, STEALTH_SCRIPT, WEBSOCKETS_AVAILABLE, find_chrome
+)
 
 # 경로 매니저 초기화
 path_manager = PathManager()
@@ -74,6 +89,95 @@ logger = logging.getLogger(__name__)
 
 # 기본 설정
 BASE_URL = "https://shop.tworld.co.kr"
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
+
+# 공시 테이블 선택자 (우선순위 순)
+NOTICE_TABLE_SELECTORS = [
+    "table.disclosure-list",
+    "table.data-list",
+    "table.result-table",
+    "table[id*='disclosure']",
+    "table[class*='list']",
+    "table"
+]
+
+# 현재 페이지의 공시 테이블 전체를 한 번에 가져오는 스크립트 (arguments[0] = 테이블 선택자 목록)
+# 반환: {found, empty, rows: [[기기명, 공시일, 출고가, 공통지원금, 전환지원금], ...]}
+PAGE_ROWS_SCRIPT = """
+    var selectors = arguments[0];
+    var tables = [];
+    for (var i = 0; i < selectors.length; i++) {
+        tables = document.querySelectorAll(selectors[i]);
+        if (tables.length) break;
+    }
+    
+    function cellText(el) {
+        return (el.innerText || el.textContent || '').trim();
+    }
+    
+    // twoLine 셀은 중첩 구조이므로 span.num 우선
+    function numText(cell) {
+        return cellText(cell.querySelector('span.num') || cell);
+    }
+    
+    if (!tables.length) {
+        var bodyText = document.body ? cellText(document.body) : '';
+        return {found: false, empty: bodyText.indexOf('데이터가 없습니다') >= 0, rows: []};
+    }
+    
+    var rows = [];
+    for (var t = 0; t < tables.length; t++) {
+        var tbody = tables[t].querySelector('tbody');
+        if (!tbody) continue;
+        
+        var trs = tbody.querySelectorAll('tr');
+        for (var r = 0; r < trs.length; r++) {
+            var cells = trs[r].querySelectorAll('td');
+            if (cells.length === 1 && cellText(cells[0]).indexOf('데이터가 없습니다') >= 0) {
+                return {found: true, empty: true, rows: rows};
+            }
+            if (cells.length < 6) continue;
+            
+            rows.push([cellText(cells[0]), cellText(cells[1]), cellText(cells[2]),
+                       numText(cells[3]), numText(cells[4])]);
+        }
+    }
+    
+    return {found: true, empty: rows.length === 0, rows: rows};
+"""
+
+# 페이지네이션 상태 (arguments[0] = 다음 페이지 번호) - async 엔진 페이지 이동용
+# 반환: 페이지네이션 없으면 null, 있으면 {active: 활성 페이지 번호, has_next: 다음 페이지 링크 존재}
+PAGINATION_SCRIPT = """
+    var pagination = document.querySelector('.pagination, .paginate, .paging');
+    if (!pagination) return null;
+    var active = pagination.querySelector('.active, .on, .current');
+    var target = String(arguments[0]);
+    var links = pagination.querySelectorAll('a, button, li, span, strong');
+    var hasNext = false;
+    for (var i = 0; i < links.length; i++) {
+        if (links[i].textContent.trim() === target) { hasNext = true; break; }
+    }
+    return {active: active ? parseInt(active.textContent.trim(), 10) : null, has_next: hasNext};
+"""
+
+# 페이지 이동 완료 여부 (arguments[0] = 기대하는 활성 페이지 번호, 재로드 시 로드 완료까지)
+PAGE_SWITCHED_SCRIPT = """
+    if (document.readyState !== 'complete') return false;
+    var pagination = document.querySelector('.pagination, .paginate, .paging');
+    var active = pagination && pagination.querySelector('.active, .on, .current');
+    return !!active && parseInt(active.textContent.trim(), 10) === arguments[0];
+"""
+
+# 공시 페이지 준비 완료 선택자 (wait_for_page_ready와 동일)
+PAGE_READY_SELECTOR = "table, .disclosure-list, .data-list, .result-table, td"
+
+# 단계별 대기 타임아웃 기본값(초) - 기록된 대기 시간(sk_step_waits.json)으로 조정
+STEP_TIMEOUTS = {
+    'page_ready': 5,
+    'category_switch': 5,
+    'page_switch': 10,
+}
 
 
 class TworldCrawler:
@@ -82,7 +186,7 @@ class TworldCrawler:
     def __init__(self, config=None):
         """초기화"""
         self.driver = None
-        self.all_data = []
+        self.all_data = RowStore(dict)  # 필드별 배열로 보관 (row_store.py)
         self.data_lock = threading.Lock()
         self.rate_plans = []
         self.categories = []
@@ -98,15 +202,53 @@ class TworldCrawler:
             'page_load_timeout': 90,  # 증가 (45->90) 네트워크 안정성 확보
             'element_wait_timeout': 30,  # 증가 (20->30) 요소 대기 시간 확보
             'checkpoint_interval': 20,  # 더 자주 저장 (30->20)
+            'checkpoint_fsync': True,  # 체크포인트마다 저널 fsync
+            'checkpoint_tag': None,  # 체크포인트 파일 구분자 (예: 'hot' - 프로필 실행이 전체 크롤링 체크포인트를 건드리지 않음)
             'save_formats': ['csv'],
             'output_dir': path_manager.data_dir,
             'max_rate_plans': 0,  # 0 = 모든 요금제
+            'first_page_only': False,  # 조합별 첫 페이지만 수집 (최근 변경 기기)
+            'max_devices': 0,  # 조합별 최대 기기 수 (0 = 제한 없음, 최근 변경 순 상위, 지정 시 첫 페이지만 수집)
             'show_browser': False,
             'delay_between_requests': 5,  # 5초로 증가하여 안정성 확보
             'alert_wait_time': 3,
             'network_error_wait': 60,  # 증가 (30->60) 네트워크 오류 복구 대기
             'implicit_wait': 10,  # 암시적 대기 추가
-            'page_load_strategy': 'eager'  # DOM 로드 완료 시점에 진행
+            'page_load_strategy': 'eager',  # DOM 로드 완료 시점에 진행
+            'use_driver_pool': True,  # 조합마다 Chrome을 새로 띄우지 않고 재사용
+            'driver_max_uses': 50,  # 드라이버 재생성 전 최대 사용 횟수
+            'driver_max_memory_mb': 0,  # 드라이버 메모리 한도 (0 = 확인 안함)
+            'fetch_mode': 'selenium',  # 'http' = 브라우저 없이 공시 페이지 수집 (실패 시 Selenium 대체)
+            'http_workers': 16,  # HTTP 모드 동시 작업 수
+            'http_max_per_host': 8,  # 호스트별 동시 HTTP 요청 수
+            'http_timeout': 20,  # HTTP 요청 타임아웃(초)
+            'http_delay': 0,  # HTTP 요청 후 지연 시간(초)
+            'browser_engine': 'selenium',  # 'async' = Chrome 하나에 격리 컨텍스트 여러 개로 수집 (websockets 필요, 불가 시 Selenium)
+            'engine_contexts': 12,  # async 엔진 동시 컨텍스트(탭) 수
+            'engine_context_max_uses': 50,  # 컨텍스트 재생성 전 최대 사용 횟수
+            'adaptive_concurrency': False,  # 페이지 로드 지연/오류/알림창에 따라 동시 작업 수와 요청 간 지연 자동 조절 (AIMD)
+            'adaptive_max_workers': 8,  # 자동 조절 시 최대 동시 작업 수 (시작값은 max_workers)
+            'adaptive_max_delay': 30,  # 자동 조절 시 최대 요청 간 지연(초)
+            'combo_planner': True,  # 결과가 동일할 것으로 예측되는 조합은 수집을 미루고 복사
+            'planner_sample_rate': 0.1,  # 중복 예측 조합 중 검증 수집 비율
+            'planner_min_streak': 2,  # 중복 예측에 필요한 연속 동일 횟수
+            'incremental': False,  # 변경 없는 페이지에서 페이지 이동 중단, 나머지는 이전 스냅샷 사용
+            'event_waits': True,  # 고정 sleep 대신 DOM 변경/네트워크 유휴 신호 대기
+            'block_resources': True,  # 이미지/폰트/미디어/광고·분석 스크립트 요청 차단
+            'blocked_url_patterns': [],  # 추가 차단 URL 패턴 (예: ['*.mp4'])
+            'allowed_url_patterns': [],  # 차단에서 제외할 URL (통신사 기본 허용 목록에 추가)
+            'step_timeouts': {},  # 단계별 대기 타임아웃 덮어쓰기 (예: {'page_switch': 15})
+            'fixture_record': None,  # 코퍼스 경로 지정 시 페이지/XHR 응답을 픽스처로 기록
+            'fixture_replay': None,  # 코퍼스 경로 또는 재생 서버 URL (라이브 사이트 대신 기록된 응답 사용)
+            'save_parquet': False,  # CSV와 함께 통신사/수집일 분할 Parquet 저장 (pyarrow 필요)
+            'parquet_dir': None,  # Parquet 저장소 루트 (기본: price_crawler/data/parquet)
+            'save_delta': False,  # 직전 스냅샷 대비 추가/변경/삭제 행을 raw/delta/에 저장 (snapshot_diff.py)
+            'shared_service': False,  # chromedriver Service 하나를 모든 드라이버가 공유 (드라이버마다 프로세스 생성 안 함)
+            'chromedriver_version': None,  # chromedriver 버전 고정 (예: '131', 기본: 설치된 Chrome에 맞춤)
+            'plan_catalog': True,  # 카테고리/첫 요금제 목록의 지문이 같으면 저장된 요금제 목록 사용
+            'plan_catalog_ttl_hours': DEFAULT_TTL_HOURS,  # 저장된 요금제 목록 유효 시간
+            'telemetry': True,  # 조합/단계별 소요 시간을 JSON Lines + Prometheus textfile로 기록
+            'telemetry_dir': None  # 텔레메트리 저장 디렉토리 (기본: 체크포인트 디렉토리/telemetry)
         }
         
         if config:
@@ -118,6 +260,14 @@ class TworldCrawler:
         self.total_devices = 0
         self.start_time = None
         self.checkpoint_file = get_checkpoint_path('sk')
+        if self.config['checkpoint_tag']:
+            self.checkpoint_file = self.checkpoint_file.with_stem(f"{self.checkpoint_file.stem}_{self.config['checkpoint_tag']}")
+        
+        # 체크포인트 저널 (새 행과 진행 마커만 추가 기록)
+        self.journal = CheckpointJournal(
+            self.checkpoint_file.with_suffix('.journal'),
+            fsync=self.config['checkpoint_fsync']
+        )
         
         # 스레드 안전 변수
         self.status_lock = threading.Lock()
@@ -126,6 +276,73 @@ class TworldCrawler:
         # 크롤링 조합
         self.all_combinations = []
         
+        # 드라이버 풀 (run_parallel_crawling 동안만 사용)
+        self.driver_pool = None
+        
+        # HTTP 모드 (run_parallel_crawling 동안만 사용)
+        self.http_fetcher = None
+        self.browser_slots = None  # HTTP 모드에서 Selenium 대체 실행 동시 수 제한
+        self.http_stats = {'http': 0, 'fallback': 0}
+        
+        # 공유 브라우저 엔진 (run_parallel_crawling 동안만 사용)
+        self.browser_engine = None
+        
+        # 조합 계획기 (중복 조합 예측)
+        self.planner = CombinationPlanner(
+            'SK',
+            state_file=self.checkpoint_file.parent / 'sk_combo_planner.json',
+            sample_rate=self.config['planner_sample_rate'],
+            min_streak=self.config['planner_min_streak'],
+            enabled=self.config['combo_planner']
+        )
+        self.deferred_combos = {}  # {(family, variant): combo_index}
+        
+        # 증분 크롤링 인덱스 (실행 간 유지)
+        self.crawl_index = CrawlIndex('SK', self.checkpoint_file.parent / 'sk_crawl_index.json')
+        
+        # 요금제 카탈로그 (실행 간 유지, 변경 없으면 카테고리별 열거 생략)
+        self.plan_catalog = PlanCatalog(
+            'SK',
+            self.checkpoint_file.parent / 'sk_plan_catalog.json',
+            ttl_hours=self.config['plan_catalog_ttl_hours'],
+            enabled=self.config['plan_catalog']
+        )
+        
+        # 리소스 차단 프로필 (드라이버 생성 시 적용)
+        self.browser_profile = BrowserProfile(
+            'SK',
+            enabled=self.config['block_resources'],
+            extra_blocked=self.config['blocked_url_patterns'],
+            extra_allowed=self.config['allowed_url_patterns']
+        )
+        
+        # 단계별 대기 (대기 시간 기록은 실행 간 누적)
+        self.waiter = StepWaiter(
+            timeouts={**STEP_TIMEOUTS, **self.config['step_timeouts']},
+            enabled=self.config['event_waits'],
+            stats_file=self.checkpoint_file.parent / 'sk_step_waits.json'
+        )
+        
+        # 픽스처 기록/재생 (드라이버 생성 시 연결)
+        self.fixtures = FixtureMode.from_config(self.config, 'SK')
+        
+        # 조합/단계별 소요 시간 기록 (실행 종료 시 Prometheus textfile)
+        self.telemetry = CrawlTelemetry(
+            'SK',
+            Path(self.config['telemetry_dir'] or self.checkpoint_file.parent / 'telemetry'),
+            enabled=self.config['telemetry']
+        )
+        
+        # 동시 작업 수 / 요청 간 지연 (adaptive_concurrency면 page_load·재시도 기록과 알림창으로 조절)
+        self.concurrency = AdaptiveConcurrency(
+            initial_workers=self.config['max_workers'],
+            max_workers=max(self.config['adaptive_max_workers'], self.config['max_workers']),
+            initial_delay=self.config['delay_between_requests'],
+            max_delay=self.config['adaptive_max_delay'],
+            enabled=self.config['adaptive_concurrency']
+        )
+        self.telemetry.subscribe(self.concurrency.observe)
+        
     def setup_driver(self):
         """Chrome 드라이버 설정 - 개선된 버전"""
         options = Options()
@@ -169,8 +386,7 @@ class TworldCrawler:
         options.add_argument('--disable-features=TranslateUI')
         
         # User-Agent 및 프로필 설정
-        user_agent = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36'
-        options.add_argument(f'user-agent={user_agent}')
+        options.add_argument(f'user-agent={USER_AGENT}')
         
         # 차단 회피를 위한 추가 옵션
         options.add_argument('--disable-web-security')
@@ -186,6 +402,12 @@ class TworldCrawler:
         }
         options.add_experimental_option("prefs", prefs)
         
+        # 리소스 차단 프로필 (이미지 비활성화 설정 병합)
+        self.browser_profile.apply_options(options)
+        
+        # 픽스처 기록(performance 로그) / 재생(로컬 프록시) 설정
+        self.fixtures.apply_options(options)
+        
         # 페이지 로드 전략 설정
         options.page_load_strategy = self.config.get('page_load_strategy', 'normal')
         
@@ -194,37 +416,14 @@ class TworldCrawler:
         
         # ChromeDriver 설정 개선
         max_retries = 3
+        started = time.perf_counter()
         for attempt in range(max_retries):
             try:
-                # 캐시 정리 (첫 시도에서만)
-                if attempt == 0:
-                    import shutil
-                    cache_dir = os.path.expanduser("~/.wdm")
-                    if os.path.exists(cache_dir):
-                        try:
-                            shutil.rmtree(cache_dir)
-                            logger.info(f"ChromeDriver 캐시 정리: {cache_dir}")
-                        except:
-                            pass
-                
-                # ChromeDriver 다운로드 및 설치
-                chromedriver_path = ChromeDriverManager().install()
-                
-                # macOS에서 quarantine 속성 제거
-                if platform.system() == 'Darwin':
-                    try:
-                        import subprocess
-                        subprocess.run(['xattr', '-cr', os.path.dirname(chromedriver_path)], 
-                                     capture_output=True, check=False)
-                        subprocess.run(['chmod', '+x', chromedriver_path], 
-                                     capture_output=True, check=False)
-                    except:
-                        pass
-                
-                # Service 객체 생성 (로그 비활성화)
-                service = Service(
-                    executable_path=chromedriver_path,
-                    log_output=os.devnull  # 로그 출력 비활성화
+                # chromedriver 경로 / Service (경로는 프로세스당 한 번만 확인, 재시도 시 다시 확인 - driver_resolver.py)
+                service = make_service(
+                    shared=self.config['shared_service'],
+                    version=self.config['chromedriver_version'],
+                    refresh=attempt > 0
                 )
                 
                 # Driver 생성
@@ -241,9 +440,12 @@ class TworldCrawler:
             except Exception as e:
                 logger.error(f"ChromeDriver 생성 실패 (시도 {attempt + 1}/{max_retries}): {e}")
                 if attempt < max_retries - 1:
+                    self.telemetry.retry('driver_create')
                     time.sleep(5)  # 재시도 전 대기
                 else:
+                    self.telemetry.record('driver_create', time.perf_counter() - started, ok=False)
                     raise Exception(f"ChromeDriver를 시작할 수 없습니다: {str(e)}")
+        self.telemetry.record('driver_create', time.perf_counter() - started)
         driver.set_page_load_timeout(self.config['page_load_timeout'])
         driver.implicitly_wait(self.config.get('implicit_wait', 10))
         
@@ -277,6 +479,15 @@ class TworldCrawler:
             '''
         })
         
+        # 네트워크 유휴 대기용 XHR/fetch 카운터
+        install_network_tracker(driver)
+        
+        # 불필요한 리소스 요청 차단
+        self.browser_profile.apply(driver)
+        
+        # 픽스처 기록 연결
+        self.fixtures.attach(driver)
+        
         return driver
     
     def create_driver(self):
@@ -285,6 +496,50 @@ class TworldCrawler:
         # Note: driver is already added to active_drivers in setup_driver
         return driver
     
+    def _untrack_driver(self, driver):
+        """활성 드라이버 목록에서 제거"""
+        with self.drivers_lock:
+            if driver in self.active_drivers:
+                self.active_drivers.remove(driver)
+    
+    def _acquire_driver(self):
+        """작업용 드라이버 확보 (풀 사용 시 대여)"""
+        if self.driver_pool:
+            return self.driver_pool.acquire()
+        return self.create_driver()
+    
+    def _release_driver(self, driver, discard=False):
+        """작업용 드라이버 반납 (풀 미사용 시 종료)"""
+        if driver is None:
+            return
+        self.browser_profile.collect(driver)
+        if self.driver_pool:
+            self.driver_pool.release(driver, discard=discard)
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류: {e}")
+        self._untrack_driver(driver)
+    
+    def _open_driver_pool(self):
+        """병렬 크롤링용 드라이버 풀 생성"""
+        if not self.config.get('use_driver_pool', True):
+            return
+        self.driver_pool = DriverPool(
+            self.create_driver,
+            size=self.concurrency.max_workers,
+            max_uses=self.config.get('driver_max_uses', 50),
+            max_memory_mb=self.config.get('driver_max_memory_mb', 0),
+            on_discard=self._untrack_driver
+        )
+    
+    def _close_driver_pool(self):
+        """드라이버 풀 종료"""
+        if self.driver_pool:
+            self.driver_pool.close()
+            self.driver_pool = None
+    
     def handle_alert(self, driver):
         """Alert 처리"""
         try:
@@ -299,9 +554,11 @@ class TworldCrawler:
             # 특정 alert 메시지에 대한 처리
             if "네트워크" in alert_text or "오류" in alert_text:
                 logger.warning("네트워크 오류 감지")
+                self.concurrency.congestion('alert')
                 return 'network_error'
             elif "실패" in alert_text or "새로고침" in alert_text:
                 logger.warning("조회 실패")
+                self.concurrency.congestion('alert')
                 return 'refresh_needed'
                 
             return 'handled'
@@ -342,7 +599,8 @@ class TworldCrawler:
         except Exception as e:
             logger.debug(f"페이지 대기 중 오류: {e}")
         
-        time.sleep(2)  # 약간의 추가 대기
+        # 남은 AJAX 요청 완료 대기
+        self.waiter.network_idle(driver, 'page_ready', fallback=2)
     
     def collect_rate_plans(self):
         """모든 요금제 수집"""
@@ -371,74 +629,86 @@ class TworldCrawler:
                 logger.error("카테고리를 찾을 수 없습니다.")
                 return
             
-            if RICH_AVAILABLE:
-                console.print(f"\n[green]✓[/green] 총 {len(self.categories)}개 카테고리 발견")
-                
-                # Progress bar로 카테고리별 요금제 수집
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    MofNCompleteColumn(),
-                    TimeRemainingColumn(),
-                    console=console
-                ) as progress:
+            # 카테고리 목록 + 첫 화면 요금제로 카탈로그 확인 (변경 없으면 카테고리별 클릭 생략)
+            fingerprint = plan_fingerprint(self.categories + self.collect_plans_in_category(driver, {'name': ''}))
+            cached = self.plan_catalog.lookup(fingerprint)
+            if cached:
+                self.rate_plans = [dict(plan) for plan in cached]
+                logger.info(f"요금제 {len(self.rate_plans)}개 (카탈로그)")
+            else:
+                complete = True
+                if RICH_AVAILABLE:
+                    console.print(f"\n[green]✓[/green] 총 {len(self.categories)}개 카테고리 발견")
                     
-                    task = progress.add_task(
-                        "[cyan]카테고리 처리",
-                        total=len(self.categories)
-                    )
+                    # Progress bar로 카테고리별 요금제 수집
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        BarColumn(),
+                        MofNCompleteColumn(),
+                        TimeRemainingColumn(),
+                        console=console
+                    ) as progress:
+                        
+                        task = progress.add_task(
+                            "[cyan]카테고리 처리",
+                            total=len(self.categories)
+                        )
+                        
+                        for idx, category in enumerate(self.categories, 1):
+                            progress.update(
+                                task,
+                                description=f"[cyan]{category['name']} 처리 중..."
+                            )
+                            
+                            try:
+                                # 카테고리 클릭
+                                self.click_category(driver, category['id'])
+                                
+                                # 해당 카테고리의 요금제 수집
+                                plans = self.collect_plans_in_category(driver, category)
+                                
+                                if plans:
+                                    console.print(f"[green]✓[/green] {category['name']}: {len(plans)}개 요금제")
+                                    self.rate_plans.extend(plans)
+                                else:
+                                    console.print(f"[yellow]-[/yellow] {category['name']}: 요금제 없음")
+                                
+                                progress.advance(task)
+                                
+                            except Exception as e:
+                                logger.error(f"카테고리 처리 오류: {e}")
+                                complete = False
+                                progress.advance(task)
+                                continue
+                else:
+                    # Rich 없을 때
+                    logger.info(f"\n총 {len(self.categories)}개 카테고리 발견")
                     
                     for idx, category in enumerate(self.categories, 1):
-                        progress.update(
-                            task,
-                            description=f"[cyan]{category['name']} 처리 중..."
-                        )
+                        logger.info(f"\n[{idx}/{len(self.categories)}] {category['name']} 카테고리 요금제 수집 중...")
                         
                         try:
-                            # 카테고리 클릭
                             self.click_category(driver, category['id'])
-                            time.sleep(2)
-                            
-                            # 해당 카테고리의 요금제 수집
                             plans = self.collect_plans_in_category(driver, category)
                             
                             if plans:
-                                console.print(f"[green]✓[/green] {category['name']}: {len(plans)}개 요금제")
+                                logger.info(f"  ✓ {len(plans)}개 요금제 수집")
                                 self.rate_plans.extend(plans)
-                            else:
-                                console.print(f"[yellow]-[/yellow] {category['name']}: 요금제 없음")
-                            
-                            progress.advance(task)
-                            
                         except Exception as e:
-                            logger.error(f"카테고리 처리 오류: {e}")
-                            progress.advance(task)
+                            logger.error(f"  카테고리 처리 오류: {e}")
+                            complete = False
                             continue
-            else:
-                # Rich 없을 때
-                logger.info(f"\n총 {len(self.categories)}개 카테고리 발견")
                 
-                for idx, category in enumerate(self.categories, 1):
-                    logger.info(f"\n[{idx}/{len(self.categories)}] {category['name']} 카테고리 요금제 수집 중...")
-                    
-                    try:
-                        self.click_category(driver, category['id'])
-                        time.sleep(2)
-                        plans = self.collect_plans_in_category(driver, category)
-                        
-                        if plans:
-                            logger.info(f"  ✓ {len(plans)}개 요금제 수집")
-                            self.rate_plans.extend(plans)
-                    except Exception as e:
-                        logger.error(f"  카테고리 처리 오류: {e}")
-                        continue
-            
-            # 중복 제거
-            unique_plans = {}
-            for plan in self.rate_plans:
-                unique_plans[plan['id']] = plan
-            self.rate_plans = list(unique_plans.values())
+                # 중복 제거
+                unique_plans = {}
+                for plan in self.rate_plans:
+                    unique_plans[plan['id']] = plan
+                self.rate_plans = list(unique_plans.values())
+                
+                # 일부 카테고리가 실패한 목록은 카탈로그에 저장하지 않음
+                if self.rate_plans and complete:
+                    self.plan_catalog.store(fingerprint, self.rate_plans)
             
             # 요금제 수 제한
             if self.config['max_rate_plans'] > 0:
@@ -528,7 +798,10 @@ class TworldCrawler:
             
             driver.execute_script("arguments[0].scrollIntoView(true);", category_element)
             time.sleep(0.5)
-            driver.execute_script("arguments[0].click();", category_element)
+            
+            # 클릭 후 요금제 목록 갱신 대기
+            with self.waiter.mutation(driver, 'category_switch', 'ul.phone-charge-list', fallback=2):
+                driver.execute_script("arguments[0].click();", category_element)
             
         except Exception as e:
             logger.error(f"카테고리 클릭 오류: {e}")
@@ -615,9 +888,472 @@ class TworldCrawler:
         else:
             logger.info(f"\n총 {len(self.all_combinations)}개 조합 준비 완료")
     
+    def _combo_keys(self, combo):
+        """조합 계획기용 (family, variant) 키"""
+        return combo['plan']['id'], f"{combo['network']['code']}:{combo['scrb_type']['value']}"
+    
+    def _plan_combinations(self, start_index):
+        """수집할 조합 인덱스 결정 (중복 예측 조합은 미룸)"""
+        indices = []
+        seen_variants = {}
+        for i in range(start_index, len(self.all_combinations)):
+            family, variant = self._combo_keys(self.all_combinations[i])
+            sources = seen_variants.setdefault(family, [])
+            if self.planner.should_defer(family, variant, sources):
+                self.deferred_combos[(family, variant)] = i
+            else:
+                indices.append(i)
+            sources.append(variant)
+        
+        if self.deferred_combos:
+            logger.info(f"중복 예측으로 {len(self.deferred_combos)}개 조합 수집을 미룹니다.")
+        return indices
+    
+    def _materialize_deferred(self):
+        """미룬 조합 처리 - 원본 결과 복사, 원본이 없으면 직접 수집"""
+        if not self.deferred_combos:
+            self.planner.finish()
+            return
+        
+        # 원본 수집에 실패한 조합은 직접 수집
+        for family, variant, _ in self.planner.unresolved():
+            idx = self.deferred_combos.pop((family, variant))
+            logger.info(f"원본 결과 없음 - 직접 수집: {self.all_combinations[idx]['plan']['name'][:30]} ({variant})")
+            self.process_combination(idx)
+        
+        # 원본 조합 결과를 (요금제, 네트워크, 가입유형) 단위로 묶기
+        with self.data_lock:
+            rows_by_combo = self.all_data.group_indices('plan_name', 'network_type', 'scrb_type_name')
+        
+        variant_combo = {}
+        for combo in self.all_combinations:
+            variant_combo[self._combo_keys(combo)] = combo
+        
+        copied = 0
+        for family, variant, source in self.planner.resolved():
+            if (family, variant) not in self.deferred_combos:
+                continue
+            target = variant_combo[(family, variant)]
+            origin = variant_combo[(family, source)]
+            source_rows = rows_by_combo.get((origin['plan']['name'], origin['network']['name'], origin['scrb_type']['name']), [])
+            
+            with self.data_lock:
+                copied += self.all_data.copy_rows(source_rows,
+                                                  network_type=target['network']['name'],
+                                                  scrb_type_name=target['scrb_type']['name'])
+        
+        if RICH_AVAILABLE:
+            console.print(f"[green]✓[/green] 미룬 조합 {len(self.deferred_combos)}개 - 원본 결과 {copied:,}개 복사")
+        else:
+            logger.info(f"미룬 조합 {len(self.deferred_combos)}개 - 원본 결과 {copied}개 복사")
+        
+        self.deferred_combos = {}
+        self.planner.finish()
+    
+    def _index_key(self, combo):
+        """증분 인덱스 조합 키"""
+        return combo_key(combo['plan']['name'], combo['scrb_type']['name'], combo['network']['name'])
+    
+    def _incremental_snapshot(self, combo, page_items, collected_items):
+        """증분 모드: 페이지가 이전과 같으면 나머지 행을 이전 스냅샷에서 가져옴
+        
+        Args:
+            page_items: 방금 수집한 페이지 항목
+            collected_items: 이 조합에서 지금까지 수집한 항목
+        
+        Returns:
+            스냅샷 행 리스트 (페이지 이동을 멈춰야 함), 계속 수집해야 하면 None
+        """
+        if not self.config.get('incremental'):
+            return None
+        key = self._index_key(combo)
+        if not self.crawl_index.page_unchanged(key, page_items):
+            return None
+        
+        logger.debug(f"변경 없는 페이지 - 페이지 이동 중단: {combo['plan']['name'][:30]}")
+        
+        # day7 모드는 최근 공시만 수집하므로 이전 스냅샷을 채우지 않음
+        if self.config.get('day7', False):
+            return []
+        seen = {item['device_nm'] for item in collected_items}
+        return self.crawl_index.snapshot_rows(key, exclude_devices=seen)
+    
+    def _page_limit(self):
+        """조합별 최대 수집 페이지 수 (첫 페이지/상위 기기만 수집하면 1)"""
+        if self.config.get('first_page_only') or self.config.get('max_devices'):
+            return 1
+        return 10
+    
+    def _update_crawl_index(self):
+        """이번 결과로 증분 인덱스 갱신 (첫 페이지만 / 최근 7일만 수집했으면 수집된 기기만 교체)"""
+        with self.data_lock:
+            rows = self.all_data.dicts()
+        # day7 모드는 7일 이전 공시 기기를 버리므로 전체 교체하면 인덱스에서 빠짐
+        partial = self._page_limit() == 1 or self.config.get('day7', False)
+        self.crawl_index.update(rows, partial=partial)
+        self.crawl_index.save()
+        if self.config.get('incremental'):
+            logger.info(f"증분 모드 - {self.crawl_index.summary()}")
+    
+    def _build_notice_url(self, combo):
+        """공시지원금 조회 URL 생성"""
+        params = {
+            'modelNwType': combo['network']['code'],
+            'saleMonth': '24',
+            'prodId': combo['plan']['id'],
+            'prodNm': combo['plan']['name'],
+            'saleYn': 'Y',
+            'order': 'CHANGEPRICE',  # 최근 변경 순 정렬
+            'scrbTypCd': combo['scrb_type']['value']
+        }
+        return f"{BASE_URL}/notice?{urlencode(params, quote_via=quote_plus)}"
+    
+    def _open_http_mode(self):
+        """HTTP 모드 세션 준비"""
+        if self.config.get('fetch_mode') != 'http':
+            return
+        self.http_fetcher = HttpFetcher(
+            max_connections=self.config['http_workers'],
+            max_per_host=self.config['http_max_per_host'],
+            timeout=self.config['http_timeout']
+        )
+        self.fixtures.configure_fetcher(self.http_fetcher)
+        browser_workers = self.config['engine_contexts'] if self.browser_engine else self.concurrency.max_workers
+        self.browser_slots = threading.BoundedSemaphore(browser_workers)
+    
+    def _close_http_mode(self):
+        """HTTP 모드 세션 종료"""
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+            self.browser_slots = None
+            logger.info(f"HTTP 모드 결과 - HTTP 처리 {self.http_stats['http']}개, "
+                        f"Selenium 대체 {self.http_stats['fallback']}개")
+    
+    def _open_browser_engine(self):
+        """공유 브라우저 엔진 시작 (Chrome 하나에 조합별 격리 컨텍스트)
+        
+        Returns:
+            엔진 사용 여부 (불가 시 Selenium 드라이버로 진행)
+        """
+        if self.config.get('browser_engine') != 'async':
+            return False
+        if not WEBSOCKETS_AVAILABLE:
+            logger.warning("websockets 미설치 - async 엔진 대신 Selenium 사용 (pip install websockets)")
+            return False
+        if not find_chrome():
+            logger.warning("Chrome 실행 파일을 찾을 수 없음 - async 엔진 대신 Selenium 사용 (CHROME_PATH로 지정)")
+            return False
+        
+        profile = self.browser_profile
+        try:
+            self.browser_engine = BrowserEngine(
+                size=self.config['engine_contexts'],
+                max_uses=self.config['engine_context_max_uses'],
+                headless=self.config['headless'] and not self.config.get('show_browser'),
+                blocked_patterns=profile.blocked_patterns if profile.enabled else (),
+                init_scripts=(STEALTH_SCRIPT, NETWORK_TRACKER_SCRIPT),
+                user_agent=USER_AGENT,
+                default_timeout=self.config['page_load_timeout']
+            ).start()
+        except Exception as e:
+            logger.warning(f"공유 브라우저 시작 실패 - Selenium 사용: {e}")
+            self.browser_engine = None
+            return False
+        return True
+    
+    def _close_browser_engine(self):
+        """공유 브라우저 엔진 종료"""
+        if self.browser_engine:
+            logger.info(f"공유 브라우저 - {self.browser_engine.summary()}")
+            self.telemetry.add_bytes(self.browser_engine.browser.stats['loaded_bytes'], 'engine')
+            self.browser_engine.close()
+            self.browser_engine = None
+    
+    def _process_combination_http(self, combo):
+        """HTTP로 단일 조합 처리
+        
+        Returns:
+            수집 항목 수, Selenium으로 대체해야 하면 None
+        """
+        timer = self.telemetry.timer(source='http')
+        url = self._build_notice_url(combo)
+        response = self.http_fetcher.get(url)
+        timer.lap('page_load', ok=response is not None)
+        
+        if response is None:
+            return None
+        self.telemetry.add_bytes(len(response.content), 'http')
+        if response.status_code != 200 or looks_blocked(response):
+            logger.warning(f"HTTP 응답 차단/오류 ({response.status_code}) - Selenium 대체: {combo['plan']['name'][:30]}")
+            return None
+        
+        parsed = self._parse_notice_html(response.text, combo)
+        timer.lap('extract', ok=parsed is not None)
+        if parsed is None:
+            logger.debug(f"공시 테이블 없음 (JS 렌더링 추정) - Selenium 대체: {combo['plan']['name'][:30]}")
+            return None
+        
+        items, has_more_pages = parsed
+        if has_more_pages and self._page_limit() > 1:
+            # 첫 페이지가 이전과 같으면 나머지는 스냅샷으로 채우고 브라우저 생략
+            reused = self._incremental_snapshot(combo, items, items)
+            if reused is not None:
+                items = items + reused
+                with self.data_lock:
+                    self.all_data.extend(items)
+                self.planner.record(*self._combo_keys(combo), items)
+                return len(items)
+            
+            # 페이지 이동은 goPage() 스크립트로만 가능하므로 브라우저에서 처리
+            logger.debug(f"여러 페이지 결과 - Selenium 대체: {combo['plan']['name'][:30]}")
+            return None
+        
+        if items:
+            with self.data_lock:
+                self.all_data.extend(items)
+            self.planner.record(*self._combo_keys(combo), items)
+        return len(items)
+    
+    def _parse_notice_html(self, html, combo):
+        """공시 페이지 HTML 파싱
+        
+        Returns:
+            (항목 리스트, 다음 페이지 존재 여부), 테이블이 없으면 None
+        """
+        try:
+            soup = BeautifulSoup(html, 'lxml')
+        except Exception:
+            soup = BeautifulSoup(html, 'html.parser')
+        
+        tables = []
+        for selector in NOTICE_TABLE_SELECTORS:
+            tables = soup.select(selector)
+            if tables:
+                break
+        
+        if not tables:
+            body_text = soup.get_text(' ', strip=True)
+            if "데이터가 없습니다" in body_text or "조회된 데이터가 없습니다" in body_text:
+                return [], False
+            return None
+        
+        rows = []
+        for table in tables:
+            tbody = table.find('tbody')
+            if tbody is None:
+                continue
+            
+            for row in tbody.find_all('tr'):
+                cells = row.find_all('td')
+                
+                if len(cells) == 1:
+                    cell_text = cells[0].get_text(' ', strip=True)
+                    if '데이터가 없습니다' in cell_text or '조회된 데이터가 없습니다' in cell_text:
+                        return self._items_from_rows(combo, rows), False
+                
+                if len(cells) < 6:
+                    continue
+                
+                price_span = cells[3].select_one('span.num')
+                add_span = cells[4].select_one('span.num')
+                rows.append([
+                    cells[0].get_text(' ', strip=True),
+                    cells[1].get_text(strip=True),
+                    cells[2].get_text(),
+                    (price_span or cells[3]).get_text(),
+                    (add_span or cells[4]).get_text()
+                ])
+        
+        items = self._items_from_rows(combo, rows)
+        
+        # 페이지네이션에 2페이지 링크가 있으면 다음 페이지 존재
+        has_more_pages = False
+        pagination = soup.select_one(".pagination, .paginate, .paging")
+        if pagination is not None:
+            for link in pagination.find_all(['a', 'button']):
+                if link.get_text(strip=True) == '2' or 'goPage(2)' in (link.get('href', '') + link.get('onclick', '')):
+                    has_more_pages = True
+                    break
+        
+        return items, has_more_pages
+    
+    def _build_item(self, combo, device_nm, date_text, release_price, public_fee, add_fee):
+        """통합 데이터 형식의 항목 생성 (day7 범위 밖이면 None)"""
+        if not device_nm:
+            return None
+        
+        # day7 옵션이 켜져있을 때 날짜 확인
+        if self.config.get('day7', False):
+            try:
+                # 날짜 형식이 다양할 수 있으므로 파싱 시도 (YYYY.MM.DD 형식 등)
+                date_obj = pd.to_datetime(date_text.replace('.', '-'))
+                now = datetime.now(ZoneInfo('Asia/Seoul'))
+                seven_days_ago = now - pd.Timedelta(days=7)
+                
+                if date_obj < seven_days_ago:
+                    logger.debug(f"날짜({date_text})가 7일 이전이므로 건너뜀")
+                    return None
+            except Exception as e:
+                logger.debug(f"날짜 파싱 오류: {e}, 데이터 포함")
+        
+        return {
+            'date': date_text,
+            'crawled_at': crawl_timestamp(),
+            'carrier': 'SK',
+            'manufacturer': self.get_manufacturer(device_nm),
+            'scrb_type_name': combo['scrb_type']['name'],
+            'network_type': combo['network']['name'],
+            'device_nm': device_nm,
+            'plan_name': combo['plan']['name'],
+            'monthly_fee': combo['plan']['monthly_fee'],
+            'release_price': release_price,
+            'public_support_fee': public_fee,
+            'additional_support_fee': add_fee,
+            'total_support_fee': public_fee + add_fee,
+            'total_price': release_price - (public_fee + add_fee) if release_price > 0 else 0
+        }
+    
+    def _record_result(self, combo_index, combo, items_count):
+        """조합 처리 결과 집계"""
+        self.telemetry.add_rows(items_count)
+        with self.status_lock:
+            if items_count > 0:
+                self.completed_count += 1
+                self.total_devices += items_count
+                
+                if RICH_AVAILABLE:
+                    console.print(f"[green]✓[/green] [{combo_index+1}/{len(self.all_combinations)}] {combo['plan']['name'][:40]}... - [bold]{items_count}개[/bold]")
+            else:
+                self.failed_count += 1
+    
     def process_combination(self, combo_index, progress=None, task_id=None):
-        """단일 조합 처리"""
+        """단일 조합 처리 (조합 단위로 텔레메트리 기록)"""
         combo = self.all_combinations[combo_index]
+        with self.telemetry.task('combination', plan=combo['plan']['name'], network=combo['network']['name'],
+                                 scrb_type=combo['scrb_type']['name']) as task:
+            task.ok = self._process_combination(combo_index, combo, progress, task_id)
+        return task.ok
+    
+    def _process_combination(self, combo_index, combo, progress=None, task_id=None):
+        """HTTP 우선 처리, 실패 시 Selenium 대체"""
+        
+        # HTTP 모드: 브라우저 없이 먼저 시도
+        if self.http_fetcher:
+            if progress and task_id is not None:
+                progress.update(task_id, description=f"[{combo_index+1}/{len(self.all_combinations)}] {combo['plan']['name'][:30]}... ({combo['network']['name']}) [HTTP]")
+            
+            items_count = self._process_combination_http(combo)
+            if items_count is not None:
+                with self.status_lock:
+                    self.http_stats['http'] += 1
+                self._record_result(combo_index, combo, items_count)
+                if self.config.get('http_delay'):
+                    time.sleep(self.config['http_delay'])
+                return True
+            
+            with self.status_lock:
+                self.http_stats['fallback'] += 1
+            
+            # 브라우저 대체 실행은 브라우저 수만큼만 동시에
+            with self.browser_slots:
+                return self._process_combination_browser(combo_index, combo, progress, task_id)
+        
+        return self._process_combination_browser(combo_index, combo, progress, task_id)
+    
+    def _process_combination_browser(self, combo_index, combo, progress=None, task_id=None):
+        """브라우저로 단일 조합 처리 (공유 엔진이 있으면 엔진, 없으면 Selenium)
+        
+        동시 실행 수는 적응형 동시성 제어의 현재 한도를 따름
+        """
+        with self.concurrency.slot():
+            if self.browser_engine:
+                return self._process_combination_engine(combo_index, combo, progress, task_id)
+            return self._process_combination_selenium(combo_index, combo, progress, task_id)
+    
+    def _process_combination_engine(self, combo_index, combo, progress=None, task_id=None):
+        """공유 브라우저 엔진으로 단일 조합 처리 (조합마다 격리된 컨텍스트 탭 사용)"""
+        thread_id = threading.current_thread().name
+        
+        with self.status_lock:
+            self.current_tasks[thread_id] = f"{combo['plan']['name'][:30]} - {combo['network']['name']}"
+        
+        try:
+            for attempt in range(self.config['retry_count']):
+                page = None
+                discard = False
+                
+                if progress and task_id is not None:
+                    desc = f"[{combo_index+1}/{len(self.all_combinations)}] {combo['plan']['name'][:30]}... ({combo['network']['name']})"
+                    if attempt > 0:
+                        desc += f" (재시도 {attempt+1}/{self.config['retry_count']})"
+                    progress.update(task_id, description=desc)
+                
+                try:
+                    page = self.browser_engine.acquire()
+                    url = self._build_notice_url(combo)
+                    timer = self.telemetry.timer(source='engine')
+                    
+                    # 페이지 로드 (타임아웃 시 로딩만 중단하고 부분 로드된 페이지로 진행)
+                    try:
+                        page.get(url, timeout=self.config['page_load_timeout'])
+                    except BrowserTimeout:
+                        logger.warning(f"페이지 로드 타임아웃 - 부분 로드 상태로 진행: {combo['plan']['name']}")
+                    
+                    if not page.wait_for_selector(PAGE_READY_SELECTOR, timeout=self.config['element_wait_timeout']):
+                        logger.warning("페이지 요소 대기 타임아웃, 현재 상태로 계속 진행")
+                    self._engine_network_idle(page)
+                    timer.lap('page_load')
+                    
+                    # Alert은 엔진이 자동 수락 - 메시지로 판단
+                    for alert_text in page.take_dialogs():
+                        logger.warning(f"Alert detected: {alert_text}")
+                        if "네트워크" in alert_text or "오류" in alert_text:
+                            self.concurrency.congestion('alert')
+                            raise BrowserError("네트워크 에러")
+                    
+                    collected = []
+                    items_count = self._collect_all_pages_engine(page, combo, collected)
+                    if collected:
+                        self.planner.record(*self._combo_keys(combo), collected)
+                    
+                    self._record_result(combo_index, combo, items_count)
+                    return True
+                
+                except BrowserError as e:
+                    # 오류가 난 컨텍스트는 재사용하지 않음
+                    discard = True
+                    logger.error(f"처리 오류 [{combo_index+1}] (시도 {attempt+1}): {str(e)}")
+                    if attempt + 1 < self.config['retry_count']:
+                        self.telemetry.retry('combination')
+                        time.sleep(self.config['delay_between_requests'] * 2)
+                
+                except Exception as e:
+                    discard = True
+                    logger.error(f"처리 오류 [{combo_index+1}]: {str(e)}")
+                    break
+                
+                finally:
+                    self.browser_engine.release(page, discard=discard)
+            
+            with self.status_lock:
+                self.failed_count += 1
+            return False
+        
+        finally:
+            with self.status_lock:
+                self.current_tasks.pop(thread_id, None)
+            self.concurrency.pause()
+    
+    def _engine_network_idle(self, page, idle_ms=500):
+        """남은 AJAX 요청 완료 대기 (엔진 탭, 타임아웃은 step_timeouts['page_ready'])"""
+        try:
+            page.wait_for_function(NETWORK_IDLE_SCRIPT, idle_ms, timeout=self.waiter.timeout_for('page_ready'))
+        except BrowserTimeout:
+            logger.debug("네트워크 유휴 대기 타임아웃, 계속 진행")
+    
+    def _process_combination_selenium(self, combo_index, combo, progress=None, task_id=None):
+        """Selenium으로 단일 조합 처리"""
         driver = None
         thread_id = threading.current_thread().name
         retry_count = 0
@@ -628,7 +1364,7 @@ class TworldCrawler:
         
         while retry_count < self.config['retry_count']:
             try:
-                driver = self.create_driver()
+                driver = self._acquire_driver()
                 
                 # 진행 상황 업데이트
                 if progress and task_id is not None:
@@ -638,21 +1374,12 @@ class TworldCrawler:
                     progress.update(task_id, description=desc)
                 
                 # URL 생성
-                params = {
-                    'modelNwType': combo['network']['code'],
-                    'saleMonth': '24',
-                    'prodId': combo['plan']['id'],
-                    'prodNm': combo['plan']['name'],
-                    'saleYn': 'Y',
-                    'order': 'CHANGEPRICE',  # 최근 변경 순 정렬
-                    'scrbTypCd': combo['scrb_type']['value']
-                }
-                url = f"{BASE_URL}/notice?{urlencode(params, quote_via=quote_plus)}"
+                url = self._build_notice_url(combo)
+                timer = self.telemetry.timer()
                 
                 # 페이지 로드 (타임아웃 처리 개선)
                 page_loaded = False
                 logger.info(f"URL 접속 시도: {url[:100]}...")
-                logger.info(f"정렬 파라미터: order={params.get('order')}")
                 
                 try:
                     driver.get(url)
@@ -677,7 +1404,9 @@ class TworldCrawler:
                     logger.info("페이지 로드 완료, 요소 대기 중...")
                     self.wait_for_page_ready(driver)
                     logger.info("페이지 준비 완료")
+                    timer.lap('page_load')
                 else:
+                    timer.lap('page_load', ok=False)
                     raise TimeoutException("페이지 로드 실패")
                 
                 # Alert 처리
@@ -691,18 +1420,13 @@ class TworldCrawler:
                 
                 # 데이터 수집
                 logger.info(f"데이터 수집 시작: {combo['plan']['name'][:30]}...")
-                items_count = self._collect_all_pages_data(driver, combo)
+                collected = []
+                items_count = self._collect_all_pages_data(driver, combo, collected)
                 logger.info(f"데이터 수집 완료: {items_count}개 항목")
+                if collected:
+                    self.planner.record(*self._combo_keys(combo), collected)
                 
-                with self.status_lock:
-                    if items_count > 0:
-                        self.completed_count += 1
-                        self.total_devices += items_count
-                        
-                        if RICH_AVAILABLE and items_count > 0:
-                            console.print(f"[green]✓[/green] [{combo_index+1}/{len(self.all_combinations)}] {combo['plan']['name'][:40]}... - [bold]{items_count}개[/bold]")
-                    else:
-                        self.failed_count += 1
+                self._record_result(combo_index, combo, items_count)
                 
                 return True
                 
@@ -732,6 +1456,7 @@ class TworldCrawler:
                                         logger.info(f"{len(tables)}개 테이블 발견 - 데이터 수집 시도")
                                         # 다시 데이터 수집 시도를 위해 continue 대신 드라이버 유지
                                         retry_count += 1
+                                        self.telemetry.retry('combination')
                                         time.sleep(self.config['delay_between_requests'])
                                         continue
                                 else:
@@ -756,17 +1481,12 @@ class TworldCrawler:
                 
                 retry_count += 1
                 
-                if driver:
-                    try:
-                        driver.quit()
-                        with self.drivers_lock:
-                            if driver in self.active_drivers:
-                                self.active_drivers.remove(driver)
-                    except:
-                        pass
-                    driver = None
+                # 오류가 난 드라이버는 재사용하지 않음
+                self._release_driver(driver, discard=True)
+                driver = None
                 
                 if retry_count < self.config['retry_count']:
+                    self.telemetry.retry('combination')
                     # 네트워크 에러 시 더 긴 대기
                     wait_time = self.config.get('network_error_wait', 30) if isinstance(e, TimeoutException) else self.config['delay_between_requests'] * 2
                     logger.info(f"{wait_time}초 대기 후 재시도...")
@@ -779,45 +1499,54 @@ class TworldCrawler:
                     
             except Exception as e:
                 logger.error(f"처리 오류 [{combo_index+1}]: {str(e)}")
+                self._release_driver(driver, discard=True)
+                driver = None
                 with self.status_lock:
                     self.failed_count += 1
                 return False
                 
             finally:
-                if driver:
-                    try:
-                        driver.quit()
-                        with self.drivers_lock:
-                            if driver in self.active_drivers:
-                                self.active_drivers.remove(driver)
-                    except Exception as e:
-                        logger.debug(f"드라이버 종료 중 오류: {e}")
+                # 드라이버 반납 (풀 미사용 시 종료)
+                self._release_driver(driver)
+                driver = None
                 # 작업 상태 제거
                 with self.status_lock:
                     self.current_tasks.pop(thread_id, None)
                 
-                # 요청 간 지연
-                time.sleep(self.config['delay_between_requests'])
+                # 요청 간 지연 (적응형이면 현재 조절값)
+                self.concurrency.pause()
     
-    def _collect_all_pages_data(self, driver, combo):
-        """모든 페이지 데이터 수집"""
+    def _collect_all_pages_data(self, driver, combo, collected=None):
+        """모든 페이지 데이터 수집 (collected가 주어지면 수집 항목을 함께 담음)"""
         all_items = 0
         current_page = 1
-        max_pages = 10
+        max_pages = self._page_limit()
+        combo_items = []
+        timer = self.telemetry.timer()
         
         logger.debug(f"데이터 수집 시작: {combo['plan']['name']} - {combo['network']['name']} - {combo['scrb_type']['name']}")
         
         while current_page <= max_pages:
             logger.debug(f"페이지 {current_page} 데이터 수집 중...")
             items = self._collect_current_page_data(driver, combo)
+            if current_page == 1:
+                timer.lap('extract', ok=bool(items))
             
             if not items:
                 logger.debug(f"페이지 {current_page}에 데이터 없음")
                 break
                 
-            all_items += len(items)
+            combo_items.extend(items)
             logger.debug(f"페이지 {current_page}에서 {len(items)}개 항목 수집")
             
+            # 증분 모드: 변경 없는 페이지면 이후 페이지는 스냅샷 사용
+            reused = self._incremental_snapshot(combo, items, combo_items)
+            if reused is not None:
+                with self.data_lock:
+                    self.all_data.extend(reused)
+                combo_items.extend(reused)
+                break
+            
             # 다음 페이지 확인
             try:
                 pagination = driver.find_element(By.CSS_SELECTOR, ".pagination, .paginate, .paging")
@@ -825,11 +1554,12 @@ class TworldCrawler:
                 
                 next_page = current_page + 1
                 try:
-                    # JavaScript로 페이지 이동
-                    driver.execute_script(f"javascript:goPage({next_page});")
-                    time.sleep(2)
+                    # JavaScript로 페이지 이동 (테이블 갱신 또는 페이지 재로드 대기)
+                    with self.waiter.mutation(driver, 'page_switch', 'tbody', fallback=2):
+                        driver.execute_script(f"javascript:goPage({next_page});")
                     
-                    # 페이지 변경 확인
+                    # 페이지 변경 확인 (재로드되었을 수 있으므로 다시 조회)
+                    pagination = driver.find_element(By.CSS_SELECTOR, ".pagination, .paginate, .paging")
                     active = pagination.find_element(By.CSS_SELECTOR, ".active, .on, .current")
                     if int(active.text.strip()) == next_page:
                         current_page = next_page
@@ -848,127 +1578,115 @@ class TworldCrawler:
                 logger.debug(f"페이지네이션 처리 오류: {e}")
                 break
         
+        if current_page > 1:
+            timer.lap('paginate', pages=current_page)
+        
+        all_items = len(combo_items)
+        if collected is not None:
+            collected.extend(combo_items)
+        
         logger.info(f"총 {all_items}개 항목 수집 완료")
         return all_items
     
-    def _collect_current_page_data(self, driver, combo):
-        """현재 페이지 데이터 수집"""
-        items = []
+    def _collect_all_pages_engine(self, page, combo, collected=None):
+        """엔진 탭에서 모든 페이지 데이터 수집 (_collect_all_pages_data와 동일한 흐름)"""
+        current_page = 1
+        max_pages = self._page_limit()
+        combo_items = []
+        timer = self.telemetry.timer(source='engine')
         
-        try:
-            # 테이블 찾기 시도
-            logger.debug("테이블 검색 중...")
-            
-            # 다양한 선택자로 테이블 찾기
-            table_selectors = [
-                "table.disclosure-list",
-                "table.data-list",
-                "table.result-table",
-                "table[id*='disclosure']",
-                "table[class*='list']",
-                "table"
-            ]
+        while current_page <= max_pages:
+            # 테이블 추출 스크립트는 SyncPage.execute_script로 그대로 실행
+            items = self._collect_current_page_data(page, combo)
+            if current_page == 1:
+                timer.lap('extract', ok=bool(items))
             
-            tables = []
-            for selector in table_selectors:
-                found_tables = driver.find_elements(By.CSS_SELECTOR, selector)
-                if found_tables:
-                    tables.extend(found_tables)
-                    logger.debug(f"선택자 '{selector}'로 {len(found_tables)}개 테이블 발견")
-                    break
+            if not items:
+                break
+            combo_items.extend(items)
             
-            if not tables:
-                logger.warning("테이블을 찾을 수 없음")
-                # 페이지 소스 확인
-                page_text = driver.find_element(By.TAG_NAME, "body").text
-                if "데이터가 없습니다" in page_text or "조회된 데이터가 없습니다" in page_text:
-                    logger.info("데이터 없음 메시지 확인")
-                return items
+            reused = self._incremental_snapshot(combo, items, combo_items)
+            if reused is not None:
+                with self.data_lock:
+                    self.all_data.extend(reused)
+                combo_items.extend(reused)
+                break
             
-            for table in tables:
-                tbody = table.find_element(By.TAG_NAME, "tbody")
-                rows = tbody.find_elements(By.TAG_NAME, "tr")
+            next_page = current_page + 1
+            try:
+                pagination = page.execute_script(PAGINATION_SCRIPT, next_page)
+                if pagination is None:
+                    logger.debug("페이지네이션 없음 - 단일 페이지")
+                    break
+                if not pagination.get('has_next'):
+                    logger.debug("더 이상 페이지 없음")
+                    break
                 
-                for row in rows:
-                    cells = row.find_elements(By.TAG_NAME, "td")
-                    
-                    if len(cells) == 1 and ('데이터가 없습니다' in cells[0].text or
-                                           '조회된 데이터가 없습니다' in cells[0].text):
-                        return items
-                    
-                    if len(cells) >= 6:
-                        device_nm = cells[0].text.strip().replace('\n', ' ').replace('\r', ' ')
-                        date_text = cells[1].text.strip()
-                        release_price = self.clean_price(cells[2].text)
-                        
-                        # SK 사이트에서 용어 변경 (2024)
-                        # cells[3] = 공통지원금(=공시지원금), cells[4] = 전환지원금(=추가지원금), cells[5] = T 다이렉트샵 판매 가격
-                        # twoLine 클래스가 있는 셀은 중첩된 div 구조를 가지고 있음
-                        try:
-                            # 공통지원금 추출 - 중첩된 구조에서 span.num 찾기
-                            price_span = cells[3].find_element(By.CSS_SELECTOR, "span.num")
-                            public_fee = self.clean_price(price_span.text) if price_span else self.clean_price(cells[3].text)
-                        except:
-                            public_fee = self.clean_price(cells[3].text)
-                            
-                        # 전환지원금(추가지원금) 추출 - cells[4]
-                        # 전환지원금은 대부분 "-"로 표시되어 0원임
-                        try:
-                            if len(cells) > 4:
-                                add_span = cells[4].find_element(By.CSS_SELECTOR, "span.num")
-                                add_text = add_span.text if add_span else cells[4].text
-                                # "-" 이거나 빈값이면 0으로 처리
-                                if "-" in add_text or not add_text.strip():
-                                    add_fee = 0
-                                else:
-                                    add_fee = self.clean_price(add_text)
-                            else:
-                                add_fee = 0
-                        except:
-                            add_fee = 0
-                            
-                        # 디버깅용 로그
-                        if device_nm and "갤럭시 Z" in device_nm:
-                            logger.info(f"디버깅: {device_nm} - 공통지원금: {public_fee}, 전환지원금: {add_fee}")
-                        
-                        if device_nm:
-                            # day7 옵션이 켜져있을 때 날짜 확인
-                            if self.config.get('day7', False):
-                                try:
-                                    # 날짜 형식이 다양할 수 있으므로 파싱 시도 (YYYY.MM.DD 형식 등)
-                                    date_obj = pd.to_datetime(date_text.replace('.', '-'))
-                                    now = datetime.now(ZoneInfo('Asia/Seoul'))
-                                    seven_days_ago = now - pd.Timedelta(days=7)
-                                    
-                                    if date_obj < seven_days_ago:
-                                        logger.debug(f"날짜({date_text})가 7일 이전이므로 건너뜀")
-                                        continue
-                                except Exception as e:
-                                    logger.debug(f"날짜 파싱 오류: {e}, 데이터 포함")
-                            # 통합 데이터 형식
-                            item = {
-                                'date': date_text,
-                                'crawled_at': datetime.now(ZoneInfo('Asia/Seoul')).strftime('%Y-%m-%d %H:%M:%S'),
-                                'carrier': 'SK',
-                                'manufacturer': self.get_manufacturer(device_nm),
-                                'scrb_type_name': combo['scrb_type']['name'],
-                                'network_type': combo['network']['name'],
-                                'device_nm': device_nm,
-                                'plan_name': combo['plan']['name'],
-                                'monthly_fee': combo['plan']['monthly_fee'],
-                                'release_price': release_price,
-                                'public_support_fee': public_fee,
-                                'additional_support_fee': add_fee,
-                                'total_support_fee': public_fee + add_fee,
-                                'total_price': release_price - (public_fee + add_fee) if release_price > 0 else 0
-                            }
-                            items.append(item)
-                            
-                            with self.data_lock:
-                                self.all_data.append(item)
-                            
+                # goPage()는 테이블 갱신 또는 페이지 재로드 - 활성 페이지 번호가 바뀔 때까지 대기
+                # (재로드되면 실행 컨텍스트가 사라지므로 스크립트 호출과 분리)
+                page.execute_script(f"setTimeout(function() {{ goPage({next_page}); }}, 0);")
+                page.wait_for_function(PAGE_SWITCHED_SCRIPT, next_page,
+                                       timeout=self.waiter.timeout_for('page_switch'))
+            except BrowserError as e:
+                logger.debug(f"페이지 이동 실패: {e}")
+                break
+            
+            self._engine_network_idle(page)
+            current_page = next_page
+        
+        if current_page > 1:
+            timer.lap('paginate', pages=current_page)
+        
+        if collected is not None:
+            collected.extend(combo_items)
+        
+        logger.info(f"총 {len(combo_items)}개 항목 수집 완료")
+        return len(combo_items)
+    
+    def _collect_current_page_data(self, driver, combo):
+        """현재 페이지 데이터 수집 (테이블 전체를 한 번의 execute_script로 가져옴)"""
+        try:
+            result = driver.execute_script(PAGE_ROWS_SCRIPT, NOTICE_TABLE_SELECTORS)
         except Exception as e:
             logger.debug(f"페이지 데이터 수집 오류: {e}")
+            return []
+        
+        if not result or not result.get('found'):
+            logger.warning("테이블을 찾을 수 없음")
+            if result and result.get('empty'):
+                logger.info("데이터 없음 메시지 확인")
+            return []
+        
+        items = self._items_from_rows(combo, result.get('rows') or [])
+        if items:
+            with self.data_lock:
+                self.all_data.extend(items)
+        
+        return items
+    
+    def _items_from_rows(self, combo, rows):
+        """셀 텍스트 행을 통합 형식 항목으로 일괄 변환
+        
+        SK 사이트 용어 (2024): 공통지원금 = 공시지원금, 전환지원금 = 추가지원금
+        
+        Args:
+            rows: [[기기명, 공시일, 출고가, 공통지원금, 전환지원금], ...] 셀 텍스트
+        """
+        items = []
+        for device_text, date_text, price_text, public_text, add_text in rows:
+            device_nm = ' '.join(device_text.split())
+            release_price = self.clean_price(price_text)
+            public_fee = self.clean_price(public_text)
+            # 전환지원금은 대부분 "-"로 표시되어 0원임
+            add_fee = 0 if "-" in add_text or not add_text.strip() else self.clean_price(add_text)
+            
+            item = self._build_item(combo, device_nm, date_text.strip(), release_price, public_fee, add_fee)
+            if item:
+                items.append(item)
+        
+        # 상위 기기만 수집 (최근 변경 순 정렬이므로 앞쪽이 최신)
+        if self.config.get('max_devices'):
+            items = items[:self.config['max_devices']]
         
         return items
     
@@ -1002,93 +1720,138 @@ class TworldCrawler:
         """병렬 크롤링 실행"""
         self.start_time = time.time()
         
+        # 공유 브라우저 엔진: Chrome 하나에 컨텍스트를 동시 작업 수만큼 (드라이버 풀 대신)
+        engine_mode = self._open_browser_engine()
+        if engine_mode:
+            # 엔진 작업은 Selenium 워커 수가 아니라 컨텍스트 수 기준으로 제한 (자동 조절도 컨텍스트 수 이하에서)
+            self.concurrency.resize(self.config['engine_contexts'], self.config['engine_contexts'])
+        browser_workers = self.config['engine_contexts'] if engine_mode else self.concurrency.max_workers
+        
+        # HTTP 모드에서는 워커 수를 늘리고 브라우저는 대체 실행에만 사용
+        http_mode = self.config.get('fetch_mode') == 'http'
+        num_workers = self.config['http_workers'] if http_mode else browser_workers
+        mode_text = f" (HTTP 모드, 브라우저 {browser_workers}개)" if http_mode else ""
+        if engine_mode:
+            mode_text += f" [공유 브라우저 컨텍스트 {browser_workers}개]"
+        if self.concurrency.enabled:
+            mode_text += f" [자동 조절: 브라우저 작업 {self.concurrency.limit}개에서 시작, 최대 {self.concurrency.max_workers}개]"
+        
         if RICH_AVAILABLE:
             console.print(Panel.fit(
                 f"[bold cyan]공시지원금 데이터 수집 시작[/bold cyan]\n"
-                f"[yellow]워커: {self.config['max_workers']}개[/yellow]",
+                f"[yellow]워커: {num_workers}개{mode_text}[/yellow]",
                 border_style="cyan"
             ))
         else:
             print("\n공시지원금 데이터 수집 시작")
-            print(f"워커: {self.config['max_workers']}개")
-        
-        # 체크포인트 확인
-        start_index = self.load_checkpoint()
+            print(f"워커: {num_workers}개{mode_text}")
         
-        with ThreadPoolExecutor(max_workers=self.config['max_workers']) as executor:
+        # 예외로 중단되어도 드라이버 풀 / HTTP 세션 / 공유 브라우저는 정리
+        try:
+            # 체크포인트 확인
+            start_index = self.load_checkpoint()
             
-            if RICH_AVAILABLE:
-                # Rich Progress 사용
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    MofNCompleteColumn(),
-                    TextColumn("• {task.fields[status]}"),
-                    TimeRemainingColumn(),
-                    console=console,
-                    refresh_per_second=2
-                ) as progress:
-                    
-                    main_task = progress.add_task(
-                        "[green]전체 진행률",
-                        total=len(self.all_combinations) - start_index,
-                        status=f"수집: 0개"
-                    )
-                    
-                    # 작업 제출
-                    futures = []
-                    for i in range(start_index, len(self.all_combinations)):
-                        future = executor.submit(self.process_combination, i, progress, main_task)
-                        futures.append((future, i))
-                    
-                    # 결과 수집 - as_completed 사용
-                    for future in as_completed([f[0] for f in futures]):
-                        try:
-                            # 완료된 future의 인덱스 찾기
-                            idx = None
-                            for f, i in futures:
-                                if f == future:
-                                    idx = i
-                                    break
-                            
-                            result = future.result()
-                            progress.advance(main_task)
-                            
-                            # 상태 업데이트
-                            elapsed = time.time() - self.start_time
-                            speed = self.completed_count / (elapsed / 60) if elapsed > 0 else 0
-                            
-                            progress.update(
-                                main_task,
-                                status=f"수집: {self.total_devices:,}개 | 속도: {speed:.1f}개/분"
-                            )
-                            
-                            # 체크포인트 저장
-                            if idx is not None and (idx + 1) % self.config['checkpoint_interval'] == 0:
-                                self.save_checkpoint(idx + 1)
-                            
-                        except Exception as e:
-                            logger.error(f"Future 오류: {str(e)}")
-                            progress.advance(main_task)
-            else:
-                # Rich 없을 때
-                futures = []
-                future_to_idx = {}
-                for i in range(start_index, len(self.all_combinations)):
-                    future = executor.submit(self.process_combination, i)
-                    futures.append(future)
-                    future_to_idx[future] = i
+            # 수집할 조합 결정 (중복 예측 조합 제외)
+            indices = self._plan_combinations(start_index)
+            
+            # 드라이버 풀 / HTTP 세션 준비 (공유 엔진 사용 시 드라이버 풀 생략)
+            if not engine_mode:
+                self._open_driver_pool()
+            self._open_http_mode()
+            
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
                 
-                completed = 0
-                total = len(self.all_combinations) - start_index
-                for future in as_completed(futures):
-                    completed += 1
-                    idx = future_to_idx[future]
-                    print(f"진행: {completed}/{total} ({completed/total*100:.1f}%)")
+                if RICH_AVAILABLE:
+                    # Rich Progress 사용
+                    with Progress(
+                        SpinnerColumn(),
+                        TextColumn("[progress.description]{task.description}"),
+                        BarColumn(),
+                        MofNCompleteColumn(),
+                        TextColumn("• {task.fields[status]}"),
+                        TimeRemainingColumn(),
+                        console=console,
+                        refresh_per_second=2
+                    ) as progress:
+                        
+                        main_task = progress.add_task(
+                            "[green]전체 진행률",
+                            total=len(indices),
+                            status=f"수집: 0개"
+                        )
+                        
+                        # 작업 제출
+                        futures = []
+                        for i in indices:
+                            future = executor.submit(self.process_combination, i, progress, main_task)
+                            futures.append((future, i))
+                        
+                        # 결과 수집 - as_completed 사용
+                        for future in as_completed([f[0] for f in futures]):
+                            try:
+                                # 완료된 future의 인덱스 찾기
+                                idx = None
+                                for f, i in futures:
+                                    if f == future:
+                                        idx = i
+                                        break
+                                
+                                result = future.result()
+                                progress.advance(main_task)
+                                
+                                # 상태 업데이트
+                                elapsed = time.time() - self.start_time
+                                speed = self.completed_count / (elapsed / 60) if elapsed > 0 else 0
+                                
+                                progress.update(
+                                    main_task,
+                                    status=f"수집: {self.total_devices:,}개 | 속도: {speed:.1f}개/분"
+                                )
+                                
+                                # 체크포인트 저장
+                                if idx is not None and (idx + 1) % self.config['checkpoint_interval'] == 0:
+                                    self.save_checkpoint(idx + 1)
+                                
+                            except Exception as e:
+                                logger.error(f"Future 오류: {str(e)}")
+                                progress.advance(main_task)
+                else:
+                    # Rich 없을 때
+                    futures = []
+                    future_to_idx = {}
+                    for i in indices:
+                        future = executor.submit(self.process_combination, i)
+                        futures.append(future)
+                        future_to_idx[future] = i
                     
-                    if (idx + 1) % self.config['checkpoint_interval'] == 0:
-                        self.save_checkpoint(idx + 1)
+                    completed = 0
+                    total = len(indices)
+                    for future in as_completed(futures):
+                        completed += 1
+                        idx = future_to_idx[future]
+                        print(f"진행: {completed}/{total} ({completed/total*100:.1f}%)")
+                        
+                        if (idx + 1) % self.config['checkpoint_interval'] == 0:
+                            self.save_checkpoint(idx + 1)
+            
+            # 미룬 조합 처리 (원본 수집 실패 시 직접 수집하므로 세션 정리 전에 실행)
+            self._materialize_deferred()
+        finally:
+            # 드라이버 풀 / HTTP 세션 / 공유 브라우저 정리
+            self._close_http_mode()
+            self._close_driver_pool()
+            self._close_browser_engine()
+        
+        # 단계별 대기 시간 기록
+        self.waiter.save()
+        self.waiter.log_summary()
+        logger.info(f"리소스 차단 - {self.browser_profile.summary()}")
+        logger.info(f"요금제 카탈로그 - {self.plan_catalog.summary()}")
+        logger.info(f"드라이버 - {resolver_summary()}")
+        logger.info(f"동시성 - {self.concurrency.summary()}")
+        if self.fixtures.active:
+            logger.info(f"픽스처 - {self.fixtures.summary()}")
+            self.fixtures.close()
         
         # 다른 가입유형 데이터 복사 (제거)
         # self._duplicate_data_for_other_types()
@@ -1127,14 +1890,11 @@ class TworldCrawler:
         else:
             logger.info("\n다른 가입유형 데이터 생성 중...")
         
-        original_data = [d for d in self.all_data if d['scrb_type_name'] == '기기변경']
+        original_rows = self.all_data.where(scrb_type_name='기기변경')
         other_types = ['신규가입', '번호이동']
         
         for scrb_type in other_types:
-            for item in original_data:
-                new_item = item.copy()
-                new_item['scrb_type_name'] = scrb_type
-                self.all_data.append(new_item)
+            self.all_data.copy_rows(original_rows, scrb_type_name=scrb_type)
         
         if RICH_AVAILABLE:
             console.print(f"[green]✓[/green] 총 {len(self.all_data):,}개 데이터 생성 완료")
@@ -1142,56 +1902,75 @@ class TworldCrawler:
             logger.info(f"✓ 총 {len(self.all_data)}개 데이터 생성 완료")
     
     def save_checkpoint(self, index):
-        """체크포인트 저장"""
-        checkpoint_data = {
+        """체크포인트 저장 (지난 체크포인트 이후 수집한 행만 저널에 추가)"""
+        marker = {
             'index': index,
-            'all_data': self.all_data,
-            'rate_plans': self.rate_plans,
-            'categories': self.categories,
-            'all_combinations': self.all_combinations,
             'completed_count': self.completed_count,
             'failed_count': self.failed_count,
             'total_devices': self.total_devices,
             'timestamp': datetime.now(ZoneInfo('Asia/Seoul')).isoformat()
         }
         
-        try:
-            with open(str(self.checkpoint_file), 'wb') as f:
-                pickle.dump(checkpoint_data, f)
-            logger.debug(f"체크포인트 저장: {index}")
-        except Exception as e:
-            logger.error(f"체크포인트 저장 실패: {e}")
+        # 요금제/카테고리/조합 목록은 실행 중 바뀌지 않으므로 한 번만 저장
+        state = None
+        if not self.journal.state_written:
+            state = {
+                'rate_plans': self.rate_plans,
+                'categories': self.categories,
+                'all_combinations': self.all_combinations
+            }
+        
+        appended = self.journal.checkpoint(self.all_data, marker, state)
+        logger.debug(f"체크포인트 저장: {index} (+{appended}행)")
     
     def load_checkpoint(self):
-        """체크포인트 로드"""
-        if not self.checkpoint_file.exists():
-            return 0
-        
+        """체크포인트 로드 (저널 재생, 없으면 이전 pickle 체크포인트)"""
         try:
-            with open(str(self.checkpoint_file), 'rb') as f:
-                checkpoint_data = pickle.load(f)
-            
-            self.all_data = checkpoint_data.get('all_data', [])
-            self.rate_plans = checkpoint_data.get('rate_plans', [])
-            self.categories = checkpoint_data.get('categories', [])
-            self.all_combinations = checkpoint_data.get('all_combinations', [])
-            self.completed_count = checkpoint_data.get('completed_count', 0)
-            self.failed_count = checkpoint_data.get('failed_count', 0)
-            self.total_devices = checkpoint_data.get('total_devices', 0)
-            saved_index = checkpoint_data.get('index', 0)
-            
-            if RICH_AVAILABLE:
-                console.print(f"[yellow]체크포인트 로드: {saved_index}번째부터 재개[/yellow]")
-            else:
-                logger.info(f"체크포인트 로드: {saved_index}번째부터 재개")
-            
-            return saved_index
+            loaded = self.journal.load()
         except Exception as e:
-            logger.error(f"체크포인트 로드 실패: {e}")
+            logger.error(f"체크포인트 저널 로드 실패: {e}")
+            loaded = None
+        
+        if loaded is not None:
+            rows, marker, state = loaded
+            state = state or {}
+            self.all_data = RowStore(dict, rows)
+            self.rate_plans = state.get('rate_plans', [])
+            self.categories = state.get('categories', [])
+            self.all_combinations = state.get('all_combinations', [])
+            self.completed_count = marker.get('completed_count', 0)
+            self.failed_count = marker.get('failed_count', 0)
+            self.total_devices = marker.get('total_devices', 0)
+            saved_index = marker.get('index', 0)
+        elif self.checkpoint_file.exists():
+            try:
+                with open(str(self.checkpoint_file), 'rb') as f:
+                    checkpoint_data = pickle.load(f)
+                
+                self.all_data = RowStore(dict, checkpoint_data.get('all_data', []))
+                self.rate_plans = checkpoint_data.get('rate_plans', [])
+                self.categories = checkpoint_data.get('categories', [])
+                self.all_combinations = checkpoint_data.get('all_combinations', [])
+                self.completed_count = checkpoint_data.get('completed_count', 0)
+                self.failed_count = checkpoint_data.get('failed_count', 0)
+                self.total_devices = checkpoint_data.get('total_devices', 0)
+                saved_index = checkpoint_data.get('index', 0)
+            except Exception as e:
+                logger.error(f"체크포인트 로드 실패: {e}")
+                return 0
+        else:
             return 0
+        
+        if RICH_AVAILABLE:
+            console.print(f"[yellow]체크포인트 로드: {saved_index}번째부터 재개[/yellow]")
+        else:
+            logger.info(f"체크포인트 로드: {saved_index}번째부터 재개")
+        
+        return saved_index
     
     def clear_checkpoint(self):
         """체크포인트 삭제"""
+        self.journal.clear()
         if self.checkpoint_file.exists():
             try:
                 self.checkpoint_file.unlink()
@@ -1213,7 +1992,7 @@ class TworldCrawler:
         
         try:
             # DataFrame 생성
-            df = pd.DataFrame(self.all_data)
+            df = self.all_data.to_dataframe()
             
             # CSV 저장
             if 'csv' in self.config['save_formats']:
@@ -1225,6 +2004,15 @@ class TworldCrawler:
                     console.print(f"[green]✅ CSV 저장:[/green] {csv_file}")
                 else:
                     logger.info(f"CSV 저장: {csv_file}")
+                
+                # 직전 스냅샷 대비 변경분 (선택)
+                if self.config['save_delta']:
+                    try:
+                        delta_file = write_delta(csv_file)
+                        if delta_file:
+                            saved_files.append(str(delta_file))
+                    except Exception as e:
+                        logger.error(f"변경분 저장 실패: {e}")
             
             # Excel 저장
             if 'excel' in self.config['save_formats']:
@@ -1235,7 +2023,7 @@ class TworldCrawler:
                     df.to_excel(writer, sheet_name='전체데이터', index=False)
                     
                     # 요약 시트
-                    summary = df.groupby(['network_type', 'scrb_type_name']).agg({
+                    summary = df.groupby(['network_type', 'scrb_type_name'], observed=True).agg({
                         'device_nm': 'count',
                         'public_support_fee': 'mean',
                         'total_support_fee': 'mean'
@@ -1250,6 +2038,18 @@ class TworldCrawler:
                 else:
                     logger.info(f"Excel 저장: {excel_file}")
             
+            # Parquet (통신사/수집일 분할, 선택)
+            if self.config['save_parquet']:
+                if PYARROW_AVAILABLE:
+                    try:
+                        parquet_file = write_raw_data(df, 'sk', root=self.config['parquet_dir'],
+                                                      run_time=datetime.now(ZoneInfo('Asia/Seoul')))
+                        saved_files.append(str(parquet_file))
+                    except Exception as e:
+                        logger.error(f"Parquet 저장 실패: {e}")
+                else:
+                    logger.warning("pyarrow가 설치되어 있지 않아 Parquet 저장을 건너뜁니다.")
+            
             # 통계 출력
             self._print_statistics(df)
             
@@ -1289,6 +2089,7 @@ class TworldCrawler:
     
     def run(self):
         """전체 실행"""
+        status = 'failed'
         try:
             if RICH_AVAILABLE:
                 console.print(Panel.fit(
@@ -1319,11 +2120,14 @@ class TworldCrawler:
                 if start_index > 0 and self.all_combinations:
                     # 체크포인트에서 재개
                     self.run_parallel_crawling()
+                    self._update_crawl_index()
                     saved_files = self.save_results()
+                    status = 'ok'
                     return saved_files
             
             # 1. 요금제 수집
-            self.collect_rate_plans()
+            with self.telemetry.step('plan_list'):
+                self.collect_rate_plans()
             
             if not self.rate_plans:
                 if RICH_AVAILABLE:
@@ -1337,13 +2141,16 @@ class TworldCrawler:
             
             # 3. 병렬 크롤링
             self.run_parallel_crawling()
+            self._update_crawl_index()
             
             # 4. 결과 저장
             saved_files = self.save_results()
             
+            status = 'ok'
             return saved_files
             
         except KeyboardInterrupt:
+            status = 'interrupted'
             if RICH_AVAILABLE:
                 console.print("\n[yellow]사용자에 의해 중단되었습니다.[/yellow]")
             else:
@@ -1362,6 +2169,14 @@ class TworldCrawler:
                 logger.error(f"크롤링 중 오류: {e}")
             traceback.print_exc()
             return []
+        
+        finally:
+            # 중단/오류 시 공유 브라우저 종료
+            self._close_browser_engine()
+            
+            # 조합/단계별 소요 시간 기록
+            self.telemetry.add_bytes(self.browser_profile.stats['loaded_bytes'], 'browser')
+            self.telemetry.finish(rows=len(self.all_data), status=status)
     
     def __del__(self):
         """객체 소멸자 - 모든 드라이버 정리"""
@@ -1391,6 +2206,10 @@ class TworldCrawler:
                             except:
                                 pass
                         self.active_services.clear()
+            
+            # 픽스처 기록 파일 닫기 / 재생 서버 종료 (중단·오류 시)
+            if hasattr(self, 'fixtures'):
+                self.fixtures.close()
         except:
             pass
 
@@ -1412,9 +2231,11 @@ def main():
                         help='브라우저 표시')
     parser.add_argument('--output', type=str, default='data',
                         help='출력 디렉토리')
-    parser.add_argument('--format', nargs='+', choices=['excel', 'csv'],
+    parser.add_argument('--format', nargs='+', choices=['excel', 'csv', 'parquet'],
                         default=['csv'],
-                        help='저장 형식')
+                        help='저장 형식 (parquet: 통신사/수집일 분할, pyarrow 필요)')
+    parser.add_argument('--delta', action='store_true',
+                        help='직전 스냅샷 대비 변경분(추가/변경/삭제)을 raw/delta/에 저장')
     parser.add_argument('--test', action='store_true',
                         help='테스트 모드 (처음 10개 요금제만)')
     parser.add_argument('--resume', action='store_true',
@@ -1423,6 +2244,52 @@ def main():
                         help='요청 간 지연 시간(초) (기본: 2)')
     parser.add_argument('--day7', action='store_true',
                         help='최근 7일치 데이터만 수집')
+    parser.add_argument('--first-page-only', action='store_true',
+                        help='각 조합의 첫 페이지만 수집 (최근 변경 기기)')
+    parser.add_argument('--max-devices', type=int, default=0,
+                        help='조합별 최대 기기 수 (0=전체, 지정 시 첫 페이지만 수집)')
+    parser.add_argument('--no-driver-pool', action='store_true',
+                        help='드라이버 풀 비활성화 (조합마다 Chrome 새로 실행)')
+    parser.add_argument('--driver-max-uses', type=int, default=50,
+                        help='드라이버 재생성 전 최대 사용 횟수 (기본: 50)')
+    parser.add_argument('--no-block-resources', action='store_true',
+                        help='이미지/폰트/광고 스크립트 등 리소스 차단 비활성화')
+    parser.add_argument('--record-fixtures', type=str, default=None, metavar='DIR',
+                        help='페이지/XHR 응답을 픽스처 코퍼스로 기록')
+    parser.add_argument('--replay-fixtures', type=str, default=None, metavar='DIR_OR_URL',
+                        help='라이브 사이트 대신 픽스처 코퍼스(또는 재생 서버)로 실행')
+    parser.add_argument('--fixed-waits', action='store_true',
+                        help='이벤트 기반 대기 대신 기존 고정 대기 사용')
+    parser.add_argument('--incremental', action='store_true',
+                        help='증분 모드 (변경 없는 페이지 이후는 이전 결과 재사용)')
+    parser.add_argument('--shared-service', action='store_true',
+                        help='chromedriver Service 하나를 모든 드라이버가 공유')
+    parser.add_argument('--chromedriver-version', type=str, default=None, metavar='VERSION',
+                        help='chromedriver 버전 고정 (예: 131, 기본: 설치된 Chrome에 맞춤)')
+    parser.add_argument('--no-telemetry', action='store_true',
+                        help='작업/단계별 소요 시간 기록(JSON Lines, Prometheus textfile) 비활성화')
+    parser.add_argument('--telemetry-dir', type=str, default=None, metavar='DIR',
+                        help='텔레메트리 저장 디렉토리 (기본: 체크포인트 디렉토리/telemetry)')
+    parser.add_argument('--refresh-plans', action='store_true',
+                        help='요금제 카탈로그를 무시하고 요금제 목록 전체 다시 열거')
+    parser.add_argument('--plan-ttl', type=float, default=DEFAULT_TTL_HOURS, metavar='HOURS',
+                        help=f'저장된 요금제 목록 유효 시간 (기본: {DEFAULT_TTL_HOURS}시간)')
+    parser.add_argument('--no-planner', action='store_true',
+                        help='중복 조합 예측 비활성화 (모든 조합 수집)')
+    parser.add_argument('--http', action='store_true',
+                        help='HTTP 모드 (브라우저 없이 수집, 실패 시 Selenium 대체)')
+    parser.add_argument('--http-workers', type=int, default=16,
+                        help='HTTP 모드 동시 작업 수 (기본: 16)')
+    parser.add_argument('--http-per-host', type=int, default=8,
+                        help='호스트별 동시 HTTP 요청 수 (기본: 8)')
+    parser.add_argument('--engine', choices=['selenium', 'async'], default='selenium',
+                        help='브라우저 엔진 (async = Chrome 하나에 격리 컨텍스트 여러 개, websockets 필요)')
+    parser.add_argument('--contexts', type=int, default=12,
+                        help='async 엔진 동시 컨텍스트 수 (기본: 12)')
+    parser.add_argument('--adaptive', action='store_true',
+                        help='동시 작업 수/요청 간 지연 자동 조절 (--workers/--delay에서 시작)')
+    parser.add_argument('--adaptive-max-workers', type=int, default=8,
+                        help='자동 조절 시 최대 동시 작업 수 (기본: 8)')
     
     args = parser.parse_args()
     
@@ -1436,7 +2303,32 @@ def main():
         'save_formats': args.format,
         'resume': args.resume,
         'delay_between_requests': args.delay,
-        'day7': args.day7
+        'day7': args.day7,
+        'first_page_only': args.first_page_only,
+        'max_devices': args.max_devices,
+        'use_driver_pool': not args.no_driver_pool,
+        'driver_max_uses': args.driver_max_uses,
+        'combo_planner': not args.no_planner,
+        'incremental': args.incremental,
+        'plan_catalog': not args.refresh_plans,
+        'shared_service': args.shared_service,
+        'chromedriver_version': args.chromedriver_version,
+        'plan_catalog_ttl_hours': args.plan_ttl,
+        'telemetry': not args.no_telemetry,
+        'telemetry_dir': args.telemetry_dir,
+        'block_resources': not args.no_block_resources,
+        'fixture_record': args.record_fixtures,
+        'fixture_replay': args.replay_fixtures,
+        'save_parquet': 'parquet' in args.format,
+        'save_delta': args.delta,
+        'event_waits': not args.fixed_waits,
+        'fetch_mode': 'http' if args.http else 'selenium',
+        'http_workers': args.http_workers,
+        'http_max_per_host': args.http_per_host,
+        'browser_engine': args.engine,
+        'engine_contexts': args.contexts,
+        'adaptive_concurrency': args.adaptive,
+        'adaptive_max_workers': args.adaptive_max_workers
     }
     
     # 크롤러 실행
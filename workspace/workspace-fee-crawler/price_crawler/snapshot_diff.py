@@ -0,0 +1,244 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+크롤링 스냅샷 변경분 (delta)
+새 raw CSV 스냅샷을 직전 스냅샷과 (통신사, 가입유형, 네트워크, 요금제, 기기) 키로 비교해
+추가/변경/삭제된 행만 이전값/새값과 함께 작은 delta CSV로 저장합니다.
+
+- inserted: 새 스냅샷에만 있는 키, removed: 직전 스냅샷에만 있는 키
+- changed: 공시일자/요금/출고가/지원금/구매가 중 하나라도 달라진 키 (changed_fields에 변경 컬럼)
+- 같은 키의 행이 여러 개면 나온 순서대로 짝지어 비교
+- 스냅샷 선택은 merge_and_upload와 같은 규칙 (KT는 같은 날짜 파일을 합쳐 하나의 스냅샷, 뒤 파일 우선)
+- delta 파일: raw/delta/<통신사>_delta_<날짜>_<시각>.csv (raw/*.csv를 읽는 머지 단계에는 섞이지 않음)
+- 하위 단계(머지/정제/요약/업로드)가 변경분만 처리하거나 가격 변동 알림에 사용
+
+사용법:
+    python3 price_crawler/snapshot_diff.py --raw-dir data/raw                    # 통신사별 최신 vs 직전
+    python3 price_crawler/snapshot_diff.py --raw-dir data/raw --carriers kt
+    python3 price_crawler/snapshot_diff.py --old data/raw/sk_20251026_020011.csv --new data/raw/sk_20251027_020304.csv
+
+작성일: 2025-10-27
+파일명: snapshot_diff.py
+"""
+
+import logging
+import argparse
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+from price_crawler.columnar_store import CSV_NAME_PATTERN, PRICE_COLUMNS, CARRIERS
+
+logger = logging.getLogger(__name__)
+
+# 스냅샷 행 키
+KEY_COLUMNS = ('carrier', 'scrb_type_name', 'network_type', 'plan_name', 'device_nm')
+
+# 변경 여부 비교 컬럼 (수집 시각/제조사 등 부가 정보는 제외)
+COMPARE_COLUMNS = ('date',) + PRICE_COLUMNS
+
+# delta 파일 폴더 (raw 폴더 아래)
+DELTA_DIR_NAME = 'delta'
+
+# 변경 종류 (delta 파일 정렬 순서)
+CHANGE_TYPES = ('inserted', 'changed', 'removed')
+
+
+def snapshot_file_key(path: Union[str, Path]) -> Optional[Tuple[str, str, str]]:
+    """raw CSV 파일명에서 (통신사, 날짜, 시각) 추출 (스냅샷 파일이 아니면 None)"""
+    match = CSV_NAME_PATTERN.match(Path(path).name)
+    return match.groups() if match else None
+
+
+def list_snapshot_files(raw_dir: Union[str, Path], carrier: str) -> List[Path]:
+    """통신사 raw CSV 파일 (오래된 순)"""
+    files = [f for f in Path(raw_dir).glob(f'{carrier}_*.csv') if snapshot_file_key(f)]
+    return sorted(files, key=snapshot_file_key)
+
+
+def snapshot_files_at(raw_dir: Union[str, Path], carrier: str, upto: Union[str, Path]) -> List[Path]:
+    """upto 파일 저장 시점의 스냅샷 구성 파일
+
+    KT는 같은 날짜의 upto 이전 파일 전체, SK/LG는 upto 하나
+    """
+    upto = Path(upto)
+    if carrier != 'kt':
+        return [upto]
+    upto_key = snapshot_file_key(upto)
+    return [f for f in list_snapshot_files(raw_dir, carrier)
+            if snapshot_file_key(f)[1] == upto_key[1] and snapshot_file_key(f) <= upto_key]
+
+
+def previous_snapshot_files(new_file: Union[str, Path]) -> List[Path]:
+    """new_file 직전 스냅샷 구성 파일 (없으면 빈 리스트)"""
+    new_file = Path(new_file)
+    new_key = snapshot_file_key(new_file)
+    if not new_key:
+        raise ValueError(f"스냅샷 파일명이 아닙니다: {new_file.name}")
+    carrier = new_key[0]
+    earlier = [f for f in list_snapshot_files(new_file.parent, carrier) if snapshot_file_key(f) < new_key]
+    if not earlier:
+        return []
+    return snapshot_files_at(new_file.parent, carrier, earlier[-1])
+
+
+def row_keys(df: pd.DataFrame) -> List[tuple]:
+    """행 키 목록 (문자열 튜플)"""
+    return list(df[list(KEY_COLUMNS)].astype(str).itertuples(index=False, name=None))
+
+
+def load_snapshot(files: Iterable[Union[str, Path]]) -> pd.DataFrame:
+    """스냅샷 파일 읽기 (여러 파일이면 뒤 파일의 행이 앞 파일의 같은 키 행을 대체)"""
+    frames = [pd.read_csv(f, encoding='utf-8-sig') for f in files]
+    if len(frames) == 1:
+        return frames[0]
+
+    seen = set()
+    kept = []
+    for df in reversed(frames):
+        keys = row_keys(df)
+        kept.append(df[[key not in seen for key in keys]])
+        seen.update(keys)
+    kept.reverse()
+    return pd.concat(kept, ignore_index=True)
+
+
+def _same_values(old: pd.Series, new: pd.Series) -> pd.Series:
+    """두 컬럼 값이 같은지 (결측끼리는 같음, 숫자는 1과 1.0을 같게 봄)"""
+    both_missing = old.isna() & new.isna()
+    if pd.api.types.is_numeric_dtype(old) and pd.api.types.is_numeric_dtype(new):
+        return both_missing | (old.astype(float) == new.astype(float))
+    return both_missing | (old.astype(str) == new.astype(str))
+
+
+def diff_snapshots(old: pd.DataFrame, new: pd.DataFrame,
+                   compare_columns: Iterable[str] = COMPARE_COLUMNS) -> Tuple[pd.DataFrame, Dict[str, int]]:
+    """두 스냅샷 비교
+
+    Returns:
+        (delta DataFrame, {'inserted', 'changed', 'removed', 'unchanged'} 행 수)
+        delta 컬럼: change, 키 컬럼, changed_fields, old_<컬럼>, new_<컬럼>
+    """
+    keys = list(KEY_COLUMNS)
+    missing = [col for col in keys if col not in old.columns or col not in new.columns]
+    if missing:
+        raise ValueError(f"스냅샷에 키 컬럼 없음: {', '.join(missing)}")
+    compare = [col for col in compare_columns if col in old.columns and col in new.columns]
+
+    def prepare(df: pd.DataFrame) -> pd.DataFrame:
+        df = df[keys + compare].copy()
+        df[keys] = df[keys].astype(str)
+        df['_seq'] = df.groupby(keys, sort=False).cumcount()
+        return df
+
+    joined = prepare(old).merge(prepare(new), on=keys + ['_seq'], how='outer',
+                                suffixes=('_old', '_new'), indicator=True, sort=False)
+
+    both = joined['_merge'] == 'both'
+    changed_fields = pd.Series('', index=joined.index)
+    for col in compare:
+        differs = both & ~_same_values(joined[f'{col}_old'], joined[f'{col}_new'])
+        changed_fields = changed_fields.where(~differs, changed_fields + ',' + col)
+    changed_fields = changed_fields.str.lstrip(',')
+
+    change = pd.Series('unchanged', index=joined.index)
+    change[joined['_merge'] == 'right_only'] = 'inserted'
+    change[joined['_merge'] == 'left_only'] = 'removed'
+    change[both & (changed_fields != '')] = 'changed'
+
+    delta = joined[keys].copy()
+    delta.insert(0, 'change', change)
+    delta['changed_fields'] = changed_fields
+    for col in compare:
+        delta[f'old_{col}'] = joined[f'{col}_old']
+        delta[f'new_{col}'] = joined[f'{col}_new']
+
+    stats = {name: int((change == name).sum()) for name in CHANGE_TYPES + ('unchanged',)}
+
+    delta = delta[delta['change'] != 'unchanged']
+    order = {name: i for i, name in enumerate(CHANGE_TYPES)}
+    delta = delta.sort_values('change', key=lambda s: s.map(order), kind='stable').reset_index(drop=True)
+    return delta, stats
+
+
+def delta_path(new_file: Union[str, Path], delta_dir: Union[str, Path, None] = None) -> Path:
+    """스냅샷 파일의 delta 파일 경로 (raw/delta/kt_delta_20251027_100512.csv)"""
+    new_file = Path(new_file)
+    carrier, date, time_part = snapshot_file_key(new_file)
+    directory = Path(delta_dir) if delta_dir else new_file.parent / DELTA_DIR_NAME
+    return directory / f'{carrier}_delta_{date}_{time_part}.csv'
+
+
+def write_delta(new_file: Union[str, Path], old_files: Optional[List[Union[str, Path]]] = None,
+                delta_dir: Union[str, Path, None] = None) -> Optional[Path]:
+    """새 스냅샷과 직전 스냅샷의 delta 파일 저장
+
+    Args:
+        new_file: 새 raw CSV 파일
+        old_files: 비교 대상 파일 (기본: 같은 폴더의 직전 스냅샷)
+        delta_dir: delta 저장 폴더 (기본: raw/delta)
+
+    Returns:
+        delta 파일 경로, 직전 스냅샷이 없으면 None
+    """
+    new_file = Path(new_file)
+    carrier = snapshot_file_key(new_file)[0]
+    if old_files is None:
+        old_files = previous_snapshot_files(new_file)
+    if not old_files:
+        logger.info(f"[{carrier.upper()}] 직전 스냅샷 없음 - 변경분 생략: {new_file.name}")
+        return None
+
+    new_files = snapshot_files_at(new_file.parent, carrier, new_file)
+    delta, stats = diff_snapshots(load_snapshot(old_files), load_snapshot(new_files))
+
+    output = delta_path(new_file, delta_dir)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = output.with_suffix('.tmp')
+    delta.to_csv(temp_file, index=False, encoding='utf-8-sig')
+    temp_file.replace(output)
+
+    logger.info(f"[{carrier.upper()}] 변경분 저장: {output} (추가 {stats['inserted']:,} / 변경 {stats['changed']:,} / "
+                f"삭제 {stats['removed']:,} / 동일 {stats['unchanged']:,}, 기준 {Path(old_files[-1]).name})")
+    return output
+
+
+def main():
+    """메인 실행"""
+    parser = argparse.ArgumentParser(
+        description='크롤링 스냅샷 변경분(delta) 생성',
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument('--raw-dir', type=str, default=None,
+                        help='raw CSV 폴더 (통신사별 최신 스냅샷을 직전 스냅샷과 비교)')
+    parser.add_argument('--carriers', nargs='+', choices=list(CARRIERS), default=list(CARRIERS),
+                        help='대상 통신사 (기본: kt sk lg)')
+    parser.add_argument('--old', nargs='+', default=None, metavar='CSV',
+                        help='비교 기준 스냅샷 파일 (--new와 함께 사용)')
+    parser.add_argument('--new', type=str, default=None, metavar='CSV',
+                        help='새 스냅샷 파일 (기본 비교 대상: 같은 폴더의 직전 스냅샷)')
+    parser.add_argument('--delta-dir', type=str, default=None,
+                        help='delta 저장 폴더 (기본: raw/delta)')
+
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    if args.new:
+        new_files = [Path(args.new)]
+    elif args.raw_dir:
+        new_files = []
+        for carrier in args.carriers:
+            files = list_snapshot_files(args.raw_dir, carrier)
+            if files:
+                new_files.append(files[-1])
+    else:
+        parser.error('--raw-dir 또는 --new가 필요합니다')
+
+    written = [write_delta(f, args.old, args.delta_dir) for f in new_files]
+    for output in filter(None, written):
+        print(f"  - {output}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+대기(standby) 드라이버 교체
+세션 갱신 시 Chrome 종료 → 대기 → 재생성 → 페이지 로드를 기다리지 않도록,
+백그라운드 스레드에서 교체용 드라이버를 미리 띄워 시작 페이지까지 열어 둡니다.
+
+- StandbyDriver: 교체용 드라이버를 미리 준비, take()로 즉시 교체 (준비 중이면 완료까지만 대기)
+- 오래 대기한 드라이버는 꺼낼 때 시작 페이지를 다시 준비 (세션 만료 방지)
+- 교체된 이전 드라이버는 백그라운드에서 종료
+- RefreshPolicy: 고정 요금제 수 대신 Chrome 프로세스 RSS와 응답 지연으로 갱신 시점 결정
+  (psutil이 없으면 RSS 대신 기존처럼 요금제 수 기준)
+
+작성일: 2025-10-27
+파일명: standby_driver.py
+"""
+
+import time
+import logging
+import statistics
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional
+
+from price_crawler.driver_pool import driver_memory_mb, PSUTIL_AVAILABLE
+
+logger = logging.getLogger(__name__)
+
+
+class StandbyDriver:
+    """백그라운드에서 미리 준비해 두는 교체용 드라이버"""
+
+    def __init__(self, factory: Callable, prepare: Optional[Callable] = None,
+                 enabled: bool = True, max_idle: float = 600,
+                 on_retire: Optional[Callable] = None):
+        """
+        Args:
+            factory: 새 드라이버를 생성하는 함수 (예: crawler.create_driver)
+            prepare: 생성한 드라이버를 사용 가능한 상태로 만드는 함수 (예: 시작 페이지 로드)
+            enabled: False면 준비하지 않음 (take()는 항상 None)
+            max_idle: 이 시간(초)보다 오래 대기한 드라이버는 꺼낼 때 prepare를 다시 실행
+            on_retire: 이전 드라이버 종료 직전 호출 (리소스 차단 집계 등)
+        """
+        self.factory = factory
+        self.prepare = prepare
+        self.enabled = enabled
+        self.max_idle = max_idle
+        self.on_retire = on_retire
+
+        self._driver = None
+        self._ready_at = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._lock = threading.Lock()
+
+        # 통계
+        self.stats = {'prepared': 0, 'swaps': 0, 'misses': 0, 'failed': 0, 'waited': 0.0}
+
+    def warm(self):
+        """교체용 드라이버 준비 시작 (이미 준비됐거나 준비 중이면 무시)"""
+        with self._lock:
+            if not self.enabled or self._closed or self._driver is not None:
+                return
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._build, name='standby-driver', daemon=True)
+            self._thread.start()
+
+    def _build(self):
+        driver = None
+        try:
+            driver = self.factory()
+            if self.prepare:
+                self.prepare(driver)
+        except Exception as e:
+            logger.warning(f"대기 드라이버 준비 실패: {e}")
+            self._quit(driver)
+            with self._lock:
+                self.stats['failed'] += 1
+            return
+
+        with self._lock:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                self._driver = driver
+                self._ready_at = time.time()
+                self.stats['prepared'] += 1
+        if closed:
+            self._quit(driver)
+        else:
+            logger.debug("대기 드라이버 준비 완료")
+
+    def take(self, timeout: float = 60):
+        """준비된 드라이버 꺼내기 (준비 중이면 최대 timeout초 대기, 없으면 None)
+
+        꺼낸 뒤 다음 교체용 드라이버 준비를 다시 시작합니다.
+        """
+        if not self.enabled or self._closed:
+            return None
+
+        thread = self._thread
+        if thread is not None and thread.is_alive():
+            started = time.time()
+            thread.join(timeout)
+            self.stats['waited'] += time.time() - started
+
+        with self._lock:
+            driver, ready_at = self._driver, self._ready_at
+            self._driver = None
+
+        if driver is not None and not self._healthy(driver):
+            logger.warning("대기 드라이버 상태 불량 - 폐기")
+            self._quit(driver)
+            driver = None
+
+        if driver is not None and self.prepare and time.time() - ready_at > self.max_idle:
+            # 오래 대기한 드라이버는 세션이 만료됐을 수 있으므로 시작 페이지 다시 준비
+            try:
+                self.prepare(driver)
+            except Exception as e:
+                logger.warning(f"대기 드라이버 재준비 실패: {e}")
+                self._quit(driver)
+                driver = None
+
+        if driver is None:
+            self.stats['misses'] += 1
+        else:
+            self.stats['swaps'] += 1
+        self.warm()
+        return driver
+
+    def retire(self, driver):
+        """교체된 이전 드라이버를 백그라운드에서 종료"""
+        if driver is None:
+            return
+
+        def _retire():
+            if self.on_retire:
+                try:
+                    self.on_retire(driver)
+                except Exception as e:
+                    logger.debug(f"on_retire 콜백 오류: {e}")
+            self._quit(driver)
+
+        threading.Thread(target=_retire, name='retire-driver', daemon=True).start()
+
+    def close(self):
+        """준비 중/준비된 드라이버 종료"""
+        with self._lock:
+            self._closed = True
+            driver = self._driver
+            self._driver = None
+            thread = self._thread
+        self._quit(driver)
+        # 준비 중인 드라이버는 _build가 끝나면서 종료
+        if thread is not None and thread.is_alive():
+            thread.join(5)
+
+    def summary(self) -> str:
+        """통계 문자열"""
+        return (f"즉시 교체 {self.stats['swaps']}회, 준비 안 됨 {self.stats['misses']}회, "
+                f"준비 실패 {self.stats['failed']}회, 준비 대기 {self.stats['waited']:.1f}초")
+
+    @staticmethod
+    def _healthy(driver) -> bool:
+        try:
+            driver.current_window_handle
+            return driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"드라이버 종료 중 오류: {e}")
+
+
+class RefreshPolicy:
+    """Chrome RSS / 응답 지연 기반 드라이버 갱신 판단"""
+
+    def __init__(self, max_memory_mb: float = 1500, latency_factor: float = 3.0,
+                 min_latency: float = 0.25, window: int = 5, max_plans: int = 0,
+                 fallback_plans: int = 20):
+        """
+        Args:
+            max_memory_mb: chromedriver + Chrome 프로세스 트리 RSS 한도 (psutil 필요)
+            latency_factor: 최근 응답 지연 중앙값이 드라이버 초기 중앙값의 몇 배를 넘으면 갱신
+                (응답 지연 = 요금제마다 하는 상태 확인의 WebDriver/JavaScript 왕복 시간)
+            min_latency: 이 시간(초) 미만의 지연은 느려진 것으로 보지 않음
+            window: 지연 중앙값 계산 표본 수
+            max_plans: 드라이버당 최대 요금제 수 (0 = 제한 없음)
+            fallback_plans: psutil이 없을 때 사용하는 고정 갱신 주기 (요금제 수)
+        """
+        self.max_memory_mb = max_memory_mb
+        self.latency_factor = latency_factor
+        self.min_latency = min_latency
+        self.window = max(1, window)
+        self.max_plans = max_plans if PSUTIL_AVAILABLE else (max_plans or fallback_plans)
+
+        self.plans = 0
+        self._baseline: List[float] = []
+        self._recent: Deque[float] = deque(maxlen=self.window)
+
+        if not PSUTIL_AVAILABLE:
+            logger.info(f"psutil 미설치 - 드라이버 갱신은 {self.max_plans}개 요금제마다 + 응답 지연 기준")
+
+    def reset(self):
+        """새 드라이버로 교체된 뒤 호출"""
+        self.plans = 0
+        self._baseline = []
+        self._recent.clear()
+
+    def record(self, latency: float):
+        """요청 하나의 응답 지연(초) 기록"""
+        self.plans += 1
+        if len(self._baseline) < self.window:
+            self._baseline.append(latency)
+        else:
+            self._recent.append(latency)
+
+    def check(self, driver) -> Optional[str]:
+        """갱신이 필요하면 이유, 아니면 None"""
+        if self.max_plans and self.plans >= self.max_plans:
+            return f"요금제 {self.plans}개 처리"
+
+        if self.max_memory_mb and PSUTIL_AVAILABLE:
+            rss_mb = driver_memory_mb(driver)
+            if rss_mb > self.max_memory_mb:
+                return f"메모리 {rss_mb:.0f}MB > {self.max_memory_mb:.0f}MB"
+
+        if len(self._recent) >= self.window:
+            baseline = statistics.median(self._baseline)
+            recent = statistics.median(self._recent)
+            if recent >= self.min_latency and recent > baseline * self.latency_factor:
+                return f"응답 지연 {recent:.2f}초 (초기 {baseline:.2f}초)"
+
+        return None
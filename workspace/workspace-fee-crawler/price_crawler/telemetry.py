@@ -0,0 +1,388 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+크롤링 텔레메트리
+실행 끝의 `소요 시간` 출력만으로는 시간이 어디에 쓰였는지 알 수 없으므로,
+작업(요금제 × 가입유형 등) 단위와 단계 단위 소요 시간을 구조화해 기록합니다.
+
+- 단계: driver_create, page_load, plan_list, plan_select, extract, paginate (크롤러별로 추가 가능)
+- 작업(task) 안에서 기록한 단계/재시도/바이트는 해당 작업에도 합산 (스레드별)
+- 이벤트는 JSON Lines로 기록: <carrier>_<run_id>.jsonl
+- 실행 종료 시 Prometheus textfile 기록: <carrier>_crawler.prom (node_exporter textfile collector용)
+- 이전 실행 요약(<carrier>_last_run.json)과 비교해 단계별 중앙값이 크게 늘어난 단계는 경고
+
+작성일: 2025-10-27
+파일명: telemetry.py
+"""
+
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 버퍼를 파일로 내보내는 간격 (이벤트 수)
+FLUSH_EVERY = 50
+
+# 이전 실행 대비 중앙값이 이 배수를 넘고 최소 증가량 이상이면 회귀로 경고
+REGRESSION_FACTOR = 2.0
+REGRESSION_MIN_SECONDS = 0.5
+
+METRIC_PREFIX = 'price_crawler'
+
+
+def _now() -> datetime:
+    return datetime.now(ZoneInfo('Asia/Seoul'))
+
+
+def _percentile(ordered: List[float], q: float) -> float:
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q))]
+
+
+def _label_value(value: Any) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels: Any) -> str:
+    return '{' + ','.join(f'{name}="{_label_value(value)}"' for name, value in labels.items()) + '}'
+
+
+class Task:
+    """task() 블록에서 반환되는 작업 기록 (rows/ok는 호출자가 설정 가능)"""
+
+    def __init__(self, name: str, labels: Dict[str, Any]):
+        self.name = name
+        self.labels = labels
+        self.started = time.perf_counter()
+        self.steps: Dict[str, float] = {}
+        self.retries = 0
+        self.bytes = 0
+        self.rows = 0
+        self.ok = True
+
+
+class StepTimer:
+    """순차 코드용 구간 타이머 - lap()마다 직전 lap 이후 시간을 단계로 기록"""
+
+    def __init__(self, telemetry: 'CrawlTelemetry', labels: Dict[str, Any]):
+        self.telemetry = telemetry
+        self.labels = labels
+        self._last = time.perf_counter()
+
+    def lap(self, step: str, ok: bool = True, **labels: Any) -> float:
+        """직전 lap(또는 생성) 이후 시간을 step으로 기록"""
+        now = time.perf_counter()
+        seconds = now - self._last
+        self._last = now
+        self.telemetry.record(step, seconds, ok, **{**self.labels, **labels})
+        return seconds
+
+    def reset(self):
+        """기록하지 않고 구간 시작점만 이동"""
+        self._last = time.perf_counter()
+
+
+class CrawlTelemetry:
+    """작업/단계별 소요 시간, 재시도, 바이트 기록"""
+
+    def __init__(self, carrier: str, output_dir: Optional[Path] = None, enabled: bool = True,
+                 run_id: Optional[str] = None):
+        """
+        Args:
+            carrier: 통신사 (SK, KT, LG)
+            output_dir: JSON Lines / Prometheus textfile 저장 디렉토리 (None이면 파일 기록 안 함)
+            enabled: False면 파일을 기록하지 않음 (요약 로그는 유지)
+            run_id: 실행 ID (기본: 시작 시각)
+        """
+        self.carrier = carrier
+        self.enabled = enabled and output_dir is not None
+        self.output_dir = Path(output_dir) if output_dir else None
+        self.run_id = run_id or _now().strftime('%Y%m%d_%H%M%S')
+
+        prefix = carrier.lower()
+        self.events_file = self.output_dir / f"{prefix}_{self.run_id}.jsonl" if self.output_dir else None
+        self.prom_file = self.output_dir / f"{prefix}_crawler.prom" if self.output_dir else None
+        self.last_run_file = self.output_dir / f"{prefix}_last_run.json" if self.output_dir else None
+
+        self.started = time.time()
+        self.finished = False
+
+        # {단계명: [소요 시간(초), ...]}, {단계명: 실패 횟수}, {단계명: 재시도 횟수}, {출처: 바이트}
+        self.durations: Dict[str, List[float]] = {}
+        self.failures: Dict[str, int] = {}
+        self.retries: Dict[str, int] = {}
+        self.bytes: Dict[str, int] = {}
+        self.tasks = {'ok': 0, 'failed': 0}
+        self.task_seconds = 0.0
+
+        self._events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._listeners: List[Callable[[str, str, float, bool], None]] = []
+
+    # ------------------------------------------------------------------
+    # 기록
+
+    def subscribe(self, listener: Callable[[str, str, float, bool], None]):
+        """단계/재시도 기록 구독 - listener(kind, step, seconds, ok), kind는 'step' 또는 'retry'
+
+        파일 기록 여부(enabled)와 관계없이 호출 (적응형 동시성 제어 등)
+        """
+        self._listeners.append(listener)
+
+    def _notify(self, kind: str, step: str, seconds: float, ok: bool):
+        for listener in self._listeners:
+            try:
+                listener(kind, step, seconds, ok)
+            except Exception as e:
+                logger.debug(f"텔레메트리 구독 콜백 오류: {e}")
+
+    def _current(self) -> Optional[Task]:
+        return getattr(self._local, 'task', None)
+
+    def _event(self, kind: str, **fields: Any):
+        if not self.enabled:
+            return
+        event = {'ts': round(time.time(), 3), 'run_id': self.run_id, 'carrier': self.carrier, 'type': kind}
+        event.update(fields)
+        with self._lock:
+            self._events.append(event)
+            flush = len(self._events) >= FLUSH_EVERY
+        if flush:
+            self.flush()
+
+    def record(self, step: str, seconds: float, ok: bool = True, **labels: Any):
+        """단계 소요 시간 기록"""
+        with self._lock:
+            self.durations.setdefault(step, []).append(seconds)
+            if not ok:
+                self.failures[step] = self.failures.get(step, 0) + 1
+        task = self._current()
+        if task is not None:
+            task.steps[step] = task.steps.get(step, 0.0) + seconds
+        self._notify('step', step, seconds, ok)
+        self._event('step', step=step, seconds=round(seconds, 4), ok=ok,
+                    task=task.name if task else None, labels=labels)
+
+    @contextmanager
+    def step(self, step: str, **labels: Any):
+        """블록 소요 시간을 단계로 기록 (예외 발생 시 실패로 기록 후 다시 발생)"""
+        started = time.perf_counter()
+        ok = True
+        try:
+            yield
+        except BaseException:
+            ok = False
+            raise
+        finally:
+            self.record(step, time.perf_counter() - started, ok, **labels)
+
+    def timer(self, **labels: Any) -> StepTimer:
+        """순차 구간 타이머"""
+        return StepTimer(self, labels)
+
+    @contextmanager
+    def task(self, name: str, **labels: Any):
+        """작업 단위 기록 - 블록 안의 단계/재시도/바이트를 작업에 합산"""
+        task = Task(name, labels)
+        previous = self._current()
+        self._local.task = task
+        try:
+            yield task
+        except BaseException:
+            task.ok = False
+            raise
+        finally:
+            self._local.task = previous
+            seconds = time.perf_counter() - task.started
+            with self._lock:
+                self.tasks['ok' if task.ok else 'failed'] += 1
+                self.task_seconds += seconds
+            self._event('task', task=name, seconds=round(seconds, 4), ok=task.ok, rows=task.rows,
+                        retries=task.retries, bytes=task.bytes,
+                        steps={step: round(value, 4) for step, value in task.steps.items()}, labels=labels)
+
+    def retry(self, step: str, count: int = 1):
+        """재시도 기록"""
+        with self._lock:
+            self.retries[step] = self.retries.get(step, 0) + count
+        task = self._current()
+        if task is not None:
+            task.retries += count
+        self._notify('retry', step, 0.0, False)
+        self._event('retry', step=step, count=count, task=task.name if task else None)
+
+    def add_rows(self, count: int):
+        """현재 작업의 수집 행 수 추가 (작업 밖에서는 무시)"""
+        task = self._current()
+        if task is not None:
+            task.rows += count
+
+    def add_bytes(self, count: int, source: str = 'html'):
+        """수신/처리 바이트 기록 (source: html, xhr, browser 등)"""
+        if not count:
+            return
+        with self._lock:
+            self.bytes[source] = self.bytes.get(source, 0) + int(count)
+        task = self._current()
+        if task is not None:
+            task.bytes += int(count)
+
+    # ------------------------------------------------------------------
+    # 출력
+
+    def flush(self):
+        """버퍼된 이벤트를 JSON Lines 파일에 추가"""
+        if not self.enabled:
+            return
+        with self._lock:
+            events, self._events = self._events, []
+        if not events:
+            return
+        try:
+            self.events_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.events_file, 'a', encoding='utf-8') as f:
+                for event in events:
+                    f.write(json.dumps(event, ensure_ascii=False, default=str))
+                    f.write('\n')
+        except Exception as e:
+            logger.warning(f"텔레메트리 이벤트 기록 실패: {e}")
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 통계"""
+        result = {}
+        with self._lock:
+            for step, values in sorted(self.durations.items()):
+                if not values:
+                    continue
+                ordered = sorted(values)
+                result[step] = {
+                    'count': len(values),
+                    'total': round(sum(values), 3),
+                    'p50': round(_percentile(ordered, 0.5), 3),
+                    'p95': round(_percentile(ordered, 0.95), 3),
+                    'max': round(ordered[-1], 3),
+                    'failures': self.failures.get(step, 0),
+                    'retries': self.retries.get(step, 0)
+                }
+        return result
+
+    def log_summary(self):
+        """단계별 통계 로그 (총 소요 시간 순)"""
+        elapsed = max(time.time() - self.started, 1e-9)
+        steps = sorted(self.summary().items(), key=lambda item: item[1]['total'], reverse=True)
+        for step, stats in steps:
+            logger.info(f"단계 [{step}] {stats['count']}회 - 합계 {stats['total']:.1f}초 ({stats['total'] / elapsed:.0%}), "
+                        f"중앙값 {stats['p50']:.2f}초, p95 {stats['p95']:.2f}초, 최대 {stats['max']:.2f}초, "
+                        f"실패 {stats['failures']}회, 재시도 {stats['retries']}회")
+        extra = set(self.retries) - set(self.durations)
+        for step in sorted(extra):
+            logger.info(f"재시도 [{step}] {self.retries[step]}회")
+
+    def _check_regressions(self, summary: Dict[str, Dict[str, Any]]):
+        """이전 실행 대비 단계별 중앙값 증가 경고"""
+        if not self.last_run_file or not self.last_run_file.exists():
+            return
+        try:
+            with open(self.last_run_file, 'r', encoding='utf-8') as f:
+                previous = json.load(f).get('steps', {})
+        except Exception as e:
+            logger.debug(f"이전 실행 요약 로드 실패: {e}")
+            return
+        for step, stats in summary.items():
+            before = previous.get(step, {}).get('p50')
+            if not before:
+                continue
+            if stats['p50'] > before * REGRESSION_FACTOR and stats['p50'] - before >= REGRESSION_MIN_SECONDS:
+                logger.warning(f"[{self.carrier}] 단계 '{step}' 중앙값 증가: {before:.2f}초 -> {stats['p50']:.2f}초 "
+                               f"(사이트 변경 여부 확인 필요)")
+
+    def _write_json(self, path: Path, data: Dict[str, Any]):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = path.with_suffix('.tmp')
+        with open(temp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        temp_file.replace(path)
+
+    def prometheus_text(self, summary: Dict[str, Dict[str, Any]], rows: Optional[int], status: str) -> str:
+        """Prometheus 텍스트 형식 지표"""
+        carrier = self.carrier
+        lines = [
+            f"# HELP {METRIC_PREFIX}_step_seconds 크롤링 단계별 소요 시간",
+            f"# TYPE {METRIC_PREFIX}_step_seconds summary",
+        ]
+        for step, stats in summary.items():
+            for quantile, key in (('0.5', 'p50'), ('0.95', 'p95')):
+                lines.append(f"{METRIC_PREFIX}_step_seconds{_labels(carrier=carrier, step=step, quantile=quantile)} {stats[key]}")
+            lines.append(f"{METRIC_PREFIX}_step_seconds_sum{_labels(carrier=carrier, step=step)} {stats['total']}")
+            lines.append(f"{METRIC_PREFIX}_step_seconds_count{_labels(carrier=carrier, step=step)} {stats['count']}")
+
+        lines += [f"# HELP {METRIC_PREFIX}_step_failures_total 실패로 끝난 단계 수",
+                  f"# TYPE {METRIC_PREFIX}_step_failures_total counter"]
+        lines += [f"{METRIC_PREFIX}_step_failures_total{_labels(carrier=carrier, step=step)} {count}"
+                  for step, count in sorted(self.failures.items())]
+
+        lines += [f"# HELP {METRIC_PREFIX}_retries_total 단계별 재시도 수",
+                  f"# TYPE {METRIC_PREFIX}_retries_total counter"]
+        lines += [f"{METRIC_PREFIX}_retries_total{_labels(carrier=carrier, step=step)} {count}"
+                  for step, count in sorted(self.retries.items())]
+
+        lines += [f"# HELP {METRIC_PREFIX}_bytes_total 수신/처리 바이트",
+                  f"# TYPE {METRIC_PREFIX}_bytes_total counter"]
+        lines += [f"{METRIC_PREFIX}_bytes_total{_labels(carrier=carrier, source=source)} {count}"
+                  for source, count in sorted(self.bytes.items())]
+
+        lines += [f"# HELP {METRIC_PREFIX}_tasks_total 작업 수",
+                  f"# TYPE {METRIC_PREFIX}_tasks_total counter"]
+        lines += [f"{METRIC_PREFIX}_tasks_total{_labels(carrier=carrier, status=key)} {count}"
+                  for key, count in self.tasks.items()]
+
+        lines += [f"# HELP {METRIC_PREFIX}_run_duration_seconds 실행 소요 시간",
+                  f"# TYPE {METRIC_PREFIX}_run_duration_seconds gauge",
+                  f"{METRIC_PREFIX}_run_duration_seconds{_labels(carrier=carrier)} {time.time() - self.started:.3f}"]
+        if rows is not None:
+            lines += [f"# HELP {METRIC_PREFIX}_rows 수집 행 수",
+                      f"# TYPE {METRIC_PREFIX}_rows gauge",
+                      f"{METRIC_PREFIX}_rows{_labels(carrier=carrier)} {rows}"]
+        lines += [f"# HELP {METRIC_PREFIX}_last_run_timestamp_seconds 마지막 실행 종료 시각",
+                  f"# TYPE {METRIC_PREFIX}_last_run_timestamp_seconds gauge",
+                  f"{METRIC_PREFIX}_last_run_timestamp_seconds{_labels(carrier=carrier, status=status)} {time.time():.0f}"]
+        return '\n'.join(lines) + '\n'
+
+    def finish(self, rows: Optional[int] = None, status: str = 'ok'):
+        """실행 종료 - 요약 로그, 실행 이벤트, Prometheus textfile, 실행 요약 기록 (한 번만)"""
+        if self.finished:
+            return
+        self.finished = True
+
+        summary = self.summary()
+        self.log_summary()
+        self._event('run', seconds=round(time.time() - self.started, 3), status=status, rows=rows,
+                    tasks=dict(self.tasks), bytes=dict(self.bytes), steps=summary)
+        self.flush()
+        if not self.enabled:
+            return
+
+        self._check_regressions(summary)
+        try:
+            self.prom_file.parent.mkdir(parents=True, exist_ok=True)
+            temp_file = self.prom_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                f.write(self.prometheus_text(summary, rows, status))
+            temp_file.replace(self.prom_file)
+            self._write_json(self.last_run_file, {
+                'run_id': self.run_id,
+                'finished_at': _now().isoformat(),
+                'status': status,
+                'rows': rows,
+                'steps': summary
+            })
+            logger.info(f"텔레메트리 저장: {self.events_file}, {self.prom_file}")
+        except Exception as e:
+            logger.warning(f"텔레메트리 저장 실패: {e}")
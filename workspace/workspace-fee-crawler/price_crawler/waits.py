@@ -0,0 +1,378 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+이벤트 기반 대기
+고정 time.sleep() 대신 페이지가 실제로 준비되었다는 신호를 기다립니다.
+
+- DOM 변경: MutationObserver로 대상 목록이 바뀌고 잠잠해질 때까지 대기
+- 네트워크 유휴: 문서 로드 전에 CDP로 주입한 XHR/fetch 카운터가 0이 될 때까지 대기
+- 요소 교체(staleness), 임의 조건(JS/파이썬)
+- 단계(step)별 타임아웃, 단계별 실제 대기 시간을 기록해 기본값 조정에 사용
+- enabled=False면 단계별로 지정한 기존 고정 대기(fallback)로 동작
+
+작성일: 2025-10-27
+파일명: waits.py
+"""
+
+import json
+import time
+import uuid
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+logger = logging.getLogger(__name__)
+
+# 단계별 기록 보관 개수 (실행 간 누적)
+MAX_SAMPLES_PER_STEP = 500
+
+# 문서 로드 전에 주입하는 XHR/fetch 진행 카운터
+NETWORK_TRACKER_SCRIPT = """
+(function() {
+    if (window.__crawlerNet) return;
+    var net = window.__crawlerNet = {pending: 0, last: Date.now()};
+    function done() {
+        net.pending = Math.max(0, net.pending - 1);
+        net.last = Date.now();
+    }
+    var send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        net.pending++;
+        net.last = Date.now();
+        this.addEventListener('loadend', done);
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function() {
+            net.pending++;
+            net.last = Date.now();
+            return originalFetch.apply(this, arguments).then(
+                function(r) { done(); return r; },
+                function(e) { done(); throw e; }
+            );
+        };
+    }
+})();
+"""
+
+# 네트워크 유휴 여부 (arguments[0] = 유휴 판단 시간 ms)
+# 카운터가 없으면 jQuery.active와 리소스 타이밍 항목 수 변화로 판단
+NETWORK_IDLE_SCRIPT = """
+    var idleMs = arguments[0];
+    if (document.readyState !== 'complete') return false;
+    var jq = (typeof jQuery === 'undefined') ? 0 : jQuery.active;
+    var net = window.__crawlerNet;
+    if (net) {
+        return net.pending === 0 && jq === 0 && Date.now() - net.last >= idleMs;
+    }
+    var count = performance.getEntriesByType('resource').length;
+    if (window.__crawlerResCount !== count) {
+        window.__crawlerResCount = count;
+        window.__crawlerResAt = Date.now();
+        return false;
+    }
+    return jq === 0 && Date.now() - window.__crawlerResAt >= idleMs;
+"""
+
+# 대상 선택자 내부 변경 감시 시작 (arguments[0] = 토큰, arguments[1] = 선택자)
+MUTATION_START_SCRIPT = """
+    var token = arguments[0], selector = arguments[1];
+    var registry = window.__crawlerMutations = window.__crawlerMutations || {};
+    var state = registry[token] = {count: 0, last: 0, observer: null};
+
+    function touches(node) {
+        if (!node) return false;
+        var el = node.nodeType === 1 ? node : node.parentElement;
+        if (!el) return false;
+        return !!(el.closest(selector) || (el.querySelector && el.querySelector(selector)));
+    }
+
+    state.observer = new MutationObserver(function(records) {
+        for (var i = 0; i < records.length; i++) {
+            var record = records[i];
+            var target = record.target.nodeType === 1 ? record.target : record.target.parentElement;
+            var hit = target && target.closest(selector);
+            if (!hit) {
+                var nodes = Array.prototype.slice.call(record.addedNodes)
+                    .concat(Array.prototype.slice.call(record.removedNodes));
+                hit = nodes.some(touches);
+            }
+            if (hit) {
+                state.count++;
+                state.last = Date.now();
+            }
+        }
+    });
+    state.observer.observe(document.documentElement,
+                           {childList: true, subtree: true, characterData: true, attributes: true});
+    return true;
+"""
+
+# 감시 상태 조회: -1 = 감시 정보 없음(페이지 이동), null = 아직 변경 없음, 숫자 = 마지막 변경 후 경과 ms
+MUTATION_POLL_SCRIPT = """
+    var registry = window.__crawlerMutations;
+    var state = registry && registry[arguments[0]];
+    if (!state) return -1;
+    if (!state.count) return null;
+    return Date.now() - state.last;
+"""
+
+MUTATION_STOP_SCRIPT = """
+    var registry = window.__crawlerMutations;
+    var state = registry && registry[arguments[0]];
+    if (state) {
+        state.observer.disconnect();
+        delete registry[arguments[0]];
+    }
+"""
+
+
+def install_network_tracker(driver):
+    """XHR/fetch 카운터를 이후 모든 문서와 현재 문서에 주입 (드라이버 생성 직후 호출)"""
+    try:
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': NETWORK_TRACKER_SCRIPT})
+        driver.execute_script(NETWORK_TRACKER_SCRIPT)
+    except Exception as e:
+        logger.debug(f"네트워크 카운터 주입 실패: {e}")
+
+
+class MutationWatch:
+    """mutation() 블록에서 반환되는 핸들 (동작이 일어나지 않았으면 skip()으로 대기 생략)"""
+
+    def __init__(self):
+        self.skipped = False
+
+    def skip(self):
+        """블록 종료 시 대기하지 않음"""
+        self.skipped = True
+
+
+class StepWaiter:
+    """단계별 이벤트 기반 대기와 대기 시간 기록"""
+
+    def __init__(self, timeouts: Optional[Dict[str, float]] = None, default_timeout: float = 10,
+                 enabled: bool = True, stats_file: Optional[Path] = None, poll_interval: float = 0.1):
+        """
+        Args:
+            timeouts: 단계별 타임아웃(초) {단계명: 초}
+            default_timeout: 지정되지 않은 단계의 타임아웃(초)
+            enabled: False면 이벤트 대기 대신 단계별 fallback 고정 대기
+            stats_file: 단계별 대기 시간 기록 파일 (JSON, 실행 간 누적)
+            poll_interval: 조건 확인 간격(초)
+        """
+        self.timeouts = dict(timeouts or {})
+        self.default_timeout = default_timeout
+        self.enabled = enabled
+        self.stats_file = Path(stats_file) if stats_file else None
+        self.poll_interval = poll_interval
+
+        # {단계명: [대기 시간(초), ...]}, {단계명: 타임아웃 횟수}
+        self.samples: Dict[str, List[float]] = {}
+        self.timed_out: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def timeout_for(self, step: str) -> float:
+        """단계 타임아웃"""
+        return self.timeouts.get(step, self.default_timeout)
+
+    # ------------------------------------------------------------------
+    # 대기 시간 기록
+
+    def _load(self):
+        """이전 실행 기록 로드"""
+        if not self.stats_file or not self.stats_file.exists():
+            return
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.samples = {step: list(values) for step, values in data.get('samples', {}).items()}
+            self.timed_out = dict(data.get('timed_out', {}))
+        except Exception as e:
+            logger.warning(f"대기 기록 로드 실패: {e}")
+
+    def record(self, step: str, seconds: float, timed_out: bool = False):
+        """단계 대기 시간 기록"""
+        with self._lock:
+            values = self.samples.setdefault(step, [])
+            values.append(round(seconds, 3))
+            if len(values) > MAX_SAMPLES_PER_STEP:
+                del values[:len(values) - MAX_SAMPLES_PER_STEP]
+            if timed_out:
+                self.timed_out[step] = self.timed_out.get(step, 0) + 1
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """단계별 통계 (suggested_timeout = p95의 2배, 최소 1초)"""
+        result = {}
+        with self._lock:
+            for step, values in sorted(self.samples.items()):
+                if not values:
+                    continue
+                ordered = sorted(values)
+                p50 = ordered[len(ordered) // 2]
+                p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+                result[step] = {
+                    'count': len(values),
+                    'timeouts': self.timed_out.get(step, 0),
+                    'mean': round(sum(values) / len(values), 3),
+                    'p50': p50,
+                    'p95': p95,
+                    'max': ordered[-1],
+                    'timeout': self.timeout_for(step),
+                    'suggested_timeout': round(max(1.0, p95 * 2), 1)
+                }
+        return result
+
+    def log_summary(self):
+        """단계별 통계 로그"""
+        for step, stats in self.summary().items():
+            logger.info(f"대기 [{step}] {stats['count']}회 - 중앙값 {stats['p50']:.2f}초, p95 {stats['p95']:.2f}초, "
+                        f"최대 {stats['max']:.2f}초, 타임아웃 {stats['timeouts']}회 (제안 타임아웃 {stats['suggested_timeout']}초)")
+
+    def save(self):
+        """대기 기록 저장 (원자적 교체)"""
+        if not self.stats_file:
+            return
+        try:
+            self.stats_file.parent.mkdir(parents=True, exist_ok=True)
+            with self._lock:
+                data = {'samples': self.samples, 'timed_out': self.timed_out}
+            data['summary'] = self.summary()
+            temp_file = self.stats_file.with_suffix('.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=1)
+            temp_file.replace(self.stats_file)
+        except Exception as e:
+            logger.warning(f"대기 기록 저장 실패: {e}")
+
+    # ------------------------------------------------------------------
+    # 대기
+
+    def _poll(self, driver, step: str, predicate: Callable[[Any], Any], timeout: Optional[float] = None) -> bool:
+        """predicate가 참이 될 때까지 대기하고 기록 (타임아웃 시 False)"""
+        timeout = self.timeout_for(step) if timeout is None else timeout
+
+        def safe(d):
+            try:
+                return predicate(d)
+            except Exception:
+                # 페이지 이동 중 스크립트 실패 등은 다음 확인에서 다시 시도
+                return False
+
+        start = time.monotonic()
+        try:
+            WebDriverWait(driver, timeout, poll_frequency=self.poll_interval).until(safe)
+            self.record(step, time.monotonic() - start)
+            return True
+        except TimeoutException:
+            self.record(step, time.monotonic() - start, timed_out=True)
+            logger.debug(f"대기 타임아웃 [{step}] {timeout}초")
+            return False
+
+    def until(self, driver, step: str, condition: Union[str, Callable[[Any], Any]],
+              fallback: Optional[float] = 1, timeout: Optional[float] = None) -> bool:
+        """조건 대기 (condition: 참/거짓을 반환하는 JS 문자열 또는 driver를 받는 함수)
+
+        fallback이 None이면 고정 대기 모드에서도 조건을 확인합니다 (원래부터 조건 확인이던 단계).
+        """
+        if not self.enabled and fallback is not None:
+            time.sleep(fallback)
+            return True
+        if isinstance(condition, str):
+            script = condition
+            return self._poll(driver, step, lambda d: d.execute_script(script), timeout)
+        return self._poll(driver, step, condition, timeout)
+
+    def network_idle(self, driver, step: str, fallback: float = 1, idle: float = 0.5,
+                     timeout: Optional[float] = None) -> bool:
+        """문서 로드 완료 후 XHR/fetch가 idle초 동안 없을 때까지 대기"""
+        if not self.enabled:
+            time.sleep(fallback)
+            return True
+        idle_ms = int(idle * 1000)
+        return self._poll(driver, step, lambda d: d.execute_script(NETWORK_IDLE_SCRIPT, idle_ms), timeout)
+
+    def stale(self, driver, step: str, element, fallback: float = 1, timeout: Optional[float] = None) -> bool:
+        """요소가 DOM에서 교체/제거될 때까지 대기"""
+        if not self.enabled:
+            time.sleep(fallback)
+            return True
+        return self._poll(driver, step, EC.staleness_of(element), timeout)
+
+    @contextmanager
+    def mutation(self, driver, step: str, selector: str, fallback: float = 1, quiet: float = 0.3,
+                 timeout: Optional[float] = None):
+        """with 블록 안의 동작 후 선택자 내부가 바뀌고 quiet초 동안 잠잠해질 때까지 대기
+
+        페이지가 새로 로드되면 감시 정보가 사라지므로 네트워크 유휴까지 이어서 대기합니다.
+        블록 안에서 동작이 일어나지 않았으면 watch.skip()으로 대기를 생략합니다.
+
+        Example:
+            with waiter.mutation(driver, 'sort', '#prodList', fallback=2) as watch:
+                if not driver.execute_script(click_sort_script):
+                    watch.skip()
+        """
+        watch = MutationWatch()
+
+        if not self.enabled:
+            yield watch
+            if not watch.skipped:
+                time.sleep(fallback)
+            return
+
+        token = uuid.uuid4().hex
+        try:
+            driver.execute_script(MUTATION_START_SCRIPT, token, selector)
+        except Exception as e:
+            # 감시를 걸 수 없으면 네트워크 유휴로 대체
+            logger.debug(f"DOM 변경 감시 실패 [{step}]: {e}")
+            yield watch
+            if not watch.skipped:
+                self.network_idle(driver, step, fallback, timeout=timeout)
+            return
+
+        try:
+            yield watch
+        except Exception:
+            watch.skip()
+            raise
+        finally:
+            if watch.skipped:
+                try:
+                    driver.execute_script(MUTATION_STOP_SCRIPT, token)
+                except Exception:
+                    pass
+
+        if watch.skipped:
+            return
+
+        quiet_ms = int(quiet * 1000)
+        navigated = []
+
+        def settled(d):
+            elapsed = d.execute_script(MUTATION_POLL_SCRIPT, token)
+            if elapsed == -1:
+                navigated.append(True)
+                return True
+            return elapsed is not None and elapsed >= quiet_ms
+
+        start = time.monotonic()
+        self._poll(driver, step, settled, timeout)
+
+        if navigated:
+            total = self.timeout_for(step) if timeout is None else timeout
+            remaining = max(0.5, total - (time.monotonic() - start))
+            self.network_idle(driver, f"{step}:reload", fallback, timeout=remaining)
+        else:
+            try:
+                driver.execute_script(MUTATION_STOP_SCRIPT, token)
+            except Exception:
+                pass
@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+작업 분할 / 작업 훔치기 큐
+(그룹, 인덱스 구간) 형태의 작업 공간을 워커 수만큼 나누고, 자기 구간을 먼저 끝낸 워커가
+가장 많이 남은 워커의 구간 뒤쪽 절반을 가져가도록 합니다.
+
+- 그룹(예: KT 가입유형)마다 [start, end) 구간을 워커 수에 맞춰 분할
+- 워커는 자기 구간을 앞에서부터 처리 (같은 그룹을 연속 처리해 선택 변경 최소화)
+- 자기 구간이 비면 남은 작업이 가장 많은 워커에게서 대기 구간 또는 진행 중 구간의 뒤쪽 절반을 가져감
+
+작성일: 2025-10-27
+파일명: work_partitions.py
+"""
+
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Partition:
+    """그룹 내 인덱스 구간 [start, end)"""
+    group: str
+    start: int
+    end: int
+
+    def __len__(self) -> int:
+        return max(0, self.end - self.start)
+
+
+class StealingQueue:
+    """워커별 구간 큐 + 작업 훔치기"""
+
+    def __init__(self, ranges: Sequence[Tuple[str, int, int]], workers: int, min_split: int = 2):
+        """
+        Args:
+            ranges: [(그룹, start, end)] - 처리 순서대로
+            workers: 워커 수
+            min_split: 진행 중 구간을 나눌 최소 남은 개수 (이보다 작으면 훔치지 않음)
+        """
+        self.workers = max(1, workers)
+        self.min_split = max(2, min_split)
+        self._queues: List[Deque[Partition]] = [deque() for _ in range(self.workers)]
+        self._lock = threading.Lock()
+        self.stats = {'steals': 0, 'stolen_items': 0}
+
+        partitions = self._split(ranges)
+        # 연속 구간을 워커에 고르게 배정 (각 워커가 앞쪽 그룹부터 갖도록 순서 유지)
+        for i, partition in enumerate(partitions):
+            self._queues[i % self.workers].append(partition)
+
+    def _split(self, ranges: Sequence[Tuple[str, int, int]]) -> List[Partition]:
+        """전체 작업량을 기준으로 그룹별 구간을 워커 수만큼 분할"""
+        total = sum(max(0, end - start) for _, start, end in ranges)
+        if not total:
+            return []
+
+        partitions = []
+        for group, start, end in ranges:
+            size = end - start
+            if size <= 0:
+                continue
+            # 그룹 크기 비율만큼 조각 수 배정 (최소 1)
+            pieces = max(1, min(size, round(self.workers * size / total)))
+            step, extra = divmod(size, pieces)
+            cursor = start
+            for piece in range(pieces):
+                length = step + (1 if piece < extra else 0)
+                partitions.append(Partition(group, cursor, cursor + length))
+                cursor += length
+        return partitions
+
+    def next(self, worker: int) -> Optional[Tuple[str, int]]:
+        """워커의 다음 작업 (그룹, 인덱스), 남은 작업이 없으면 None"""
+        with self._lock:
+            queue = self._queues[worker]
+            while queue and not len(queue[0]):
+                queue.popleft()
+            if not queue and not self._steal(worker):
+                return None
+
+            partition = queue[0]
+            item = (partition.group, partition.start)
+            partition.start += 1
+            return item
+
+    def _steal(self, thief: int) -> bool:
+        """남은 작업이 가장 많은 워커에게서 구간을 가져옴 (락 보유 상태에서 호출)"""
+        victim = max(range(self.workers), key=lambda w: self._remaining(w) if w != thief else -1)
+        if victim == thief or not self._remaining(victim):
+            return False
+
+        queue = self._queues[victim]
+        if len(queue) > 1:
+            # 대기 중인 마지막 구간을 통째로 가져감
+            stolen = queue.pop()
+        else:
+            current = queue[0]
+            if len(current) < self.min_split:
+                return False
+            middle = current.start + len(current) // 2
+            stolen = Partition(current.group, middle, current.end)
+            current.end = middle
+
+        self._queues[thief].append(stolen)
+        self.stats['steals'] += 1
+        self.stats['stolen_items'] += len(stolen)
+        logger.debug(f"워커 {thief}: 워커 {victim}의 {stolen.group} [{stolen.start}, {stolen.end}) 가져옴")
+        return True
+
+    def _remaining(self, worker: int) -> int:
+        return sum(len(p) for p in self._queues[worker])
+
+    def remaining(self) -> int:
+        """전체 남은 작업 수"""
+        with self._lock:
+            return sum(self._remaining(w) for w in range(self.workers))
+
+    def assignments(self) -> Dict[int, List[Tuple[str, int, int]]]:
+        """워커별 남은 구간 (로그용)"""
+        with self._lock:
+            return {w: [(p.group, p.start, p.end) for p in q if len(p)] for w, q in enumerate(self._queues)}
@@ -0,0 +1,441 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+분산 작업 큐 (SQLite 파일)
+작업 목록을 한 프로세스 메모리와 체크포인트 인덱스 대신 공유 SQLite 파일에 두고,
+여러 머신/컨테이너의 워커가 임대(lease)로 작업을 나눠 가져가도록 합니다.
+
+- 작업: 키 + JSON 페이로드, 상태 pending → leased → done / failed
+- 임대: 워커가 작업을 가져가면 lease_seconds 동안 소유, 하트비트로 연장
+  (워커가 죽어 임대가 만료되면 다른 워커가 다시 가져감)
+- 재시도: 임대할 때마다 attempts 증가, max_attempts에 도달하면 failed
+- 결과: 작업 완료와 같은 트랜잭션에 수집 행을 저장 (작업당 한 번만 반영, 마지막에 병합)
+- 클레임: 요금제 수집/작업 등록(seed)과 결과 병합(merge)은 한 워커만 수행
+- 공유 디렉토리(NFS 등)에서도 동작하도록 롤백 저널 모드 사용 (WAL은 네트워크 파일시스템 미지원)
+
+작성일: 2025-10-27
+파일명: work_queue.py
+"""
+
+import os
+import json
+import time
+import socket
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+STATUS_PENDING = 'pending'
+STATUS_LEASED = 'leased'
+STATUS_DONE = 'done'
+STATUS_FAILED = 'failed'
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key TEXT PRIMARY KEY,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    owner TEXT,
+    lease_until REAL,
+    rows INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, lease_until);
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    owner TEXT,
+    rows TEXT NOT NULL,
+    created_at REAL
+);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY,
+    value TEXT,
+    owner TEXT,
+    until REAL
+);
+"""
+
+
+def default_worker_id() -> str:
+    """워커 식별자 (호스트명-PID)"""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+@dataclass
+class Lease:
+    """임대한 작업"""
+    key: str
+    payload: Any
+    attempts: int
+
+
+class WorkQueue:
+    """SQLite 파일 기반 작업 큐"""
+
+    def __init__(self, path, worker_id: Optional[str] = None,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS,
+                 max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+        """
+        Args:
+            path: 큐 파일 경로 (여러 머신이 공유하려면 공유 디렉토리에 둠)
+            worker_id: 워커 식별자 (기본: 호스트명-PID)
+            lease_seconds: 임대 유지 시간(초) - 하트비트 없이 이 시간이 지나면 다른 워커가 가져감
+            max_attempts: 작업당 최대 시도 횟수
+        """
+        self.path = Path(path)
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.executescript(SCHEMA)
+        finally:
+            conn.close()
+
+        # 이 워커의 통계
+        self.stats = {'leased': 0, 'completed': 0, 'failed': 0, 'rows': 0}
+        self._stats_lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=60, isolation_level=None)
+        conn.execute('PRAGMA busy_timeout = 60000')
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 트랜잭션 (BEGIN IMMEDIATE로 다른 워커와 직렬화)"""
+        conn = self._connect()
+        try:
+            conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield conn
+            except BaseException:
+                conn.execute('ROLLBACK')
+                raise
+            conn.execute('COMMIT')
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # 작업 등록 / 임대
+
+    def enqueue(self, items: Iterable[Tuple[str, Any]]) -> int:
+        """작업 등록 (이미 있는 키는 무시)
+
+        Returns:
+            새로 등록한 작업 수
+        """
+        now = time.time()
+        rows = [(key, json.dumps(payload, ensure_ascii=False), now) for key, payload in items]
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany("INSERT OR IGNORE INTO tasks (key, payload, updated_at) VALUES (?, ?, ?)", rows)
+            return conn.total_changes - before
+
+    def lease(self, limit: int = 1) -> List[Lease]:
+        """대기 중이거나 임대가 만료된 작업 임대 (없으면 빈 목록)"""
+        now = time.time()
+        with self._transaction() as conn:
+            # 시도 횟수를 다 쓴 만료 임대는 실패 처리
+            conn.execute(
+                "UPDATE tasks SET status = ?, owner = NULL, error = COALESCE(error, '임대 만료'), updated_at = ? "
+                "WHERE status = ? AND lease_until < ? AND attempts >= ?",
+                (STATUS_FAILED, now, STATUS_LEASED, now, self.max_attempts)
+            )
+            rows = conn.execute(
+                "SELECT key, payload, attempts FROM tasks "
+                "WHERE (status = ? OR (status = ? AND lease_until < ?)) AND attempts < ? "
+                "ORDER BY attempts, rowid LIMIT ?",
+                (STATUS_PENDING, STATUS_LEASED, now, self.max_attempts, limit)
+            ).fetchall()
+            leases = []
+            for key, payload, attempts in rows:
+                conn.execute(
+                    "UPDATE tasks SET status = ?, owner = ?, lease_until = ?, attempts = attempts + 1, updated_at = ? "
+                    "WHERE key = ?",
+                    (STATUS_LEASED, self.worker_id, now + self.lease_seconds, now, key)
+                )
+                leases.append(Lease(key, json.loads(payload), attempts + 1))
+        if leases:
+            self._count('leased', len(leases))
+        return leases
+
+    def heartbeat(self, keys: Iterable[str]) -> int:
+        """이 워커가 임대 중인 작업의 임대 연장
+
+        Returns:
+            연장한 작업 수 (다른 워커에게 넘어간 작업은 제외)
+        """
+        keys = list(keys)
+        if not keys:
+            return 0
+        now = time.time()
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "UPDATE tasks SET lease_until = ?, updated_at = ? WHERE key = ? AND owner = ? AND status = ?",
+                [(now + self.lease_seconds, now, key, self.worker_id, STATUS_LEASED) for key in keys]
+            )
+            return conn.total_changes - before
+
+    def complete(self, key: str, rows: List[Dict[str, Any]]) -> bool:
+        """작업 완료 + 수집 행 저장 (같은 트랜잭션)
+
+        Returns:
+            반영 여부 (다른 워커가 이미 완료했으면 False)
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            status = conn.execute("SELECT status FROM tasks WHERE key = ?", (key,)).fetchone()
+            if status is None or status[0] == STATUS_DONE:
+                return False
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, owner, rows, created_at) VALUES (?, ?, ?, ?)",
+                (key, self.worker_id, json.dumps(rows, ensure_ascii=False), now)
+            )
+            conn.execute(
+                "UPDATE tasks SET status = ?, owner = ?, lease_until = NULL, rows = ?, error = NULL, updated_at = ? "
+                "WHERE key = ?",
+                (STATUS_DONE, self.worker_id, len(rows), now, key)
+            )
+        self._count('completed')
+        self._count('rows', len(rows))
+        return True
+
+    def fail(self, key: str, error: str = '') -> str:
+        """작업 실패 (시도 횟수가 남았으면 다시 대기, 아니면 failed)
+
+        Returns:
+            바뀐 상태
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute("SELECT attempts, status, owner FROM tasks WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] == STATUS_DONE or row[2] != self.worker_id:
+                return row[1] if row else STATUS_FAILED
+            status = STATUS_FAILED if row[0] >= self.max_attempts else STATUS_PENDING
+            conn.execute(
+                "UPDATE tasks SET status = ?, owner = NULL, lease_until = NULL, error = ?, updated_at = ? WHERE key = ?",
+                (status, error[:500], now, key)
+            )
+        if status == STATUS_FAILED:
+            self._count('failed')
+        return status
+
+    def reset_failed(self) -> int:
+        """실패 작업을 다시 대기 상태로 (시도 횟수 초기화)"""
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.execute("UPDATE tasks SET status = ?, attempts = 0, error = NULL, updated_at = ? WHERE status = ?",
+                         (STATUS_PENDING, time.time(), STATUS_FAILED))
+            return conn.total_changes - before
+
+    # ------------------------------------------------------------------
+    # 상태 / 결과
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수"""
+        conn = self._connect()
+        try:
+            counts = {STATUS_PENDING: 0, STATUS_LEASED: 0, STATUS_DONE: 0, STATUS_FAILED: 0}
+            for status, count in conn.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status"):
+                counts[status] = count
+            return counts
+        finally:
+            conn.close()
+
+    def drained(self) -> bool:
+        """남은 작업(대기/임대 중)이 없으면 True"""
+        counts = self.counts()
+        return counts[STATUS_PENDING] == 0 and counts[STATUS_LEASED] == 0
+
+    def results(self) -> Iterator[Dict[str, Any]]:
+        """완료된 작업의 수집 행 (작업 등록 순서)"""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "SELECT r.rows FROM results r JOIN tasks t ON t.key = r.key "
+                "WHERE t.status = ? ORDER BY t.rowid", (STATUS_DONE,)
+            )
+            for (rows,) in cursor:
+                yield from json.loads(rows)
+        finally:
+            conn.close()
+
+    def failures(self) -> List[Tuple[str, str]]:
+        """실패 작업 (키, 오류)"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT key, COALESCE(error, '') FROM tasks WHERE status = ? ORDER BY rowid",
+                                (STATUS_FAILED,)).fetchall()
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # 메타 / 클레임
+
+    def get_meta(self, name: str) -> Optional[str]:
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE name = ?", (name,)).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def set_meta(self, name: str, value: str):
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT INTO meta (name, value) VALUES (?, ?) ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+                (name, value)
+            )
+
+    def claim(self, name: str, ttl: float, unless: Optional[str] = None) -> bool:
+        """한 워커만 수행할 단계 클레임 (다른 워커의 클레임이 유효하면 False, 만료됐으면 가져옴)
+
+        Args:
+            unless: 이 메타 값이 설정되어 있으면 클레임하지 않음 (단계 완료 표시 - 확인과 클레임을 같은 트랜잭션에서)
+        """
+        now = time.time()
+        claim_name = f"claim:{name}"
+        with self._transaction() as conn:
+            if unless:
+                done = conn.execute("SELECT value FROM meta WHERE name = ?", (unless,)).fetchone()
+                if done and done[0]:
+                    return False
+            row = conn.execute("SELECT owner, until FROM meta WHERE name = ?", (claim_name,)).fetchone()
+            if row and row[0] != self.worker_id and row[1] and row[1] > now:
+                return False
+            conn.execute(
+                "INSERT INTO meta (name, owner, until) VALUES (?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET owner = excluded.owner, until = excluded.until",
+                (claim_name, self.worker_id, now + ttl)
+            )
+            return True
+
+    def release_claim(self, name: str):
+        """클레임 해제"""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM meta WHERE name = ? AND owner = ?", (f"claim:{name}", self.worker_id))
+
+    def _count(self, name: str, value: int = 1):
+        with self._stats_lock:
+            self.stats[name] += value
+
+    def summary(self) -> str:
+        """통계 문자열"""
+        counts = self.counts()
+        return (f"큐 완료 {counts[STATUS_DONE]}개, 대기 {counts[STATUS_PENDING]}개, 임대 중 {counts[STATUS_LEASED]}개, "
+                f"실패 {counts[STATUS_FAILED]}개 | 이 워커({self.worker_id}) 완료 {self.stats['completed']}개, "
+                f"수집 {self.stats['rows']:,}행")
+
+
+class LeaseHeartbeat:
+    """임대 중인 작업을 주기적으로 연장하는 백그라운드 스레드"""
+
+    def __init__(self, queue: WorkQueue, interval: Optional[float] = None):
+        """
+        Args:
+            queue: 작업 큐
+            interval: 연장 주기(초, 기본: 임대 시간의 1/3)
+        """
+        self.queue = queue
+        self.interval = interval or max(1.0, queue.lease_seconds / 3)
+        self._keys: Set[str] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def hold(self, key: str):
+        with self._lock:
+            self._keys.add(key)
+
+    def drop(self, key: str):
+        with self._lock:
+            self._keys.discard(key)
+
+    def start(self) -> 'LeaseHeartbeat':
+        self._thread = threading.Thread(target=self._run, name='lease-heartbeat', daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            with self._lock:
+                keys = list(self._keys)
+            try:
+                self.queue.heartbeat(keys)
+            except sqlite3.Error as e:
+                logger.warning(f"임대 연장 실패: {e}")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(5)
+
+
+def run_queue_worker(queue: WorkQueue, handler: Callable[[Lease], Optional[List[Dict[str, Any]]]],
+                     threads: int = 1, poll: float = 5,
+                     on_progress: Optional[Callable[[Lease, bool], None]] = None) -> Dict[str, int]:
+    """큐가 빌 때까지 작업 처리
+
+    Args:
+        queue: 작업 큐
+        handler: 작업 처리 함수 - 수집 행 목록 반환, 실패면 None 또는 예외
+        threads: 동시 처리 스레드 수
+        poll: 다른 워커의 임대 작업만 남았을 때 재확인 주기(초, 임대 만료 시 가져옴)
+        on_progress: 작업 하나 처리 후 호출 (lease, 성공 여부)
+
+    Returns:
+        이 워커의 통계
+    """
+    heartbeat = LeaseHeartbeat(queue).start()
+
+    def _loop():
+        while True:
+            leases = queue.lease(1)
+            if not leases:
+                if queue.drained():
+                    return
+                # 다른 워커가 처리 중 - 그 워커가 죽으면 임대 만료 후 가져옴
+                time.sleep(poll)
+                continue
+
+            lease = leases[0]
+            heartbeat.hold(lease.key)
+            ok = False
+            try:
+                rows = handler(lease)
+                if rows is None:
+                    queue.fail(lease.key, '수집 실패')
+                else:
+                    queue.complete(lease.key, rows)
+                    ok = True
+            except Exception as e:
+                logger.error(f"작업 처리 오류 [{lease.key}]: {e}")
+                queue.fail(lease.key, str(e))
+            finally:
+                heartbeat.drop(lease.key)
+            if on_progress:
+                on_progress(lease, ok)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, threads)) as executor:
+            for future in [executor.submit(_loop) for _ in range(max(1, threads))]:
+                future.result()
+    finally:
+        heartbeat.stop()
+    return dict(queue.stats)
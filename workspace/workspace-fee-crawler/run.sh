@@ -72,10 +72,8 @@ run_crawlers() {
             python3 price_crawler/lg_crawler.py
             ;;
         4)
-            echo -e "${BLUE}전체 크롤러 실행 중...${NC}"
-            python3 price_crawler/kt_crawler.py
-            python3 price_crawler/sk_crawler.py
-            python3 price_crawler/lg_crawler.py
+            echo -e "${BLUE}전체 크롤러 동시 실행 중...${NC}"
+            python3 price_crawler/crawl_scheduler.py
             ;;
         *)
             echo -e "${RED}잘못된 선택${NC}"
@@ -86,8 +84,8 @@ run_crawlers() {
 # 2) 전체 데이터 업데이트 크롤러
 run_all_crawler() {
     activate_venv
-    echo -e "${BLUE}전체 데이터 업데이트 크롤러 실행 중...${NC}"
-    python3 price_crawler/kt_crawler.py && python3 price_crawler/sk_crawler.py && python3 price_crawler/lg_crawler.py
+    echo -e "${BLUE}전체 데이터 업데이트 크롤러 실행 중 (KT/SK/LG 동시)...${NC}"
+    python3 price_crawler/crawl_scheduler.py
 }
 
 # 3) OCR 실행
@@ -133,8 +131,8 @@ run_full_pipeline() {
     read -p "계속하시겠습니까? (y/n): " confirm
 
     if [[ $confirm == [yY] ]]; then
-        echo -e "${GREEN}📍 Step 1/3: 크롤러 실행${NC}"
-        python3 price_crawler/kt_crawler.py && python3 price_crawler/sk_crawler.py && python3 price_crawler/lg_crawler.py
+        echo -e "${GREEN}📍 Step 1/3: 크롤러 실행 (KT/SK/LG 동시)${NC}"
+        python3 price_crawler/crawl_scheduler.py
 
         echo ""
         echo -e "${GREEN}📍 Step 2/3: 머지 & 업로드${NC}"
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+KT prodList 파서 벤치마크
+저장된 prodList HTML로 제품별 정규식 방식(이전)과 단일 패스 토큰 파서(현재)의
+처리량(제품/초)을 비교하고, 두 방식의 추출 결과가 같은지 확인합니다.
+
+사용법:
+    # prodList HTML 저장 (한 번만, 지원금 페이지 기본 목록)
+    python scripts/benchmark/bench_kt_parser.py --record --html kt_prodlist.html
+
+    # 벤치마크 (여러 파일 가능)
+    python scripts/benchmark/bench_kt_parser.py --html kt_prodlist.html --repeat 50
+
+    # 저장된 HTML이 없을 때: 합성 목록으로 측정
+    python scripts/benchmark/bench_kt_parser.py --synthetic 500
+"""
+import re
+import sys
+import time
+import random
+import argparse
+import statistics
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from price_crawler.kt_parser import parse_product_list, detect_manufacturer, detect_network_type
+
+
+def legacy_parse(html_content):
+    """이전 방식: 제품마다 HTML을 잘라 필드별 re.search 실행"""
+    products = []
+    li_starts = [(m.start(), m.group(1)) for m in re.finditer(r'<li cd="([^"]+)">', html_content)]
+
+    for i, (start_pos, cd) in enumerate(li_starts):
+        if i < len(li_starts) - 1:
+            end_pos = li_starts[i + 1][0]
+        else:
+            end_match = html_content.find('</ul>', start_pos)
+            end_pos = end_match if end_match > -1 else len(html_content)
+        li_content = html_content[start_pos:end_pos]
+
+        def price(pattern):
+            match = re.search(pattern, li_content)
+            if not match:
+                return 0
+            text = match.group(1).replace('원', '').replace(',', '').strip()
+            return int(text) if text.isdigit() else 0
+
+        name_match = re.search(r'<strong class="prodName">([^<]+)</strong>', li_content)
+        device_name = name_match.group(1).strip() if name_match else ""
+        date_match = re.search(r'<span>(\d{4}\.\d{2}\.\d{2})</span>', li_content)
+        rate_discount_total = price(r'<strong class="tit"[^>]*>요금할인\(24개월\)</strong>[\s\S]*?<div class="conts">\s*([^<]+)')
+
+        products.append({
+            'date': date_match.group(1).replace('.', '-') if date_match else "",
+            'device_nm': device_name,
+            'manufacturer': detect_manufacturer(device_name),
+            'network_type': detect_network_type(device_name),
+            'monthly_discount': rate_discount_total // 24 if rate_discount_total > 0 else 0,
+            'release_price': price(r'<div class="tit">출고가</div>[\s\S]*?<div class="conts">([^<]+)</div>'),
+            'public_support_fee': price(r'<div class="tit">공통지원금</div>[\s\S]*?<div class="conts">([^<]+)</div>'),
+            'total_price': price(r'<div class="tit">단말가격</div>[\s\S]*?<div class="conts">([^<]+)</div>'),
+            'additional_support_fee': price(r'<div class="tit">전환지원금</div>[\s\S]*?<div class="conts">([^<]+)</div>'),
+        })
+    return products
+
+
+def comparable(products):
+    """비교용 필드만 남김"""
+    keys = ('date', 'device_nm', 'manufacturer', 'network_type', 'monthly_discount',
+            'release_price', 'public_support_fee', 'total_price', 'additional_support_fee')
+    return [{k: p[k] for k in keys} for p in products]
+
+
+def synthetic_html(count, seed=0):
+    """KT prodList 구조를 흉내 낸 합성 HTML (제품당 약 3KB - 버튼/배지/숨김 필드 등 부가 마크업 포함)"""
+    rng = random.Random(seed)
+    filler = ('\n            <input type="hidden" name="prodNo" value="0">'
+              '\n            <p class="desc">    <em class="badge">인기</em> 자세한 혜택은 상세 페이지에서 확인하세요.</p>'
+              '\n            <button type="button" class="btnCompare" onclick="fnCompare(this);">비교하기</button>') * 4
+    names = ['갤럭시 S25 256GB', '아이폰 16 Pro 128GB', '갤럭시 Z 플립6', 'LG Q92', '갤럭시 탭 S9 LTE', '애플워치 SE']
+    items = []
+    for i in range(count):
+        release = rng.randrange(300, 2500) * 1000
+        support = rng.randrange(0, 600) * 1000
+        convert = rng.choice([0, 0, 100000, 300000])
+        discount = rng.choice([0, 396000, 594000])
+        convert_block = (f'<div class="item"><div class="tit">전환지원금</div><div class="conts">{convert:,}원</div></div>'
+                         if convert else '')
+        discount_block = (f'<div class="rate"><strong class="tit" id="rt{i}">요금할인(24개월)</strong>'
+                          f'<div class="info"><p>선택약정</p></div><div class="conts">\n  {discount:,}원 <em>월</em></div></div>'
+                          if discount else '')
+        items.append(
+            f'<li cd="WL{i:05d}"><div class="prodItemCase"><div class="thumb"><img src="/img/{i}.png"></div>{filler}'
+            f'<strong class="prodName">{rng.choice(names)}</strong><p class="date">공시일 <span>2025.{rng.randrange(1, 13):02d}.{rng.randrange(1, 29):02d}</span></p>'
+            f'<div class="item"><div class="tit">출고가</div><div class="conts">{release:,}원</div></div>'
+            f'<div class="item"><div class="tit">공통지원금</div><div class="conts"><span class="badge">up</span></div>'
+            f'<div class="conts">{support:,}원</div></div>{convert_block}'
+            f'<div class="item"><div class="tit">단말가격</div><div class="conts">{release - support - convert:,}원</div></div>'
+            f'{discount_block}{filler}</div></li>'
+        )
+    return '<ul id="prodList">' + ''.join(items) + '</ul><div class="pageWrap"><a pageno="2">2</a></div>'
+
+
+def record_prod_list(html_path, show_browser):
+    """KT 지원금 페이지의 기본 prodList HTML 저장"""
+    from price_crawler.kt_crawler import KTCrawler
+
+    crawler = KTCrawler({'headless': not show_browser})
+    driver = crawler.create_driver()
+    try:
+        driver.get(KTCrawler.BASE_URL)
+        crawler.wait_for_page_ready(driver)
+        crawler.waiter.until(driver, 'prod_list_ready', KTCrawler.PROD_LIST_READY_JS, fallback=5)
+        html = driver.execute_script("var p = document.getElementById('prodList'); return p ? p.outerHTML : null;")
+        if not html:
+            print("prodList를 찾을 수 없습니다.")
+            return False
+        html_path.write_text(html, encoding='utf-8')
+        print(f"저장 완료: {html_path} ({html_path.stat().st_size / 1024:.0f}KB)")
+        return True
+    finally:
+        driver.quit()
+
+
+def time_runs(func, html, repeat):
+    """repeat회 실행 시간(초)과 마지막 결과"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(html)
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='KT prodList 파서 벤치마크')
+    parser.add_argument('--html', nargs='+', default=[], help='저장된 prodList HTML 경로')
+    parser.add_argument('--record', action='store_true', help='KT 지원금 페이지의 prodList를 첫 --html 경로로 저장')
+    parser.add_argument('--synthetic', type=int, default=0, help='합성 제품 N개 목록도 측정')
+    parser.add_argument('--repeat', type=int, default=30, help='방식별 반복 횟수 (기본: 30)')
+    parser.add_argument('--show-browser', action='store_true', help='브라우저 표시 (--record)')
+    args = parser.parse_args()
+
+    if args.record:
+        if not args.html or not record_prod_list(Path(args.html[0]).resolve(), args.show_browser):
+            return 1
+
+    inputs = []
+    for path in args.html:
+        path = Path(path).resolve()
+        if not path.exists():
+            print(f"HTML 파일이 없습니다: {path}")
+            return 1
+        inputs.append((path.name, path.read_text(encoding='utf-8')))
+    if args.synthetic:
+        inputs.append((f'합성 {args.synthetic}개', synthetic_html(args.synthetic)))
+    if not inputs:
+        parser.error('--html 또는 --synthetic 이 필요합니다')
+
+    mismatched = False
+    print(f"{'입력':<24}{'제품':>6}{'이전(제품/초)':>16}{'현재(제품/초)':>16}{'향상':>8}")
+    for name, html in inputs:
+        legacy_times, legacy_result = time_runs(legacy_parse, html, args.repeat)
+        current_times, current_result = time_runs(parse_product_list, html, args.repeat)
+
+        count = len(current_result)
+        legacy_rate = count / max(statistics.median(legacy_times), 1e-9)
+        current_rate = count / max(statistics.median(current_times), 1e-9)
+        print(f"{name:<24}{count:>6}{legacy_rate:>16,.0f}{current_rate:>16,.0f}{current_rate / max(legacy_rate, 1e-9):>7.1f}x")
+
+        if comparable(legacy_result) != comparable(current_result):
+            print(f"  경고: {name} 추출 결과가 다릅니다")
+            mismatched = True
+
+    if mismatched:
+        return 1
+    print("\n추출 결과 일치")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+SK 공시 페이지 추출 벤치마크
+저장된 공시 페이지에서 셀 단위 WebDriver 호출 방식(이전)과
+execute_script 한 번으로 테이블 전체를 가져오는 방식(현재)의 페이지당 추출 시간을 비교합니다.
+
+사용법:
+    # 공시 페이지 저장 (한 번만)
+    python scripts/benchmark/bench_sk_page_extraction.py --record "https://shop.tworld.co.kr/notice?..." --html sk_notice.html
+
+    # 벤치마크
+    python scripts/benchmark/bench_sk_page_extraction.py --html sk_notice.html --repeat 20
+"""
+import sys
+import time
+import argparse
+import statistics
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from selenium.webdriver.common.by import By
+
+from price_crawler.sk_crawler import TworldCrawler, NOTICE_TABLE_SELECTORS
+
+# _build_item에 필요한 최소 조합 정보
+BENCH_COMBO = {
+    'plan': {'id': 'BENCH', 'name': '벤치마크 요금제', 'monthly_fee': 0},
+    'network': {'code': '5G', 'name': '5G'},
+    'scrb_type': {'value': '11', 'name': '기기변경'}
+}
+
+
+def legacy_collect_page(crawler, driver, combo):
+    """이전 방식: 행/셀마다 find_element(s) 호출"""
+    items = []
+
+    tables = []
+    for selector in NOTICE_TABLE_SELECTORS:
+        found_tables = driver.find_elements(By.CSS_SELECTOR, selector)
+        if found_tables:
+            tables.extend(found_tables)
+            break
+
+    for table in tables:
+        tbody = table.find_element(By.TAG_NAME, "tbody")
+        for row in tbody.find_elements(By.TAG_NAME, "tr"):
+            cells = row.find_elements(By.TAG_NAME, "td")
+
+            if len(cells) == 1 and '데이터가 없습니다' in cells[0].text:
+                return items
+
+            if len(cells) < 6:
+                continue
+
+            device_nm = ' '.join(cells[0].text.split())
+            date_text = cells[1].text.strip()
+            release_price = crawler.clean_price(cells[2].text)
+
+            try:
+                public_fee = crawler.clean_price(cells[3].find_element(By.CSS_SELECTOR, "span.num").text)
+            except Exception:
+                public_fee = crawler.clean_price(cells[3].text)
+
+            try:
+                add_text = cells[4].find_element(By.CSS_SELECTOR, "span.num").text
+            except Exception:
+                add_text = cells[4].text
+            add_fee = 0 if "-" in add_text or not add_text.strip() else crawler.clean_price(add_text)
+
+            item = crawler._build_item(combo, device_nm, date_text, release_price, public_fee, add_fee)
+            if item:
+                items.append(item)
+
+    return items
+
+
+def record_page(crawler, url, html_path):
+    """공시 페이지를 열어 HTML 저장"""
+    driver = crawler.create_driver()
+    try:
+        driver.get(url)
+        crawler.wait_for_page_ready(driver)
+        html_path.write_text(driver.page_source, encoding='utf-8')
+        print(f"저장 완료: {html_path} ({html_path.stat().st_size / 1024:.0f}KB)")
+    finally:
+        driver.quit()
+
+
+def time_runs(func, repeat):
+    """repeat회 실행 시간(ms)과 마지막 결과"""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, result
+
+
+def comparable(items):
+    """수집 시각을 제외한 비교용 항목"""
+    return [{k: v for k, v in item.items() if k != 'crawled_at'} for item in items]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='SK 공시 페이지 추출 벤치마크')
+    parser.add_argument('--html', required=True, help='저장된 공시 페이지 HTML 경로')
+    parser.add_argument('--record', metavar='URL', help='이 URL의 페이지를 --html 경로로 저장')
+    parser.add_argument('--repeat', type=int, default=20, help='방식별 반복 횟수 (기본: 20)')
+    parser.add_argument('--show-browser', action='store_true', help='브라우저 표시')
+    args = parser.parse_args()
+
+    html_path = Path(args.html).resolve()
+    crawler = TworldCrawler({'headless': not args.show_browser, 'use_driver_pool': False})
+
+    if args.record:
+        record_page(crawler, args.record, html_path)
+
+    if not html_path.exists():
+        print(f"HTML 파일이 없습니다: {html_path}")
+        return 1
+
+    driver = crawler.create_driver()
+    try:
+        driver.get(html_path.as_uri())
+        crawler.wait_for_page_ready(driver)
+
+        legacy_times, legacy_items = time_runs(
+            lambda: legacy_collect_page(crawler, driver, BENCH_COMBO), args.repeat)
+
+        def current():
+            # 현재 방식은 all_data에도 누적하므로 매 실행 전에 비움
+            crawler.all_data.clear()
+            return crawler._collect_current_page_data(driver, BENCH_COMBO)
+
+        current_times, current_items = time_runs(current, args.repeat)
+    finally:
+        driver.quit()
+
+    print(f"\n페이지: {html_path.name}, 행 {len(current_items)}개, 반복 {args.repeat}회")
+    print(f"{'방식':<20}{'중앙값(ms)':>12}{'평균(ms)':>12}{'최소(ms)':>12}")
+    for name, timings in (('셀 단위 호출 (이전)', legacy_times), ('execute_script 1회', current_times)):
+        print(f"{name:<20}{statistics.median(timings):>12.1f}{statistics.mean(timings):>12.1f}{min(timings):>12.1f}")
+
+    speedup = statistics.median(legacy_times) / max(statistics.median(current_times), 1e-6)
+    print(f"\n속도 향상: {speedup:.1f}배")
+
+    if comparable(legacy_items) != comparable(current_items):
+        print("경고: 두 방식의 추출 결과가 다릅니다")
+        return 1
+
+    print("추출 결과 일치")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
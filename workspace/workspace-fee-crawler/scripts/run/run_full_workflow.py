@@ -14,47 +14,29 @@ import argparse
 from datetime import datetime
 from zoneinfo import ZoneInfo
 
-def run_full_workflow():
+def run_full_workflow(max_browsers: int = 6):
     """전체 워크플로우 실행"""
     print("\n" + "="*60)
     print("통신사 요금 데이터 수집 및 분석 시스템")
     print("전체 워크플로우 실행")
     print("="*60)
     
-    # 1. 크롤링 실행
+    # 1. 크롤링 실행 (KT/SK/LG 동시 실행, 브라우저 예산 공유)
     print("\n[1/4] 웹 크롤링 시작...")
-    from src.crawlers.kt_crawler import KTCrawler
-    from src.crawlers.lg_crawler import LGUPlusCrawler
-    from src.crawlers.sk_crawler import TworldCrawler
+    from price_crawler.crawl_scheduler import BrowserBudget, CrawlScheduler
     
     crawl_results = []
     
-    # KT 크롤링
-    try:
-        kt_crawler = KTCrawler({'max_workers': 3, 'headless': True})
-        kt_results = kt_crawler.run()
-        crawl_results.extend(kt_results or [])
-        print(f"✓ KT 크롤링 완료: {len(kt_results or [])}개 파일")
-    except Exception as e:
-        print(f"✗ KT 크롤링 실패: {e}")
-    
-    # LG 크롤링
-    try:
-        lg_crawler = LGUPlusCrawler({'max_workers': 3, 'headless': True})
-        lg_results = lg_crawler.run()
-        crawl_results.extend(lg_results or [])
-        print(f"✓ LG 크롤링 완료: {len(lg_results or [])}개 파일")
-    except Exception as e:
-        print(f"✗ LG 크롤링 실패: {e}")
+    scheduler = CrawlScheduler(BrowserBudget(max_browsers=max_browsers))
+    for carrier in ('kt', 'sk', 'lg'):
+        scheduler.add(carrier, {'max_workers': 3, 'headless': True})
     
-    # SK 크롤링
-    try:
-        sk_crawler = TworldCrawler({'max_workers': 3, 'headless': True})
-        sk_results = sk_crawler.run()
-        crawl_results.extend(sk_results or [])
-        print(f"✓ SK 크롤링 완료: {len(sk_results or [])}개 파일")
-    except Exception as e:
-        print(f"✗ SK 크롤링 실패: {e}")
+    for carrier, result in scheduler.run().items():
+        crawl_results.extend(result['files'])
+        if result['error']:
+            print(f"✗ {carrier.upper()} 크롤링 실패: {result['error']}")
+        else:
+            print(f"✓ {carrier.upper()} 크롤링 완료: {len(result['files'])}개 파일")
     
     # 2. OCR 처리
     print("\n[2/4] OCR 처리 시작...")
@@ -98,13 +80,15 @@ def main():
                         help='크롤링 단계 건너뛰기')
     parser.add_argument('--skip-ocr', action='store_true',
                         help='OCR 단계 건너뛰기')
+    parser.add_argument('--max-browsers', type=int, default=6,
+                        help='크롤링 단계 전체 동시 Chrome 수 (기본: 6)')
     
     args = parser.parse_args()
     
     start_time = datetime.now(ZoneInfo('Asia/Seoul'))
     print(f"워크플로우 시작: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
     
-    run_full_workflow()
+    run_full_workflow(max_browsers=args.max_browsers)
     
     end_time = datetime.now(ZoneInfo('Asia/Seoul'))
     elapsed = (end_time - start_time).total_seconds() / 60
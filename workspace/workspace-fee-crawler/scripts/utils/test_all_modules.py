@@ -49,6 +49,29 @@ def main():
         ("price_crawler.kt_crawler", "KT 크롤러"),
         ("price_crawler.sk_crawler", "SK 크롤러"),
         ("price_crawler.lg_crawler", "LG 크롤러"),
+        ("price_crawler.driver_pool", "드라이버 풀"),
+        ("price_crawler.http_fetch", "HTTP 수집기"),
+        ("price_crawler.cdp_network", "CDP 네트워크 로그"),
+        ("price_crawler.combo_planner", "조합 계획기"),
+        ("price_crawler.crawl_index", "증분 크롤링 인덱스"),
+        ("price_crawler.waits", "이벤트 기반 대기"),
+        ("price_crawler.browser_profile", "리소스 차단 프로필"),
+        ("price_crawler.checkpoint_journal", "체크포인트 저널"),
+        ("price_crawler.crawl_scheduler", "크롤러 동시 실행 스케줄러"),
+        ("price_crawler.work_partitions", "작업 분할/훔치기 큐"),
+        ("price_crawler.kt_parser", "KT prodList 파서"),
+        ("price_crawler.fixtures", "픽스처 기록/재생 서버"),
+        ("price_crawler.columnar_store", "Parquet 원시 데이터 저장소"),
+        ("price_crawler.row_store", "열 단위 수집 결과 저장소"),
+        ("price_crawler.plan_catalog", "요금제 카탈로그 캐시"),
+        ("price_crawler.standby_driver", "대기 드라이버 교체"),
+        ("price_crawler.driver_resolver", "chromedriver 경로 확인"),
+        ("price_crawler.telemetry", "크롤링 텔레메트리"),
+        ("price_crawler.async_browser", "비동기 브라우저 엔진"),
+        ("price_crawler.work_queue", "분산 작업 큐"),
+        ("price_crawler.adaptive_concurrency", "적응형 동시성 제어"),
+        ("price_crawler.crawl_profiles", "계층형 크롤링 프로필 (hot/full)"),
+        ("price_crawler.snapshot_diff", "스냅샷 변경분(delta)"),
 
         # OCR 모듈
         ("image_ocr.clova_ocr", "CLOVA OCR"),
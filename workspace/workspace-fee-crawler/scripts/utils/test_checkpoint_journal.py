@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+체크포인트 저널 재개 테스트
+체크포인트 도중 중단(마커 없는 꼬리 행) → 재개 → 체크포인트 후 버린 행이 되살아나지 않는지 확인합니다.
+"""
+
+import sys
+import json
+import tempfile
+from pathlib import Path
+
+# 프로젝트 루트를 Python path에 추가
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from price_crawler.checkpoint_journal import CheckpointJournal
+
+
+def test_interrupted_tail():
+    """마커 없는 꼬리 행은 재개 후 다음 체크포인트에서도 버려져야 함"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = Path(temp_dir) / 'checkpoint.journal'
+
+        # 1. 정상 체크포인트 후 행 기록 도중 중단 (마커 없음)
+        journal = CheckpointJournal(path, fsync=False)
+        journal.checkpoint([{'a': 1}, {'a': 2}], {'index': 1})
+        journal.close()
+        segment = sorted(path.glob('seg-*.jsonl'))[-1]
+        with open(segment, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'t': 'rows', 'rows': [{'a': 99}]}) + '\n')
+
+        # 2. 재개: 마커까지만 복원
+        journal = CheckpointJournal(path, fsync=False)
+        rows, marker, _ = journal.load()
+        assert rows == [{'a': 1}, {'a': 2}], f"재개 행 불일치: {rows}"
+        assert marker == {'index': 1}, f"재개 마커 불일치: {marker}"
+
+        # 3. 재개 후 체크포인트 → 다시 재생
+        journal.checkpoint(rows + [{'a': 3}], {'index': 2})
+        journal.close()
+        rows, marker, _ = CheckpointJournal(path, fsync=False).load()
+        assert rows == [{'a': 1}, {'a': 2}, {'a': 3}], f"버린 행이 복원됨: {rows}"
+        assert marker == {'index': 2}, f"마커 불일치: {marker}"
+
+
+def main():
+    print("=" * 70)
+    print("체크포인트 저널 테스트")
+    print("=" * 70)
+
+    try:
+        test_interrupted_tail()
+        print("✅ 중단 → 재개 → 체크포인트: 마커 없는 행 제거")
+    except AssertionError as e:
+        print(f"❌ 실패: {e}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())